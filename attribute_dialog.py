@@ -26,15 +26,12 @@
 #####################################################################################
 
 
-import os
-
 from qgis.PyQt.QtWidgets import QDialog, QTableWidgetItem
-from qgis.PyQt import uic
 from qgis.PyQt import QtCore
 
-FORM_CLASS, _ = uic.loadUiType(
-    os.path.join(os.path.dirname(__file__), "ui/attribute.ui")
-)
+from .forms import load_form
+
+FORM_CLASS = load_form("attribute")
 
 
 class AttributeDialog(QDialog, FORM_CLASS):
@@ -46,7 +43,10 @@ class AttributeDialog(QDialog, FORM_CLASS):
         super(AttributeDialog, self).__init__(parent)
         QDialog.__init__(self)
         self.setupUi(self)
-        self._populate_attributes(combination)
+
+        # The values as loaded, to only save the rows that changed.
+        self.original = [tuple(row) for row in combination]
+        self._populate_attributes(self.original)
 
         # The id of the feature we are going to edit
         self.feature_id = feature_id
@@ -67,3 +67,40 @@ class AttributeDialog(QDialog, FORM_CLASS):
                     item.setFlags(QtCore.Qt.ItemIsEnabled)
                 self.tableWidget.setItem(row_index, index, item)
         self.tableWidget.resizeColumnsToContents()
+
+    def attributes(self) -> list:
+        """Return the values shown in the table
+
+        A cell whose text was not edited keeps its loaded value, an
+        integer or real cell that is not a number becomes NULL.
+
+        Returns:
+            list: (attrname, strval, intval, realval) tuples
+        """
+
+        attributes = []
+        for row_index, original in enumerate(self.original):
+            row = [original[0]]
+            for index, parse in ((1, str), (2, int), (3, float)):
+                text = self.tableWidget.item(row_index, index).text()
+                if text == str(original[index]):
+                    row.append(original[index])
+                    continue
+                try:
+                    row.append(parse(text))
+                except ValueError:
+                    row.append(None)
+            attributes.append(tuple(row))
+
+        return attributes
+
+    def changed_attributes(self) -> list:
+        """
+        Return the rows of attributes() that differ from the loaded values.
+        """
+
+        return [
+            row
+            for row, original in zip(self.attributes(), self.original)
+            if row != original
+        ]
@@ -0,0 +1,508 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+"""
+Fill a 3D City Database with synthetic LOD2 buildings for scale tests.
+
+The citydb schema must already exist (see the 3D City Database setup
+scripts). Buildings are boxes with a flat or gabled roof, spread over a
+jittered grid around an origin, with LOD0 footprints, LOD1 blocks, LOD2
+thematic surfaces and generic attributes. Rows are streamed with COPY in
+batches; the same seed always produces the same dataset:
+
+    python -m benchmarks.generate_dataset --dbname city_100k --buildings 100000
+"""
+
+import argparse
+import io
+import math
+import os
+import random
+import sys
+import time
+
+import psycopg2
+
+# Object classes of the 3D City Database.
+BUILDING = 26
+ROOF_SURFACE = 33
+WALL_SURFACE = 34
+GROUND_SURFACE = 35
+
+# Names and types of the generated generic attributes, the first ones
+# are used first. Further attributes are numbered strings.
+ATTRIBUTES = (
+    ("function", "string"),
+    ("storeys", "integer"),
+    ("measured_height", "real"),
+    ("year_of_construction", "integer"),
+    ("roof_type", "string"),
+    ("usage", "string"),
+    ("energy_demand", "real"),
+    ("dwellings", "integer"),
+)
+FUNCTIONS = ("residential", "office", "retail", "industrial", "public", "garage")
+USAGES = ("private", "commercial", "mixed", "vacant")
+
+COLUMNS = {
+    "cityobject": ("id", "objectclass_id", "gmlid", "envelope", "creation_date"),
+    "surface_geometry": (
+        "id",
+        "gmlid",
+        "parent_id",
+        "root_id",
+        "is_solid",
+        "is_composite",
+        "is_triangulated",
+        "is_xlink",
+        "is_reverse",
+        "geometry",
+        "cityobject_id",
+    ),
+    "building": (
+        "id",
+        "objectclass_id",
+        "building_root_id",
+        "measured_height",
+        "storeys_above_ground",
+        "lod0_footprint_id",
+        "lod1_multi_surface_id",
+        "lod2_multi_surface_id",
+    ),
+    "thematic_surface": (
+        "id",
+        "objectclass_id",
+        "building_id",
+        "lod2_multi_surface_id",
+    ),
+    "cityobject_genericattrib": (
+        "id",
+        "root_genattrib_id",
+        "attrname",
+        "datatype",
+        "strval",
+        "intval",
+        "realval",
+        "cityobject_id",
+    ),
+}
+
+# Tables in the order they are loaded, so foreign keys always resolve.
+TABLES = tuple(COLUMNS)
+
+# Sequences of the ids, by table.
+SEQUENCES = {
+    "cityobject": "citydb.cityobject_seq",
+    "surface_geometry": "citydb.surface_geometry_seq",
+    "cityobject_genericattrib": "citydb.cityobject_genericatt_seq",
+}
+
+DATATYPES = {"string": 1, "integer": 2, "real": 3}
+
+# COPY text format
+NULL = "\\N"
+
+
+class Ids:
+    """
+    Id counters, started after the ids already in the database.
+    """
+
+    def __init__(self, cursor):
+        self.next = {}
+        for table in SEQUENCES:
+            cursor.execute("SELECT COALESCE(MAX(id), 0) FROM citydb.{}".format(table))
+            (maximum,) = cursor.fetchone()
+            self.next[table] = maximum + 1
+
+    def take(self, table: str) -> int:
+        value = self.next[table]
+        self.next[table] += 1
+        return value
+
+
+def point(x: float, y: float, z: float) -> str:
+    return "{:.3f} {:.3f} {:.3f}".format(x, y, z)
+
+
+def polygon(srid: int, ring: list) -> str:
+    """
+    Return the EWKT of a polygon from its ring, closed here.
+    """
+
+    return "SRID={};POLYGON Z (({}))".format(
+        srid, ", ".join(point(*vertex) for vertex in ring + ring[:1])
+    )
+
+
+def flat(corners: list, z: float) -> list:
+    """
+    Return the horizontal ring of the (x, y) corners at height z.
+    """
+
+    return [(x, y, z) for x, y in corners]
+
+
+def wall(start: tuple, end: tuple, bottom: float, top: float) -> list:
+    """
+    Return the ring of the vertical rectangle from start to end (x, y).
+    """
+
+    return [start + (bottom,), end + (bottom,), end + (top,), start + (top,)]
+
+
+def lod1_block(xmin, ymin, xmax, ymax, bottom, top) -> list:
+    """
+    Return the rings of the faces of a box, oriented outwards.
+    """
+
+    corners = [(xmin, ymin), (xmax, ymin), (xmax, ymax), (xmin, ymax)]
+    walls = [
+        wall(corners[index], corners[(index + 1) % 4], bottom, top) for index in range(4)
+    ]
+
+    return [flat(corners[::-1], bottom), flat(corners, top)] + walls
+
+
+def lod2_surfaces(xmin, ymin, xmax, ymax, ground, eave, ridge) -> dict:
+    """
+    Return the rings of the ground, wall and roof surfaces of a building,
+    gabled along x if ridge is above eave, flat otherwise.
+    """
+
+    ymid = (ymin + ymax) / 2
+    corners = [(xmin, ymin), (xmax, ymin), (xmax, ymax), (xmin, ymax)]
+
+    surfaces = {
+        GROUND_SURFACE: [flat(corners[::-1], ground)],
+        WALL_SURFACE: [
+            wall(corners[0], corners[1], ground, eave),
+            wall(corners[2], corners[3], ground, eave),
+        ],
+    }
+
+    if ridge > eave:
+        # Gable walls up to the ridge, two roof planes.
+        for start, end in ((corners[1], corners[2]), (corners[3], corners[0])):
+            ring = wall(start, end, ground, eave)
+            ring.insert(3, (start[0], ymid, ridge))
+            surfaces[WALL_SURFACE].append(ring)
+        surfaces[ROOF_SURFACE] = [
+            wall(corners[0], corners[1], eave, eave),
+            wall(corners[2], corners[3], eave, eave),
+        ]
+        for ring in surfaces[ROOF_SURFACE]:
+            ring[2:] = [(x, ymid, ridge) for x, _, _ in ring[2:]]
+    else:
+        surfaces[WALL_SURFACE] += [
+            wall(corners[1], corners[2], ground, eave),
+            wall(corners[3], corners[0], ground, eave),
+        ]
+        surfaces[ROOF_SURFACE] = [flat(corners, eave)]
+
+    return surfaces
+
+
+class Generator:
+    """
+    Write the rows of the synthetic buildings into one COPY buffer per table.
+    """
+
+    def __init__(self, arguments, srid: int, ids: Ids):
+        self.random = random.Random(arguments.seed)
+        self.srid = srid
+        self.ids = ids
+        self.attributes = arguments.attributes
+        self.origin = arguments.origin
+
+        # Buildings sit on a jittered grid with density buildings per km²,
+        # filling a square around the origin.
+        self.cell = 1000 / math.sqrt(arguments.density)
+        self.columns = max(math.ceil(math.sqrt(arguments.buildings)), 1)
+
+        self.buffers = {table: io.StringIO() for table in TABLES}
+        self.created = time.strftime("%Y-%m-%d %H:%M:%S")
+
+    def row(self, table: str, *values):
+        self.buffers[table].write(
+            "\t".join(NULL if value is None else str(value) for value in values) + "\n"
+        )
+
+    def flush(self):
+        """
+        Return the buffers and start new ones.
+        """
+
+        buffers = self.buffers
+        self.buffers = {table: io.StringIO() for table in TABLES}
+        return buffers
+
+    def multi_surface(self, rings: list, cityobject_id: int) -> int:
+        """
+        Write a multi surface of polygons, return the id of its root.
+        """
+
+        root = self.ids.take("surface_geometry")
+        self.surface(root, None, root, None, cityobject_id)
+        for ring in rings:
+            surface_id = self.ids.take("surface_geometry")
+            self.surface(
+                surface_id, root, root, polygon(self.srid, ring), cityobject_id
+            )
+
+        return root
+
+    def surface(self, surface_id, parent_id, root_id, geometry, cityobject_id):
+        """
+        Write a surface_geometry row, not solid, composite nor xlink.
+        """
+
+        flags = (0, 0, 0, 0, 0)
+        self.row(
+            "surface_geometry",
+            surface_id,
+            "geom_{}".format(surface_id),
+            parent_id,
+            root_id,
+            *flags,
+            geometry,
+            cityobject_id,
+        )
+
+    def cityobject(self, objectclass: int, envelope) -> int:
+        cityobject_id = self.ids.take("cityobject")
+        xmin, ymin, zmin, xmax, ymax, zmax = envelope
+        # The envelope of the 3D City Database, a diagonal polygon.
+        ring = [
+            (xmin, ymin, zmin),
+            (xmax, ymin, zmin),
+            (xmax, ymax, zmax),
+            (xmin, ymax, zmax),
+        ]
+        self.row(
+            "cityobject",
+            cityobject_id,
+            objectclass,
+            "id_{}".format(cityobject_id),
+            polygon(self.srid, ring),
+            self.created,
+        )
+        return cityobject_id
+
+    def building(self, index: int):
+        """
+        Write the rows of the building at index in the grid.
+        """
+
+        column, row = index % self.columns, index // self.columns
+        half = self.columns * self.cell / 2
+        x = self.origin[0] - half + (column + self.random.uniform(0.1, 0.3)) * self.cell
+        y = self.origin[1] - half + (row + self.random.uniform(0.1, 0.3)) * self.cell
+
+        width = self.random.uniform(0.3, 0.6) * self.cell
+        depth = self.random.uniform(0.3, 0.6) * self.cell
+        ground = self.random.uniform(0, 20)
+        storeys = self.random.randint(1, 12)
+        eave = ground + storeys * 3.0
+        ridge = eave + (self.random.uniform(2, 6) if self.random.random() < 0.6 else 0)
+
+        xmin, ymin, xmax, ymax = x, y, x + width, y + depth
+        envelope = (xmin, ymin, ground, xmax, ymax, ridge)
+
+        building_id = self.cityobject(BUILDING, envelope)
+        corners = [(xmin, ymin), (xmax, ymin), (xmax, ymax), (xmin, ymax)]
+        footprint = self.multi_surface([flat(corners[::-1], ground)], building_id)
+        block = self.multi_surface(
+            lod1_block(xmin, ymin, xmax, ymax, ground, eave), building_id
+        )
+        surfaces = lod2_surfaces(xmin, ymin, xmax, ymax, ground, eave, ridge)
+
+        # The LOD2 geometry of the building is the one of its surfaces.
+        self.row(
+            "building",
+            building_id,
+            BUILDING,
+            building_id,
+            "{:.2f}".format(ridge - ground),
+            storeys,
+            footprint,
+            block,
+            None,
+        )
+
+        for objectclass, rings in surfaces.items():
+            for ring in rings:
+                surface_id = self.cityobject(objectclass, envelope)
+                root = self.multi_surface([ring], surface_id)
+                self.row("thematic_surface", surface_id, objectclass, building_id, root)
+
+        values = {
+            "function": self.random.choice(FUNCTIONS),
+            "storeys": storeys,
+            "measured_height": round(ridge - ground, 2),
+            "year_of_construction": self.random.randint(1850, 2024),
+            "roof_type": "gabled" if ridge > eave else "flat",
+            "usage": self.random.choice(USAGES),
+            "energy_demand": round(self.random.uniform(20, 300), 1),
+            "dwellings": self.random.randint(0, storeys * 4),
+        }
+        for number in range(self.attributes):
+            if number < len(ATTRIBUTES):
+                name, datatype = ATTRIBUTES[number]
+                value = values[name]
+            else:
+                name, datatype = "attribute_{}".format(number), "string"
+                value = "value_{}".format(self.random.randint(0, 99))
+
+            attribute_id = self.ids.take("cityobject_genericattrib")
+            self.row(
+                "cityobject_genericattrib",
+                attribute_id,
+                attribute_id,
+                name,
+                DATATYPES[datatype],
+                value if datatype == "string" else None,
+                value if datatype == "integer" else None,
+                value if datatype == "real" else None,
+                building_id,
+            )
+
+
+def copy(cursor, buffers: dict):
+    """
+    Load the buffered rows with one COPY per table.
+    """
+
+    for table in TABLES:
+        buffer = buffers[table]
+        buffer.seek(0)
+        cursor.copy_expert(
+            "COPY citydb.{} ({}) FROM STDIN".format(table, ", ".join(COLUMNS[table])),
+            buffer,
+        )
+
+
+def generate(connection, arguments):
+    with connection.cursor() as cursor:
+        if arguments.truncate:
+            cursor.execute(
+                "TRUNCATE {} CASCADE".format(
+                    ", ".join("citydb.{}".format(table) for table in TABLES)
+                )
+            )
+
+        srid = arguments.srid
+        if srid is None:
+            cursor.execute("SELECT srid FROM citydb.database_srs LIMIT 1")
+            (srid,) = cursor.fetchone()
+
+        generator = Generator(arguments, srid, Ids(cursor))
+        start = time.perf_counter()
+
+        for index in range(arguments.buildings):
+            generator.building(index)
+            done = index + 1
+            if done % arguments.batch_size == 0 or done == arguments.buildings:
+                copy(cursor, generator.flush())
+                connection.commit()
+                print(
+                    "{} buildings loaded, {:.0f} per second".format(
+                        done, done / (time.perf_counter() - start)
+                    ),
+                    flush=True,
+                )
+
+        for table, sequence in SEQUENCES.items():
+            cursor.execute(
+                "SELECT setval(%s, %s, false)", (sequence, generator.ids.next[table])
+            )
+        connection.commit()
+
+    # Fresh statistics, the plugin relies on them for the estimated
+    # extent and building counts.
+    connection.autocommit = True
+    with connection.cursor() as cursor:
+        for table in TABLES:
+            cursor.execute("ANALYZE citydb.{}".format(table))
+
+
+def coordinates(text: str) -> tuple:
+    x, y = text.split(",")
+    return float(x), float(y)
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default=os.environ.get("PGHOST", "localhost"))
+    parser.add_argument("--port", default=os.environ.get("PGPORT", "5432"))
+    parser.add_argument("--user", default=os.environ.get("PGUSER", "postgres"))
+    parser.add_argument("--password", default=os.environ.get("PGPASSWORD", ""))
+    parser.add_argument("--dbname", default=os.environ.get("PGDATABASE", "citydb"))
+    parser.add_argument("--buildings", type=int, default=10000)
+    parser.add_argument(
+        "--density", type=float, default=1500, help="buildings per square km"
+    )
+    parser.add_argument(
+        "--attributes", type=int, default=5, help="generic attributes per building"
+    )
+    parser.add_argument(
+        "--origin",
+        type=coordinates,
+        default=(690000.0, 5336000.0),
+        help="x,y center of the buildings, in the srid of the database",
+    )
+    parser.add_argument("--srid", type=int, help="the one of database_srs by default")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--batch-size", type=int, default=10000, help="buildings per COPY"
+    )
+    parser.add_argument(
+        "--truncate",
+        action="store_true",
+        help="delete all the city objects of the database first",
+    )
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    arguments = parse_arguments(argv)
+
+    connection = psycopg2.connect(
+        host=arguments.host,
+        port=arguments.port,
+        dbname=arguments.dbname,
+        user=arguments.user,
+        password=arguments.password,
+    )
+    try:
+        generate(connection, arguments)
+    finally:
+        connection.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+"""
+Measure the import time the plugin adds to the start of QGIS.
+
+QGIS imports the plugin module when it starts, the dock widget only
+when the plugin is opened. Both are imported in fresh interpreters with
+python -X importtime, which needs the Python of QGIS (qgis and PyQt5):
+
+    python -m benchmarks.import_time --repeat 5
+
+Run it on two commits to compare the startup cost before and after a change.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Modules QGIS imports at startup, and on first opening of the plugin.
+MODULES = ("citydb_explorer", "citydb_explorer_dockwidget")
+
+
+def import_times(package: str, module: str, python: str) -> dict:
+    """Import a module of the plugin in a new interpreter
+
+    Returns:
+        dict: cumulative import time in microseconds by module name
+    """
+
+    plugin = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = "import sys; sys.path.insert(0, {!r}); import {}.{}".format(
+        os.path.dirname(plugin), package, module
+    )
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", code],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    if result.returncode != 0:
+        # Typically a Python without qgis, see --python.
+        raise SystemExit(
+            "Cannot import {}: {}".format(module, result.stderr.strip().splitlines()[-1])
+        )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--python", default=sys.executable)
+    parser.add_argument("--output", help="JSON file for the results")
+    arguments = parser.parse_args(argv)
+
+    plugin = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    package = os.path.basename(plugin)
+
+    results = {}
+    for module in MODULES:
+        name = "{}.{}".format(package, module)
+        runs = [
+            import_times(package, module, arguments.python)
+            for _ in range(arguments.repeat)
+        ]
+        totals = [times.get(name, 0) / 1000 for times in runs]
+
+        # Slowest modules imported by the plugin, from the last run.
+        slowest = sorted(
+            (
+                (cumulative / 1000, imported)
+                for imported, cumulative in runs[-1].items()
+                if imported.startswith(package + ".") and imported != name
+            ),
+            reverse=True,
+        )[:5]
+
+        results[module] = {"median_ms": statistics.median(totals), "runs_ms": totals}
+        print(
+            "{}: {:.1f} ms (median of {})".format(
+                name, results[module]["median_ms"], len(totals)
+            )
+        )
+        for milliseconds, imported in slowest:
+            print("    {}: {:.1f} ms".format(imported, milliseconds))
+
+    if arguments.output:
+        with open(arguments.output, "w") as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
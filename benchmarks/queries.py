@@ -0,0 +1,397 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+"""
+Benchmark of the PostgreSQLInterface queries.
+
+Run from the plugin directory against throwaway databases, e.g. filled
+by benchmarks/generate_dataset.py, one database per dataset size:
+
+    python -m benchmarks.queries --dbname city_10k,city_100k --output run.json
+
+Every query is run for a matrix of extent sizes and Max Features limits.
+The latency percentiles, rows and bytes are printed and written as JSON,
+which a later run can be compared to with --compare.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+from db.postgresql import PostgreSQLInterface
+
+# Queries whose result does not depend on the limit
+COUNT_QUERIES = {"count_building", "estimate_building_count"}
+
+
+class Rectangle:
+    """
+    Extent with the accessors of QgsRectangle used by PostgreSQLInterface.
+    """
+
+    def __init__(self, xmin, ymin, xmax, ymax):
+        self._bounds = (xmin, ymin, xmax, ymax)
+
+    def xMinimum(self):
+        return self._bounds[0]
+
+    def yMinimum(self):
+        return self._bounds[1]
+
+    def xMaximum(self):
+        return self._bounds[2]
+
+    def yMaximum(self):
+        return self._bounds[3]
+
+
+def square(center: tuple, size: float) -> Rectangle:
+    """
+    Return the extent of edge length size around center.
+    """
+
+    x, y = center
+    return Rectangle(x - size / 2, y - size / 2, x + size / 2, y + size / 2)
+
+
+def percentile(values: list, fraction: float) -> float:
+    """
+    Return the nearest-rank percentile of sorted values.
+    """
+
+    index = max(math.ceil(fraction * len(values)) - 1, 0)
+    return values[index]
+
+
+def summary(durations: list) -> dict:
+    """
+    Return the latency statistics of durations, in milliseconds.
+    """
+
+    values = sorted(duration * 1000 for duration in durations)
+    return {
+        "min": values[0],
+        "p50": percentile(values, 0.50),
+        "p90": percentile(values, 0.90),
+        "p95": percentile(values, 0.95),
+        "p99": percentile(values, 0.99),
+        "max": values[-1],
+        "mean": statistics.mean(values),
+    }
+
+
+def building_rows(batches) -> tuple:
+    """
+    Consume the batches of iter_buildings, return (rows, bytes).
+    """
+
+    rows = size = 0
+    for batch in batches:
+        rows += len(batch)
+        size += sum(len(geom) + len(attributes or "") for _, geom, attributes in batch)
+
+    return rows, size
+
+
+def legacy_rows(db, extent, srs, limit) -> tuple:
+    """
+    Run the query of sql_building, return (rows, bytes).
+    """
+
+    with db.connection() as connection, connection.cursor() as cursor:
+        cursor.execute(db.sql_building(extent, srs, limit))
+        rows = cursor.fetchall()
+
+    return len(rows), sum(len(bytes.fromhex(geom)) for _, geom in rows)
+
+
+def extent_cases(db, srs, extent, limit):
+    """
+    Yield (name, function) of the queries depending on an extent and a limit.
+    The functions return (rows, bytes).
+    """
+
+    yield "count_building", lambda: (db.count_building(extent, srs), 0)
+    yield "estimate_building_count", lambda: (db.estimate_building_count(extent, srs), 0)
+    yield "sql_building", lambda: legacy_rows(db, extent, srs, limit)
+    for lod in ("envelope", "lod1", "lod2"):
+        yield "iter_buildings_{}".format(lod), lambda lod=lod: building_rows(
+            db.iter_buildings(extent, srs, limit=limit, lod=lod)
+        )
+    yield "iter_buildings_lod2_twkb", lambda: building_rows(
+        db.iter_buildings(extent, srs, limit=limit, precision=2)
+    )
+    yield "iter_buildings_lod2_attributes", lambda: building_rows(
+        db.iter_buildings(extent, srs, limit=limit, attributes=True)
+    )
+
+
+def dataset_cases(db, building_ids):
+    """
+    Yield (name, function) of the queries depending only on the dataset.
+    """
+
+    def extent():
+        db.extent
+        return 1, 0
+
+    def generic_attributes():
+        attributes = db.generic_attributes(random.choice(building_ids))
+        return len(attributes), sum(len(str(row)) for row in attributes)
+
+    yield "extent", extent
+    if building_ids:
+        yield "generic_attributes", generic_attributes
+
+
+def measure(function, repeat: int) -> dict:
+    """
+    Run function once to warm up, then repeat times.
+    """
+
+    function()
+
+    durations = []
+    rows = size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows, size = function()
+        durations.append(time.perf_counter() - start)
+
+    return {"latency_ms": summary(durations), "rows": rows, "bytes": size}
+
+
+def dataset_info(db) -> dict:
+    """
+    Return the srs, center, building count and some building ids of a database.
+    """
+
+    with db.connection() as connection, connection.cursor() as cursor:
+        cursor.execute("SELECT count(*) FROM citydb.building")
+        (buildings,) = cursor.fetchone()
+        cursor.execute("SELECT id FROM citydb.building ORDER BY random() LIMIT 100")
+        building_ids = [building_id for (building_id,) in cursor.fetchall()]
+        cursor.execute("SELECT current_setting('server_version')")
+        (server_version,) = cursor.fetchone()
+
+    xmin, ymin, xmax, ymax = db.extent
+    return {
+        "srs": db.srs,
+        "center": ((xmin + xmax) / 2, (ymin + ymax) / 2),
+        "buildings": buildings,
+        "building_ids": building_ids,
+        "server_version": server_version,
+    }
+
+
+def run(arguments) -> dict:
+    """
+    Run the benchmark matrix, print and return the results.
+    """
+
+    random.seed(arguments.seed)
+    results = []
+
+    for dbname in arguments.dbname.split(","):
+        db = PostgreSQLInterface(
+            {
+                "host": arguments.host,
+                "port": arguments.port,
+                "dbname": dbname,
+                "username": arguments.user,
+                "password": arguments.password,
+            },
+            maxconn=1,
+        )
+        try:
+            info = dataset_info(db)
+            center = arguments.center or info["center"]
+
+            def record(query, function, extent_size=None, limit=None):
+                result = measure(function, arguments.repeat)
+                result.update(
+                    dataset=dbname,
+                    buildings=info["buildings"],
+                    server_version=info["server_version"],
+                    query=query,
+                    extent_size=extent_size,
+                    limit=limit,
+                )
+                results.append(result)
+                print_result(result)
+
+            for query, function in dataset_cases(db, info["building_ids"]):
+                record(query, function)
+
+            for size in arguments.extent_sizes:
+                extent = square(center, size)
+                for limit in arguments.limits:
+                    for query, function in extent_cases(db, info["srs"], extent, limit):
+                        if query in COUNT_QUERIES and limit != arguments.limits[0]:
+                            # Counts do not depend on the limit.
+                            continue
+                        record(
+                            query,
+                            function,
+                            size,
+                            None if query in COUNT_QUERIES else limit,
+                        )
+        finally:
+            db.close_connection()
+
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "plugin_version": plugin_version(),
+        "python": platform.python_version(),
+        "repeat": arguments.repeat,
+        "results": results,
+    }
+
+
+def plugin_version() -> str:
+    """
+    Return the version in metadata.txt.
+    """
+
+    path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "metadata.txt")
+    with open(path) as metadata:
+        for line in metadata:
+            if line.startswith("version="):
+                return line.split("=", 1)[1].strip()
+
+    return "unknown"
+
+
+def print_result(result: dict):
+    latency = result["latency_ms"]
+    print(
+        "{dataset:>14} {query:<32} {extent:>7} {limit:>7} "
+        "p50 {p50:9.2f} p95 {p95:9.2f} p99 {p99:9.2f} ms "
+        "{rows:>8} rows {bytes:>11} bytes".format(
+            dataset=result["dataset"],
+            query=result["query"],
+            extent="-" if result["extent_size"] is None else result["extent_size"],
+            limit="-" if result["limit"] is None else result["limit"],
+            rows=result["rows"],
+            bytes=result["bytes"],
+            **latency,
+        )
+    )
+
+
+def compare(results: dict, baseline: dict):
+    """
+    Print the p50 and p95 change of every query also in the baseline.
+    """
+
+    def key(result):
+        return (
+            result["dataset"],
+            result["query"],
+            result["extent_size"],
+            result["limit"],
+        )
+
+    previous = {key(result): result for result in baseline["results"]}
+
+    print("\nCompared to {}:".format(baseline.get("plugin_version", "baseline")))
+    for result in results["results"]:
+        old = previous.get(key(result))
+        if old is None:
+            continue
+        changes = [
+            "{} {:+.1f}%".format(
+                name,
+                100 * (result["latency_ms"][name] / old["latency_ms"][name] - 1)
+                if old["latency_ms"][name]
+                else 0.0,
+            )
+            for name in ("p50", "p95")
+        ]
+        print(" ".join(str(part) for part in key(result) + tuple(changes)))
+
+
+def numbers(text: str, type=float) -> list:
+    return [type(value) for value in text.split(",") if value]
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default=os.environ.get("PGHOST", "localhost"))
+    parser.add_argument("--port", default=os.environ.get("PGPORT", "5432"))
+    parser.add_argument("--user", default=os.environ.get("PGUSER", "postgres"))
+    parser.add_argument("--password", default=os.environ.get("PGPASSWORD", ""))
+    parser.add_argument(
+        "--dbname",
+        default=os.environ.get("PGDATABASE", "citydb"),
+        help="comma separated databases, one per dataset size",
+    )
+    parser.add_argument(
+        "--extent-sizes",
+        type=numbers,
+        default=[250.0, 1000.0, 4000.0],
+        help="comma separated extent edge lengths in map units",
+    )
+    parser.add_argument(
+        "--limits",
+        type=lambda text: numbers(text, int),
+        default=[100, 1000, 10000],
+        help="comma separated Max Features limits",
+    )
+    parser.add_argument(
+        "--center",
+        type=lambda text: tuple(numbers(text)),
+        help="x,y center of the extents, the center of the data by default",
+    )
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON file for the results")
+    parser.add_argument("--compare", help="JSON results of an earlier run")
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    arguments = parse_arguments(argv)
+    results = run(arguments)
+
+    if arguments.output:
+        with open(arguments.output, "w") as output:
+            json.dump(results, output, indent=2)
+
+    if arguments.compare:
+        with open(arguments.compare) as baseline:
+            compare(results, json.load(baseline))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,269 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+
+from qgis.core import (
+    QgsFeature,
+    QgsFeatureRequest,
+    QgsGeometry,
+    QgsPointXY,
+    QgsProject,
+    QgsRectangle,
+    QgsSpatialIndex,
+    QgsVectorLayer,
+)
+
+
+class BuildingLayer:
+    """
+    Memory layer holding the buildings streamed from the database.
+
+    The layer remembers which grid tiles its buildings were loaded for,
+    so a pan only has to add the tiles that became visible and can evict
+    the tiles that moved far away. The bounding boxes of the buildings
+    are kept in an R-tree to identify them without a provider request.
+
+    When loaded, the generic attributes of every building are stored as
+    a JSON object in the attributes field, e.g. for a rule based style
+    on map_get(json_to_map("attributes"), 'name').
+    """
+
+    NAME = "3D CityDB Buildings"
+
+    def __init__(self, srs: int):
+        """Create the memory layer
+
+        Args:
+            srs (int): epsg code of the buildings
+        """
+
+        self.layer = QgsVectorLayer(
+            "MultiPolygonZ?crs=EPSG:{}&field=id:long&field=attributes:string".format(
+                srs
+            ),
+            self.NAME,
+            "memory",
+        )
+        self.layer_id = self.layer.id()
+
+        # Geometry of the loaded buildings, see BuildingLoader.cache_lod.
+        self.lod = None
+
+        # Feature id of every loaded building.
+        self.feature_ids = {}
+        # Building ids of every loaded tile, and tiles of every building.
+        self.tiles = {}
+        self.building_tiles = {}
+
+        # R-tree of the bounding boxes, by feature id.
+        self.index = QgsSpatialIndex()
+        self.bounds = {}
+
+    def is_valid(self) -> bool:
+        """
+        Check if the layer is still part of the project.
+        """
+
+        return QgsProject.instance().mapLayer(self.layer_id) is not None
+
+    @property
+    def tiled(self) -> bool:
+        """
+        Check if the buildings were loaded by tile.
+        """
+
+        return bool(self.tiles) or not self.feature_ids
+
+    def clear(self):
+        """
+        Remove all the buildings.
+        """
+
+        self.layer.dataProvider().truncate()
+        self.feature_ids = {}
+        self.tiles = {}
+        self.building_tiles = {}
+        self.index = QgsSpatialIndex()
+        self.bounds = {}
+
+    def add_batch(self, rows) -> int:
+        """Add a batch of buildings to the layer
+
+        Buildings already in the layer are skipped.
+
+        Args:
+            rows (list): (id, wkb, attributes) tuples as yielded by
+                iter_buildings
+
+        Returns:
+            int: number of buildings added
+        """
+
+        features = []
+        for building_id, wkb, attributes in rows:
+            if building_id in self.feature_ids:
+                continue
+
+            geometry = QgsGeometry()
+            geometry.fromWkb(wkb)
+            geometry.convertToMultiType()
+
+            feature = QgsFeature(self.layer.fields())
+            feature.setGeometry(geometry)
+            feature.setAttribute("id", building_id)
+            feature.setAttribute("attributes", attributes)
+            features.append(feature)
+
+        if not features:
+            return 0
+
+        _, features = self.layer.dataProvider().addFeatures(features)
+        for feature in features:
+            self.feature_ids[feature["id"]] = feature.id()
+            self.bounds[feature.id()] = feature.geometry().boundingBox()
+            self.index.addFeature(feature)
+
+        self.layer.updateExtents()
+        self.layer.triggerRepaint()
+
+        return len(features)
+
+    def add_tile(self, tile: tuple, rows) -> int:
+        """Add the buildings of a grid tile
+
+        Args:
+            tile (tuple): (x, y) index of the tile
+            rows (list): (id, wkb, attributes) tuples of the tile
+
+        Returns:
+            int: number of buildings added
+        """
+
+        added = self.add_batch(rows)
+
+        building_ids = {row[0] for row in rows}
+        self.tiles[tile] = building_ids
+        for building_id in building_ids:
+            self.building_tiles.setdefault(building_id, set()).add(tile)
+
+        return added
+
+    def evict_tiles(self, keep) -> int:
+        """Remove the tiles not in keep
+
+        A building is removed once none of its tiles is loaded.
+
+        Args:
+            keep (set): (x, y) indexes of the tiles to keep
+
+        Returns:
+            int: number of buildings removed
+        """
+
+        removed = []
+        for tile in [tile for tile in self.tiles if tile not in keep]:
+            for building_id in self.tiles.pop(tile):
+                tiles = self.building_tiles[building_id]
+                tiles.discard(tile)
+                if not tiles:
+                    del self.building_tiles[building_id]
+                    removed.append(self.feature_ids.pop(building_id))
+
+        if removed:
+            for feature_id in removed:
+                # The index finds the entry by its bounding box.
+                feature = QgsFeature(feature_id)
+                feature.setGeometry(QgsGeometry.fromRect(self.bounds.pop(feature_id)))
+                self.index.deleteFeature(feature)
+
+            self.layer.dataProvider().deleteFeatures(removed)
+            self.layer.triggerRepaint()
+
+        return len(removed)
+
+    def update_attributes(self, building_id: int, attributes: str):
+        """Replace the generic attributes of a loaded building
+
+        Nothing is done if the building or its attributes are not loaded.
+
+        Args:
+            building_id (int): id of the building
+            attributes (str): the attributes as a JSON object
+        """
+
+        feature_id = self.feature_ids.get(building_id)
+        if feature_id is None:
+            return
+
+        feature = next(self.layer.getFeatures(QgsFeatureRequest(feature_id)), None)
+        # A NULL field means the attributes were not loaded.
+        if feature is None or not feature["attributes"]:
+            return
+
+        field = self.layer.fields().indexOf("attributes")
+        self.layer.dataProvider().changeAttributeValues(
+            {feature_id: {field: attributes}}
+        )
+
+    def identify(self, point: QgsPointXY, tolerance: float):
+        """Return the building at a point
+
+        Candidates are looked up in the R-tree, then only their
+        geometries are tested.
+
+        Args:
+            point (QgsPointXY): the point, in layer coordinates
+            tolerance (float): search radius in layer units
+
+        Returns:
+            QgsFeature: the building nearest to the point, None if none
+        """
+
+        rectangle = QgsRectangle(
+            point.x() - tolerance,
+            point.y() - tolerance,
+            point.x() + tolerance,
+            point.y() + tolerance,
+        )
+        candidates = self.index.intersects(rectangle)
+        if not candidates:
+            return None
+
+        search = QgsGeometry.fromRect(rectangle)
+        target = QgsGeometry.fromPointXY(point)
+
+        nearest = None
+        nearest_distance = None
+        request = QgsFeatureRequest().setFilterFids(candidates)
+        for feature in self.layer.getFeatures(request):
+            geometry = feature.geometry()
+            if not geometry.intersects(search):
+                continue
+            distance = geometry.distance(target)
+            if nearest is None or distance < nearest_distance:
+                nearest, nearest_distance = feature, distance
+
+        return nearest
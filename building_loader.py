@@ -0,0 +1,277 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+
+import math
+
+from qgis.core import QgsRectangle
+
+from .db.tile_cache import TileKey, tile_bounds, tile_range
+
+
+def split_extent(extent, parts: int) -> list:
+    """Split an extent in parts of the same size
+
+    The extent is cut in a grid of about square cells.
+
+    Args:
+        extent (QgsRectangle): the extent
+        parts (int): minimum number of parts
+
+    Returns:
+        list: QgsRectangle parts
+    """
+
+    if parts <= 1 or extent.width() <= 0 or extent.height() <= 0:
+        return [extent]
+
+    columns = max(math.ceil(math.sqrt(parts * extent.width() / extent.height())), 1)
+    rows = max(math.ceil(parts / columns), 1)
+
+    width = extent.width() / columns
+    height = extent.height() / rows
+
+    return [
+        QgsRectangle(
+            extent.xMinimum() + column * width,
+            extent.yMinimum() + row * height,
+            extent.xMinimum() + (column + 1) * width,
+            extent.yMinimum() + (row + 1) * height,
+        )
+        for column in range(columns)
+        for row in range(rows)
+    ]
+
+
+class BuildingLoader:
+    """
+    Fetch the buildings of an extent from the database, going through
+    the tile cache when one is configured.
+    """
+
+    def __init__(
+        self,
+        db_interface,
+        srs: int,
+        connection_key: str,
+        tile_cache=None,
+        tile_size: float = 500,
+        max_tiles: int = 64,
+        precision=None,
+        precomputed=False,
+        lod: str = "lod2",
+        tolerance=None,
+        attributes=False,
+    ):
+        """Create the loader
+
+        Args:
+            db_interface (PostgreSQLInterface): the database
+            srs (int): srid of the database
+            connection_key (str): identify the database in the tile cache
+            tile_cache (TileCache): the cache, None to always query the database
+            tile_size (float): tile edge length in map units
+            max_tiles (int): extents covering more tiles bypass the cache
+            precision (int): TWKB transfer precision, None for full precision
+            precomputed (bool): read the precomputed building geometry table
+            lod (str): geometry to load, see iter_buildings
+            tolerance (float): simplification tolerance in map units, see
+                iter_buildings. None loads the geometries unchanged.
+            attributes (bool): also load the generic attributes, see
+                iter_buildings
+        """
+
+        self.db_interface = db_interface
+        self.srs = srs
+        self.connection_key = connection_key
+        self.tile_cache = tile_cache
+        self.tile_size = tile_size
+        self.max_tiles = max_tiles
+        self.precision = precision
+        self.precomputed = precomputed
+        self.lod = lod
+        self.tolerance = tolerance
+        self.attributes = attributes
+
+    @property
+    def cache_lod(self) -> str:
+        """
+        Name of the geometries stored in the tile cache, including the
+        tile size since the same x, y indexes another area for another size.
+        """
+
+        name = "{}#{:g}".format(self.lod, self.tile_size)
+        if self.precision is not None:
+            name += "@{}".format(self.precision)
+        if self.tolerance is not None and self.lod != "envelope":
+            name += "~{:g}".format(self.tolerance)
+        if self.attributes:
+            name += "+attributes"
+
+        return name
+
+    def tiles(self, extent):
+        """Return the grid tiles covering an extent
+
+        Args:
+            extent (QgsRectangle): the extent
+
+        Returns:
+            set: (x, y) tile indexes, None if the extent covers more
+                than max_tiles tiles and has to be loaded at once
+        """
+
+        tiles = tile_range(
+            extent.xMinimum(),
+            extent.yMinimum(),
+            extent.xMaximum(),
+            extent.yMaximum(),
+            self.tile_size,
+        )
+
+        if len(tiles) > self.max_tiles:
+            return None
+
+        return set(tiles)
+
+    def fetch(
+        self,
+        extent,
+        limit=None,
+        after_id: int = 0,
+        batch_size: int = 500,
+        connection=None,
+    ):
+        """Yield the buildings of the extent in batches
+
+        Buildings are yielded once, ordered by id, starting after after_id,
+        so pages of limit buildings can be requested one after the other.
+        Tiles missing from the cache are fetched and stored.
+
+        Args:
+            extent (QgsRectangle): the extent to load
+            limit (int): max number of buildings, None for no limit
+            after_id (int): only yield buildings with a greater id
+            batch_size (int): number of buildings per batch
+            connection (connection): database connection to use, see
+                iter_buildings
+
+        Yields:
+            list: (id, wkb, attributes) tuples
+        """
+
+        tiles = tile_range(
+            extent.xMinimum(),
+            extent.yMinimum(),
+            extent.xMaximum(),
+            extent.yMaximum(),
+            self.tile_size,
+        )
+
+        if self.tile_cache is None or len(tiles) > self.max_tiles:
+            yield from self.db_interface.iter_buildings(
+                extent,
+                self.srs,
+                batch_size=batch_size,
+                limit=limit,
+                precision=self.precision,
+                precomputed=self.precomputed,
+                lod=self.lod,
+                tolerance=self.tolerance,
+                attributes=self.attributes,
+                after_id=after_id,
+                connection=connection,
+            )
+            return
+
+        # Tiles are complete, so the page is cut from their merged buildings.
+        buildings = {}
+        for x, y in tiles:
+            for row in self.fetch_tile((x, y), connection=connection):
+                if row[0] > after_id:
+                    buildings[row[0]] = row
+
+        page = [buildings[building_id] for building_id in sorted(buildings)]
+        if limit is not None:
+            page = page[:limit]
+
+        for start in range(0, len(page), batch_size):
+            yield page[start:start + batch_size]
+
+    def fetch_tile(self, tile: tuple, connection=None) -> list:
+        """Return the buildings of a grid tile, from the cache if possible
+
+        Args:
+            tile (tuple): (x, y) index of the tile
+            connection (connection): database connection to use, see
+                iter_buildings
+
+        Returns:
+            list: (id, wkb, attributes) tuples
+        """
+
+        rows = self.cached_tile(tile)
+        if rows is not None:
+            return rows
+
+        x, y = tile
+        rows = [
+            row
+            for batch in self.db_interface.iter_buildings(
+                QgsRectangle(*tile_bounds(x, y, self.tile_size)),
+                self.srs,
+                precision=self.precision,
+                precomputed=self.precomputed,
+                lod=self.lod,
+                tolerance=self.tolerance,
+                attributes=self.attributes,
+                connection=connection,
+            )
+            for row in batch
+        ]
+        if self.tile_cache is not None:
+            key = TileKey(self.connection_key, self.srs, self.cache_lod, x, y)
+            self.tile_cache.put(key, rows)
+
+        return rows
+
+    def cached_tile(self, tile: tuple):
+        """Return the buildings of a grid tile from the cache
+
+        Args:
+            tile (tuple): (x, y) index of the tile
+
+        Returns:
+            list: (id, wkb, attributes) tuples, None if the tile is not cached
+        """
+
+        if self.tile_cache is None:
+            return None
+
+        x, y = tile
+        return self.tile_cache.get(
+            TileKey(self.connection_key, self.srs, self.cache_lod, x, y)
+        )
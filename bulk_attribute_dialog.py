@@ -0,0 +1,126 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+from qgis.PyQt.QtWidgets import QDialog
+
+from .forms import load_form
+
+FORM_CLASS = load_form("bulk_attribute")
+
+# Values of the operation and type combo boxes, in their order.
+OPERATIONS = ("set", "update", "delete")
+TYPES = (("string", str), ("integer", int), ("real", float))
+
+
+class BulkAttributeDialog(QDialog, FORM_CLASS):
+    """
+    Dialog to set, update or delete a generic attribute of many
+    buildings at once
+    """
+
+    def __init__(self, selected: int, parent=None):
+        super(BulkAttributeDialog, self).__init__(parent)
+        self.setupUi(self)
+
+        # The selection is only offered when there is one.
+        self.selectedBuildings.setText("Selected buildings ({})".format(selected))
+        self.selectedBuildings.setEnabled(selected > 0)
+        if selected > 0:
+            self.selectedBuildings.setChecked(True)
+
+        self.operation.currentIndexChanged.connect(self._update_fields)
+        self.filterAttribute.toggled.connect(self._update_fields)
+        self._update_fields()
+
+    def _update_fields(self):
+        """
+        Enable the fields the chosen operation and filter use.
+        """
+
+        filtered = self.filterAttribute.isChecked()
+        self.filterName.setEnabled(filtered)
+        self.filterValue.setEnabled(filtered)
+
+        valued = OPERATIONS[self.operation.currentIndex()] != "delete"
+        self.dataType.setEnabled(valued)
+        self.attributeValue.setEnabled(valued)
+
+    def scope(self) -> str:
+        """
+        Return which buildings are edited: "selection", "view" or "all".
+        """
+
+        if self.selectedBuildings.isChecked():
+            return "selection"
+        if self.viewBuildings.isChecked():
+            return "view"
+        return "all"
+
+    def attribute_filter(self):
+        """Return the attribute filter
+
+        Returns:
+            tuple: (name, value) with value None for any value, or
+                (None, None) without filter
+        """
+
+        name = self.filterName.text().strip()
+        if not self.filterAttribute.isChecked() or not name:
+            return None, None
+
+        return name, self.filterValue.text() or None
+
+    def edit(self) -> dict:
+        """Return the edit to apply
+
+        Raises:
+            ValueError: if the name is missing or the value has not the type
+
+        Returns:
+            dict: operation, name, datatype and value, as expected by
+                PostgreSQLInterface.bulk_edit_generic_attribute
+        """
+
+        name = self.attributeName.text().strip()
+        if not name:
+            raise ValueError("Enter the name of the attribute.")
+
+        operation = OPERATIONS[self.operation.currentIndex()]
+        if operation == "delete":
+            return {"operation": operation, "name": name}
+
+        datatype, parse = TYPES[self.dataType.currentIndex()]
+        try:
+            value = parse(self.attributeValue.text())
+        except ValueError:
+            raise ValueError("The value is not a valid {}.".format(datatype))
+
+        return {
+            "operation": operation,
+            "name": name,
+            "datatype": datatype,
+            "value": value,
+        }
@@ -31,9 +31,6 @@ from qgis.PyQt.QtCore import QCoreApplication, QSettings, Qt, QTranslator
 from qgis.PyQt.QtGui import QIcon
 from qgis.PyQt.QtWidgets import QAction
 
-from .citydb_explorer_dockwidget import CityDbExplorerDockWidget
-from .resources import *  # noqa F403
-
 
 class CityDbExplorer:
     """QGIS Plugin Implementation."""
@@ -162,13 +159,41 @@ class CityDbExplorer:
     def initGui(self):
         """Create the menu entries and toolbar icons inside the QGIS GUI."""
 
-        icon_path = ":/plugins/citydb_explorer/icon.png"
+        # The icon file is read directly, compiled Qt resources would
+        # slow down the start of QGIS.
+        icon_path = os.path.join(self.plugin_dir, "icon.png")
         self.add_action(
             icon_path,
             text=self.tr(u"Open Widget"),
             callback=self.run,
             parent=self.iface.mainWindow(),
         )
+        self.add_action(
+            icon_path,
+            text=self.tr(u"Create Building Table"),
+            callback=self.create_building_table,
+            add_to_toolbar=False,
+            status_tip=self.tr(
+                u"Precompute the building geometries of the connected database"
+            ),
+            parent=self.iface.mainWindow(),
+        )
+        self.add_action(
+            icon_path,
+            text=self.tr(u"Refresh Building Table"),
+            callback=self.refresh_building_table,
+            add_to_toolbar=False,
+            status_tip=self.tr(u"Update the geometries of the changed buildings"),
+            parent=self.iface.mainWindow(),
+        )
+        self.add_action(
+            icon_path,
+            text=self.tr(u"Check Indexes"),
+            callback=self.check_indexes,
+            add_to_toolbar=False,
+            status_tip=self.tr(u"Report the missing indexes of the connected database"),
+            parent=self.iface.mainWindow(),
+        )
 
     # --------------------------------------------------------------------------
 
@@ -197,6 +222,24 @@ class CityDbExplorer:
 
     # --------------------------------------------------------------------------
 
+    def create_building_table(self):
+        """Create the building table for the database connected in the widget"""
+
+        self.run()
+        self.dockwidget.create_building_table()
+
+    def refresh_building_table(self):
+        """Refresh the building table of the database connected in the widget"""
+
+        self.run()
+        self.dockwidget.refresh_building_table()
+
+    def check_indexes(self):
+        """Check the indexes of the database connected in the widget"""
+
+        self.run()
+        self.dockwidget.check_indexes()
+
     def run(self):
         """Run method that loads and starts the plugin"""
 
@@ -209,6 +252,10 @@ class CityDbExplorer:
             #    first run of plugin
             #    removed on close (see self.onClosePlugin method)
             if self.dockwidget is None:
+                # Import the widget on first use only, it loads the database
+                # modules and the form.
+                from .citydb_explorer_dockwidget import CityDbExplorerDockWidget
+
                 # Create the dockwidget (after translation) and keep reference
                 self.dockwidget = CityDbExplorerDockWidget(self.iface)
 
@@ -25,25 +25,36 @@
 #
 #####################################################################################
 
+import math
 import os
 
 from qgis.core import (
     Qgis,
+    QgsApplication,
     QgsCoordinateReferenceSystem,
-    QgsDataSourceUri,
     QgsMessageLog,
     QgsProject,
     QgsRectangle,
-    QgsVectorLayer,
+    QgsTask,
 )
-from qgis.PyQt import QtWidgets, uic
-from qgis.PyQt.QtCore import QSettings, pyqtSignal
+from qgis.PyQt import QtWidgets
+from qgis.PyQt.QtCore import QSettings, QTimer, pyqtSignal
 
-from .attribute_dialog import AttributeDialog
-from .db.postgresql import PostgreSQLInterface, PostgreSQLInterfaceException
+from . import settings
+from .building_layer import BuildingLayer
+from .building_loader import BuildingLoader
+from .db import index_advisor
+from .db.attribute_cache import AttributeCache
+from .db.metadata_cache import MetadataCache
+from .db.postgresql import TWKB_PRECISION, PostgreSQLInterfaceException
+from .db.query_stats import QueryStats
+from .db.tile_cache import TileCache, TileCacheException
+from .forms import load_form
+from .refresh_scheduler import RefreshScheduler
+from .tasks import BuildingLoadTask, BulkEditTask, ConnectTask, CountTask
 from .tools.edit_generic import EditGenericAttributes
 
-FORM_CLASS, _ = uic.loadUiType(os.path.join(os.path.dirname(__file__), "ui", "main.ui"))
+FORM_CLASS = load_form("main")
 
 
 class CityDbExplorerDockWidget(QtWidgets.QDockWidget, FORM_CLASS):
@@ -62,6 +73,44 @@ class CityDbExplorerDockWidget(QtWidgets.QDockWidget, FORM_CLASS):
 
         self.iface = iface
         self.db_interface = None
+        self.building_layer = None
+        self.building_table = False
+        self.tile_cache = None
+
+        # Metadata of the databases connected recently.
+        ttl = settings.value("metadata/ttl", 24, type=float)
+        self.metadata_cache = MetadataCache(
+            os.path.join(
+                QgsApplication.qgisSettingsDirPath(), "citydb_explorer", "metadata.json"
+            ),
+            ttl=ttl * 3600,
+        )
+
+        # Timing of the statements of every connection.
+        self.query_stats = QueryStats(
+            slow_threshold=settings.value("stats/slowQuery", 500, type=float) / 1000,
+            explain=settings.value("stats/explain", False, type=bool),
+            listener=self._log_slow_query,
+        )
+
+        # Id of the last loaded building, the next page starts after it.
+        self.last_building_id = 0
+
+        # Background tasks: connection, count, load, bulk edit and index creation.
+        self.connect_task = None
+        self.count_task = None
+        self.load_task = None
+        self.bulk_task = None
+        self.index_task = None
+        self.building_table_task = None
+
+        # Refresh the count and the buildings once the canvas stops moving.
+        self.refresh_scheduler = RefreshScheduler(
+            self._refresh,
+            delay=settings.value("refresh/delay", 300, type=int),
+            parent=self,
+        )
+        self.iface.mapCanvas().extentsChanged.connect(self.refresh_scheduler.schedule)
 
         # Populate database connection
         db_connections = self._postgres_connections()
@@ -70,13 +119,77 @@ class CityDbExplorerDockWidget(QtWidgets.QDockWidget, FORM_CLASS):
 
         # Event for the GUI.
         self.loadBuilding.clicked.connect(self.load_building)
+        self.loadMore.clicked.connect(self.load_more_buildings)
         self.editAttribute.clicked.connect(self._edit_generic)
+        self.bulkEdit.clicked.connect(self._bulk_edit_generic)
         self.connect.clicked.connect(self._database_connection)
+        self.resetStats.clicked.connect(self._reset_query_stats)
+
+        # The statistics are shown while their box is expanded.
+        self.stats_timer = QTimer(self)
+        self.stats_timer.setInterval(1000)
+        self.stats_timer.timeout.connect(self._update_query_stats)
+        self.queryStatsBox.toggled.connect(self._show_query_stats)
+        self._show_query_stats(self.queryStatsBox.isChecked())
 
         # Take track if the attribute edit tool is active.
         self.attribute_editor = None
         self.attribute_dialog = None
 
+    def _log_slow_query(self, statement):
+        """
+        Log a slow statement, with its plan if captured. Called from the
+        thread that ran the statement.
+        """
+
+        message = "Slow query {}: {:.0f} ms, {} rows, {} bytes".format(
+            statement.label, statement.duration * 1000, statement.rows, statement.bytes
+        )
+        if statement.plan is not None:
+            message += "\n" + statement.plan
+
+        QgsMessageLog.logMessage(message, tag="3D CityDB Plugin", level=Qgis.Warning)
+
+    def _show_query_stats(self, shown):
+        """
+        Show or hide the statistics panel.
+        """
+
+        self.queryStats.setVisible(shown)
+        self.resetStats.setVisible(shown)
+        if shown:
+            self._update_query_stats()
+            self.stats_timer.start()
+        else:
+            self.stats_timer.stop()
+
+    def _update_query_stats(self):
+        """
+        Show the statements that took the most time.
+        """
+
+        lines = [
+            "{label}: {count} x {mean_ms:.1f} ms (max {max_ms:.1f}), "
+            "{rows} rows, {bytes} bytes".format(
+                mean_ms=entry["mean"] * 1000, max_ms=entry["max"] * 1000, **entry
+            )
+            for entry in self.query_stats.summary()
+        ]
+        for statement in self.query_stats.plans():
+            lines.append("")
+            lines.append(
+                "{} ({:.0f} ms):".format(statement.label, statement.duration * 1000)
+            )
+            lines.append(statement.plan)
+
+        text = "\n".join(lines)
+        if text != self.queryStats.toPlainText():
+            self.queryStats.setPlainText(text)
+
+    def _reset_query_stats(self):
+        self.query_stats.reset()
+        self._update_query_stats()
+
     def _postgres_connections(self):
         """
         Return the list of saved PostgreSQL connections.
@@ -119,30 +232,147 @@ class CityDbExplorerDockWidget(QtWidgets.QDockWidget, FORM_CLASS):
 
         connection_parameters = self._connection_parameters()
 
-        # We try to build the connection to the database.
-        try:
-            self.db_interface = PostgreSQLInterface(connection_parameters)
-        except PostgreSQLInterfaceException:
-            self.dbVersion.setText("Error connecting to database.")
+        # Release the pooled connections of a previous database.
+        self._cancel_load()
+        if self.db_interface is not None:
+            self.db_interface.close_connection()
+            self.db_interface = None
+
+        # We try to build the connection to the database in the background.
+        self.dbVersion.setText("Connecting...")
+        # One connection per load worker, plus the ones for count and edits.
+        task = ConnectTask(
+            connection_parameters,
+            maxconn=self._workers() + 2,
+            metadata_cache=self.metadata_cache,
+            attribute_cache=self._attribute_cache(),
+            stats=self.query_stats,
+        )
+        task.taskCompleted.connect(lambda: self._database_connected(task))
+        task.taskTerminated.connect(lambda: self._database_connected(task))
+        self.connect_task = task
+        QgsApplication.taskManager().addTask(task)
+
+    def _database_connected(self, task):
+        """
+        Use the connection made by a ConnectTask, if it is the last one.
+        """
+
+        if task is not self.connect_task:
+            # Another connection was requested meanwhile.
+            if task.db_interface is not None:
+                task.db_interface.close_connection()
+            return
+        self.connect_task = None
+
+        if task.db_interface is None:
+            if task.exception is None:
+                self.dbVersion.setText("Error connecting to database.")
+                return
+            message = "Error connecting to database: {}".format(task.exception)
+            self.dbVersion.setText(message)
+            QgsMessageLog.logMessage(message, tag="3D CityDB Plugin", level=Qgis.Warning)
+            return
+
+        self.db_interface = task.db_interface
+
+        # We have the connection. Now test if it is really a 3DCity DB
+        metadata = task.metadata
+        version = metadata["version"]
+        if version != -1:
+            self.srs = metadata["srs"]
+            extent = metadata["extent"]
+            self.building_table = metadata["building_table"]
+            self._log_missing_indexes(task.index_advice)
+            self.dbVersion.setText(f"Connected. Current DB version is {version}.")
+            # Set the project to the extent and srs of database
+            QgsProject.instance().setCrs(
+                QgsCoordinateReferenceSystem.fromEpsgId(self.srs)
+            )
+            canvas = self.iface.mapCanvas()
+            xmin, ymin, xmax, ymax = extent
+            canvas.setExtent(QgsRectangle(xmin, ymin, xmax, ymax))
+
+            # Show how many buildings are in view.
+            self.refresh_scheduler.schedule()
+
         else:
-            # We have the connection. Now test if it is really a 3DCity DB
-            version = self.db_interface.version
-            self.srs = self.db_interface.srs
-            extent = self.db_interface.extent
-            if version != -1:
-                self.dbVersion.setText(f"Connected. Current DB version is {version}.")
-                # Set the project to the extent and srs of database
-                QgsProject.instance().setCrs(
-                    QgsCoordinateReferenceSystem.fromEpsgId(self.srs)
-                )
-                canvas = self.iface.mapCanvas()
-                xmin, ymin, xmax, ymax = extent
-                canvas.setExtent(QgsRectangle(xmin, ymin, xmax, ymax))
+            # It is not a 3DCity DB. Reset the db_interface to None
+            self.dbVersion.setText(
+                "Error. Current DB is not a 3DCity DB or is an unsupported version."
+            )
+            self.db_interface.close_connection()
+            self.db_interface = None
 
-            else:
-                # It is not a 3DCity DB. Reset the db_interface to None
-                self.dbVersion.setText("Error. Current DB is not a 3DCity DB or is an unsupported version.") 
-                self.db_interface = None
+    def _refresh(self, generation):
+        """
+        Update the count and the buildings for the extent the canvas
+        stopped on.
+        """
+
+        if self.db_interface is None:
+            return
+
+        self._update_building_count(generation)
+        self._update_building_layer()
+
+    def _update_building_count(self, generation):
+        """
+        Estimate the number of buildings in the current extent and count
+        them exactly if requested, in a background task. The running
+        count is cancelled: its extent is outdated.
+        """
+
+        self._cancel_count()
+
+        task = CountTask(
+            self.db_interface,
+            self.iface.mapCanvas().extent(),
+            self.srs,
+            generation,
+            exact=self.exactCount.isChecked(),
+        )
+        task.estimated.connect(
+            lambda generation, estimate: self._show_building_count(
+                generation, f"~{estimate} buildings in view"
+            )
+        )
+        task.taskCompleted.connect(lambda: self._count_finished(task))
+        task.taskTerminated.connect(lambda: self._count_finished(task))
+
+        self.count_task = task
+        QgsApplication.taskManager().addTask(task)
+
+    def _cancel_count(self):
+        """
+        Cancel the running building count, aborting its query.
+        """
+
+        if self.count_task is not None:
+            self.count_task.cancel()
+            self.count_task = None
+
+    def _show_building_count(self, generation, text):
+        """
+        Show a building count if the extent did not change meanwhile.
+        """
+
+        if self.refresh_scheduler.is_current(generation):
+            self.buildingCount.setText(text)
+
+    def _count_finished(self, task):
+        """
+        Show the exact count once a CountTask ended.
+        """
+
+        if task is not self.count_task:
+            return
+        self.count_task = None
+
+        if task.estimate is None:
+            self.buildingCount.setText("")
+        elif task.count is not None:
+            self._show_building_count(task.generation, f"{task.count} buildings in view")
 
     def load_building(self):
         """
@@ -153,188 +383,504 @@ class CityDbExplorerDockWidget(QtWidgets.QDockWidget, FORM_CLASS):
             return
         self._add_building_layer()
 
-    def _create_buildings_uri(self) -> str:
-        """Create a uri for the buildings in the current extent
+    def create_building_table(self):
+        """
+        Create the precomputed building geometry table in the connected
+        database, in a background task.
+        """
+
+        if self.db_interface is None:
+            self.dbVersion.setText("Please connect to a database first.")
+            return
+
+        def create(task, db_interface):
+            return db_interface.create_building_table()
+
+        def finished(exception, count=None):
+            self.building_table_task = None
+            if exception is not None:
+                message = str(exception)
+                level = Qgis.Warning
+            else:
+                self.building_table = True
+                message = f"Building table created with {count} buildings."
+                level = Qgis.Info
+            self.dbVersion.setText(message)
+            QgsMessageLog.logMessage(message, tag="3D CityDB Plugin", level=level)
+
+        self._start_building_table_task(
+            "Creating building table...",
+            QgsTask.fromFunction(
+                "Create 3D CityDB building table",
+                create,
+                self.db_interface,
+                on_finished=finished,
+            ),
+        )
 
-        Returns:
-            str: uri definition
+    def refresh_building_table(self):
+        """
+        Update the precomputed building geometry table with the changed
+        buildings, in a background task.
+        """
+
+        if self.db_interface is None:
+            self.dbVersion.setText("Please connect to a database first.")
+            return
+
+        if not self.building_table:
+            self.dbVersion.setText("The database has no building table.")
+            return
+
+        def refresh(task, db_interface):
+            return db_interface.refresh_building_table()
+
+        def finished(exception, result=None):
+            self.building_table_task = None
+            if exception is not None:
+                message = str(exception)
+                level = Qgis.Warning
+            else:
+                updated, deleted = result
+                message = (
+                    f"Building table refreshed: {updated} updated, {deleted} deleted."
+                )
+                level = Qgis.Info
+            self.dbVersion.setText(message)
+            QgsMessageLog.logMessage(message, tag="3D CityDB Plugin", level=level)
+
+        self._start_building_table_task(
+            "Refreshing building table...",
+            QgsTask.fromFunction(
+                "Refresh 3D CityDB building table",
+                refresh,
+                self.db_interface,
+                on_finished=finished,
+            ),
+        )
+
+    def _start_building_table_task(self, message, task):
+        """
+        Run a task creating or refreshing the building table, one at a time.
+        """
+
+        if self.building_table_task is not None:
+            self.dbVersion.setText("The building table is already being updated.")
+            return
+
+        self.dbVersion.setText(message)
+        self.building_table_task = task
+        QgsApplication.taskManager().addTask(task)
+
+    def _log_missing_indexes(self, advice):
+        """
+        Warn about the missing and invalid indexes found when connecting.
+        """
+
+        missing = [
+            item for item in advice or () if item.status in ("missing", "invalid")
+        ]
+        if missing:
+            QgsMessageLog.logMessage(
+                "{} indexes the plugin relies on are missing or invalid, "
+                "loading buildings may be slow. Use Check Indexes in the plugin "
+                "menu.\n{}".format(
+                    len(missing), index_advisor.report(missing)
+                ),
+                tag="3D CityDB Plugin",
+                level=Qgis.Warning,
+            )
+
+    def check_indexes(self):
+        """
+        Report the missing, invalid and unused indexes of the connected
+        database and offer to create the missing ones and rebuild the
+        invalid ones.
+        """
+
+        if self.db_interface is None:
+            self.dbVersion.setText("Please connect to a database first.")
+            return
+
+        try:
+            advice = self.db_interface.index_advice()
+        except PostgreSQLInterfaceException as error:
+            self.dbVersion.setText(str(error))
+            return
+
+        text = index_advisor.report(advice) or "All the recommended indexes exist."
+        missing = [item for item in advice if item.status in ("missing", "invalid")]
+        if not missing:
+            QtWidgets.QMessageBox.information(self, "Check Indexes", text)
+            return
+
+        answer = QtWidgets.QMessageBox.question(
+            self,
+            "Check Indexes",
+            text + "\n\nCreate the missing indexes and rebuild the invalid ones? "
+            "They are built in the background without locking the tables.",
+        )
+        if answer == QtWidgets.QMessageBox.Yes:
+            self._create_indexes(missing)
+
+    def _create_indexes(self, missing):
+        """
+        Create the missing indexes and rebuild the invalid ones one after
+        the other in a background task.
+        """
+
+        def create(task, db_interface):
+            for done, advice in enumerate(missing):
+                if task.isCanceled():
+                    return done
+                db_interface.create_index(advice)
+                task.setProgress(100 * (done + 1) / len(missing))
+            return len(missing)
+
+        def finished(exception, created=None):
+            if exception is not None:
+                message = "Error creating indexes: {}".format(exception)
+                level = Qgis.Warning
+            else:
+                message = "{} indexes created.".format(created)
+                level = Qgis.Info
+            self.dbVersion.setText(message)
+            QgsMessageLog.logMessage(message, tag="3D CityDB Plugin", level=level)
+
+        self.dbVersion.setText("Creating indexes...")
+        self.index_task = QgsTask.fromFunction(
+            "Create 3D CityDB indexes", create, self.db_interface, on_finished=finished
+        )
+        QgsApplication.taskManager().addTask(self.index_task)
+
+    def _tile_cache(self):
+        """
+        Return the tile cache, opening it on first use.
+        None if the cache is disabled or cannot be opened.
+        """
+
+        if not settings.value("cache/enabled", True, type=bool):
+            return None
+
+        if self.tile_cache is None:
+            path = os.path.join(
+                QgsApplication.qgisSettingsDirPath(), "citydb_explorer", "tiles.sqlite"
+            )
+            max_age = settings.value("cache/maxAge", 24, type=float)
+            try:
+                self.tile_cache = TileCache(
+                    path,
+                    max_bytes=settings.value("cache/maxSize", 256, type=int) * 1024 ** 2,
+                    max_age=max_age * 3600 if max_age > 0 else None,
+                )
+            except TileCacheException as error:
+                QgsMessageLog.logMessage(
+                    str(error), tag="3D CityDB Plugin", level=Qgis.Warning
+                )
+                return None
+
+        return self.tile_cache
+
+    def _attribute_cache(self):
+        """
+        Create the cache of generic attributes for a new connection.
+        """
+
+        ttl = settings.value("attributes/cacheTtl", 0, type=float)
+        return AttributeCache(
+            max_entries=settings.value("attributes/cacheSize", 256, type=int),
+            ttl=ttl if ttl > 0 else None,
+        )
+
+    def _level_of_detail(self) -> str:
+        """
+        Choose the geometry to load for the current map scale: envelopes
+        at overview scales, LOD1 at mid scales and LOD2 when zoomed in.
+        """
+
+        scale = self.iface.mapCanvas().scale()
+
+        if scale >= settings.value("lod/envelopeScale", 50000, type=float):
+            return "envelope"
+        if scale >= settings.value("lod/lod1Scale", 10000, type=float):
+            return "lod1"
+        return "lod2"
+
+    def _simplify_tolerance(self):
+        """
+        Return the simplification tolerance for the current map scale,
+        None if simplification is disabled.
+        """
+
+        pixels = settings.value("simplify/pixels", 0, type=float)
+        if pixels <= 0:
+            return None
+
+        tolerance = self.iface.mapCanvas().mapUnitsPerPixel() * pixels
+
+        # Round to a power of two, so the cached tiles are reused
+        # until the scale changes by a factor of two.
+        return 2.0 ** round(math.log2(tolerance))
+
+    def _workers(self) -> int:
+        """
+        Number of connections a building load uses at the same time.
+        """
+
+        return max(settings.value("parallel/workers", 4, type=int), 1)
+
+    def _building_loader(self) -> BuildingLoader:
+        """
+        Create a loader for the connected database with the current options.
+        """
+
+        # Decimals of the compact TWKB transfer, -1 for full precision WKB.
+        # More decimals than TWKB keeps would only give the cached tiles
+        # another name.
+        precision = settings.value("transfer/precision", -1, type=int)
+        precision = min(precision, TWKB_PRECISION[1])
+
+        return BuildingLoader(
+            self.db_interface,
+            self.srs,
+            self.db_interface.connection_key,
+            tile_cache=self._tile_cache(),
+            tile_size=settings.value("cache/tileSize", 500, type=float),
+            max_tiles=settings.value("cache/maxTiles", 64, type=int),
+            precision=None if precision < 0 else precision,
+            precomputed=self.building_table,
+            lod=self._level_of_detail(),
+            tolerance=self._simplify_tolerance(),
+            attributes=settings.value("attributes/load", False, type=bool),
+        )
+
+    def _start_load(self, task):
+        """
+        Run a building load task in the background, cancelling the
+        running one: its extent is outdated.
+        """
+
+        self._cancel_load()
+
+        task.batchLoaded.connect(
+            lambda tile, rows: self._add_loaded_batch(task, tile, rows)
+        )
+        task.taskCompleted.connect(lambda: self._load_finished(task))
+        task.taskTerminated.connect(lambda: self._load_finished(task))
+
+        self.load_task = task
+        QgsApplication.taskManager().addTask(task)
+
+    def _cancel_load(self):
+        """
+        Cancel the running building load, aborting its query.
+        """
+
+        if self.load_task is not None:
+            self.load_task.cancel()
+            self.load_task = None
+
+    def _add_loaded_batch(self, task, tile, rows):
+        """
+        Add a batch loaded by a BuildingLoadTask to the building layer.
+        """
+
+        if task is not self.load_task or not self.building_layer.is_valid():
+            return
+
+        if tile is None:
+            self.building_layer.add_batch(rows)
+            self.last_building_id = rows[-1][0]
+        else:
+            self.building_layer.add_tile(tile, rows)
+
+    def _load_finished(self, task):
+        """
+        Update the widget once a BuildingLoadTask ended.
+        """
+
+        if task is not self.load_task:
+            return
+        self.load_task = None
+
+        if task.exception is not None:
+            QgsMessageLog.logMessage(
+                "Error loading buildings: {}".format(task.exception),
+                tag="3D CityDB Plugin",
+                level=Qgis.Warning,
+            )
+
+        # Tiles are complete. Every building scanned for a page is loaded,
+        # see iter_buildings, so a short page means the extent has no more.
+        self.loadMore.setEnabled(task.tiles is None and task.loaded == task.limit)
+
+        self._log_cache_stats(task.loader)
+
+    def _load_buildings(self):
+        """
+        Load the next page of buildings of the current extent into the
+        building layer. A page holds up to Max Features buildings.
         """
 
-        connection_parameters = self._connection_parameters()
-        extent = self.iface.mapCanvas().extent()
         limit = int(self.maxFeatures.text())
 
-        sql_building = self.db_interface.sql_building(extent, self.srs, limit)
+        self._start_load(
+            BuildingLoadTask(
+                self._building_loader(),
+                self.iface.mapCanvas().extent(),
+                limit=limit,
+                after_id=self.last_building_id,
+                workers=self._workers(),
+            )
+        )
 
-        uri = QgsDataSourceUri()
-        uri.setConnection(*connection_parameters.values())
+    def _log_cache_stats(self, loader):
+        """
+        Log the counters of the tile cache used by the loader.
+        """
 
-        uri.setUseEstimatedMetadata(True)
+        if loader.tile_cache is not None:
+            QgsMessageLog.logMessage(
+                "Tile cache: {hits} hits, {misses} misses, "
+                "{tiles} tiles, {bytes} bytes".format(**loader.tile_cache.stats()),
+                tag="3D CityDB Plugin",
+                level=Qgis.Info,
+            )
 
-        uri.setDataSource("", "(" + sql_building + ")", "geom", "", "id")
+    def load_more_buildings(self):
+        """
+        Load the next page of buildings of the current extent.
+        """
 
-        return uri.uri()
+        if self.building_layer is None or not self.building_layer.is_valid():
+            return
+        self._load_buildings()
 
     def _add_building_layer(self):
         """"""
-        uri = self._create_buildings_uri()
-        virtual_layer = QgsVectorLayer(uri, "3D CityDB Buildings", "postgres")
-        QgsProject.instance().addMapLayer(virtual_layer)
+        if self.building_layer is None or not self.building_layer.is_valid():
+            self.building_layer = BuildingLayer(self.srs)
+            QgsProject.instance().addMapLayer(self.building_layer.layer)
 
-        # We need to update the uri on every zoom change
-        self.iface.mapCanvas().extentsChanged.connect(self._update_layer_uri)
+        # The layer is then updated on every zoom change by _refresh.
+        self._update_building_layer()
 
-    def _update_layer_uri(self):
+    def _update_building_layer(self):
         """
-        Update the layer uri
+        Update the buildings for the current extent. Small extents are
+        loaded by tile, only fetching the tiles that became visible;
+        larger ones replace the buildings with a new page.
         """
-        try:
-            layer = QgsProject.instance().mapLayersByName("3D CityDB Buildings")[0]
-        except IndexError:
-            # TODO Remove signal
-            pass
-        else:
-            uri = self._create_buildings_uri()
-            layer.setDataSource(uri, "3D CityDB Buildings", "postgres")
-            layer.triggerRepaint()
+        if self.building_layer is None or not self.building_layer.is_valid():
+            return
+
+        # The running load is for an outdated extent.
+        self._cancel_load()
+
+        loader = self._building_loader()
+        extent = self.iface.mapCanvas().extent()
+        tiles = loader.tiles(extent)
+
+        if self.building_layer.lod != loader.cache_lod:
+            # The scale crossed a threshold, replace all the geometries.
+            self.building_layer.clear()
+            self.building_layer.lod = loader.cache_lod
+
+        if tiles is None:
+            self.building_layer.clear()
+            self.last_building_id = 0
+            self._load_buildings()
+            return
+
+        if not self.building_layer.tiled:
+            # Drop the page loaded for a larger extent.
+            self.building_layer.clear()
+
+        # Keep the tiles around the extent, so panning back is free.
+        margin = settings.value("delta/keepMargin", 1.0, type=float)
+        keep = extent.buffered(max(extent.width(), extent.height()) * margin)
+        self.building_layer.evict_tiles(loader.tiles(keep) or tiles)
+
+        limit = int(self.maxFeatures.text())
+        center = extent.center()
+
+        def distance(tile):
+            dx = (tile[0] + 0.5) * loader.tile_size - center.x()
+            dy = (tile[1] + 0.5) * loader.tile_size - center.y()
+            return dx * dx + dy * dy
+
+        # Nearest tiles first, so Max Features keeps the center of the view.
+        missing = sorted(tiles - self.building_layer.tiles.keys(), key=distance)
+        self.loadMore.setEnabled(False)
+        if not missing:
+            return
+
+        self._start_load(
+            BuildingLoadTask(
+                loader,
+                extent,
+                tiles=missing,
+                limit=max(limit - len(self.building_layer.feature_ids), 0),
+                known_ids=self.building_layer.feature_ids.keys(),
+                workers=self._workers(),
+            )
+        )
 
     def _edit_generic(self):
         """
         Edit generic attributes
         """
-        layer = self.iface.activeLayer()
         canvas = self.iface.mapCanvas()
 
         if self.attribute_editor is not None:
             # Deactivating
             self.attribute_editor.deactivate()
             self.attribute_editor = None
-        else:
-            self.attribute_editor = EditGenericAttributes(canvas, layer)
+        elif self.building_layer is not None and self.building_layer.is_valid():
+            self.attribute_editor = EditGenericAttributes(canvas, self.building_layer)
             canvas.setMapTool(self.attribute_editor)
-            self.attribute_editor.identifier.featureIdentified.connect(
-                self._open_edit_generic
-            )
+            self.attribute_editor.featureIdentified.connect(self._open_edit_generic)
 
     def _open_edit_generic(self, feature):
         """
         Open edit window
         """
-        feature_id = feature.id()
-        sql_query = """
-                    WITH attribute_table AS (
-                        SELECT
-                        building.id as id,
-                        generic.attrname,
-                        generic.strval,
-                        generic.realval,
-                        generic.intval
-                        FROM
-                            citydb.building building
-                        FULL JOIN
-                            citydb.cityobject_genericattrib generic
-                        ON building.id = generic.cityobject_id
-                        WHERE building.id = {}
-                        ORDER BY building.id, attrname
-                    )
-
-                    SELECT
-                        id,
-                        array_agg(attrname) as attributes,
-                        array_agg(strval) as string_value,
-                        array_agg(intval) as integer_value,
-                        array_agg(realval) as real_value
-                        from attribute_table group by id order by id;
-                """.format(
-            feature_id
-        )
+        feature_id = feature["id"]
+        combination = self.db_interface.generic_attributes(feature_id)
 
-        with self.db_interface.connection.cursor() as cursor:
+        # The dialogs are only loaded when first opened.
+        from .attribute_dialog import AttributeDialog
 
-            cursor.execute(sql_query)
-            query_results = cursor.fetchall()
-
-            """ QgsMessageLog.logMessage(
-                "Data from database: {}".format(query_results),
-                tag="3D CityDB Plugin",
-                level=Qgis.Info,
-            ) """
-
-            # TODO Fix it
-            combination = zip(
-                query_results[0][1],
-                query_results[0][2],
-                query_results[0][3],
-                query_results[0][4],
-            )
-
-            self.attribute_dialog = AttributeDialog(combination, feature_id)
-            self.attribute_dialog.buttonBox.clicked.connect(self._save_edit_generic)
-            self.attribute_dialog.exec_()
+        self.attribute_dialog = AttributeDialog(combination, feature_id)
+        self.attribute_dialog.buttonBox.clicked.connect(self._save_edit_generic)
+        self.attribute_dialog.exec_()
 
     def _save_edit_generic(self, button):
         """
+        Save the attributes changed in the edit dialog, all in one
+        statement and one transaction.
+
         Args:
-            id ([type]): [description]
-            combination ([type]): [description]
+            button (QAbstractButton): the dialog button clicked
         """
 
         if button.text() == "Save":
 
-            table = self.attribute_dialog.tableWidget
             feature_id = self.attribute_dialog.feature_id
-            rows = table.rowCount()
-
-            for row in range(rows):
-                # values = [table.item(row, column).text() for column in range(columns)]
-                attribute_name = table.item(row, 0).text()
-
-                string_value = table.item(row, 1).text()
-
-                try:
-                    int_value = int(table.item(row, 2).text())
-                except ValueError:
-                    int_value = None
+            changed = self.attribute_dialog.changed_attributes()
+            if not changed:
+                self.attribute_dialog.statusText.setText("No changes to save.")
+                return
 
-                try:
-                    real_value = float(table.item(row, 3).text())
-                except ValueError:
-                    real_value = None
-                connection = self.db_interface.connection
-
-                cursor = connection.cursor()
+            attribute_cache = self.db_interface.attribute_cache
 
+            with self.db_interface.connection() as connection:
                 try:
-                    QgsMessageLog.logMessage(
-                        "Committing {} {} {} {} {}".format(
-                            string_value,
-                            int_value,
-                            real_value,
-                            feature_id,
-                            attribute_name,
-                        ),
-                        tag="3D CityDB Plugin",
-                        level=Qgis.Info,
-                    )
-                    cursor.execute(
-                        """
-                        UPDATE
-                            citydb.cityobject_genericattrib
-                        SET
-                            (strval, intval, realval) = (%s, %s, %s)
-                        WHERE
-                            cityobject_id = %s
-                        AND
-                            attrname = %s
-                    """,
-                        (
-                            string_value,
-                            int_value,
-                            real_value,
-                            feature_id,
-                            attribute_name,
-                        ),
-                    )
+                    with connection.cursor() as cursor:
+                        updated = self.db_interface.update_generic_attributes(
+                            cursor, feature_id, changed
+                        )
+                    connection.commit()
                 except Exception:
                     QgsMessageLog.logMessage(
                         "Error executing query",
@@ -342,23 +888,191 @@ class CityDbExplorerDockWidget(QtWidgets.QDockWidget, FORM_CLASS):
                         level=Qgis.Warning,
                     )
                     connection.rollback()
+                    if attribute_cache is not None:
+                        attribute_cache.invalidate(feature_id)
                     self.attribute_dialog.statusText.setText("Error saving data.")
-                else:
-                    connection.commit()
-                    QgsMessageLog.logMessage(
-                        "Committed data", tag="3D CityDB Plugin", level=Qgis.Info
-                    )
-                    self.attribute_dialog.statusText.setText("Data saved.")
+                    return
+
+            QgsMessageLog.logMessage(
+                "Committed {} attributes of building {}".format(updated, feature_id),
+                tag="3D CityDB Plugin",
+                level=Qgis.Info,
+            )
+
+            # The saved values are the new reference for the next save.
+            attributes = self.attribute_dialog.attributes()
+            self.attribute_dialog.original = attributes
+            if attribute_cache is not None:
+                attribute_cache.put(feature_id, attributes)
+            self._attributes_changed([feature_id])
+            self.attribute_dialog.statusText.setText("Data saved.")
+
+    def _attributes_changed(self, building_ids):
+        """
+        Update the attributes loaded in the building layer and drop the
+        cached tiles of edited buildings.
+
+        Args:
+            building_ids (list): ids of the edited buildings, None for any
+        """
+
+        if building_ids is None:
+            # Unknown buildings were edited: load them all again.
+            if self.tile_cache is not None:
+                self.tile_cache.clear()
+            if self.building_layer is not None and self.building_layer.is_valid():
+                self.building_layer.lod = None
+                self._update_building_layer()
+            return
+
+        if self.tile_cache is not None:
+            self.tile_cache.invalidate_buildings(
+                self.db_interface.connection_key, building_ids
+            )
+
+        if self.building_layer is not None and self.building_layer.is_valid():
+            # Read them back as loaded: the dialog only edits some of them.
+            try:
+                loaded = self.db_interface.building_attributes(building_ids)
+            except PostgreSQLInterfaceException as error:
+                QgsMessageLog.logMessage(
+                    str(error), tag="3D CityDB Plugin", level=Qgis.Warning
+                )
+                return
+            for building_id, attributes in loaded.items():
+                self.building_layer.update_attributes(building_id, attributes)
+
+    def _bulk_edit_generic(self):
+        """
+        Open the bulk edit window for the selected buildings, the buildings
+        in view or all buildings.
+        """
+
+        if self.db_interface is None:
+            return
+
+        selected = []
+        if self.building_layer is not None and self.building_layer.is_valid():
+            selected = [
+                feature["id"] for feature in self.building_layer.layer.selectedFeatures()
+            ]
+
+        from .bulk_attribute_dialog import BulkAttributeDialog
+
+        self.bulk_dialog = BulkAttributeDialog(len(selected))
+        self.bulk_dialog.buttonBox.clicked.connect(
+            lambda button: self._apply_bulk_edit(button, selected)
+        )
+        # A running edit goes on when the dialog is closed, its result is then
+        # shown in the message bar.
+        self.bulk_dialog.exec_()
+
+    def _apply_bulk_edit(self, button, selected):
+        """
+        Start the bulk edit of the dialog in a background task.
+        """
+
+        dialog = self.bulk_dialog
+        if dialog.buttonBox.buttonRole(button) != dialog.buttonBox.ApplyRole:
+            return
+        if self.bulk_task is not None:
+            # The edit of a closed dialog may still be running.
+            dialog.statusText.setText("Another bulk edit is still running.")
+            return
 
-    def closeEvent(self, event):
         try:
-            self.iface.mapCanvas().extentsChanged.disconnect(self._update_layer_uri)
-        except TypeError:
-            # TODO Fix
-            pass
+            edit = dialog.edit()
+        except ValueError as error:
+            dialog.statusText.setText(str(error))
+            return
+
+        scope = dialog.scope()
+        targets = {}
+        if scope == "selection":
+            targets["building_ids"] = selected
+        elif scope == "view":
+            targets["extent"] = self.iface.mapCanvas().extent()
+            targets["epsg"] = self.srs
+        else:
+            targets["all_buildings"] = True
+        targets["attribute"], targets["value"] = dialog.attribute_filter()
+        if targets["attribute"] is None:
+            del targets["attribute"], targets["value"]
+
+        task = BulkEditTask(self.db_interface, targets, **edit)
+        task.progressChanged.connect(
+            lambda progress: dialog.progressBar.setValue(int(progress))
+        )
+        task.taskCompleted.connect(lambda: self._bulk_edit_finished(task, dialog))
+        task.taskTerminated.connect(lambda: self._bulk_edit_finished(task, dialog))
+
+        button.setEnabled(False)
+        dialog.progressBar.setValue(0)
+        dialog.statusText.setText("Editing...")
+        self.bulk_task = task
+        QgsApplication.taskManager().addTask(task)
+
+    def _bulk_edit_finished(self, task, dialog):
+        """
+        Report the result of a bulk edit.
+        """
+
+        if task is self.bulk_task:
+            self.bulk_task = None
+        dialog.buttonBox.button(dialog.buttonBox.Apply).setEnabled(True)
+
+        if task.counts is None:
+            if task.exception is not None:
+                message = "Error: {}".format(task.exception)
+            else:
+                message = "Cancelled, nothing was changed."
+            QgsMessageLog.logMessage(
+                "Bulk edit: {}".format(message),
+                tag="3D CityDB Plugin",
+                level=Qgis.Warning,
+            )
+            dialog.statusText.setText(message)
+            if not dialog.isVisible():
+                self.iface.messageBar().pushMessage(
+                    "Bulk edit", message, level=Qgis.Warning
+                )
+            return
+
+        # The cached attributes of the edited buildings are outdated.
+        if task.db_interface.attribute_cache is not None:
+            task.db_interface.attribute_cache.clear()
+        if settings.value("attributes/load", False, type=bool):
+            self._attributes_changed(None)
+
+        message = (
+            "{buildings} buildings: {updated} attributes updated, "
+            "{inserted} added, {deleted} deleted.".format(
+                buildings=task.buildings, **task.counts
+            )
+        )
+        QgsMessageLog.logMessage(message, tag="3D CityDB Plugin", level=Qgis.Info)
+        dialog.statusText.setText(message)
+        if not dialog.isVisible():
+            self.iface.messageBar().pushMessage("Bulk edit", message, level=Qgis.Info)
+
+    def closeEvent(self, event):
+        self.refresh_scheduler.cancel()
+        self.stats_timer.stop()
+        self._cancel_load()
+        self._cancel_count()
+        # Closing the connections rolls back a running bulk edit anyway, the
+        # task reports it.
+        if self.bulk_task is not None:
+            self.bulk_task.cancel()
 
         # close connection to db
-        self.db_interface.close_connection()
+        if self.db_interface is not None:
+            self.db_interface.close_connection()
+            self.db_interface = None
+
+        if self.tile_cache is not None:
+            self.tile_cache.close()
+            self.tile_cache = None
 
         self.closingPlugin.emit()
         event.accept()
@@ -0,0 +1,57 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+"""
+Precompile the Qt Designer forms of ui/ into Python modules, so the
+plugin does not parse the XML when it opens a widget. Run from a Python
+with PyQt5, e.g. the one of QGIS, before packaging the plugin:
+
+    python compile_forms.py
+"""
+
+import glob
+import os
+import sys
+
+from PyQt5 import uic
+
+# Directory of the Qt Designer files, the one of forms.load_form.
+UI_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ui")
+
+
+def main() -> int:
+    for path in sorted(glob.glob(os.path.join(UI_DIRECTORY, "*.ui"))):
+        name = os.path.splitext(os.path.basename(path))[0]
+        target = os.path.join(UI_DIRECTORY, "ui_{}.py".format(name))
+        with open(target, "w") as module:
+            uic.compileUi(path, module)
+        print("{} -> {}".format(path, target))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class AttributeCache:
+    """
+    Bounded LRU cache of the generic attributes of buildings, by building
+    id, so opening the same building again does not query the database.
+    Entries older than ttl seconds are ignored, if a ttl is set.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = None):
+        """Create the cache
+
+        Args:
+            max_entries (int): number of buildings kept, the least
+                recently used are evicted first
+            ttl (float): seconds an entry stays valid, None for no limit
+        """
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get(self, building_id: int):
+        """
+        Return the cached attributes of a building, None if missing or expired.
+        """
+
+        with self._lock:
+            entry = self._entries.get(building_id)
+            if entry is None:
+                return None
+
+            stored, attributes = entry
+            if self.ttl is not None and time.monotonic() - stored > self.ttl:
+                del self._entries[building_id]
+                return None
+
+            self._entries.move_to_end(building_id)
+            return list(attributes)
+
+    def put(self, building_id: int, attributes: list):
+        """
+        Store the attributes of a building.
+        """
+
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[building_id] = (time.monotonic(), list(attributes))
+            self._entries.move_to_end(building_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, building_id: int):
+        """
+        Forget the attributes of a building.
+        """
+
+        with self._lock:
+            self._entries.pop(building_id, None)
+
+    def clear(self):
+        """
+        Forget every building.
+        """
+
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,305 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+
+from collections import namedtuple
+
+from psycopg2 import sql
+
+# Index the plugin queries rely on: table of the citydb schema, key
+# columns, access method and the queries it serves.
+RecommendedIndex = namedtuple(
+    "RecommendedIndex", ["table", "columns", "method", "purpose"]
+)
+
+RECOMMENDED_INDEXES = (
+    RecommendedIndex(
+        "cityobject", ("envelope",), "gist", "building count and envelope extent queries"
+    ),
+    RecommendedIndex(
+        "surface_geometry", ("geometry",), "gist", "LOD2 surfaces in the extent"
+    ),
+    RecommendedIndex(
+        "surface_geometry", ("root_id",), "btree", "surfaces of a geometry"
+    ),
+    RecommendedIndex(
+        "thematic_surface",
+        ("lod2_multi_surface_id",),
+        "btree",
+        "thematic surface of a LOD2 geometry",
+    ),
+    RecommendedIndex(
+        "thematic_surface", ("building_id",), "btree", "surfaces of a building"
+    ),
+    RecommendedIndex(
+        "building", ("building_root_id",), "btree", "parts of a building"
+    ),
+    RecommendedIndex(
+        "cityobject_genericattrib",
+        ("cityobject_id", "attrname"),
+        "btree",
+        "generic attributes of a building",
+    ),
+)
+
+# Advice for one recommended index, or one unused index of the tables.
+# status is "ok", "missing", "invalid" (left by a failed concurrent build,
+# never used by queries) or "unused"; index, scans and size describe the
+# existing index, rows is the estimated size of the table.
+IndexAdvice = namedtuple(
+    "IndexAdvice",
+    [
+        "table",
+        "columns",
+        "method",
+        "purpose",
+        "status",
+        "index",
+        "scans",
+        "size",
+        "rows",
+    ],
+)
+
+# Indexes of the tables of the recommended indexes, with their key columns
+# in order, access method, usage, size and validity.
+INDEXES_SQL = """
+    SELECT
+        tab.relname,
+        idx.relname,
+        am.amname,
+        ARRAY(
+            SELECT att.attname
+            FROM unnest(ind.indkey) WITH ORDINALITY AS key (attnum, position)
+            JOIN pg_attribute att
+                ON att.attrelid = tab.oid AND att.attnum = key.attnum
+            ORDER BY key.position
+        ),
+        ind.indisprimary OR ind.indisunique,
+        stat.idx_scan,
+        pg_relation_size(idx.oid),
+        tab.reltuples::bigint,
+        ind.indisvalid
+    FROM
+        pg_index ind
+    JOIN
+        pg_class tab ON tab.oid = ind.indrelid
+    JOIN
+        pg_class idx ON idx.oid = ind.indexrelid
+    JOIN
+        pg_namespace nsp ON nsp.oid = tab.relnamespace
+    JOIN
+        pg_am am ON am.oid = idx.relam
+    LEFT JOIN
+        pg_stat_user_indexes stat ON stat.indexrelid = ind.indexrelid
+    WHERE
+        nsp.nspname = 'citydb'
+    AND
+        tab.relname = ANY(%(tables)s)
+"""
+
+# Rows of the tables, for the tables without any index.
+TABLE_ROWS_SQL = """
+    SELECT
+        tab.relname, tab.reltuples::bigint
+    FROM
+        pg_class tab
+    JOIN
+        pg_namespace nsp ON nsp.oid = tab.relnamespace
+    WHERE
+        nsp.nspname = 'citydb'
+    AND
+        tab.relname = ANY(%(tables)s)
+"""
+
+# Indexes smaller than this are not reported as unused.
+UNUSED_MIN_SIZE = 1024 * 1024
+
+
+def advise(indexes: list, table_rows: dict) -> list:
+    """Compare the existing indexes to the recommended ones
+
+    An existing index covers a recommendation if it has the same access
+    method and its leading key columns are the recommended ones. An invalid
+    index covering a recommendation is reported to be rebuilt.
+
+    Args:
+        indexes (list): rows of INDEXES_SQL
+        table_rows (dict): estimated rows by table
+
+    Returns:
+        list: IndexAdvice of every recommended index, then of the unused
+            indexes of the tables
+    """
+
+    advice = []
+    covering = set()
+
+    for recommended in RECOMMENDED_INDEXES:
+        found = None
+        for row in indexes:
+            table, name, method, columns = row[:4]
+            leading = tuple(columns[: len(recommended.columns)])
+            if (
+                table == recommended.table and
+                method == recommended.method and
+                leading == recommended.columns
+            ):
+                # Prefer a valid index over an invalid one.
+                if found is None or row[8]:
+                    found = row
+                if row[8]:
+                    break
+
+        if found is None:
+            advice.append(
+                IndexAdvice(
+                    *recommended,
+                    status="missing",
+                    index=None,
+                    scans=None,
+                    size=None,
+                    rows=table_rows.get(recommended.table, 0),
+                )
+            )
+            continue
+
+        covering.add(found[1])
+        if not found[8]:
+            status = "invalid"
+        elif found[5] == 0:
+            status = "unused"
+        else:
+            status = "ok"
+        advice.append(
+            IndexAdvice(
+                *recommended,
+                status=status,
+                index=found[1],
+                scans=found[5],
+                size=found[6],
+                rows=found[7],
+            )
+        )
+
+    for table, name, method, columns, unique, scans, size, rows, valid in indexes:
+        if name in covering or unique or not valid:
+            continue
+        if scans != 0 or size < UNUSED_MIN_SIZE:
+            continue
+        advice.append(
+            IndexAdvice(
+                table,
+                tuple(columns),
+                method,
+                "not used by the plugin",
+                status="unused",
+                index=name,
+                scans=scans,
+                size=size,
+                rows=rows,
+            )
+        )
+
+    return advice
+
+
+def index_name(advice: IndexAdvice) -> str:
+    """
+    Name of the index created for a missing recommendation.
+    """
+
+    return "{}_{}_cdbx_idx".format(advice.table, "_".join(advice.columns))
+
+
+def drop_index_sql(advice: IndexAdvice) -> sql.Composed:
+    """
+    Statement dropping an invalid index without locking its table.
+    """
+
+    return sql.SQL("DROP INDEX CONCURRENTLY IF EXISTS {}").format(
+        sql.Identifier("citydb", advice.index)
+    )
+
+
+def create_index_sql(advice: IndexAdvice) -> sql.Composed:
+    """
+    Statement creating a missing index without locking writes to its table.
+    """
+
+    SQL = "CREATE INDEX CONCURRENTLY IF NOT EXISTS {} ON {} USING {} ({})"
+
+    return sql.SQL(SQL).format(
+        sql.Identifier(index_name(advice)),
+        sql.Identifier("citydb", advice.table),
+        sql.Identifier(advice.method),
+        sql.SQL(", ").join(sql.Identifier(column) for column in advice.columns),
+    )
+
+
+def report(advice: list) -> str:
+    """
+    Describe the missing, invalid and unused indexes, with their estimated
+    impact.
+    """
+
+    lines = []
+    for item in advice:
+        if item.status == "missing":
+            lines.append(
+                "Missing index on {}({}) using {}: {} scan ~{} rows "
+                "sequentially.".format(
+                    item.table,
+                    ", ".join(item.columns),
+                    item.method,
+                    item.purpose[:1].upper() + item.purpose[1:],
+                    item.rows,
+                )
+            )
+        elif item.status == "invalid":
+            lines.append(
+                "Invalid index {} on {}({}): {} scan ~{} rows sequentially "
+                "until it is rebuilt.".format(
+                    item.index,
+                    item.table,
+                    ", ".join(item.columns),
+                    item.purpose[:1].upper() + item.purpose[1:],
+                    item.rows,
+                )
+            )
+        elif item.status == "unused":
+            lines.append(
+                "Unused index {} on {}({}), {} kB: {}, no scan since the statistics "
+                "were reset.".format(
+                    item.index,
+                    item.table,
+                    ", ".join(item.columns),
+                    item.size // 1024,
+                    item.purpose,
+                )
+            )
+
+    return "\n".join(lines)
@@ -0,0 +1,119 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+import json
+import os
+import threading
+import time
+
+
+class MetadataCache:
+    """
+    Cache of the database metadata, kept in memory and in a JSON file,
+    so reconnecting to a known database does not query it again.
+    Entries older than ttl seconds are ignored.
+    """
+
+    def __init__(self, path=None, ttl: float = 24 * 3600):
+        """Create the cache
+
+        Args:
+            path (str): JSON file, None to only cache in memory
+            ttl (float): seconds an entry stays valid
+        """
+
+        self.path = path
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._entries = self._read()
+
+    def _read(self) -> dict:
+        """
+        Read the entries stored on disk.
+        """
+
+        if self.path is None or not os.path.exists(self.path):
+            return {}
+
+        try:
+            with open(self.path) as cache_file:
+                entries = json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+
+        return entries if isinstance(entries, dict) else {}
+
+    def _write(self):
+        """
+        Store the entries on disk. Must be called holding the lock.
+        """
+
+        if self.path is None:
+            return
+
+        directory = os.path.dirname(self.path)
+        temporary = self.path + ".tmp"
+        try:
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(temporary, "w") as cache_file:
+                json.dump(self._entries, cache_file)
+            os.replace(temporary, self.path)
+        except OSError:
+            # The cache is an optimization, failing to write it is harmless.
+            pass
+
+    def get(self, key: str):
+        """
+        Return the cached metadata of a database, None if missing or expired.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is None or time.time() - entry["time"] > self.ttl:
+            return None
+
+        return entry["metadata"]
+
+    def put(self, key: str, metadata: dict):
+        """
+        Store the metadata of a database.
+        """
+
+        with self._lock:
+            self._entries[key] = {"time": time.time(), "metadata": metadata}
+            self._write()
+
+    def invalidate(self, key: str):
+        """
+        Forget the metadata of a database.
+        """
+
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._write()
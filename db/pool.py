@@ -0,0 +1,299 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+import threading
+import time
+from contextlib import contextmanager
+
+from psycopg2 import Error, InterfaceError, OperationalError, connect, extensions
+
+from .query_stats import TimedCursor
+
+
+class ConnectionPoolException(Exception):
+    """
+    Exception for ConnectionPool
+    """
+
+
+class PooledConnection(extensions.connection):
+    """
+    psycopg2 connection remembering the statements prepared on it, and
+    timing its statements in stats if set.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Names of the server-side prepared statements of this session.
+        self.prepared = set()
+        # QueryStats of the statements run on this connection.
+        self.stats = None
+        self.cursor_factory = TimedCursor
+
+
+class ConnectionPool:
+    """
+    Bounded, thread-safe pool of psycopg2 connections.
+
+    Connections are checked out with getconn() (or the connection() context
+    manager) and must be handed back with putconn(). Idle connections are
+    closed after idle_timeout seconds and are health checked before they are
+    handed out again.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        minconn: int = 1,
+        maxconn: int = 4,
+        timeout: float = 30,
+        idle_timeout: float = 300,
+        health_check_interval: float = 30,
+        stats=None,
+    ):
+        """Create the pool. No connection is opened until it is needed.
+
+        Args:
+            dsn (str): libpq connection string
+            minconn (int): idle connections kept open by the eviction
+            maxconn (int): max number of connections open at the same time
+            timeout (float): seconds to wait for a free connection
+            idle_timeout (float): seconds before an idle connection is closed
+            health_check_interval (float): idle seconds after which a
+                connection is tested with a query before being handed out
+            stats (QueryStats): statistics of the statements run on the
+                connections, None to not time them
+        """
+
+        if maxconn < 1 or minconn > maxconn:
+            raise ConnectionPoolException("Invalid pool size")
+
+        self.dsn = dsn
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.stats = stats
+
+        # Idle connections as (connection, returned_at), most recent last.
+        self._idle = []
+        # Number of open connections, idle or checked out.
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        """
+        Number of open connections.
+        """
+
+        with self._condition:
+            return self._size
+
+    def _connect(self):
+        """
+        Open a new connection.
+        """
+
+        try:
+            connection = connect(self.dsn, connection_factory=PooledConnection)
+        except OperationalError:
+            raise ConnectionPoolException("Error connecting to database")
+
+        connection.stats = self.stats
+        return connection
+
+    def _discard(self, connection):
+        """
+        Close a connection that will not be handed out anymore.
+        Must be called without holding the lock.
+        """
+
+        try:
+            connection.close()
+        except (Error, InterfaceError):
+            pass
+
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    def _healthy(self, connection, returned_at: float) -> bool:
+        """
+        Check if an idle connection can still be used.
+        """
+
+        if connection.closed:
+            return False
+
+        if time.monotonic() - returned_at < self.health_check_interval:
+            return True
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            connection.rollback()
+        except (Error, OperationalError):
+            return False
+
+        return True
+
+    def _evict_idle(self) -> list:
+        """
+        Remove the connections idle for longer than idle_timeout, keeping
+        minconn of them. Must be called holding the lock; the returned
+        connections have to be discarded after releasing it.
+        """
+
+        now = time.monotonic()
+        expired = []
+        keep = []
+
+        # Oldest first, so the most recently used connections survive.
+        for connection, returned_at in self._idle:
+            if (
+                now - returned_at > self.idle_timeout and
+                self._size - len(expired) > self.minconn
+            ):
+                expired.append(connection)
+            else:
+                keep.append((connection, returned_at))
+
+        self._idle = keep
+
+        return expired
+
+    def getconn(self):
+        """
+        Check out a connection, waiting up to timeout seconds
+        if the pool is exhausted.
+        """
+
+        deadline = time.monotonic() + self.timeout
+
+        while True:
+            candidate = None
+            create = False
+
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise ConnectionPoolException("Connection pool is closed")
+
+                    expired = self._evict_idle()
+                    if expired:
+                        break
+
+                    if self._idle:
+                        candidate = self._idle.pop()
+                        break
+
+                    if self._size < self.maxconn:
+                        # Reserve the slot before connecting outside the lock.
+                        self._size += 1
+                        create = True
+                        break
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise ConnectionPoolException(
+                            "Timeout waiting for a database connection"
+                        )
+                    self._condition.wait(remaining)
+
+            if not candidate and not create:
+                for connection in expired:
+                    self._discard(connection)
+                continue
+
+            if create:
+                try:
+                    return self._connect()
+                except ConnectionPoolException:
+                    with self._condition:
+                        self._size -= 1
+                        self._condition.notify()
+                    raise
+
+            connection, returned_at = candidate
+            if self._healthy(connection, returned_at):
+                return connection
+
+            self._discard(connection)
+
+    def putconn(self, connection, close: bool = False):
+        """
+        Return a connection to the pool. An open transaction is
+        rolled back so the next user gets a clean connection.
+        """
+
+        if not close and not connection.closed:
+            try:
+                status = connection.info.transaction_status
+                if status != extensions.TRANSACTION_STATUS_IDLE:
+                    connection.rollback()
+            except (Error, InterfaceError):
+                close = True
+        else:
+            close = True
+
+        with self._condition:
+            if not close and not self._closed:
+                self._idle.append((connection, time.monotonic()))
+                self._condition.notify()
+                return
+
+        self._discard(connection)
+
+    @contextmanager
+    def connection(self):
+        """
+        Context manager checking out a connection and
+        returning it to the pool on exit.
+        """
+
+        connection = self.getconn()
+        try:
+            yield connection
+        finally:
+            self.putconn(connection)
+
+    def closeall(self):
+        """
+        Close the idle connections and refuse new checkouts. Connections
+        still checked out are closed when they are returned.
+        """
+
+        with self._condition:
+            self._closed = True
+            idle = [connection for connection, _ in self._idle]
+            self._idle = []
+            self._condition.notify_all()
+
+        for connection in idle:
+            self._discard(connection)
@@ -24,8 +24,15 @@
 # M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
 #
 #####################################################################################
+import itertools
+import re
 import warnings
-from psycopg2 import Error, InterfaceError, OperationalError, connect
+
+from psycopg2 import Error, OperationalError
+from psycopg2.extras import execute_values
+
+from . import index_advisor, twkb
+from .pool import ConnectionPool, ConnectionPoolException
 
 
 class PostgreSQLInterfaceException(Exception):
@@ -34,18 +41,72 @@ class PostgreSQLInterfaceException(Exception):
     """
 
 
+# Geometries iter_buildings can fetch, from the coarsest.
+LEVELS_OF_DETAIL = ("envelope", "lod1", "lod2")
+
+# Decimals ST_AsTWKB accepts for x and y, and for z.
+TWKB_PRECISION = (-8, 7)
+TWKB_Z_PRECISION = (0, 7)
+
+# Named query parameters, as in %(name)s
+PARAMETER = re.compile(r"%\((\w+)\)s")
+
+# Generic attributes of a building as a JSON object, by name.
+ATTRIBUTES = """COALESCE((
+                    SELECT jsonb_object_agg(generic.attrname, COALESCE(
+                        to_jsonb(generic.strval),
+                        to_jsonb(generic.intval),
+                        to_jsonb(generic.realval),
+                        to_jsonb(generic.urival),
+                        to_jsonb(generic.dateval)
+                    ))
+                    FROM citydb.cityobject_genericattrib generic
+                    WHERE generic.cityobject_id = {id}
+                    AND generic.parent_genattrib_id IS NULL
+                ), '{{}}')::text"""
+
+# Operations of bulk_edit_generic_attribute.
+BULK_OPERATIONS = ("set", "update", "delete")
+
+# Generic attribute types the plugin edits, with their datatype code.
+ATTRIBUTE_TYPES = {"string": 1, "integer": 2, "real": 3}
+
+
 class PostgreSQLInterface:
     """
     PostgreSQL interface to 3D CityDB.
     """
 
-    def __init__(self, connection_dict):
-        """Create the connection to the database
+    # Counter used to give every server-side cursor a unique name.
+    _cursor_ids = itertools.count()
+
+    def __init__(
+        self,
+        connection_dict,
+        maxconn=4,
+        metadata_cache=None,
+        attribute_cache=None,
+        stats=None,
+    ):
+        """Create the connection pool to the database
 
         Args:
             connection_dict (dict): [description]
+            maxconn (int): max number of connections open at the same time
+            metadata_cache (MetadataCache): cache for metadata(), None
+                to always query the database
+            attribute_cache (AttributeCache): cache for generic_attributes(),
+                None to always query the database
+            stats (QueryStats): time the statements of the pooled connections
         """
 
+        # Identify the database in the caches, without the password.
+        self.connection_key = "{username}@{host}:{port}/{dbname}".format(
+            **connection_dict
+        )
+        self.metadata_cache = metadata_cache
+        self.attribute_cache = attribute_cache
+
         connection_string = "host={0} dbname={1} user={2} password={3} port={4}".format(
             connection_dict["host"],
             connection_dict["dbname"],
@@ -53,39 +114,152 @@ class PostgreSQLInterface:
             connection_dict["password"],
             connection_dict["port"],
         )
+        self.stats = stats
+        self.pool = ConnectionPool(connection_string, maxconn=maxconn, stats=stats)
+
+        # Open the first connection now, so wrong parameters fail early.
         try:
-            self.connection = connect(connection_string)
-        except OperationalError:
+            self.pool.putconn(self.pool.getconn())
+        except ConnectionPoolException:
             raise PostgreSQLInterfaceException("Error connecting to database")
 
-    def count_building(self, extent: dict, epsg: int) -> int:
-        """"""
+    def connection(self):
+        """
+        Context manager checking out a pooled connection.
+        Open transactions are rolled back when it is returned,
+        so callers have to commit their changes.
+        """
+
+        return self.pool.connection()
+
+    def execute_prepared(self, cursor, name: str, sql: str, parameters: dict):
+        """Execute a statement prepared once per connection
+
+        The statement is PREPAREd the first time it is used on the
+        connection of the cursor and then EXECUTEd with bound parameters,
+        so PostgreSQL parses and plans it only once.
 
-        with self.connection.cursor() as cursor:
+        Args:
+            cursor (cursor): cursor of a pooled connection
+            name (str): name of the prepared statement, unique per SQL text
+            sql (str): the statement, with %(name)s parameters
+            parameters (dict): values of the parameters
+        """
+
+        names = []
+        for parameter in PARAMETER.findall(sql):
+            if parameter not in names:
+                names.append(parameter)
+
+        connection = cursor.connection
+        if name not in connection.prepared:
+            statement = PARAMETER.sub(
+                lambda match: "${}".format(names.index(match.group(1)) + 1), sql
+            )
+            cursor.execute("PREPARE {} AS {}".format(name, statement))
+            connection.prepared.add(name)
 
+        if names:
             cursor.execute(
-                """
-                    SELECT
-                        COUNT(*)
-                    FROM
-                        citydb.cityobject
-                    WHERE
-                        objectclass_id = 26
-                    AND
-                        ST_Intersects(envelope,ST_MakeEnvelope(%s, %s, %s, %s, %s))
-                """,
-                [
-                    extent.xMinimum(),
-                    extent.xMaximum(),
-                    extent.yMinimum(),
-                    extent.yMaximum(),
-                    epsg,
-                ],
+                "EXECUTE {} ({})".format(name, ", ".join(["%s"] * len(names))),
+                [parameters[parameter] for parameter in names],
+            )
+        else:
+            cursor.execute("EXECUTE {}".format(name))
+
+    def count_building(self, extent: dict, epsg: int, connection=None) -> int:
+        """
+        Count the buildings intersecting the extent, on connection if given.
+        """
+
+        SQL = """
+            SELECT
+                COUNT(*)
+            FROM
+                citydb.cityobject
+            WHERE
+                objectclass_id = 26
+            AND
+                ST_Intersects(
+                    envelope,
+                    ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, %(epsg)s)
+                )
+        """
+
+        if connection is None:
+            with self.connection() as connection:
+                return self.count_building(extent, epsg, connection)
+
+        with connection.cursor() as cursor:
+
+            self.execute_prepared(
+                cursor,
+                "citydb_count_building",
+                SQL,
+                {
+                    "xmin": extent.xMinimum(),
+                    "ymin": extent.yMinimum(),
+                    "xmax": extent.xMaximum(),
+                    "ymax": extent.yMaximum(),
+                    "epsg": epsg,
+                },
             )
             (count,) = cursor.fetchone()
 
             return count
 
+    def estimate_building_count(self, extent, epsg: int, connection=None) -> int:
+        """Estimate the number of buildings in the extent
+
+        The query is only planned, not run: the estimate comes from the
+        planner statistics and takes about the time of a round trip.
+        It is as good as the statistics of cityobject, see ANALYZE.
+
+        Args:
+            extent (QgsRectangle): the extent
+            epsg (int): srid of the extent
+            connection (connection): plan the query on this connection,
+                a pooled one is checked out if None
+
+        Returns:
+            int: estimated number of buildings
+        """
+
+        if connection is None:
+            with self.connection() as connection:
+                return self.estimate_building_count(extent, epsg, connection)
+
+        SQL = """
+            EXPLAIN (FORMAT JSON)
+            SELECT
+                id
+            FROM
+                citydb.cityobject
+            WHERE
+                objectclass_id = 26
+            AND
+                envelope && ST_MakeEnvelope(%s, %s, %s, %s, %s)
+        """
+
+        with connection.cursor() as cursor:
+            try:
+                cursor.execute(
+                    SQL,
+                    [
+                        extent.xMinimum(),
+                        extent.yMinimum(),
+                        extent.xMaximum(),
+                        extent.yMaximum(),
+                        epsg,
+                    ],
+                )
+            except (Error, OperationalError):
+                connection.rollback()
+                raise PostgreSQLInterfaceException("Error estimating building count")
+            else:
+                (plan,) = cursor.fetchone()
+                return int(plan[0]["Plan"]["Plan Rows"])
+
     def sql_building(self, extent: dict, epsg: int, limit=None) -> str:
         """
         SQL to fetch the buildings
@@ -123,6 +297,922 @@ class PostgreSQLInterface:
             limit,
         )
 
+    def iter_buildings(
+        self,
+        extent,
+        epsg: int,
+        batch_size: int = 500,
+        limit=None,
+        precision=None,
+        precomputed=False,
+        after_id: int = 0,
+        lod: str = "lod2",
+        tolerance=None,
+        attributes=False,
+        connection=None,
+    ):
+        """Stream the buildings in the extent
+
+        Without a limit a named server-side cursor is used, so only one
+        batch is held in memory at a time and the first batch can be drawn
+        while the rest is still being fetched. Pages bounded by a limit run
+        as prepared statements instead, since PostgreSQL cannot declare a
+        cursor on EXECUTE. The pooled connection is returned when the
+        generator is exhausted or closed.
+
+        Args:
+            extent (QgsRectangle): the extent to fetch
+            epsg (int): srid of the extent
+            batch_size (int): number of buildings per batch
+            limit (int): max number of buildings, None for no limit
+            precision (int): if set, geometries are sent as TWKB rounded
+                to this number of decimals and decoded here, clamped to the
+                range of TWKB_PRECISION (TWKB_Z_PRECISION for z). None sends
+                full precision WKB.
+            precomputed (bool): read the LOD2 geometries from the table created
+                by create_building_table instead of collecting the surfaces
+            after_id (int): only return buildings with a greater id. Buildings
+                are ordered by id, so passing the last id of a page as
+                after_id returns the next page (keyset pagination).
+            lod (str): geometry to fetch, one of LEVELS_OF_DETAIL: "envelope"
+                for the cityobject envelope, "lod1" for the LOD1 solid or
+                multi surface (the LOD0 footprint, else the envelope if
+                missing) or "lod2" for the LOD2 thematic surfaces
+            tolerance (float): if set, LOD1 and LOD2 geometries are simplified
+                on the server with ST_SimplifyPreserveTopology, in map units.
+                About the size of a pixel removes the vertices that cannot
+                be seen at the current scale.
+            attributes (bool): also fetch the generic attributes of every
+                building as a JSON object, aggregated in the same query
+            connection (connection): run the query on this connection,
+                e.g. to be able to cancel it, instead of a pooled one
+
+        Yields:
+            list: (id, wkb, attributes) tuples of at most batch_size
+                buildings, attributes is None if not fetched. Every building
+                selected for the page yields one row, so a page shorter than
+                limit is the last one.
+        """
+
+        if lod not in LEVELS_OF_DETAIL:
+            raise PostgreSQLInterfaceException("Unknown level of detail {}".format(lod))
+
+        if lod == "envelope":
+            SQL = """
+                SELECT co.id as id, {geometry} as geom, {attributes} as attributes
+                FROM
+                    citydb.cityobject co
+                JOIN
+                    citydb.building b ON b.id = co.id
+                WHERE
+                    co.envelope && ST_MakeEnvelope(
+                        %(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, %(epsg)s
+                    )
+                    AND
+                    co.id > %(after_id)s
+                ORDER BY co.id
+                LIMIT %(limit)s
+            """
+            geometry = "co.envelope"
+            building_id = "co.id"
+            source = "envelope"
+        elif lod == "lod1":
+            SQL = """
+                WITH building_ids AS (SELECT
+                    co.id as id
+                FROM
+                    citydb.cityobject co
+                JOIN
+                    citydb.building b ON b.id = co.id
+                WHERE
+                    co.envelope && ST_MakeEnvelope(
+                        %(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, %(epsg)s
+                    )
+                    AND
+                    co.id > %(after_id)s
+                ORDER BY co.id
+                LIMIT %(limit)s)
+
+                SELECT b.id as id, {geometry} as geom, {attributes} as attributes
+                FROM
+                    building_ids bi
+                JOIN
+                    citydb.building b ON b.id = bi.id
+                JOIN
+                    citydb.cityobject co ON co.id = b.id
+                LEFT JOIN
+                    citydb.surface_geometry sg ON sg.root_id = COALESCE(
+                        b.lod1_solid_id, b.lod1_multi_surface_id, b.lod0_footprint_id
+                    )
+                    AND
+                    sg.geometry IS NOT NULL
+                GROUP BY b.id, co.id
+                ORDER BY b.id
+            """
+            # Buildings without LOD0 or LOD1 geometry, e.g. of LOD2 only
+            # imports, are shown by their envelope.
+            geometry = "COALESCE(st_collect(sg.geometry), co.envelope)"
+            building_id = "b.id"
+            source = "lod1"
+        elif precomputed:
+            SQL = """
+                SELECT id, {geometry} as geom, {attributes} as attributes
+                FROM
+                    citydb_explorer.building_geometry
+                WHERE
+                    envelope && ST_MakeEnvelope(
+                        %(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, %(epsg)s
+                    )
+                    AND
+                    id > %(after_id)s
+                ORDER BY id
+                LIMIT %(limit)s
+            """
+            geometry = "geom"
+            building_id = "id"
+            source = "table"
+        else:
+            # Buildings are selected by their surfaces in the extent, but all
+            # their surfaces are returned, so a building crossing the extent
+            # border is always complete.
+            SQL = """
+                WITH building_ids AS (SELECT DISTINCT
+                    b.id as id
+                FROM
+                    citydb.surface_geometry sg
+                JOIN
+                    citydb.thematic_surface ts ON ts.lod2_multi_surface_id = sg.root_id
+                JOIN
+                    citydb.building b ON ts.building_id = b.building_root_id
+                WHERE
+                    sg.geometry IS NOT NULL
+                    AND
+                    ST_Intersects(
+                        sg.geometry,
+                        ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, %(epsg)s)
+                    )
+                    AND
+                    b.id > %(after_id)s
+                ORDER BY b.id
+                LIMIT %(limit)s)
+
+                SELECT b.id as id, {geometry} as geom, {attributes} as attributes
+                FROM
+                    building_ids bi
+                JOIN
+                    citydb.building b ON b.id = bi.id
+                JOIN
+                    citydb.thematic_surface ts ON ts.building_id = b.building_root_id
+                JOIN
+                    citydb.surface_geometry sg ON sg.root_id = ts.lod2_multi_surface_id
+                WHERE
+                    sg.geometry IS NOT NULL
+                GROUP BY b.id
+                ORDER BY b.id
+            """
+            geometry = "st_collect(sg.geometry)"
+            building_id = "b.id"
+            source = "lod2"
+
+        simplified = tolerance is not None and source != "envelope"
+        if simplified:
+            geometry = "ST_SimplifyPreserveTopology({}, %(tolerance)s)".format(geometry)
+
+        xy_precision = z_precision = None
+        if precision is None:
+            geometry = "ST_AsBinary({})".format(geometry)
+        else:
+            # ST_AsTWKB fails on decimals out of its range.
+            xy_precision = min(max(precision, TWKB_PRECISION[0]), TWKB_PRECISION[1])
+            z_precision = min(max(precision, TWKB_Z_PRECISION[0]), TWKB_Z_PRECISION[1])
+            geometry = "ST_AsTWKB({}, %(precision)s, %(z_precision)s)".format(
+                geometry
+            )
+
+        SQL = SQL.format(
+            geometry=geometry,
+            attributes=ATTRIBUTES.format(id=building_id) if attributes else "NULL",
+        )
+
+        statement_name = "citydb_buildings_{}_{}{}{}".format(
+            source,
+            "wkb" if precision is None else "twkb",
+            "_simplified" if simplified else "",
+            "_attributes" if attributes else "",
+        )
+
+        parameters = {
+            "xmin": extent.xMinimum(),
+            "ymin": extent.yMinimum(),
+            "xmax": extent.xMaximum(),
+            "ymax": extent.yMaximum(),
+            "epsg": epsg,
+            "limit": limit,
+            "after_id": after_id,
+            "precision": xy_precision,
+            "z_precision": z_precision,
+            "tolerance": tolerance,
+        }
+
+        if limit is None:
+            cursor_name = "citydb_buildings_{}".format(next(self._cursor_ids))
+        else:
+            cursor_name = None
+
+        if connection is None:
+            with self.connection() as connection:
+                yield from self._fetch_buildings(
+                    connection,
+                    cursor_name,
+                    statement_name,
+                    SQL,
+                    parameters,
+                    batch_size,
+                    precision,
+                )
+        else:
+            yield from self._fetch_buildings(
+                connection,
+                cursor_name,
+                statement_name,
+                SQL,
+                parameters,
+                batch_size,
+                precision,
+            )
+
+    def _fetch_buildings(
+        self,
+        connection,
+        cursor_name,
+        statement_name,
+        SQL,
+        parameters,
+        batch_size,
+        precision,
+    ):
+        """
+        Run a building query of iter_buildings and yield its batches.
+        """
+
+        with connection.cursor(name=cursor_name) as cursor:
+            if cursor_name is None:
+                self.execute_prepared(cursor, statement_name, SQL, parameters)
+            else:
+                cursor.itersize = batch_size
+                cursor.execute(SQL, parameters)
+
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                if precision is None:
+                    yield [
+                        (building_id, bytes(geom), attributes)
+                        for building_id, geom, attributes in rows
+                    ]
+                else:
+                    yield [
+                        (building_id, twkb.decode(geom), attributes)
+                        for building_id, geom, attributes in rows
+                    ]
+
+    @property
+    def has_building_table(self) -> bool:
+        """
+        Check if the precomputed building geometry table exists.
+        """
+
+        SQL = """
+            SELECT to_regclass('citydb_explorer.building_geometry') IS NOT NULL
+        """
+
+        with self.connection() as connection, connection.cursor() as cursor:
+            try:
+                cursor.execute(SQL)
+            except (Error, OperationalError):
+                connection.rollback()
+                return False
+            else:
+                (exists,) = cursor.fetchone()
+                return exists
+
+    def create_building_table(self) -> int:
+        """Create and fill the precomputed building geometry table
+
+        The table holds one collected LOD2 geometry and its 2D envelope
+        per building, with a GiST index on the envelope. Extent queries
+        on it are a single index scan. It is kept up to date with
+        refresh_building_table.
+
+        Returns:
+            int: number of buildings in the table
+        """
+
+        SQL = """
+            CREATE SCHEMA IF NOT EXISTS citydb_explorer;
+
+            CREATE TABLE IF NOT EXISTS citydb_explorer.building_geometry (
+                id integer PRIMARY KEY,
+                geom geometry NOT NULL,
+                envelope geometry NOT NULL,
+                last_modification_date timestamptz
+            );
+
+            CREATE INDEX IF NOT EXISTS building_geometry_envelope_spx
+                ON citydb_explorer.building_geometry USING gist (envelope);
+        """
+
+        with self.connection() as connection, connection.cursor() as cursor:
+            try:
+                cursor.execute(SQL)
+            except (Error, OperationalError):
+                connection.rollback()
+                raise PostgreSQLInterfaceException("Error creating building table")
+            else:
+                connection.commit()
+
+        if self.metadata_cache is not None:
+            self.metadata_cache.invalidate(self.connection_key)
+
+        inserted, _ = self.refresh_building_table()
+
+        return inserted
+
+    def refresh_building_table(self) -> tuple:
+        """Bring the precomputed building geometry table up to date
+
+        Only the buildings that are new or were modified since they were
+        stored are collected again; deleted buildings and buildings that
+        lost their LOD2 surfaces are removed. New buildings without LOD2
+        surfaces are skipped, they have no geometry to store.
+
+        Returns:
+            tuple: number of (updated, deleted) buildings
+        """
+
+        SQL_UPDATE = """
+            WITH changed AS (SELECT
+                b.id as id, b.building_root_id, co.last_modification_date
+            FROM
+                citydb.building b
+            JOIN
+                citydb.cityobject co ON co.id = b.id
+            LEFT JOIN
+                citydb_explorer.building_geometry bg ON bg.id = b.id
+            WHERE
+                (
+                    bg.id IS NULL
+                    AND
+                    EXISTS (
+                        SELECT 1
+                        FROM
+                            citydb.thematic_surface ts
+                        JOIN
+                            citydb.surface_geometry sg
+                            ON sg.root_id = ts.lod2_multi_surface_id
+                        WHERE
+                            ts.building_id = b.building_root_id
+                        AND
+                            sg.geometry IS NOT NULL
+                    )
+                )
+                OR
+                (
+                    bg.id IS NOT NULL
+                    AND
+                    co.last_modification_date
+                        IS DISTINCT FROM bg.last_modification_date
+                )
+            )
+
+            INSERT INTO citydb_explorer.building_geometry
+                (id, geom, envelope, last_modification_date)
+            SELECT
+                changed.id,
+                st_collect(sg.geometry),
+                ST_Envelope(ST_Force2D(st_collect(sg.geometry))),
+                changed.last_modification_date
+            FROM
+                changed
+            JOIN
+                citydb.thematic_surface ts ON ts.building_id = changed.building_root_id
+            JOIN
+                citydb.surface_geometry sg ON sg.root_id = ts.lod2_multi_surface_id
+            WHERE
+                sg.geometry IS NOT NULL
+            GROUP BY changed.id, changed.last_modification_date
+            ON CONFLICT (id) DO UPDATE SET
+                geom = EXCLUDED.geom,
+                envelope = EXCLUDED.envelope,
+                last_modification_date = EXCLUDED.last_modification_date
+        """
+
+        # After the update, a row still older than its building belongs to
+        # a building without LOD2 surfaces anymore.
+        SQL_DELETE = """
+            DELETE FROM
+                citydb_explorer.building_geometry bg
+            WHERE NOT EXISTS (
+                SELECT
+                    1
+                FROM
+                    citydb.building b
+                JOIN
+                    citydb.cityobject co ON co.id = b.id
+                WHERE
+                    b.id = bg.id
+                AND
+                    co.last_modification_date
+                        IS NOT DISTINCT FROM bg.last_modification_date
+            )
+        """
+
+        with self.connection() as connection, connection.cursor() as cursor:
+            try:
+                cursor.execute(SQL_UPDATE)
+                updated = cursor.rowcount
+                cursor.execute(SQL_DELETE)
+                deleted = cursor.rowcount
+                cursor.execute("ANALYZE citydb_explorer.building_geometry")
+            except (Error, OperationalError):
+                connection.rollback()
+                raise PostgreSQLInterfaceException("Error refreshing building table")
+            else:
+                connection.commit()
+
+        return updated, deleted
+
+    def generic_attributes(self, building_id: int) -> list:
+        """Return the generic attributes of a building
+
+        Args:
+            building_id (int): id of the building
+
+        Returns:
+            list: (attrname, strval, intval, realval) tuples ordered by name
+        """
+
+        if self.attribute_cache is not None:
+            attributes = self.attribute_cache.get(building_id)
+            if attributes is not None:
+                return attributes
+
+        SQL = """
+            WITH attribute_table AS (
+                SELECT
+                building.id as id,
+                generic.attrname,
+                generic.strval,
+                generic.realval,
+                generic.intval
+                FROM
+                    citydb.building building
+                FULL JOIN
+                    citydb.cityobject_genericattrib generic
+                ON building.id = generic.cityobject_id
+                WHERE building.id = %(building_id)s
+                ORDER BY building.id, attrname
+            )
+
+            SELECT
+                id,
+                array_agg(attrname) as attributes,
+                array_agg(strval) as string_value,
+                array_agg(intval) as integer_value,
+                array_agg(realval) as real_value
+                from attribute_table group by id order by id;
+        """
+
+        with self.connection() as connection, connection.cursor() as cursor:
+            self.execute_prepared(
+                cursor,
+                "citydb_generic_attributes",
+                SQL,
+                {"building_id": building_id},
+            )
+            query_results = cursor.fetchall()
+
+        if not query_results:
+            attributes = []
+        else:
+            attributes = list(
+                zip(
+                    query_results[0][1],
+                    query_results[0][2],
+                    query_results[0][3],
+                    query_results[0][4],
+                )
+            )
+
+        if self.attribute_cache is not None:
+            self.attribute_cache.put(building_id, attributes)
+
+        return attributes
+
+    def building_attributes(self, building_ids) -> dict:
+        """Return the generic attributes of buildings as loaded with them
+
+        Args:
+            building_ids (list): ids of the buildings
+
+        Returns:
+            dict: the attributes as a JSON object, see ATTRIBUTES, by building id
+        """
+
+        SQL = """
+            SELECT
+                building.id, {attributes}
+            FROM
+                citydb.building building
+            WHERE
+                building.id = ANY(%(building_ids)s)
+        """.format(attributes=ATTRIBUTES.format(id="building.id"))
+
+        with self.connection() as connection, connection.cursor() as cursor:
+            try:
+                cursor.execute(SQL, {"building_ids": list(building_ids)})
+            except (Error, OperationalError):
+                connection.rollback()
+                raise PostgreSQLInterfaceException("Error reading building attributes")
+            else:
+                return dict(cursor.fetchall())
+
+    def update_generic_attributes(self, cursor, building_id: int, attributes) -> int:
+        """Update the values of generic attributes of a building
+
+        All the attributes are written with a single statement. The
+        change is not committed.
+
+        Args:
+            cursor (cursor): cursor of a pooled connection
+            building_id (int): id of the building
+            attributes (list): (attrname, strval, intval, realval) tuples
+
+        Returns:
+            int: number of updated rows
+        """
+
+        attributes = list(attributes)
+        if not attributes:
+            return 0
+
+        SQL = """
+            UPDATE
+                citydb.cityobject_genericattrib generic
+            SET
+                (strval, intval, realval) = (value.strval, value.intval, value.realval)
+            FROM
+                (VALUES %s) AS value (attrname, strval, intval, realval)
+            WHERE
+                generic.cityobject_id = {building_id}
+            AND
+                generic.attrname = value.attrname
+        """.format(
+            building_id=int(building_id)
+        )
+
+        # NULL values need a type in VALUES.
+        execute_values(
+            cursor,
+            SQL,
+            attributes,
+            template="(%s, %s::varchar, %s::integer, %s::numeric)",
+            page_size=len(attributes),
+        )
+
+        return cursor.rowcount
+
+    def select_bulk_buildings(
+        self,
+        cursor,
+        building_ids=None,
+        extent=None,
+        epsg: int = None,
+        attribute: str = None,
+        value: str = None,
+        all_buildings: bool = False,
+    ) -> int:
+        """Select the buildings a bulk edit applies to
+
+        The ids are stored in a temporary table of the transaction, the
+        conditions given are all applied. At least one is required unless
+        all_buildings is set.
+
+        Args:
+            cursor (cursor): cursor of a pooled connection
+            building_ids (list): ids of the buildings, e.g. the selection
+            extent (QgsRectangle): buildings intersecting the extent
+            epsg (int): srid of the extent
+            attribute (str): buildings having this generic attribute
+            value (str): ... with this value as text, None for any value
+            all_buildings (bool): select every building if no condition is given
+
+        Returns:
+            int: number of selected buildings
+        """
+
+        conditions = []
+        parameters = {}
+
+        if building_ids is not None:
+            conditions.append("building.id = ANY(%(building_ids)s)")
+            parameters["building_ids"] = list(building_ids)
+
+        if extent is not None:
+            conditions.append(
+                """ST_Intersects(
+                    cityobject.envelope,
+                    ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, %(epsg)s)
+                )"""
+            )
+            parameters.update(
+                xmin=extent.xMinimum(),
+                ymin=extent.yMinimum(),
+                xmax=extent.xMaximum(),
+                ymax=extent.yMaximum(),
+                epsg=epsg,
+            )
+
+        if attribute is not None:
+            condition = """EXISTS (
+                    SELECT 1 FROM citydb.cityobject_genericattrib generic
+                    WHERE generic.cityobject_id = building.id
+                    AND generic.attrname = %(filter_name)s"""
+            if value is not None:
+                condition += """
+                    AND coalesce(
+                        generic.strval, generic.intval::text, generic.realval::text
+                    ) = %(filter_value)s"""
+            conditions.append(condition + ")")
+            parameters.update(filter_name=attribute, filter_value=value)
+
+        if not conditions:
+            if not all_buildings:
+                raise PostgreSQLInterfaceException(
+                    "A bulk edit needs a selection, an extent or an attribute filter"
+                )
+            conditions.append("TRUE")
+
+        cursor.execute(
+            """
+            CREATE TEMPORARY TABLE IF NOT EXISTS citydb_explorer_bulk (
+                id integer PRIMARY KEY
+            ) ON COMMIT DROP
+            """
+        )
+        cursor.execute(
+            """
+            INSERT INTO citydb_explorer_bulk
+            SELECT
+                building.id
+            FROM
+                citydb.building building
+            JOIN
+                citydb.cityobject cityobject ON cityobject.id = building.id
+            WHERE
+                cityobject.objectclass_id = 26
+            AND
+                {conditions}
+            ON CONFLICT DO NOTHING
+            """.format(
+                conditions="\n            AND\n                ".join(conditions)
+            ),
+            parameters,
+        )
+
+        return cursor.rowcount
+
+    def bulk_edit_generic_attribute(
+        self, cursor, operation: str, name: str, datatype="string", value=None
+    ) -> dict:
+        """Edit a generic attribute of the buildings of select_bulk_buildings
+
+        set updates the attribute where it exists and adds it elsewhere,
+        update only changes the existing attributes and delete removes
+        them. Every operation is a single statement run on the server,
+        only top level attributes of a simple type are changed. The
+        change is not committed.
+
+        Args:
+            cursor (cursor): cursor of a pooled connection
+            operation (str): one of BULK_OPERATIONS
+            name (str): name of the attribute
+            datatype (str): one of ATTRIBUTE_TYPES, for set and update
+            value (str, int or float): the new value, for set and update
+
+        Returns:
+            dict: number of updated, inserted and deleted attributes
+        """
+
+        if operation not in BULK_OPERATIONS:
+            raise PostgreSQLInterfaceException(
+                "Unknown bulk operation {}".format(operation)
+            )
+        if datatype not in ATTRIBUTE_TYPES:
+            raise PostgreSQLInterfaceException(
+                "Unknown attribute type {}".format(datatype)
+            )
+
+        counts = {"updated": 0, "inserted": 0, "deleted": 0}
+        parameters = {
+            "attrname": name,
+            "datatype": ATTRIBUTE_TYPES[datatype],
+            "strval": value if datatype == "string" else None,
+            "intval": value if datatype == "integer" else None,
+            "realval": value if datatype == "real" else None,
+        }
+
+        if operation == "delete":
+            cursor.execute(
+                """
+                DELETE FROM
+                    citydb.cityobject_genericattrib generic
+                USING
+                    citydb_explorer_bulk target
+                WHERE
+                    generic.cityobject_id = target.id
+                AND
+                    generic.attrname = %(attrname)s
+                AND
+                    generic.parent_genattrib_id IS NULL
+                AND
+                    generic.datatype IN (1, 2, 3)
+                """,
+                parameters,
+            )
+            counts["deleted"] = cursor.rowcount
+            return counts
+
+        cursor.execute(
+            """
+            UPDATE
+                citydb.cityobject_genericattrib generic
+            SET
+                (datatype, strval, intval, realval) =
+                (%(datatype)s, %(strval)s, %(intval)s, %(realval)s)
+            FROM
+                citydb_explorer_bulk target
+            WHERE
+                generic.cityobject_id = target.id
+            AND
+                generic.attrname = %(attrname)s
+            AND
+                generic.parent_genattrib_id IS NULL
+            AND
+                generic.datatype IN (1, 2, 3)
+            """,
+            parameters,
+        )
+        counts["updated"] = cursor.rowcount
+
+        if operation == "set":
+            cursor.execute(
+                """
+                WITH missing AS (
+                    SELECT
+                        nextval('citydb.cityobject_genericatt_seq') AS id,
+                        target.id AS cityobject_id
+                    FROM
+                        citydb_explorer_bulk target
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM citydb.cityobject_genericattrib generic
+                        WHERE generic.cityobject_id = target.id
+                        AND generic.attrname = %(attrname)s
+                        AND generic.parent_genattrib_id IS NULL
+                    )
+                )
+                INSERT INTO citydb.cityobject_genericattrib (
+                    id, root_genattrib_id, attrname, datatype,
+                    strval, intval, realval, cityobject_id
+                )
+                SELECT
+                    id, id, %(attrname)s, %(datatype)s,
+                    %(strval)s, %(intval)s, %(realval)s, cityobject_id
+                FROM
+                    missing
+                """,
+                parameters,
+            )
+            counts["inserted"] = cursor.rowcount
+
+        return counts
+
+    def index_advice(self) -> list:
+        """Check the indexes the plugin queries rely on
+
+        Only the catalogs are read, so this is fast enough to run on
+        every connection.
+
+        Returns:
+            list: IndexAdvice of the recommended and unused indexes,
+                see index_advisor.advise
+        """
+
+        tables = sorted({index.table for index in index_advisor.RECOMMENDED_INDEXES})
+
+        with self.connection() as connection, connection.cursor() as cursor:
+            try:
+                cursor.execute(index_advisor.INDEXES_SQL, {"tables": tables})
+                indexes = cursor.fetchall()
+                cursor.execute(index_advisor.TABLE_ROWS_SQL, {"tables": tables})
+                table_rows = dict(cursor.fetchall())
+            except (Error, OperationalError):
+                connection.rollback()
+                raise PostgreSQLInterfaceException("Error reading the indexes")
+
+        return index_advisor.advise(indexes, table_rows)
+
+    def create_index(self, advice):
+        """Create a missing recommended index or rebuild an invalid one
+
+        The index is built concurrently, so the table stays writable,
+        which cannot run in a transaction. An invalid index is dropped
+        first.
+
+        Args:
+            advice (IndexAdvice): a missing or invalid index of index_advice
+        """
+
+        with self.connection() as connection:
+            connection.autocommit = True
+            try:
+                with connection.cursor() as cursor:
+                    if advice.status == "invalid":
+                        cursor.execute(index_advisor.drop_index_sql(advice))
+                    cursor.execute(index_advisor.create_index_sql(advice))
+            except (Error, OperationalError) as error:
+                raise PostgreSQLInterfaceException(
+                    "Error creating index on {}: {}".format(advice.table, error)
+                )
+            finally:
+                connection.autocommit = False
+
+    def metadata(self) -> dict:
+        """Return the metadata needed when connecting
+
+        Version, srs, estimated extent and the presence of the building
+        table are read in a single query. The result is cached in the
+        metadata cache, if any.
+
+        Returns:
+            dict: with version (-1 if not a 3D City DB), srs, extent
+                as (xmin, ymin, xmax, ymax) and building_table
+        """
+
+        if self.metadata_cache is not None:
+            metadata = self.metadata_cache.get(self.connection_key)
+            if metadata is not None:
+                return metadata
+
+        SQL = """
+            SELECT
+                (SELECT version FROM citydb_pkg.citydb_version()) as version,
+                (SELECT srid from citydb.database_srs LIMIT 1) as srid,
+                ST_Xmin(extent) as x_min,
+                ST_Ymin(extent) as y_min,
+                ST_Xmax(extent) as x_max,
+                ST_Ymax(extent) as y_max,
+                to_regclass('citydb_explorer.building_geometry') IS NOT NULL
+                    as building_table
+            FROM
+                ST_estimatedextent('citydb','cityobject','envelope') as extent
+        """
+
+        with self.connection() as connection, connection.cursor() as cursor:
+            try:
+                cursor.execute(SQL)
+            except (Error, OperationalError):
+                connection.rollback()
+                row = None
+            else:
+                row = cursor.fetchone()
+
+        if row is None:
+            # Not a 3D City DB v4, fall back to the single queries.
+            version = self.version
+            if version == -1:
+                return {"version": -1}
+            metadata = {
+                "version": version,
+                "srs": self.srs,
+                "extent": list(self.extent),
+                "building_table": self.has_building_table,
+            }
+        else:
+            version, srs, *extent, building_table = row
+            metadata = {
+                "version": version,
+                "srs": srs,
+                "extent": extent,
+                "building_table": building_table,
+            }
+
+        if self.metadata_cache is not None:
+            self.metadata_cache.put(self.connection_key, metadata)
+
+        return metadata
+
     @property
     def version(self):
         """
@@ -137,15 +1227,15 @@ class PostgreSQLInterface:
             SELECT citydb_version()
         """
 
-        with self.connection.cursor() as cursor:
+        with self.connection() as connection, connection.cursor() as cursor:
             try:
                 cursor.execute(SQLv4)
             except (Error, OperationalError):
-                self.connection.rollback()
+                connection.rollback()
                 try:
                     cursor.execute(SQLv3)
                 except (Error, OperationalError):
-                    self.connection.rollback()
+                    connection.rollback()
                     warnings.warn("Error retrieving citydb version")
                     return -1
                 else:
@@ -165,11 +1255,11 @@ class PostgreSQLInterface:
                 SELECT srid from citydb.database_srs LIMIT 1
               """
 
-        with self.connection.cursor() as cursor:
+        with self.connection() as connection, connection.cursor() as cursor:
             try:
                 cursor.execute(SQL)
             except (Error, OperationalError):
-                self.connection.rollback()
+                connection.rollback()
                 raise PostgreSQLInterfaceException("Error getting SRS from Database")
             else:
                 srs = cursor.fetchone()
@@ -196,11 +1286,11 @@ class PostgreSQLInterface:
                     ) as y_max
               """
 
-        with self.connection.cursor() as cursor:
+        with self.connection() as connection, connection.cursor() as cursor:
             try:
                 cursor.execute(SQL)
             except (Error, OperationalError):
-                self.connection.rollback()
+                connection.rollback()
                 raise PostgreSQLInterfaceException(
                     "Error getting Exitmated extent from Database"
                 )
@@ -210,10 +1300,7 @@ class PostgreSQLInterface:
 
     def close_connection(self):
         """
-        Close the active connection
+        Close the pooled connections
         """
 
-        try:
-            self.connection.close()
-        except InterfaceError:
-            raise PostgreSQLInterfaceException("Error closing connection")
+        self.pool.closeall()
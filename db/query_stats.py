@@ -0,0 +1,338 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+
+import heapq
+import re
+import threading
+import time
+
+from psycopg2 import Error, extensions, sql
+
+# Statements that only read, and can be run again by EXPLAIN ANALYZE.
+READ_ONLY = re.compile(r"^\s*(SELECT|WITH|EXECUTE)\b", re.IGNORECASE)
+WRITE = re.compile(r"\b(INSERT|UPDATE|DELETE|CREATE|DROP|TRUNCATE|ALTER)\b", re.I)
+
+# Name of a prepared statement run with EXECUTE.
+EXECUTE = re.compile(r"^\s*EXECUTE\s+(\w+)", re.IGNORECASE)
+
+
+def statement_label(query) -> str:
+    """
+    Short name of a statement for the statistics: the name of a prepared
+    statement, else the start of the query on one line.
+    """
+
+    if isinstance(query, bytes):
+        query = query.decode("utf-8", "replace")
+    query = str(query)
+
+    match = EXECUTE.match(query)
+    if match:
+        return match.group(1)
+
+    text = " ".join(query.split())
+    return text if len(text) <= 60 else text[:57] + "..."
+
+
+def row_bytes(row) -> int:
+    """
+    Approximate transfer size of a fetched row.
+    """
+
+    size = 0
+    for value in row:
+        if isinstance(value, (bytes, bytearray, memoryview, str)):
+            size += len(value)
+        elif value is not None:
+            size += 8
+    return size
+
+
+class Statement:
+    """
+    Timing of one statement, from its execution to the last fetch.
+    """
+
+    __slots__ = ("label", "query", "duration", "rows", "bytes", "plan")
+
+    def __init__(self, label: str, query):
+        self.label = label
+        # The statement with its parameters, only kept to be explained.
+        self.query = query
+        self.duration = 0.0
+        self.rows = 0
+        self.bytes = 0
+        self.plan = None
+
+
+class QueryStats:
+    """
+    Thread-safe statistics of the statements run on the pooled connections,
+    by statement label.
+
+    Statements slower than slow_threshold seconds are passed to the listener.
+    With explain, the slowest of them are run again with
+    EXPLAIN (ANALYZE, BUFFERS) and the plans of the max_plans slowest kept.
+    """
+
+    def __init__(
+        self,
+        slow_threshold: float = 0.5,
+        explain: bool = False,
+        max_plans: int = 10,
+        listener=None,
+    ):
+        """Create the statistics
+
+        Args:
+            slow_threshold (float): seconds from which a statement is slow
+            explain (bool): capture the plans of the slow statements. They
+                are run a second time, only read only statements are.
+            max_plans (int): number of plans kept
+            listener (callable): called with every slow Statement, from the
+                thread that ran it
+        """
+
+        self.slow_threshold = slow_threshold
+        self.explain = explain
+        self.max_plans = max_plans
+        self.listener = listener
+
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Forget all the statistics.
+        """
+
+        with self._lock:
+            self._labels = {}
+            # Heap of (duration, sequence, Statement) of the captured plans.
+            self._plans = []
+            self._sequence = 0
+
+    def is_slow(self, statement: Statement) -> bool:
+        return statement.duration >= self.slow_threshold
+
+    def should_explain(self, statement: Statement) -> bool:
+        """
+        Check if the plan of a finished statement has to be captured.
+        """
+
+        if not self.explain or not self.is_slow(statement) or statement.query is None:
+            return False
+        if not READ_ONLY.match(statement.query) or WRITE.search(statement.query):
+            return False
+
+        with self._lock:
+            if len(self._plans) < self.max_plans:
+                return True
+            return statement.duration > self._plans[0][0]
+
+    def record(self, statement: Statement):
+        """
+        Add a finished statement.
+        """
+
+        with self._lock:
+            entry = self._labels.setdefault(
+                statement.label,
+                {"count": 0, "total": 0.0, "max": 0.0, "rows": 0, "bytes": 0},
+            )
+            entry["count"] += 1
+            entry["total"] += statement.duration
+            entry["max"] = max(entry["max"], statement.duration)
+            entry["rows"] += statement.rows
+            entry["bytes"] += statement.bytes
+
+            if statement.plan is not None:
+                self._sequence += 1
+                item = (statement.duration, self._sequence, statement)
+                if len(self._plans) < self.max_plans:
+                    heapq.heappush(self._plans, item)
+                else:
+                    heapq.heappushpop(self._plans, item)
+
+        if self.listener is not None and self.is_slow(statement):
+            self.listener(statement)
+
+    def summary(self) -> list:
+        """
+        Return the statistics of every label, the most total time first.
+
+        Returns:
+            list: dicts with label, count, total, mean and max seconds,
+                rows and bytes
+        """
+
+        with self._lock:
+            entries = [
+                dict(entry, label=label, mean=entry["total"] / entry["count"])
+                for label, entry in self._labels.items()
+            ]
+
+        return sorted(entries, key=lambda entry: entry["total"], reverse=True)
+
+    def plans(self) -> list:
+        """
+        Return the captured statements with their plan, the slowest first.
+        """
+
+        with self._lock:
+            return [statement for _, _, statement in sorted(self._plans, reverse=True)]
+
+
+class TimedCursor(extensions.cursor):
+    """
+    Cursor recording the duration, rows and bytes of its statements in the
+    QueryStats of its connection, if it has one. The time of a statement
+    includes its fetches, it is recorded on the next execute or on close.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._statement = None
+
+    @property
+    def _stats(self):
+        return getattr(self.connection, "stats", None)
+
+    def execute(self, query, vars=None):
+        self._finish()
+
+        stats = self._stats
+        if stats is None:
+            return super().execute(query, vars)
+
+        if isinstance(query, sql.Composable):
+            # Labelled and explained by its text, as sent to the server.
+            query = query.as_string(self)
+
+        explained = None
+        if stats.explain:
+            encoding = extensions.encodings.get(self.connection.encoding, "utf-8")
+            explained = self.mogrify(query, vars).decode(encoding, "replace")
+        statement = Statement(statement_label(query), explained)
+        self._statement = statement
+
+        start = time.perf_counter()
+        try:
+            return super().execute(query, vars)
+        finally:
+            statement.duration += time.perf_counter() - start
+            if self.name is None:
+                # Rows of a query, or rows changed by a write.
+                statement.rows = max(self.rowcount, 0)
+
+    def _fetched(self, start: float, rows):
+        statement = self._statement
+        if statement is None:
+            return
+
+        statement.duration += time.perf_counter() - start
+        if self.name is not None:
+            statement.rows += len(rows)
+        statement.bytes += sum(row_bytes(row) for row in rows)
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._fetched(start, [] if row is None else [row])
+        return row
+
+    def fetchmany(self, size=None):
+        start = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._fetched(start, rows)
+        return rows
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._fetched(start, rows)
+        return rows
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            self._finish()
+
+    def _finish(self):
+        """
+        Record the running statement.
+        """
+
+        statement, self._statement = self._statement, None
+        stats = self._stats
+        if statement is None or stats is None:
+            return
+
+        if stats.should_explain(statement):
+            statement.plan = explain(self.connection, statement.query)
+
+        stats.record(statement)
+
+
+def explain(connection, query: str):
+    """Run a read only statement again with EXPLAIN (ANALYZE, BUFFERS)
+
+    A savepoint keeps the transaction of the connection usable if the
+    statement fails.
+
+    Returns:
+        str: the plan, None if it cannot be captured
+    """
+
+    if connection.closed:
+        return None
+    if connection.info.transaction_status not in (
+        extensions.TRANSACTION_STATUS_IDLE,
+        extensions.TRANSACTION_STATUS_INTRANS,
+    ):
+        return None
+
+    savepoint = not connection.autocommit
+    cursor = extensions.cursor(connection)
+    try:
+        if savepoint:
+            cursor.execute("SAVEPOINT citydb_explain")
+        try:
+            cursor.execute("EXPLAIN (ANALYZE, BUFFERS) " + query)
+            plan = "\n".join(line for (line,) in cursor.fetchall())
+        except Error:
+            plan = None
+        if savepoint:
+            cursor.execute("ROLLBACK TO SAVEPOINT citydb_explain")
+            cursor.execute("RELEASE SAVEPOINT citydb_explain")
+    except Error:
+        return None
+    finally:
+        cursor.close()
+
+    return plan
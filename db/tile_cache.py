@@ -0,0 +1,315 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+# Identify a cached tile. connection is a string identifying the
+# database, lod the kind of geometry stored in the tile and the tile size
+# (see BuildingLoader.cache_lod).
+TileKey = namedtuple("TileKey", ["connection", "srid", "lod", "x", "y"])
+
+
+class TileCacheException(Exception):
+    """
+    Exception for TileCache
+    """
+
+
+def tile_range(xmin: float, ymin: float, xmax: float, ymax: float, tile_size: float):
+    """Return the indexes of the grid tiles covering an extent
+
+    Args:
+        xmin, ymin, xmax, ymax (float): the extent
+        tile_size (float): tile edge length in map units
+
+    Returns:
+        list: (x, y) tile indexes
+    """
+
+    x_first, x_last = math.floor(xmin / tile_size), math.floor(xmax / tile_size)
+    y_first, y_last = math.floor(ymin / tile_size), math.floor(ymax / tile_size)
+
+    return [
+        (x, y)
+        for x in range(x_first, x_last + 1)
+        for y in range(y_first, y_last + 1)
+    ]
+
+
+def tile_bounds(x: int, y: int, tile_size: float) -> tuple:
+    """
+    Return (xmin, ymin, xmax, ymax) of a grid tile.
+    """
+
+    return (x * tile_size, y * tile_size, (x + 1) * tile_size, (y + 1) * tile_size)
+
+
+class TileCache:
+    """
+    On-disk SQLite cache of the building geometries, and optionally
+    generic attributes, of grid tiles.
+
+    The cache is bounded to max_bytes of geometry; the least recently
+    used tiles are evicted first. Tiles older than max_age seconds are
+    considered stale and fetched again.
+    """
+
+    SCHEMA_VERSION = 2
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024, max_age=None):
+        """Open or create the cache
+
+        Args:
+            path (str): SQLite database file
+            max_bytes (int): max size of the cached geometries
+            max_age (float): seconds after which a tile is stale, None to
+                keep tiles until they are evicted
+        """
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+        self.hits = 0
+        self.misses = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # The cache is shared with the background loaders.
+        self._lock = threading.Lock()
+        try:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._create_schema()
+        except sqlite3.Error:
+            raise TileCacheException("Error opening tile cache {}".format(path))
+
+    def _create_schema(self):
+        """
+        Create the tables, dropping the ones of an older schema version.
+        """
+
+        (version,) = self._db.execute("PRAGMA user_version").fetchone()
+
+        with self._db:
+            if version != self.SCHEMA_VERSION:
+                self._db.execute("DROP TABLE IF EXISTS building")
+                self._db.execute("DROP TABLE IF EXISTS tile")
+
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS tile (
+                    tile_id INTEGER PRIMARY KEY,
+                    connection TEXT NOT NULL,
+                    srid INTEGER NOT NULL,
+                    lod TEXT NOT NULL,
+                    x INTEGER NOT NULL,
+                    y INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    created REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    UNIQUE (connection, srid, lod, x, y)
+                )
+                """
+            )
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS building (
+                    tile_id INTEGER NOT NULL
+                        REFERENCES tile (tile_id) ON DELETE CASCADE,
+                    id INTEGER NOT NULL,
+                    geom BLOB,
+                    attributes TEXT
+                )
+                """
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS building_tile_idx ON building (tile_id)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS building_id_idx ON building (id)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS tile_access_idx ON tile (last_access)"
+            )
+            self._db.execute("PRAGMA user_version = {}".format(self.SCHEMA_VERSION))
+
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._db.execute("PRAGMA journal_mode = WAL")
+
+    def get(self, key: TileKey):
+        """Return the buildings of a tile
+
+        Args:
+            key (TileKey): the tile
+
+        Returns:
+            list: (id, wkb, attributes) tuples, None if the tile is not cached
+        """
+
+        now = time.time()
+
+        with self._lock, self._db:
+            row = self._db.execute(
+                """
+                SELECT tile_id, created FROM tile
+                WHERE connection = ? AND srid = ? AND lod = ? AND x = ? AND y = ?
+                """,
+                key,
+            ).fetchone()
+
+            if row is not None and self.max_age is not None:
+                if now - row[1] > self.max_age:
+                    self._db.execute("DELETE FROM tile WHERE tile_id = ?", (row[0],))
+                    row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._db.execute(
+                "UPDATE tile SET last_access = ? WHERE tile_id = ?", (now, row[0])
+            )
+
+            return self._db.execute(
+                "SELECT id, geom, attributes FROM building WHERE tile_id = ?",
+                (row[0],),
+            ).fetchall()
+
+    def put(self, key: TileKey, rows):
+        """Store the buildings of a tile, replacing a cached version
+
+        Args:
+            key (TileKey): the tile
+            rows (list): (id, wkb, attributes) tuples
+        """
+
+        now = time.time()
+        size = sum(
+            len(geom or b"") + len(attributes or "") for _, geom, attributes in rows
+        )
+
+        with self._lock, self._db:
+            self._db.execute(
+                """
+                DELETE FROM tile
+                WHERE connection = ? AND srid = ? AND lod = ? AND x = ? AND y = ?
+                """,
+                key,
+            )
+            cursor = self._db.execute(
+                """
+                INSERT INTO tile
+                    (connection, srid, lod, x, y, size, created, last_access)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                tuple(key) + (size, now, now),
+            )
+            tile_id = cursor.lastrowid
+            self._db.executemany(
+                """
+                INSERT INTO building (tile_id, id, geom, attributes)
+                VALUES (?, ?, ?, ?)
+                """,
+                [(tile_id,) + tuple(row) for row in rows],
+            )
+            self._evict()
+
+    def _evict(self):
+        """
+        Delete the least recently used tiles until the cache fits max_bytes.
+        Must be called holding the lock inside a transaction.
+        """
+
+        (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM tile").fetchone()
+
+        if total <= self.max_bytes:
+            return
+
+        expired = []
+        for tile_id, size in self._db.execute(
+            "SELECT tile_id, size FROM tile ORDER BY last_access"
+        ):
+            if total <= self.max_bytes:
+                break
+            expired.append((tile_id,))
+            total -= size
+
+        self._db.executemany("DELETE FROM tile WHERE tile_id = ?", expired)
+
+    def stats(self) -> dict:
+        """
+        Return the hit and miss counters and the cache size.
+        """
+
+        with self._lock:
+            tiles, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM tile"
+            ).fetchone()
+
+        return {"hits": self.hits, "misses": self.misses, "tiles": tiles, "bytes": size}
+
+    def invalidate_buildings(self, connection: str, building_ids):
+        """Remove the tiles holding some buildings of a database
+
+        Args:
+            connection (str): the database, as in TileKey
+            building_ids (list): ids of the changed buildings
+        """
+
+        with self._lock, self._db:
+            self._db.executemany(
+                """
+                DELETE FROM tile
+                WHERE connection = ? AND tile_id IN (
+                    SELECT tile_id FROM building WHERE id = ?
+                )
+                """,
+                [(connection, building_id) for building_id in building_ids],
+            )
+
+    def clear(self):
+        """
+        Remove all the cached tiles.
+        """
+
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM tile")
+
+    def close(self):
+        """
+        Close the cache database.
+        """
+
+        with self._lock:
+            self._db.close()
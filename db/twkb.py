@@ -0,0 +1,216 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+"""
+Decoder for Tiny Well-known Binary (TWKB) as produced by ST_AsTWKB.
+
+Geometries are converted to ISO WKB, which QgsGeometry.fromWkb can read.
+See https://github.com/TWKB/Specification for the format.
+"""
+
+import struct
+
+POINT = 1
+LINESTRING = 2
+POLYGON = 3
+MULTIPOINT = 4
+MULTILINESTRING = 5
+MULTIPOLYGON = 6
+GEOMETRYCOLLECTION = 7
+
+
+class TWKBDecodeException(Exception):
+    """
+    Exception for malformed TWKB data
+    """
+
+
+class _Reader:
+    """
+    Read bytes and varints from a TWKB buffer.
+    """
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.position = 0
+
+    def byte(self) -> int:
+        value = self.data[self.position]
+        self.position += 1
+        return value
+
+    def varint(self) -> int:
+        result = 0
+        shift = 0
+        while True:
+            value = self.data[self.position]
+            self.position += 1
+            result |= (value & 0x7F) << shift
+            if not value & 0x80:
+                return result
+            shift += 7
+
+    def zigzag(self) -> int:
+        return _unzigzag(self.varint())
+
+
+def _unzigzag(value: int) -> int:
+    return (value >> 1) ^ -(value & 1)
+
+
+def decode(data) -> bytes:
+    """Convert a TWKB geometry to ISO WKB
+
+    Args:
+        data (bytes): TWKB geometry
+
+    Returns:
+        bytes: little endian ISO WKB
+    """
+
+    reader = _Reader(bytes(data))
+    output = bytearray()
+
+    try:
+        _decode_geometry(reader, output)
+    except (IndexError, struct.error):
+        raise TWKBDecodeException("Truncated TWKB geometry")
+
+    return bytes(output)
+
+
+def _decode_geometry(reader: _Reader, output: bytearray):
+    """
+    Decode one geometry with its header and append it to output.
+    """
+
+    type_and_precision = reader.byte()
+    geometry_type = type_and_precision & 0x0F
+    precision = _unzigzag(type_and_precision >> 4)
+
+    if not POINT <= geometry_type <= GEOMETRYCOLLECTION:
+        raise TWKBDecodeException(
+            "Unsupported TWKB geometry type {}".format(geometry_type)
+        )
+
+    metadata = reader.byte()
+    has_bbox = metadata & 0x01
+    has_size = metadata & 0x02
+    has_idlist = metadata & 0x04
+    is_empty = metadata & 0x10
+
+    has_z = has_m = False
+    z_precision = m_precision = 0
+    if metadata & 0x08:
+        extended = reader.byte()
+        has_z = bool(extended & 0x01)
+        has_m = bool(extended & 0x02)
+        z_precision = (extended >> 2) & 0x07
+        m_precision = (extended >> 5) & 0x07
+
+    if has_size:
+        reader.varint()
+
+    factors = [10.0 ** precision, 10.0 ** precision]
+    if has_z:
+        factors.append(10.0 ** z_precision)
+    if has_m:
+        factors.append(10.0 ** m_precision)
+
+    if has_bbox:
+        for _ in factors:
+            # Minimum and delta of every dimension.
+            reader.zigzag()
+            reader.zigzag()
+
+    dimension_offset = 1000 * has_z + 2000 * has_m
+    _write_header(output, geometry_type + dimension_offset)
+
+    if is_empty:
+        if geometry_type == POINT:
+            nan = [float("nan")] * len(factors)
+            output += struct.pack("<{}d".format(len(nan)), *nan)
+        else:
+            output += struct.pack("<I", 0)
+        return
+
+    # Coordinates are deltas from the previous coordinate of the geometry.
+    state = [0] * len(factors)
+
+    if geometry_type == POINT:
+        _decode_points(reader, output, 1, state, factors)
+    elif geometry_type == LINESTRING:
+        _decode_linestring(reader, output, state, factors)
+    elif geometry_type == POLYGON:
+        _decode_polygon(reader, output, state, factors)
+    else:
+        count = reader.varint()
+        output += struct.pack("<I", count)
+
+        if has_idlist:
+            for _ in range(count):
+                reader.zigzag()
+
+        for _ in range(count):
+            if geometry_type == GEOMETRYCOLLECTION:
+                _decode_geometry(reader, output)
+                continue
+
+            _write_header(output, geometry_type - 3 + dimension_offset)
+            if geometry_type == MULTIPOINT:
+                _decode_points(reader, output, 1, state, factors)
+            elif geometry_type == MULTILINESTRING:
+                _decode_linestring(reader, output, state, factors)
+            else:
+                _decode_polygon(reader, output, state, factors)
+
+
+def _write_header(output: bytearray, wkb_type: int):
+    output += struct.pack("<BI", 1, wkb_type)
+
+
+def _decode_points(reader, output, count, state, factors):
+    dimensions = len(factors)
+    values = []
+    for _ in range(count):
+        for dimension in range(dimensions):
+            state[dimension] += reader.zigzag()
+            values.append(state[dimension] / factors[dimension])
+
+    output += struct.pack("<{}d".format(len(values)), *values)
+
+
+def _decode_linestring(reader, output, state, factors):
+    count = reader.varint()
+    output += struct.pack("<I", count)
+    _decode_points(reader, output, count, state, factors)
+
+
+def _decode_polygon(reader, output, state, factors):
+    rings = reader.varint()
+    output += struct.pack("<I", rings)
+    for _ in range(rings):
+        _decode_linestring(reader, output, state, factors)
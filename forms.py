@@ -0,0 +1,62 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+
+import importlib
+import os
+
+from qgis.PyQt import uic
+
+# Directory of the Qt Designer files.
+UI_DIRECTORY = os.path.join(os.path.dirname(__file__), "ui")
+
+
+def load_form(name: str):
+    """Return the form class of ui/<name>.ui
+
+    The module precompiled by compile_forms.py, ui/ui_<name>.py, is used
+    if it exists, so the XML does not have to be parsed. Otherwise the
+    form is compiled from the .ui file.
+
+    Args:
+        name (str): name of the .ui file, without extension
+
+    Returns:
+        type: the form class, to inherit from with the widget class
+    """
+
+    try:
+        module = importlib.import_module(".ui.ui_{}".format(name), __package__)
+    except ImportError:
+        form_class, _ = uic.loadUiType(os.path.join(UI_DIRECTORY, name + ".ui"))
+        return form_class
+
+    # pyuic names the class after the top level widget, with a Ui_ prefix.
+    return next(
+        getattr(module, attribute)
+        for attribute in dir(module)
+        if attribute.startswith("Ui_")
+    )
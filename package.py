@@ -0,0 +1,98 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+"""
+Package the plugin as a zip archive for the QGIS plugin manager. The Qt
+Designer forms are precompiled first, see compile_forms.py, so run it
+with a Python with PyQt5, e.g. the one of QGIS:
+
+    python package.py [--output dist/citydb_explorer.zip]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import zipfile
+
+import compile_forms
+
+PLUGIN_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+# Name of the plugin folder in the archive.
+PLUGIN_NAME = "citydb_explorer"
+
+# Tracked files not needed to run the plugin.
+EXCLUDED = ("benchmarks/", "tests/", ".", "compile_forms.py", "package.py", "setup.cfg")
+
+
+def plugin_files() -> list:
+    """
+    Return the paths of the files to package, relative to the plugin
+    directory: the files tracked by git and the precompiled forms.
+    """
+
+    tracked = subprocess.run(
+        ["git", "ls-files"],
+        cwd=PLUGIN_DIRECTORY,
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout.splitlines()
+
+    forms = [
+        "ui/{}".format(name)
+        for name in sorted(os.listdir(os.path.join(PLUGIN_DIRECTORY, "ui")))
+        if name.startswith("ui_") and name.endswith(".py")
+    ]
+
+    return [path for path in tracked if not path.startswith(EXCLUDED)] + forms
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Package the plugin as a zip archive.")
+    parser.add_argument(
+        "--output",
+        default=os.path.join(PLUGIN_DIRECTORY, "dist", PLUGIN_NAME + ".zip"),
+        help="path of the archive",
+    )
+    arguments = parser.parse_args()
+
+    compile_forms.main()
+
+    os.makedirs(os.path.dirname(os.path.abspath(arguments.output)), exist_ok=True)
+    with zipfile.ZipFile(arguments.output, "w", zipfile.ZIP_DEFLATED) as archive:
+        for path in plugin_files():
+            archive.write(
+                os.path.join(PLUGIN_DIRECTORY, path), os.path.join(PLUGIN_NAME, path)
+            )
+    print("Plugin packaged in {}".format(arguments.output))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+
+from qgis.PyQt.QtCore import QObject, QTimer
+
+
+class RefreshScheduler(QObject):
+    """
+    Debounce the canvas extent changes.
+
+    Every change restarts a timer; the callback only runs once the
+    canvas has been still for delay milliseconds, so a burst of pan or
+    zoom steps becomes a single refresh of the final extent. Every
+    change also starts a new generation: work started for an older
+    generation can check is_current and stop, since its extent is
+    already outdated.
+    """
+
+    def __init__(self, callback, delay: int = 300, parent=None):
+        """Create the scheduler
+
+        Args:
+            callback (function): called with the generation to refresh
+            delay (int): milliseconds without changes before refreshing
+            parent (QObject): Qt parent
+        """
+
+        super(RefreshScheduler, self).__init__(parent)
+
+        self.callback = callback
+        self.generation = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self._refresh)
+
+    def schedule(self):
+        """
+        Request a refresh, postponing the pending one.
+        """
+
+        self.generation += 1
+        self._timer.start()
+
+    def cancel(self):
+        """
+        Drop the pending refresh and outdate the running one.
+        """
+
+        self._timer.stop()
+        self.generation += 1
+
+    def is_current(self, generation: int) -> bool:
+        """
+        Check if no extent change happened after the generation.
+        """
+
+        return generation == self.generation
+
+    def _refresh(self):
+        self.callback(self.generation)
@@ -1,1964 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.11.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x76\xc4\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x64\x00\x00\x00\x64\x08\x06\x00\x00\x00\x70\xe2\x95\x54\
-\x00\x00\x2c\x92\x7a\x54\x58\x74\x52\x61\x77\x20\x70\x72\x6f\x66\
-\x69\x6c\x65\x20\x74\x79\x70\x65\x20\x65\x78\x69\x66\x00\x00\x78\
-\xda\xa5\x9c\x69\x92\x24\xb9\x8d\x85\xff\xf3\x14\x3a\x02\xf7\xe5\
-\x38\x24\x41\x9a\xcd\x0d\xe6\xf8\xf3\x3d\x7a\x56\xb5\xba\xa5\xd1\
-\x48\x36\x2a\x75\x55\x66\x64\x84\x2f\x04\xf0\x16\x10\x9e\xee\xfc\
-\xf7\x7f\x5d\xf7\xb7\xbf\xfd\x2d\xf8\x10\xbb\xcb\xa5\xf5\x3a\x6a\
-\xf5\xfc\x2f\x8f\x3c\xe2\xe4\x8b\xee\xbf\xff\xcd\xf7\x77\xf0\xf9\
-\xfd\xfd\xfe\x57\xf3\xcf\xcf\xc2\x9f\x5f\x77\xbf\x7f\x10\x79\x29\
-\xf1\x6f\xfa\xbe\xed\xf5\xe7\xf5\xc3\xeb\x91\xf7\xc7\x9f\xd7\xf7\
-\xcf\x71\x26\xaf\x97\xbf\x3b\xd0\x38\x3f\x3f\x58\x7f\xfe\xc1\xfc\
-\x39\x50\xec\x3f\x27\xf8\x79\xfd\xd7\x89\x52\xf8\x4e\xe0\xed\xe7\
-\x40\xf3\xe7\x40\x29\xfe\x9c\xf9\xe7\x0a\xd7\xcf\x99\xeb\xe8\xed\
-\xef\x6f\xe1\xe7\x73\xba\xfd\xf0\xf3\xef\xfb\xcf\xe9\xaf\x9c\x5a\
-\xac\xa5\x86\x96\xf9\x3b\x47\xdf\x5a\x1d\x7c\xdd\xa3\xcf\x8d\x75\
-\x33\x5d\xe8\xdd\x71\xe8\x73\x65\x7d\xc7\xf9\xeb\xf7\xee\xd7\x5b\
-\x23\xd7\x14\x4f\x0a\xc9\xbf\xbf\xf3\x77\x95\x89\x5b\x48\x23\x4d\
-\xfe\x8e\xfc\xed\x13\xa7\xe1\xeb\xf0\xbe\xd6\xdf\x31\xa5\xb7\xbe\
-\xde\x11\x32\x2e\x81\x2b\x1f\x3f\x6b\x7b\xfc\xef\xd5\xfc\xd3\xda\
-\xfc\xfa\xf7\x7f\xf9\x9f\xfb\x77\x6e\xeb\x27\x1d\xfe\x14\xee\xdf\
-\x5f\xfd\xa4\x81\xfb\x87\x1f\xfc\x25\x0d\xea\xf9\x79\x3d\xfd\x25\
-\x7a\xf5\xf7\xbf\xef\x75\xf7\xd7\x1f\x84\xf2\xcf\xc3\xfd\x62\xfa\
-\x77\x57\xd4\xf2\xef\x13\xc7\x3f\x5d\x51\xa8\xb1\xfe\xe9\xa6\xfb\
-\x1f\xff\xdd\x6b\xfd\xde\xf3\xdd\xdd\xcc\x95\x5b\xae\x3f\x37\xf5\
-\xeb\x4e\x82\x7b\xa1\xbc\xb6\x94\x04\xef\x63\x95\x3f\x8d\xff\x0a\
-\x5f\xb7\xf7\x67\xf0\xa7\x53\x2e\x9b\x1c\x33\xbf\xfd\xe2\xcf\x0e\
-\x23\x44\x42\x7c\x43\x0e\x16\x66\xb8\x2e\x9c\xf7\xc5\x0e\x9b\x6b\
-\xcc\xf1\xc4\xc6\xbf\x31\xee\x98\xde\x6b\x9d\x58\x8c\xb8\x5f\xb0\
-\xb3\xfe\x84\x1b\x1b\x09\x61\xa9\x13\xfa\x4d\xaa\x24\x5e\x8d\xf7\
-\xba\x9f\x6b\x09\xef\xbc\xe3\x9d\x6f\x87\xce\x99\x2d\xf0\xd6\x18\
-\x38\x98\x72\xe8\xff\xfc\xe3\xfe\x9d\x37\xfd\xab\x3f\xf7\xaa\x96\
-\x42\x70\x3f\x35\x13\xbe\x00\x47\x95\x21\x97\xa1\xc8\xe9\x6f\xde\
-\x46\x44\xc2\xfd\x59\xd4\xf2\x16\xf8\xd7\x9f\x3f\x27\xe4\x4f\x60\
-\x13\x21\x2c\x6f\x99\x3b\x37\x38\xfd\xfa\x0e\xb1\x4a\xf8\x23\xb7\
-\xd2\x0b\x74\xe2\x7d\x85\x7f\xbf\xe2\x0e\xcd\xbe\xcf\xeb\x40\x99\
-\x73\x17\x2e\x86\x1a\xca\xc1\xd7\x90\x4a\xa8\xc1\xb7\x18\x5b\x08\
-\x2c\x64\x27\x40\x33\xf8\x1e\x29\xb4\x45\x04\x42\x29\xd1\xb8\xc8\
-\x98\x53\xaa\xc4\x86\x22\xe0\xd4\x8e\xcf\xb4\xf0\xde\x1b\x4b\xfc\
-\x5e\x07\x25\x89\x44\x49\x35\x35\x62\x43\xc9\x12\xac\x9c\x0b\xf9\
-\xd3\x72\x27\x87\x66\x49\x25\x97\x52\x6a\x69\xa5\x97\x51\x66\x4d\
-\x35\x3b\x2a\xac\xd6\x56\x05\xb7\xb3\xa5\x96\x5b\x69\xb5\xb5\xd6\
-\xdb\x68\xb3\xa7\x9e\x7b\xe9\xb5\xb7\xde\xfb\xe8\x73\xc4\x91\x40\
-\xe3\x32\x28\xc7\xd1\xc7\x18\x73\x72\xce\xc9\x91\x67\x75\x93\xf7\
-\x4f\x5e\x59\x71\xa5\x95\x57\x59\x75\xb5\xd5\xd7\x58\x73\x93\x3e\
-\x3b\xef\xb2\xeb\x6e\xbb\xef\xb1\xa7\x45\x4b\x46\x1d\x5b\xb5\x66\
-\xdd\x86\xcd\x13\x0e\xa9\x74\xf2\x29\xee\xd4\xd3\x4e\x3f\xe3\xcc\
-\x4b\xae\xdd\x74\xf3\x2d\xb7\xde\x76\xfb\x1d\x77\xfe\x8e\xda\x4f\
-\x54\xff\xe1\xcf\x7f\x10\xb5\xf0\x13\xb5\xf8\x22\xa5\xf7\xb5\xdf\
-\x51\xe3\xd5\xd6\xbe\x7f\xdd\xcb\x17\x0e\xa2\x98\x11\xb1\x98\x03\
-\x11\x6f\x8a\x00\x09\x1d\x15\x33\xdf\x43\xce\x51\x91\x53\xcc\xfc\
-\x00\x14\x53\x89\x5c\x64\x51\x6c\x2c\xf8\x49\xc1\x67\x97\xf2\x09\
-\xb1\xdc\xf0\x3b\x76\x7f\x44\xee\x3f\x8a\x1b\xbc\xf6\x2f\xe3\x16\
-\xff\xdd\xc8\x39\x85\xee\xff\x19\xb9\x17\x37\x77\xca\xdf\xc5\xed\
-\x9f\x44\xcd\x44\xdb\xfb\x45\xec\xab\x42\xad\xa9\x4f\x54\x1f\xef\
-\x99\xb1\xf3\x7f\xd8\x34\x27\xa7\xeb\x66\xed\x7b\xda\x25\xf3\x33\
-\xbf\x56\xa7\x1e\xec\x26\xa2\x71\x52\x0f\xb7\xcc\x02\xac\x66\xce\
-\x32\x77\xeb\x9b\x37\xde\xc9\x32\xdf\x3e\xf9\x08\x8b\x70\x42\xbe\
-\xfe\x16\x67\x75\x95\x36\xf8\x26\x16\xdd\xd3\xb6\xb3\x3c\x4b\x73\
-\x5a\x4b\x13\x50\xa4\xa2\xfc\x99\x3b\x2d\x2b\x23\xa3\x07\xb8\x6b\
-\x16\x33\xc7\x1b\x77\x1e\x95\x2a\x23\x14\xf7\x64\x4b\x70\x3f\x87\
-\x24\x6e\xf9\xa4\x58\x47\xaa\x9e\xbf\xb5\x36\x75\xda\x4c\xa6\xf5\
-\xaf\xa7\xef\xe5\xcb\x29\x6b\x37\x92\x62\x72\x51\x60\x5f\x31\x41\
-\x33\x6c\xde\xf7\xf1\x77\x9a\x2b\x5c\x51\x68\xa9\xde\x49\xba\xb0\
-\x68\xc3\xd2\xde\x65\x9c\x7b\xea\x1d\x6b\xdc\xbd\xea\xb1\xbb\x1b\
-\xa9\x43\xa6\xec\xb6\xee\x19\x64\x29\x49\x32\x39\x14\xe9\x18\xef\
-\x4a\x73\x1c\xa7\xf8\xed\x93\x2b\x17\x0f\x8c\xd7\x6e\x2b\x97\xed\
-\x47\x28\x7b\x86\x93\x58\xa1\xa6\xf5\x66\xf1\x10\x4e\xbb\x46\x62\
-\x3e\xd3\x20\xfb\xf3\xbe\x87\xe8\xa5\x74\x57\x21\xc7\x86\x0b\x19\
-\x04\xaf\xfd\x70\x4f\x2d\xa5\xc6\xab\x8d\x6b\xd1\x0f\xcb\x81\xda\
-\x4f\xb2\x3a\xcb\xee\x40\x79\x6d\xb7\x4e\xee\xbb\xf3\xcf\xdc\xa5\
-\xeb\x92\x6a\xb6\xa8\x8f\x5e\xef\x96\x19\xd7\x9f\x88\x44\xec\x56\
-\x08\x4e\x86\x28\x46\xbb\xb7\x9c\x95\xc6\x20\x13\xc8\xea\x1d\x2f\
-\xd9\xc1\x12\x8e\x4e\xa5\xa4\xa3\x4b\xcc\x16\xce\x2d\x25\xac\x94\
-\x10\x5f\xd7\x95\xbb\x6b\xef\x66\xe2\x98\x31\xf7\x8e\xb9\x24\xbf\
-\x42\x30\xee\x82\xe8\x93\xa7\xa4\xe3\x99\x80\x66\x2f\x69\xf1\x56\
-\x12\xf2\x2e\x02\x68\xf0\xd2\xb1\xb5\xd6\x1e\x77\xed\xe4\x08\x8a\
-\x2d\xb2\xc6\x6c\x23\x67\xec\x52\x8a\xd3\x56\xa9\xa3\x50\xa0\x2a\
-\x0a\x96\xa7\x71\xb2\x35\x8e\x9d\x96\xf2\x45\x6e\x00\x38\x66\xb1\
-\xdd\x18\xb8\x05\x24\x20\x6b\xb5\xdd\xa1\x4c\x0d\x21\x10\x37\x35\
-\x81\x6c\xaa\x77\x13\xf6\x75\x38\x56\x0c\x8b\xf8\x91\xc2\x23\x93\
-\xfb\x1c\x79\x4e\xb2\x9f\xcc\xee\x37\xf9\x7e\x27\x75\xa5\x2c\xb4\
-\xcc\xa5\x34\x60\x24\x66\x96\x32\xdc\x16\xce\x22\x48\xf3\x34\x48\
-\xdb\x00\xa5\x54\x49\xee\xcb\xab\xf9\x78\xe3\x0e\x89\x50\xae\x9b\
-\xbc\xed\x79\xc3\xe1\xa4\x7e\xe1\x53\xfd\x48\x4f\xa4\x45\x42\xc6\
-\x59\x2c\x9d\x6b\xf1\x96\x98\x49\x1e\x70\x0d\xf8\x88\x99\x20\xef\
-\x65\xd4\xf3\xe1\x3e\x38\x5a\xcd\x73\x93\xbe\xbe\x58\x8c\x03\x3c\
-\x99\x19\x18\x21\x5b\x09\xce\xae\xc3\x11\x29\x04\x68\xe1\xff\x4f\
-\xd2\xac\x3d\x4b\xe9\x7d\xf3\xbe\x01\xe2\xa4\x71\xb2\x27\x2e\x3e\
-\xe9\x70\x64\xd4\x80\xdc\x2a\x70\xe7\x67\xe9\xd4\xc2\x4e\xb3\x36\
-\x3e\xe1\x87\x9b\x5c\xc3\xe6\xfe\xa9\xe0\x01\x1c\x19\x17\x3a\x27\
-\xf9\x8c\x8e\x5b\x14\x0c\x69\xde\x37\x1a\x42\xa9\x87\xa4\xe5\x7c\
-\x71\xb1\x12\xc4\xd4\xdf\xa4\xf3\x53\xfa\xb1\x6f\x8b\xae\xd6\x01\
-\x24\xb1\xa4\x87\x45\xc8\xcb\x88\x3d\x79\x56\x2e\xaf\xb6\x27\x4f\
-\xea\x64\xb1\x26\xd8\x3b\x41\x1f\x2d\x39\xcb\xb7\x04\x96\xef\xad\
-\x29\xf0\x1a\x4b\x19\x9d\x91\x6d\xfa\xef\x66\xe3\xfd\xe4\xad\x3f\
-\x95\x04\x0e\xfc\x97\x92\x0e\x0d\x9a\xf7\xf3\xde\x72\xd0\xdc\xe5\
-\x70\x86\xef\xa3\x4a\x86\x9f\x17\x39\xad\x13\xc0\x66\x1f\x47\x4d\
-\xa4\x2a\x60\x8f\xb2\x99\xc0\xca\xee\xdf\xc1\x28\x66\x0a\x33\xe5\
-\x69\xb7\x80\x9a\xfd\x9e\x42\x30\x43\xa6\xaa\xc1\x2a\x82\x50\x57\
-\x9e\x0b\x40\x70\x29\x11\xa5\x75\x2a\x68\x6a\xe0\x14\x0b\xda\x50\
-\xca\xa9\xcf\x93\xcb\xe2\xac\xc2\x60\xe0\x14\x10\x01\xa8\x51\xbc\
-\x87\xb0\xb3\x92\x85\x9b\xd3\xb7\x7b\x4d\xdf\x0f\x97\xe7\x16\x91\
-\x8a\x16\xab\x8a\xb9\x34\x6b\xa3\xde\xba\x2a\x2a\x2b\xac\x03\x9a\
-\xe4\xd2\xcd\x2b\xa1\x6a\xe9\x63\xfb\x93\xb9\x0e\x6a\x72\x03\x82\
-\x30\xc1\x8d\x76\x12\xd8\xce\x2d\xb8\x58\x7a\x14\xc8\x86\x3d\xf0\
-\x35\xe2\x17\xee\x4f\xd2\x03\x91\xc1\xa9\xf4\x11\xae\xa6\x0e\xf2\
-\xad\x59\xa8\xa4\xdc\x2a\x63\x95\xb2\x26\x97\x38\x94\x2f\x8d\xc5\
-\x8a\xd5\x35\x09\xbf\x53\x72\x4f\x26\x04\xe1\x1d\x06\xbf\x00\xbb\
-\xf3\x8c\xeb\x0d\xd6\x82\x1d\x23\x17\x90\xfa\x60\xd9\x8b\x4f\xa3\
-\x1a\xc5\x91\x3c\x20\xd3\x46\x02\xfa\x9b\xde\xeb\xfa\x62\x29\xab\
-\xc8\x60\xca\x68\x81\xa9\x61\x80\xea\x35\x17\x6a\xf9\x8a\x20\xd6\
-\xd8\x5c\x2f\x25\x3a\x0d\x6a\x60\xad\x7b\xf7\x14\x22\x41\x68\x25\
-\x70\x75\x8d\xf4\x2e\xc5\x05\xc2\x0c\xe7\x1d\x13\x5e\x81\xee\xb9\
-\x51\x3f\xb5\x22\x8d\x85\x71\x40\x72\xb0\x04\x82\x75\x18\x82\x48\
-\xf6\x0a\x1d\x0c\xb8\x1c\xe1\xfa\xc2\x3a\x50\x18\x4b\x58\xe3\x2e\
-\x57\xd0\x5e\xce\x04\x12\x10\x4e\x17\x54\xfd\xa4\xe5\x36\xb4\x59\
-\x27\x65\xae\x12\x8d\x37\x0a\x21\x9b\x32\x35\x40\x87\xa3\x6f\x5e\
-\xaf\x2f\x51\xe7\x70\x94\x41\xee\xef\xd5\x3f\x52\x93\xcb\x19\x3f\
-\x09\xf9\x25\xef\x54\x42\xbf\xd7\xf8\x0f\x4e\x29\xaa\x01\xa8\xf2\
-\x50\x13\xfd\xfd\x07\xf8\xf7\x57\x20\x9c\xf5\x95\x48\x91\x00\x7f\
-\xf5\x34\xa9\x81\x26\x86\x0e\x7d\xab\xa0\x01\x57\x95\x13\x31\xca\
-\xc4\x6f\x2a\x17\xe0\x4b\xca\x9a\x8a\x45\x98\xbb\xd8\x09\x27\x58\
-\x8b\x66\x19\x5c\x3b\x94\x0c\x82\x82\x5f\x8d\x48\x24\x8a\xfb\x94\
-\x0d\x76\xb6\x04\xae\xdb\x05\xee\x3a\xe4\x0a\xd9\x91\x2c\xe4\xe6\
-\x29\xc1\x26\x29\x49\xaa\x39\x38\xb3\x1b\x74\x05\x90\x52\x05\x40\
-\x60\x07\x62\x04\x64\xa2\xf5\x05\x41\xc4\x21\xfd\x90\x38\x46\x96\
-\xec\x5a\xa0\x7e\x6c\x44\xb2\x5f\xdc\x41\xb1\x91\x05\xa9\x67\x39\
-\xfd\x38\xdf\x3b\x7c\xbd\xa4\xdc\x45\x21\x75\x22\x81\xbc\x82\x42\
-\x91\x2b\x63\x2e\x7c\xcb\x5a\xa2\x66\x42\xcd\x6d\x92\x26\x48\x31\
-\x60\x07\xbb\xb2\x3a\x29\xba\x86\x70\x0c\x7d\x04\x5b\x2f\xd5\x68\
-\xe6\x26\x91\x6e\xad\x56\x2a\x0d\xcc\x01\x0d\xe1\x01\x10\x87\xfa\
-\xc6\x55\xc1\x0e\x86\xdf\x59\x50\x95\xa2\xac\xb2\x85\x56\xb8\x87\
-\x36\x03\x00\xed\x6e\x05\xb7\x26\xca\x7c\x40\x07\xbd\x16\x32\x2a\
-\x8f\xb5\xd2\x1e\x29\xb3\x72\x50\x02\x8c\xc1\x55\x8a\x00\x06\x8a\
-\x65\x01\x37\x5b\x97\x6b\xe7\x65\x4a\x49\x61\xc5\x38\x01\x36\x14\
-\xfe\x6c\x45\x29\x74\x5a\x50\xae\x70\x42\xb0\x76\xed\x8a\x11\xd8\
-\x76\x73\xb9\xdc\x41\x7c\xaf\x93\x82\x5a\x2c\x32\x4f\xe7\xb3\xc8\
-\xd1\x2c\x4f\x20\x37\x57\x57\x59\xcd\x35\x90\x20\x13\xbe\x66\x21\
-\x41\x79\x2e\xaf\xb7\x45\xa0\xa5\xde\x4e\x8f\x81\x2f\x45\xb3\xdc\
-\xf1\x18\x55\x42\xe1\x50\x87\x83\x9c\xe3\x4d\xe8\x8c\x83\x06\x25\
-\xb3\xa5\xbd\xc4\xe2\x13\x65\x0b\x69\x66\x6a\x28\x81\xa8\x28\x64\
-\xd6\xea\xf8\xc5\xf1\x4a\x8c\xf2\xa2\xab\xf0\x46\x04\x8b\x07\xbe\
-\xa9\x13\x9b\xf0\x08\x32\x0d\xac\x95\xac\x01\xe1\x5a\x8d\xb0\xb0\
-\xf1\x1d\x6a\xe1\x6c\x69\xd7\x4d\x91\x22\xb4\xf4\x21\xee\x66\x41\
-\x17\xbc\x86\xd4\x44\xfc\x4c\xa2\x64\x6a\xea\x40\x19\x97\x72\x46\
-\x83\x1a\x94\xec\x88\x2c\xa9\x93\x07\xbc\xce\x3d\x02\xba\xbb\x50\
-\xe7\xb0\x5e\x20\xc2\xa6\x44\xe5\x9e\xe0\x6c\x78\x1b\x5e\x4d\xe4\
-\x94\xe8\xf5\x10\x03\x50\x4d\x8e\x39\x5d\xbe\x6f\xdd\xe1\xeb\x25\
-\xb5\x60\x96\x82\xd4\x0a\x7b\x51\x0a\x0d\x29\xd3\xcf\x1c\xba\xed\
-\xe8\x37\x1e\xe0\x7d\x95\x4a\x8b\xa5\x02\x7f\xfa\xb9\xa0\x3e\x27\
-\xb0\x16\x69\x68\xc8\x3f\x37\xbf\x0c\xa4\x90\x01\x1a\x5d\x36\xa2\
-\x86\xb7\x11\x33\x50\x89\x63\xe3\xcf\x40\x27\xd4\x09\x6e\x97\xf5\
-\x23\xc3\x90\xb0\x2c\x1a\x8b\xc9\x85\x45\x12\xae\x4b\x10\x66\xb7\
-\x53\x0c\x80\x11\xcb\x0f\x56\xf9\xb6\xaf\x48\x25\xa3\x8b\xd0\x6e\
-\x2a\xcd\x78\x0c\xcd\x8a\xcc\xa5\x8c\xe7\x6c\xc1\x0e\x8e\xa1\x94\
-\x2d\x09\x57\x04\x8a\x3b\x83\x77\x0d\xa8\xbd\x52\x42\x15\xa1\xd3\
-\x62\x23\x6d\x60\x98\x80\xd0\x07\xc4\x9f\x86\x8a\x64\x0f\xd9\xe0\
-\xa9\x3f\x40\x78\x21\x1a\xc7\x52\x64\x91\x1d\x80\x25\x91\xe7\xdb\
-\x84\x4e\x34\x34\x64\x04\x9d\x90\x95\xd2\x98\x4f\xa3\x2c\x7c\xe6\
-\xcd\x28\xd3\xc1\xb5\xb5\x82\x60\x5b\x0b\x8d\xa9\x7c\xbc\x8a\x26\
-\x82\x6b\x83\x0c\x30\xf0\x45\x31\xfe\xbc\xd4\x5c\x0c\x97\xcb\x99\
-\x28\x34\x6a\x80\x6a\x08\x17\xb9\x6c\x2c\x5c\x39\xd4\x84\x34\x20\
-\x58\xf4\xbd\x8a\x86\x40\x80\x9c\x04\xf4\x56\x4b\x11\x99\x40\x3d\
-\xdb\x45\x8b\x5d\xf9\x35\xd6\x93\x28\xa3\x0a\xb9\xcc\xfb\x5d\x26\
-\x18\x4f\xd0\xad\xbc\x64\xe5\x28\x48\x34\xad\x05\x9e\x0a\xa9\xc9\
-\x8a\xb2\xd4\xd2\x69\x44\x0f\xf2\x2c\x54\x2a\xf7\xe7\xb4\xf8\x91\
-\x4b\xc2\x83\x90\x2e\x48\xa0\x08\x71\x07\x58\x0d\xbc\xee\xca\x26\
-\x44\xc7\x42\x33\x75\x23\xd6\xfc\x84\xec\x60\x19\x38\x2e\xd9\xc5\
-\xd9\x91\x97\x13\x5b\x58\xa2\x93\x4e\x47\x3d\xe5\x23\x7a\x89\x4f\
-\x07\xb0\xba\x47\x3a\x42\x08\x9b\xfb\x28\x88\x9b\xea\x4b\x8e\x00\
-\x91\x52\xb5\xdf\x1d\xc5\x1e\xaa\xc8\x06\x82\x70\x81\xa5\x0c\x27\
-\x9d\x43\xc2\xc0\x0e\xb1\x42\x81\x6f\x3d\x90\x54\x1b\x4e\xa4\xf0\
-\x91\xc8\xf7\x8f\xac\xae\xe4\xde\xcb\xf6\x86\x8a\xfc\x95\xd5\x18\
-\x64\xd0\x61\x22\x6b\x94\xd6\x94\x6c\xa6\xba\x45\xda\x52\xe8\x83\
-\xa2\x27\x72\x20\xe6\x64\x99\x29\x68\xee\x59\x32\xad\x36\xcc\x4d\
-\x42\x6a\x1a\x20\x0c\x90\xab\x94\x49\xf8\xa0\x4e\x04\x60\xb5\x7b\
-\x23\x45\x4d\xab\x99\x80\x4d\x84\x5c\xd3\xda\x18\xbe\x8a\xd7\x00\
-\x01\x12\x2b\xcb\x75\x50\xd2\x58\x87\x46\x7e\x7f\xff\x4e\x10\x9d\
-\x62\x42\xc1\x56\x7c\xbf\xfe\x2d\x54\x19\xbe\x30\xa2\x3a\xa5\x09\
-\x3b\x12\xa1\x44\x08\x2f\x1b\x97\xf7\x52\x8c\xf3\xf2\x1d\x40\xe3\
-\xe5\x23\x15\x6a\xfe\x9d\x42\x30\x16\xf3\xe0\xbc\x88\x5a\x42\x0f\
-\x6f\x24\x09\xab\x4a\xa6\x71\x2d\xba\x7e\x4c\xd3\x25\x1d\x7b\xa4\
-\xca\x1b\xf2\x82\xc4\x42\x46\x98\x61\x71\x45\x4c\x67\xc9\x3c\xd7\
-\x8a\x4e\x88\x3a\x8f\x99\x83\xdf\x6f\xa0\x46\xcf\x06\x6f\xe2\xc1\
-\x59\xa3\x44\x30\x78\x2c\xb7\x57\x1e\x6d\xff\x0b\xfa\xe4\x62\xfb\
-\xc4\x1d\x47\xfc\x3c\x4b\x07\x88\xf0\x93\x82\x13\x2e\x33\x05\x07\
-\xfb\x55\xb5\x90\x08\x28\x2c\xcb\x8d\x5b\xcb\x59\x7d\x35\xd1\x29\
-\xd8\x7e\x0c\x47\x8e\x81\x80\x5b\xe0\x7b\x33\xcc\xd1\x89\x5b\x87\
-\x40\x0e\x36\xc0\x18\xc1\x08\x44\x6c\xc0\x5f\x3f\x99\x14\x4d\x46\
-\x8a\x41\x1e\x4b\x86\x73\x35\x4f\xb6\x3d\x68\x9d\xbb\x5e\xcc\x39\
-\xf5\xc1\x62\x73\xe5\xb8\x3a\x56\x9e\x0f\x6c\x61\x58\x20\x1b\x50\
-\x66\x0b\xc1\x0e\xc2\x6c\xd5\xf3\xec\x69\x41\xdb\xe0\x4d\x40\x7a\
-\x43\x9a\xb2\xf0\x90\x1b\x7c\x3b\xe2\xad\x68\x28\x56\x39\x22\x93\
-\x21\x83\x09\x1d\x55\x4a\xa1\xe0\x05\x89\x2c\x65\x5c\x1c\x72\x4d\
-\x3d\x40\x8a\xa7\x8f\x0b\xda\x13\x20\x19\xf4\x47\x00\x5e\x82\x1f\
-\x5d\x71\x63\x26\x06\x80\x50\x51\x3e\xab\x87\x4b\x30\x40\x07\xb0\
-\x4b\xc4\x70\x70\xf8\xd3\x91\xe1\x44\xd1\xf2\x82\xb3\xaa\xda\xc4\
-\xe8\x12\xd6\xa2\xc8\x1b\x73\xef\x70\x25\x2e\x07\x1b\x38\xf9\x1a\
-\xc7\x3b\x03\x64\x41\x30\x51\x7d\xdc\x64\x87\x29\x3a\xac\x76\xd3\
-\x71\xdb\x1b\x34\xd5\x09\x2e\x38\x77\x93\xea\xe4\x50\x9e\x01\x33\
-\x85\x16\x44\x90\x72\x51\x64\xfe\x0a\xb2\x24\xe8\x28\xf9\x85\x07\
-\xef\xbe\xec\x11\x25\x06\xa0\x93\x6d\x55\x2e\x3b\x24\x1c\xe0\x44\
-\xb0\xc7\xa5\x66\x77\x04\x05\x42\xbb\x0b\x33\x02\xeb\x63\x91\x41\
-\x54\x12\xbc\xcf\x8d\x7a\xc6\x10\xad\xce\x52\x46\x0a\xc1\x87\x1a\
-\x50\xe9\x11\xdb\x97\x86\xdb\x90\xc5\x09\x22\x0a\x14\x25\x62\xc5\
-\x23\x9c\x61\x6a\xd2\xc0\xc6\xc2\xdb\xc8\xfe\x45\xff\x9a\xa1\x59\
-\x38\x8c\xdc\xc1\x7d\x93\xdc\x0d\x50\x8f\xe9\x99\x93\x83\x46\x72\
-\xa9\x18\x9f\xdf\xb5\xea\x33\xa8\x11\x92\xb7\xec\x28\x2f\x67\x07\
-\x2b\xcf\x7a\x4c\xe4\x90\xba\xae\x4b\x04\x12\x50\xe0\x10\x1d\x05\
-\x75\x29\x59\x35\x3c\xd0\x6d\x28\xee\xee\x02\xf5\x47\xd9\xab\x06\
-\xf7\x40\xec\x51\xa6\xd8\x3e\x4c\x1f\xa6\x82\xaa\x0e\x27\x23\x15\
-\x91\x12\xa4\xf6\x4d\x70\x28\x05\x7e\x90\xc4\x8d\xc2\x60\x11\xd7\
-\x04\xac\x48\x87\x40\xd1\x2e\x0a\xcd\x14\x76\xfc\x1e\x57\xd1\xc9\
-\xf3\xfe\x38\x47\x99\xf0\x9a\x03\xe4\xd3\x2b\x60\xc8\x01\xca\x02\
-\x54\x78\x7f\x41\x2a\x05\xe5\x44\x92\x5b\x07\x07\xa9\x35\x25\x0c\
-\x1f\x40\xc8\x40\x5d\x14\x27\xe5\x84\x18\x04\xab\xc9\x6f\xac\x28\
-\xc9\x8e\xfc\x89\x2d\x5e\x93\xd8\x83\x87\x67\x8f\x4f\xca\x63\x86\
-\x71\x70\xaa\x0c\xaa\xc8\x21\x9b\xeb\xb0\x4b\xea\x43\xc6\x88\x00\
-\xee\xbe\x28\x1b\xef\x51\xb0\x81\x2f\xd8\x04\xdf\x82\x91\x21\xe6\
-\x40\x28\x4b\x75\x59\x7b\xc4\x74\xad\xe8\x59\x24\x99\xae\x9c\xea\
-\xa7\x7a\x59\xec\x13\x23\x08\x12\x61\x0f\x9c\xea\xb3\x0e\x32\xdc\
-\x78\x5e\x6e\x06\x85\x70\xf9\x7c\x42\xd0\x91\x6e\xbc\x09\x4d\xc8\
-\x3b\x61\x92\xb2\xf7\x81\x04\x32\x66\x36\xb9\x8c\xe0\xc7\xe1\x16\
-\x35\x09\x38\xe6\x92\x8c\x67\x81\x36\x3e\x4f\xfe\x18\xf6\xab\x54\
-\xb8\x36\x86\xc0\x4f\xe4\xf0\x86\xb5\x39\xd3\x94\xee\x1b\x45\x4e\
-\x2b\xc0\x88\xa9\x39\x2e\x41\x31\x41\x4e\xc3\xb1\xfc\x8c\x08\x93\
-\x88\xe8\x55\x6a\x6c\x1d\x78\x26\xad\x28\xdf\x28\x66\xa4\xe4\x28\
-\xf8\x7c\xf3\x81\x9d\xa3\xf8\x37\xe3\x16\xf5\xc3\xd6\x5c\xa2\x06\
-\xb8\x70\xee\x19\x29\x84\x3a\x46\x53\x04\xdd\x2a\xa2\x05\x3d\x4a\
-\x21\x62\x90\x01\x6f\x62\xb7\xd5\x2b\x11\xb0\xb0\x58\xe8\xf6\x27\
-\xcf\x21\x68\xd4\x15\xee\xfa\x3a\x99\xba\x83\xea\x5d\x38\x3f\x80\
-\xc8\x50\x9e\xaf\x89\xa6\xe0\xe5\x04\x69\x86\x72\x64\x40\x0b\x52\
-\x1f\x10\xe2\x82\x86\x99\x94\xc7\x04\x97\x3d\xb2\x0f\x99\xdb\x40\
-\x26\x07\x43\xb1\x70\xb1\x70\x24\x83\x2b\x58\x75\xf2\xd4\xd7\xbc\
-\x3b\x82\xe9\xa2\x81\xd5\x5d\x47\x76\x01\x27\x86\x6d\xf5\xa3\xe0\
-\xb0\x40\x1e\x54\x05\x37\xbe\xc1\x54\xae\xe0\xc0\xb4\x35\x52\x69\
-\xc2\xde\x7b\x51\xaf\x6a\x94\xe4\x96\x92\x7a\x62\x67\x89\x5e\x90\
-\xf1\x86\x58\x16\xec\xae\x29\xa9\x64\xa4\xb5\x98\x0d\x75\x8b\xd3\
-\x29\xe2\xb6\x45\x60\xdc\xe6\x2d\x26\x39\x33\xc4\x93\x40\x2c\xd0\
-\x17\xb4\x1b\xe1\x2b\xe1\x39\xe3\xec\xba\x48\x49\x5b\x7b\x2f\xcc\
-\x3b\xda\xb4\x10\xd2\x25\x9c\xbb\x54\x54\xc1\x4a\x13\x14\xb5\x7d\
-\x78\x3b\x12\x10\x03\xc7\xe9\xc0\xbb\x8b\xf9\x40\x90\x2e\x0a\x68\
-\xb4\x26\xde\x45\x77\xc7\x21\x15\xc7\xdd\x90\x97\x13\x37\xc0\x7d\
-\x92\x42\x03\xeb\xb8\x07\x9f\x83\xda\xb3\x83\xf3\x8f\xf6\x99\xd6\
-\x62\x8d\x45\xc9\x04\x74\xc0\x00\xb8\xd6\x81\xa7\xf1\x4d\x46\xef\
-\x08\xb4\x4a\x54\x2d\x43\x71\xaf\xe4\xcf\x55\x7d\x93\x93\xd6\x24\
-\x25\x22\xb5\xd6\x58\x68\xca\xb3\x51\xdd\xac\x50\xe3\x0e\x84\xfd\
-\xdd\x43\x17\xac\x0e\x96\x95\x15\xf2\xf2\x6f\x1d\x2d\x80\x23\x44\
-\x92\x43\x4d\x73\x55\xb2\x73\x55\x03\x89\x0f\x95\xe4\x30\x60\x41\
-\x1e\x0e\xdc\x58\xb8\x41\xe4\x06\xa5\x40\x8e\x65\x2a\x2e\x10\x22\
-\xae\x00\xa7\x91\x60\x19\xab\x68\x9f\x74\x42\xed\xf0\x28\xe6\x86\
-\x4a\x83\xe6\xf2\x55\x66\xb6\x44\xf8\x49\x1a\x68\x9f\x95\x01\x0c\
-\x40\x38\xae\x8f\xfa\xc2\x69\x40\xbe\x48\x1e\xc5\x8a\x9b\x91\x83\
-\x19\xea\xe8\x1e\xa0\x4d\x71\x85\x7c\x59\xc1\x83\xf4\xa1\x16\xfb\
-\x2d\x58\x88\xc0\xcd\xce\x3d\xd5\xe3\x3d\x15\x26\xc1\x6e\xb0\xa6\
-\x07\x4f\x8b\xaf\x9d\xab\x4b\xf1\xb1\x64\x05\x88\xe8\x84\xf6\x78\
-\xe2\xb3\x91\xc0\x70\x2e\x0c\x5a\xbc\x72\xd2\x53\x22\xab\x36\xb5\
-\xfb\xb8\xe9\x83\x05\xe9\xea\x2e\x63\x32\x40\xe7\xc2\x07\x1a\xd1\
-\xaf\xe8\x2c\xde\xf2\x24\x27\x50\x23\x0d\x06\x33\xf3\x4f\xe6\x9e\
-\xe1\xdb\xdd\xc6\x2d\xd5\xa9\x2b\x0d\xdb\x65\x23\x4f\xa9\x91\x98\
-\xea\x9e\x1d\x40\x82\x33\x24\xf1\x2a\x6a\xd7\xb7\x0a\x7c\x18\x12\
-\x12\x2d\xa7\x8e\x01\xe2\x7d\x7c\x19\x4f\x61\x07\xc5\xa7\x6c\x17\
-\x87\x11\x7f\x10\x80\x22\xc8\x22\xd8\x89\xf1\x80\x83\xdb\x6b\xde\
-\x08\xb3\x31\xad\x6a\xf4\xc0\xcf\x04\xf1\x9c\x30\x13\xd9\xac\x16\
-\x6c\x59\x14\x35\xa6\x83\x62\x8b\x15\x3c\xc2\x4f\x65\x34\x37\x82\
-\x10\xb1\xfa\x6a\xab\x53\x6d\x98\x6b\x80\xec\xa0\x80\x9b\xd0\x27\
-\xcb\x30\xa1\xb3\xfa\x2b\xf8\x00\x56\x81\xb1\x0d\x87\x0a\x27\xa2\
-\xb5\x6f\x73\xfb\x53\x39\x70\xc9\xed\x78\xf4\x83\xa4\xbe\xa0\x73\
-\x54\xb2\x73\x70\x52\x1d\xdf\xa9\xbd\x5c\xa2\xc4\x29\x9f\xa0\xf1\
-\x0b\x01\xd6\x02\xf5\x4d\x80\x20\xc9\x3b\xd5\xcf\x6e\xf0\xaa\x07\
-\x30\xa3\x98\x5c\xfb\x86\xd4\xfc\x08\x82\xec\x7c\xc0\x49\x12\x12\
-\x56\xe5\xc4\x70\x24\x90\xa6\x25\x25\x97\x29\x7f\x25\xd4\x06\x4c\
-\x05\x46\x71\x04\x87\xb3\xf7\x02\x50\xc4\xb8\x74\x2c\xea\x9c\x60\
-\xc5\x1d\x2f\x1a\xd2\xcc\x6b\x1b\xe2\x0a\x16\xe3\xc1\x4f\x1a\x9e\
-\xdd\x8f\xb7\xfb\x83\x71\x90\xbe\xec\x9d\x2c\x41\xd7\x98\x6b\x08\
-\x73\xc8\x17\x6a\x42\x77\x18\xb8\x81\xae\x82\xc7\x10\x88\x84\xa8\
-\xaa\xcf\x61\x41\xeb\x34\x70\x59\xf6\x8b\x88\x32\xd7\x4c\x01\xbd\
-\xaf\x3b\xd6\x61\xe8\x8a\xae\x24\x0a\xca\x45\xbb\x1b\x47\x60\x55\
-\x58\xbe\xa6\xbe\xec\xad\xda\x3a\xdf\x88\x88\xf9\xa9\xc9\xba\xfc\
-\xc4\x3c\x19\xd0\xa0\xb0\x42\x7d\x17\x5a\xd7\x2a\x42\x90\xf3\xd9\
-\xcc\x16\x94\x86\x24\x2f\x19\xe1\xbb\x1a\xad\x47\x0d\x9a\xc3\xe2\
-\x14\xa8\x03\x61\x42\x8d\x43\x0a\x44\x72\xbe\xfd\x27\xf2\xe7\xf9\
-\xa6\x09\x86\xca\x15\x82\x47\xdb\x50\x5c\x12\x91\x01\xc5\xb6\x84\
-\x12\x11\x91\x08\xf1\xb3\xd2\xf8\x83\x08\x3b\x8b\x5b\xd4\x3e\xc5\
-\x51\x5a\x8d\x9b\x32\x81\x19\x94\xea\x5f\xa2\x63\x14\xac\x39\xc4\
-\x46\xea\xd9\xb3\xb6\xb5\x1c\xfc\xf8\x16\xa7\x9e\x42\x24\xe1\x59\
-\x90\x8a\x5c\xba\xc9\x0b\x6c\x1e\x18\xa3\xe5\x41\x88\xb7\x52\xd8\
-\x39\x30\xe4\xe4\xa5\x08\x4f\x47\x54\x12\xc2\x18\x0c\x44\xdc\x9a\
-\xa1\x5b\xe0\x55\x0a\x81\xf3\x75\xee\xb7\x93\xb5\x90\x06\xab\xa8\
-\x26\x65\x0b\x60\x1e\xc9\x2a\x96\x83\x02\x0c\xc8\x06\xa4\x0d\xd8\
-\xb8\x0e\x37\x8d\x78\x61\xf5\xd4\xa1\xba\x5d\x61\xe1\xc3\x6a\x9c\
-\x64\x35\xd1\x73\xdd\x09\x3c\xb9\x1a\x37\xb8\x58\x62\x54\x5f\x41\
-\x39\x03\x01\xdc\x1e\xe2\xd6\xd4\x7f\xb8\x08\x00\x10\xb2\xfa\x3a\
-\x2e\xf2\x1b\xdc\x01\xda\x51\x13\x7e\xa2\x3b\xf0\x9b\x5f\x0b\x33\
-\xa3\xbf\x88\x6c\x92\x10\x6f\xc2\xd8\x83\x0e\x01\xa5\xf0\x13\xa6\
-\xcd\x8b\x26\x46\x18\xc5\xf5\xd7\xe7\x91\x12\x27\xfc\x90\x26\xc4\
-\x65\x9c\x10\x87\xb2\x09\x1a\xc6\x08\x29\x23\x56\xa2\x2e\x87\x90\
-\x03\x23\xde\x82\xb4\x3c\xc0\x5d\xcf\x1d\x14\x6f\x63\xf9\xb1\xeb\
-\x07\x1c\x96\x61\x44\x00\x21\x73\xd0\x19\x44\x91\xb2\x81\xed\xde\
-\xae\x00\xbc\x06\x1a\x2f\xbe\x89\xf2\x5b\x90\xb7\xda\x3a\x47\x2d\
-\x18\x09\xf2\x03\x97\x5e\xb4\xf6\x72\x28\x19\xd4\x86\xde\x0a\x3b\
-\xf2\xb9\x01\xd2\x73\x0d\x1c\x03\xb1\x78\xb7\x7a\x35\x1b\x1f\x85\
-\x6b\x9a\x19\x25\x9c\xe6\xd9\xcf\x34\x8b\x84\x60\x35\x6d\xf2\x0f\
-\xe5\x3f\x07\xc2\x6f\x43\xd5\xd4\x73\xcf\xd8\x79\x81\x9c\x06\x3f\
-\xbc\xd0\xde\x57\x2a\x94\x0c\x86\x66\x06\x34\xb5\x25\x30\xc8\x1f\
-\x2a\xb9\xb0\x5e\xd4\x32\xca\x0b\x11\x02\xf9\x2d\x07\x59\x26\x6d\
-\xbc\x64\xdc\x6b\xf2\xc0\xe2\xda\x9a\xd4\x20\xa7\xc1\x7e\xcb\x38\
-\x02\xd4\xa6\x70\xd3\x8a\x75\xf1\x1a\x14\x9b\x3a\x32\x17\x98\x8f\
-\x22\x83\xfc\x75\x4e\x9c\x07\x17\xab\x5a\x95\xa0\x1f\xa6\x57\x3d\
-\xa2\xe7\x8d\x27\x51\x9f\x75\x72\x27\x68\xd3\xcb\xba\x82\x88\xb5\
-\x22\x39\xec\x29\x72\xd4\x01\x0b\x1b\x9b\x74\x2a\x48\xd4\x8b\x23\
-\x00\xf8\xd2\x85\x4a\xc0\xa6\xa5\x4d\x9a\xa2\x5c\x6d\xfd\xf8\xd2\
-\x32\x5f\xef\xaa\xef\xa2\x0d\x22\xad\x0d\xa2\x18\x5c\xe8\xb0\xdf\
-\xdd\x70\xef\x7b\x37\x77\x35\x9d\x7a\xa1\x38\xb0\xd7\xdd\x25\x15\
-\x36\xf0\xa1\xa5\x3c\x20\x47\x0a\xea\xda\x84\xfe\x3c\xa4\xbe\x1e\
-\x6a\xea\xa8\xab\x9c\xe5\xff\x72\xd2\x4e\x5c\xcc\x8b\x2a\x8f\xc1\
-\xe1\xbe\xf2\xaf\x46\x09\xc5\xb0\xb4\xfd\xdc\xf9\x5c\xba\xe4\x00\
-\xa8\x07\xc7\xa9\x63\x96\x76\xd7\x66\xd0\x55\xed\x11\xf2\x83\xab\
-\xd8\x43\xbd\x2c\x44\x2a\x5a\xa5\xca\x41\xa6\x40\xaa\xc0\xd8\x43\
-\x4d\x59\x2f\xcb\x85\x56\xe9\x19\x79\xb8\x31\xa1\xfc\x14\x5f\x23\
-\x26\x4e\xc0\x1a\xbc\xa8\x51\x04\x29\x67\x00\x0c\x3d\x45\x04\xa9\
-\x3c\x2a\xde\xf5\x0f\x8f\xa0\x96\x0b\x02\x47\xe4\xfd\x50\x93\x5f\
-\xcc\x44\x5e\xf3\xfe\x12\xd4\xca\x2c\x6a\x58\x69\x57\xd9\x67\xb2\
-\x61\x34\xee\x14\x45\x89\xba\x23\xb9\x6a\xe3\xcd\xae\x74\xc3\x75\
-\x00\x1e\xdc\x23\xb9\x5a\x91\x69\x5c\xf2\x90\xef\x3e\x3d\x69\x59\
-\x70\x23\xd8\xa8\xba\x25\xbf\x07\x35\xb9\x33\x52\x0f\x9d\x16\x2e\
-\x6e\x42\xff\x26\xce\xd2\x39\xd0\x40\x2c\x06\xde\x78\xc3\x51\xcf\
-\x0c\xba\xa2\x40\xb2\x9c\x70\x7b\xa8\x7c\xb3\xa6\x24\xc4\x87\x19\
-\xe8\x98\x87\xa5\x92\xf4\x09\x6f\x7b\x00\xc7\xa2\x88\x44\xa4\x1f\
-\x82\xb3\x22\x18\x39\x57\x89\x88\xed\x8d\xbc\x4f\x32\x54\x4b\xfb\
-\x1c\x0b\x11\x81\xe4\x87\x1f\x60\x41\x1d\xba\x6d\xf4\x22\x8b\xbf\
-\x52\xa4\x30\x83\x8c\x7a\xc5\x23\x74\x73\x47\x3b\x2d\x64\x43\x4c\
-\x49\x7d\x6f\x94\x8d\x3d\xf5\xd9\xe0\x31\xed\x50\xc0\x34\x4f\x77\
-\x9e\x25\xc1\xac\x29\x00\x64\xb8\x7a\x1d\xda\x05\xd1\xae\x16\x85\
-\x83\x0c\x5c\x6e\xee\x88\x39\x9a\x10\xf8\xfe\xd4\xed\xcb\x23\xa0\
-\x0a\xa1\xc5\x32\x05\x30\x84\xf7\xbf\x5d\x53\xd5\x34\x0a\x03\x51\
-\x8e\xb6\x20\xc3\xd5\xfd\x66\xe9\x2b\x2a\x66\x45\x27\xb7\x15\x11\
-\x92\x83\x0f\xb2\xd4\x6a\xfb\x4e\x8d\x22\xe8\x70\x69\xcf\xa4\x8d\
-\x62\x1c\x21\x62\x65\xc2\xb2\xa4\x90\x7a\x61\x08\x47\xd8\xb9\xa9\
-\x51\x08\xe6\x42\x54\x45\xad\x31\x75\x38\x51\x63\x50\x36\x65\x9c\
-\xb5\x5d\xc4\x95\xb7\x85\xae\x09\x6d\xce\x84\xb3\x80\x49\x83\x46\
-\x90\xbc\x34\xe4\xb7\xed\xe2\x89\x26\x67\x0d\x47\x2d\x59\xd6\x64\
-\x3a\x35\x9a\xe4\x9c\x2c\x70\xa9\x3b\xcb\xe2\xa8\xbb\x32\x57\xfe\
-\x8d\x3a\x59\x2d\x80\xd7\x0d\xc1\x43\x21\x66\xaf\xf6\x55\xb7\xee\
-\xc0\xaf\x01\xe0\xc4\x6f\x53\x1c\x16\x53\x9c\xb8\x56\xec\x22\xe6\
-\xa0\x69\x4f\x60\x72\x68\x75\xe6\x40\x44\xec\xce\xa9\x2c\x2c\x94\
-\xba\xa7\x2a\x49\xbb\xab\x1b\xfd\x28\xde\xf4\x15\x46\xf6\x2a\x20\
-\x5c\x36\x46\x50\x23\x06\x03\x80\x61\x51\xb1\xb6\xd4\xd7\x31\x35\
-\x5f\x30\xf5\xc8\x4d\xed\x69\x4d\x4d\x43\x21\x7a\xd3\xc0\x29\x83\
-\xe0\x48\x4c\x8f\xe2\xbd\xc0\x22\x9a\xab\x12\x43\xc7\xf5\x2c\xd5\
-\x27\x6a\xc0\xb4\x09\xb4\x64\x7a\xd5\x8e\x67\xbd\xa6\x04\xc7\x87\
-\x39\x19\x64\xf6\xea\x5f\x8d\xf1\x19\x67\x08\x83\x54\x28\xda\xb9\
-\x7d\x7e\xd9\xa9\x4f\x1e\x7e\x5e\xc2\x09\xe2\xa8\xcb\x78\xcb\x8d\
-\x85\xe7\xbe\x5a\x8b\xb1\x42\x98\x07\xa9\x86\xca\xaf\x6a\xe6\x90\
-\x14\xed\xdb\x2c\xb9\x03\x78\x18\xe0\xc7\x69\xce\x6b\x53\x29\x99\
-\x5c\xe8\x96\x32\x19\xbd\x14\x6d\x69\x7a\x6e\x61\x4b\x54\x65\x04\
-\x4a\xc2\x04\xe5\xce\xb5\xe8\x47\xb0\x55\x84\xa9\x6e\x88\xa0\x01\
-\x8a\xfa\xe0\xf1\x9b\x39\xed\x2a\x0c\x42\x3c\xfd\x9b\x24\xa8\x45\
-\x9d\x19\x34\x68\x33\xc2\x8b\x71\x43\x2f\x62\xbf\x28\xff\x93\x81\
-\x99\x2c\xfb\x2c\xbc\xc5\x37\x21\xbe\xc2\xe5\x7c\x1b\x12\x4d\xd1\
-\xe1\x4e\x91\x88\x94\x01\x79\xdf\x00\x6c\x32\x7c\x93\xf4\x61\x2e\
-\x22\x73\xb0\x97\x55\x5b\xbe\x0b\x1f\x4d\xb1\x4b\x49\x83\x38\x03\
-\x83\xd9\xc7\x56\xe3\xee\xb3\x28\x16\x39\x50\xc3\x98\x2c\xcd\x9a\
-\x41\x07\xf2\x6a\x41\xb8\xf7\x76\x3b\xb9\x3c\x00\x47\x9b\xa4\x19\
-\x01\xf1\xcb\x5b\x1b\x7a\xab\x69\xa4\x00\x34\x3a\x79\x22\xe7\xa1\
-\x8e\x7b\x70\x90\x73\xde\xde\xc8\x05\x42\x26\xde\xe6\xcd\x0f\xea\
-\x32\x32\x03\x16\x50\x73\x2d\x93\x9f\x82\x70\x94\xcd\xd6\xd4\xc0\
-\xa1\xdc\xb5\x17\xf1\xc8\x00\x8b\xe5\x89\x0a\xb7\xd6\x08\x27\x29\
-\x91\x8a\x48\x48\xfb\xa2\x03\x59\x22\x61\x7c\xa0\x31\x0f\xec\x81\
-\xb7\xd8\x4d\x78\xf7\x9a\x27\x14\x9e\x7b\xd1\x3e\x0b\x78\x89\x37\
-\xe1\x3d\x41\x69\xec\xd4\x37\x89\x7d\x22\xfc\xd5\xec\x4b\x6a\xf2\
-\x01\x81\xfd\x56\xfc\x5b\x93\xdf\x06\xcf\x24\xd9\x86\x76\xa9\xde\
-\x1c\x98\x27\x55\x4d\x03\x11\x6a\x48\xc4\x08\xc2\x25\x10\xd0\x5d\
-\x64\x93\xec\x99\x76\x77\xb1\xd8\xa3\x41\xa9\x28\x19\x4d\x38\xbc\
-\xbc\xd5\xa1\xa2\xb6\xc9\x47\xd4\x78\x5f\xfe\xda\x9c\x6f\x50\x42\
-\x33\x22\x3a\x70\x2a\xdc\xb3\xa3\x90\xa1\x59\x7c\x6d\xd7\xe0\x6b\
-\x92\x6b\xda\x28\x1d\x78\x07\x29\xa8\xee\x7d\xe7\x56\xcf\x33\x38\
-\x07\x5b\xab\x2d\x55\x14\x1e\xe8\x58\xbe\x43\x9a\xc6\x9a\x00\x7d\
-\xd7\x07\xa8\x89\x66\x86\x19\xbc\xe4\x90\x76\x76\xc9\x47\xc2\x58\
-\xb3\xdc\x6d\x35\xe0\x19\x54\xdf\xc0\xe3\x3d\xd0\x02\xb9\xed\xb5\
-\x93\x2c\x73\xc2\x37\xfc\xad\xfe\x4e\x70\x9c\xa0\xa9\xb9\x05\x2e\
-\x90\xff\x37\xab\xa7\xa7\xee\x38\xbe\x81\xc5\x55\x2b\xe6\x7e\x58\
-\x92\x90\x5b\x1c\x61\x13\x37\x13\x77\xe1\x05\xe1\x42\x8f\x40\xad\
-\x43\x33\x5a\x44\x09\xb1\xc2\xed\x82\x85\xb0\x29\x80\x9d\x20\x41\
-\x44\xb3\xa6\x8c\x70\xa5\x9c\xf1\x49\x9e\xb3\x81\x31\x64\x9b\xa6\
-\x54\xf1\x6e\x1c\xaa\x60\x1f\xf2\x9a\x29\x6f\x15\x9e\x53\xda\x0a\
-\x80\x91\xde\x9e\x42\x7a\x66\x9c\xbb\x38\x3b\xc8\xf7\x26\x0d\xcf\
-\x40\x7a\xba\x4d\x1c\x2e\xda\xf1\x2c\x8f\xd5\x40\x6f\xf5\x4d\xd1\
-\x1d\x83\x64\x70\x6f\x4d\x23\x31\x9a\x6d\x9a\xeb\x92\x76\x7d\xc7\
-\xd8\x81\x39\x75\x79\x0d\xd3\x8b\xe2\xc0\x1c\x4b\x41\xa1\x26\xd5\
-\xb5\x86\x0a\x89\x1e\x8a\x58\x84\xae\x2d\xda\xa8\x6d\x5a\x75\x9c\
-\x93\x0b\x10\x6b\xd7\x18\x28\x32\x99\x2a\x0c\xd8\x0f\x2a\x14\x2f\
-\xde\x92\x9a\x5b\xbc\x65\x6a\xf3\x5f\x5b\x27\x58\x1c\xa2\x86\x70\
-\xec\xa4\xef\x96\xab\xec\xa2\x86\xca\x4d\xc1\x6b\xda\xc9\x04\x3e\
-\xf8\x19\xa8\x28\x3d\x48\x15\xef\xad\x0d\x11\xf8\xa4\x81\xc0\x48\
-\x05\xcd\xab\x70\x4d\x5b\x52\x39\x06\xf5\xd0\xbb\x1a\xc3\x40\x08\
-\xe0\xb5\xb0\xbb\x71\x4c\x47\x18\x27\x5a\x0f\x6f\x44\x2c\xd1\x1f\
-\x60\x31\x46\x1e\x85\x6a\x83\x45\x41\x13\x25\xb9\x95\x41\x1a\x9b\
-\x86\x79\x48\x48\x89\xe0\xc4\x15\x7d\x9d\x9f\x7c\xf1\x9d\xa0\xb0\
-\xbb\x7d\x42\xd2\x5b\xc8\xd8\x59\xa9\x9c\xb4\xa7\x03\x30\xbe\x11\
-\xaf\x42\xbe\x00\x2f\xe8\x1e\x6c\xdd\x98\x13\x81\xd4\x32\xf5\xdb\
-\x34\x81\x87\x1a\x1c\x0d\x13\xd9\xab\x1a\x14\xd8\xf5\x2c\xa6\xc6\
-\x68\x6b\x5b\x49\xd2\x0f\x85\x8d\x48\x3c\xea\x8f\xaa\x66\x90\x22\
-\x0b\x48\x1c\x9a\xb2\x8b\x55\x4d\x27\x3c\x90\x2d\x18\x29\xec\x57\
-\xaf\xda\x66\x39\xd3\x71\xc1\x19\x05\x54\x6a\xac\x78\x58\x32\x92\
-\xd0\xea\x30\xe7\xd9\x9f\xd7\x34\xe8\xf2\x36\xf9\x25\x4c\xc5\xb7\
-\xc0\xe1\x40\x6b\xfb\xb6\x6f\x34\x87\x06\x3a\x5b\x11\xf7\xe3\xee\
-\xb5\xff\x20\xb9\x07\xdd\x18\x9e\x0b\x35\xab\x01\x8c\x23\x38\xef\
-\x7e\xd6\x2a\x2f\x8f\x60\x45\xa1\xaf\xa8\x3e\x7f\x57\xf3\x03\xdc\
-\x94\xd4\x53\x07\xa8\x36\x17\x08\x30\x08\xad\x22\xaf\x9a\xfe\x62\
-\xa1\x70\x33\xba\x92\x75\x63\x7b\xfd\x8b\x72\x82\x52\xbc\x02\xb3\
-\xd2\x35\x4b\xef\x06\x0f\x34\x14\x12\xb8\x57\x84\x29\x12\x14\x73\
-\xbc\xc0\xaa\xfc\x66\xd0\x34\x33\xb0\x10\x63\x32\x3a\xab\x69\x74\
-\x87\xdb\xc5\xe5\x28\x5b\x7c\x7a\x7b\x36\x54\x4a\xdd\x54\x0a\xc5\
-\x80\x5c\x95\x2e\x24\xed\x9b\x8f\xc7\x35\x3f\x34\x1b\xb7\x35\xde\
-\x45\xe4\x08\x1a\x1a\x43\x43\x3c\x09\x91\xc8\x62\x68\xc4\xdc\x34\
-\x6e\x92\xc4\x26\xda\x49\x4d\x6a\xd2\x1e\x35\xea\xf8\x1a\x27\xbf\
-\x09\x6d\xc8\x4e\x9d\xbd\x8e\xd0\x83\x81\x90\x3e\x2c\xbd\x97\x49\
-\xce\xa1\xc8\x73\x01\xaf\xf0\xae\x04\xb1\x21\xe7\x10\xb4\xdb\xd2\
-\xce\xa8\x12\x41\x1c\x3f\x0e\x9b\xe2\x25\x3b\x4e\xcf\x8e\xfb\x32\
-\xac\xa8\xf6\x3a\x2a\x54\x0d\x53\xf8\x31\x85\x41\xad\xc9\x3c\x0f\
-\xd6\x78\xfc\x28\x7e\xae\x1a\xf2\x0b\x54\x99\xfa\x44\xeb\x61\x38\
-\x14\x81\x43\x7c\xe3\x67\xd4\x93\x87\xe3\x82\x78\x55\x7e\x8f\x00\
-\xcb\x01\xa1\x95\x35\x05\x75\x5e\x77\x40\xb3\xb9\x5c\xc5\x59\x2a\
-\x1b\x08\x15\xfd\xdc\x25\xd4\x9b\x4a\x1a\xb5\x95\x4c\x63\xd5\xab\
-\xe8\x98\x19\x79\x3b\x62\x55\x77\x4e\x41\x15\x15\x26\x2c\x2e\x18\
-\x86\x3b\x95\x31\xc6\x9c\xb3\x82\xda\xc8\xc6\xf2\xc9\xe4\xe6\x7d\
-\x81\xc3\xfb\x46\xc4\x76\x71\x68\x22\xbc\x58\x1c\x81\x10\xa3\xf7\
-\x6c\x54\x90\xb6\x74\xaa\xd4\x83\xd6\x65\x82\xe2\x2c\x73\x20\x87\
-\xae\x86\x11\xf8\xfe\xf4\x12\xd1\x1b\x19\xfe\xd8\x22\xd3\xad\xee\
-\x56\x75\x23\x6a\x63\xc5\x80\x2e\x4c\x17\x7e\x81\xfb\xd1\x78\xd6\
-\x0a\xe0\xe1\x01\xbb\x37\x56\x8e\x8f\x63\xaa\xf2\xfe\xb6\xc1\xf6\
-\xd0\xc9\xf0\xf6\x38\x12\x16\xa6\xd5\xb7\x86\x6e\x71\x82\xc2\x07\
-\x4d\x7b\x40\xb3\x0a\x87\xb8\x4f\xff\xa4\x32\x07\x3c\xda\x37\xc4\
-\x3b\x70\x5a\x4f\xaa\x6a\x6b\x1d\xe5\x8c\x23\xf7\xc8\x24\xb4\x33\
-\x20\x06\x69\x91\x49\xae\x91\x46\x09\x25\x84\x31\x81\x99\x35\x88\
-\x10\x81\x30\xcd\x9f\xb2\x96\x2d\xae\xa0\x76\x21\x09\x9f\xde\x20\
-\x15\x09\x85\x30\xc3\x82\xa2\x0d\x16\x7a\x1d\xb4\x16\xe1\xc0\xce\
-\x70\xbf\xb1\x4c\x68\xd8\x80\x64\x68\x5e\x40\xa5\x1b\x07\x78\x34\
-\x61\xc6\xc1\xa6\x7a\xd1\x6a\xaa\x6a\xa3\x40\x2d\x5c\xa4\x3c\xdf\
-\xfa\x5f\x1a\x73\x00\xe3\xa8\x16\xa7\x4d\x17\x72\xe8\xb5\x67\xb1\
-\x16\xac\x47\xeb\xa8\x0f\xf4\x8d\x18\x19\x01\x80\x8e\xc8\xdc\xea\
-\xa5\x92\x06\x75\x99\xa4\x75\xb0\x41\xa8\x51\x52\x64\x69\x17\x67\
-\x63\xc7\xcc\x75\x0d\x09\xe0\x72\x28\x9f\x06\xd6\x23\x43\xae\x5a\
-\x4e\xfd\x6a\x72\x13\xc9\x24\xbf\x47\x25\x7a\x18\x1e\xfe\x02\xb3\
-\xe3\x10\x60\xbf\x1d\x11\x34\x22\xeb\xcc\xdb\xd6\x81\xb2\x09\x71\
-\x46\xae\x0d\x8a\xd1\x07\xcd\x36\x22\xfc\x65\x1e\xb5\x0b\xc1\x01\
-\x67\x6e\x80\x4a\x7b\xb3\xcb\xe0\x4c\x67\xbd\x7c\xd5\xc4\xf1\x18\
-\x6d\xa1\x91\x10\x20\x40\x34\x76\x7d\x6a\x53\x1f\x59\x1b\xb3\xea\
-\xf0\xe2\x32\x1e\xa3\xeb\xde\x60\xcd\x91\x34\xce\x45\x15\x18\x42\
-\xb4\x69\x57\x20\x91\x3b\x93\x45\xc3\x8d\x01\xa4\xac\x09\x05\x21\
-\xfd\xed\xa8\xdd\xbe\x48\x6d\xb4\x8d\x71\xcd\x88\x57\xa0\x62\x7f\
-\xbd\x3d\x2c\xec\x94\xaf\xed\xb0\xe7\x1b\x14\x96\xf4\x18\xea\x8c\
-\xe2\x10\x8a\xba\x43\xe8\x0c\x9c\x0a\x55\x9b\x5d\x7a\x3d\x22\xd8\
-\x53\x68\x81\xed\x1e\x5b\x59\xc3\x75\x72\x3c\xa1\xcf\xf4\x6f\x1d\
-\x70\xdb\x6d\x69\x1e\x12\x23\x6d\x97\x55\x07\x33\x83\xe6\x26\xb9\
-\x73\xf8\x6b\x66\x77\xd4\xc1\xc0\xc9\x3c\x4c\x8c\x11\x3c\x83\xf1\
-\x61\x5b\x35\xfb\xa1\x4e\xee\x07\x95\x05\x1b\x26\x6d\xad\x77\xe8\
-\x82\x8b\x07\x54\x54\xcc\x6f\xab\x81\x44\xc3\xe9\x58\x77\xd2\xe8\
-\x5c\x26\x16\x57\x3a\x46\x63\xaa\xba\xaf\xd1\xdf\x28\x92\xba\x35\
-\x73\x68\xf3\x1c\x05\x41\x4e\xc2\x7b\x70\xe6\xdb\x9e\x42\xdc\x69\
-\xf7\xd9\x28\xc4\xa4\x06\x9f\x23\xc3\xd1\xa8\x47\xdb\x6d\x52\x11\
-\x30\x05\xab\x95\x29\xf9\xfc\xee\xcc\x70\xba\xa2\xd3\xd9\x89\x31\
-\x0e\x04\xcf\x8c\x8d\xe2\x02\x41\x89\x16\xdf\x86\xd3\x25\x1f\x7b\
-\x75\x24\x28\xea\x9b\x7a\xea\x49\xd3\x36\x5f\xc4\xb0\x6e\x90\xe1\
-\xc0\x29\x60\xbe\x39\x0c\x00\xea\x61\x78\x04\xeb\x54\x2b\x6b\x50\
-\x28\x01\xde\x45\x1b\x45\xcd\xc5\xda\xc8\xcd\xcd\x00\xf9\xec\x1a\
-\xc8\x0d\x65\xad\x6d\x3d\x30\x82\x70\x28\x40\x21\x18\x15\x27\xd0\
-\x95\x75\xc9\x1c\x52\x6f\xe2\xde\x61\xa0\xac\xcd\xa5\x8b\x99\x1d\
-\x9a\xbd\x51\x57\xda\x15\xa9\x59\x6a\x00\x95\x0b\xfb\xd7\xa1\x86\
-\x14\x86\x62\x6a\xde\x13\x58\xd1\xcc\xd5\xe0\xd3\x47\x7d\x74\x34\
-\x01\x05\x83\x0b\xc1\x6a\x26\xb5\x34\x28\x8e\xaa\x09\x25\x04\xa3\
-\x2b\x19\x29\x7c\xb8\x67\x40\x5c\x9d\x50\x34\x05\xbe\xf8\x7a\x8c\
-\x07\x85\xa3\x51\xd3\xd7\x19\x38\x9a\x40\x81\x17\xb5\x7b\x12\x34\
-\xcc\xd1\x7b\xdb\xf1\xa6\xd3\x91\x96\x04\x61\x38\x71\x3a\x81\x47\
-\xb1\x1c\xb9\x09\x4d\x9f\xc2\x7e\x11\x8b\x09\x8c\x8f\x61\xbd\xb2\
-\x26\x81\x23\xf7\x86\x6f\x4c\xda\xc8\x42\x6f\x69\x98\x54\x53\xef\
-\x83\x9b\x26\x8b\x41\x56\x64\x0d\xaa\x56\x0e\x07\x5d\x70\x05\x2e\
-\xda\x58\x90\x3d\x1d\x0b\x9d\x84\xe2\x27\xaa\x0f\xa8\xf1\xaf\xac\
-\xb4\xf6\x46\xa4\x41\xde\xc8\x2c\x6a\x59\x53\xf3\x93\xa4\xda\x2e\
-\x23\xef\xc7\xd4\x56\xe7\x67\x86\xeb\xeb\x14\x9b\xf6\x80\x4d\x6e\
-\x26\x6b\xc6\x7b\xd8\x14\x56\xf4\xb0\xe4\x27\x77\xd3\x26\xec\xf2\
-\x6f\xe8\x12\x8d\x07\x28\x90\x90\xb9\x27\x74\xc2\xf6\x9f\x95\xe1\
-\x3e\x9a\xb6\x83\xe0\xc4\xad\x0d\xef\xea\xf9\x18\x2a\xa1\x20\xf2\
-\x80\xda\x5e\x24\xcf\x32\xf8\x90\xbf\x36\xc3\x9b\xd3\xcf\xa9\xc9\
-\x8a\x72\xe6\xaa\xd9\x0e\xf0\x86\x5a\x6a\xac\x5b\x08\xa6\x90\x91\
-\x05\x3e\xcd\xb7\xff\xa7\x89\x5f\x6a\xe9\x8d\x24\x12\x1b\x18\xc2\
-\x27\xd2\xe0\x79\x35\x88\xf9\x80\x8d\xda\x85\xc0\x1d\xcc\xa2\x51\
-\x32\x6e\xe8\x75\x4e\x3d\xc0\x38\xd1\x51\xf2\xd3\x99\x32\x50\xfb\
-\xb2\x69\xc8\x54\x65\x23\x7d\x4d\x02\x02\xc2\x6f\x06\x02\x82\x5b\
-\x99\xf2\x84\x69\xd5\x32\xac\xea\xc5\x90\xd2\x83\xd3\x5e\xed\xb7\
-\x09\x71\x30\xcc\xa2\xc8\x18\x59\x23\xcc\x72\x5f\xf5\x73\x72\x1a\
-\xfb\xd4\x9e\x24\xda\x98\x6a\x52\x1f\x18\x7b\xae\x96\x86\x06\x05\
-\x35\xb3\x96\x9b\xc6\xc7\x57\xc4\x02\x9f\x84\x90\x83\x25\xe0\x10\
-\xa2\xab\x71\x41\x2a\x3f\x4e\x4d\x92\xc1\xa6\xa0\x28\x19\x8f\x99\
-\xd3\xf4\x27\xee\x33\x9c\xf7\x68\x1e\x26\x55\x43\x84\x0d\x69\xa8\
-\x81\xc9\xb9\x5f\x8f\x93\x4c\xd1\x86\x96\x06\xf8\xd0\x08\x7c\x25\
-\xc3\x83\xc8\x03\x7c\xf4\x5c\x17\x27\x4c\xac\x45\x56\x4d\x85\x81\
-\x89\x76\xe7\xe2\x70\x34\x70\xa7\x2e\x75\x41\xe9\x72\xee\xf1\xa6\
-\x5e\x50\x7f\x20\x5c\x78\x0f\x7a\x4c\x99\x23\xd8\x4b\xba\x08\xcd\
-\xd7\x74\x4d\x2b\x56\xd1\x16\x2f\x72\xff\xd7\x21\x15\xf1\x13\x98\
-\x7e\x3c\x05\x4b\x4c\x7d\x22\x02\xf8\x8c\x7a\x2f\x1d\x71\x94\x86\
-\xb8\xf5\xdb\xcd\xd1\x16\x6e\x50\xb7\x44\xea\x19\x8b\x08\xb5\xbc\
-\x69\x28\xaa\xcb\x3b\x6d\x7f\x45\x93\xf3\xc5\x77\x90\x78\xa2\x06\
-\xa4\xf6\xaa\x94\xa2\x69\xdc\x19\x91\x60\x5d\x13\x19\x1a\x24\x31\
-\x2b\x1e\x31\x9a\x3b\x1c\x8c\x9c\x8b\xe9\xbc\x89\x17\x5c\xaa\xc3\
-\xba\x6b\x77\x99\x77\xce\xb5\xfa\x48\x79\x91\x67\x60\xe5\x96\x47\
-\x06\xfa\xb5\x53\x72\x1a\xf4\x1c\xf7\x9b\x20\x35\x3d\x90\x10\xe2\
-\x9b\x9b\x3b\xa2\x1a\xd1\x19\x11\x74\xa6\x79\xab\x11\xf7\xdb\x92\
-\x15\xb5\x52\x33\x85\x33\x4c\xf9\x7e\x96\x98\x82\xc7\xf0\xa8\x91\
-\x06\xfb\xc1\xc1\x80\x5b\x89\xb7\x4a\x3b\xe3\x10\x01\x62\x3f\xb5\
-\x05\xb2\x50\x23\xdf\xc0\xcd\x32\x12\x18\x05\xa0\xcd\x6e\x44\xb4\
-\x25\x92\x76\x82\xec\xe7\xed\x90\xea\x11\x90\x15\xd2\x51\xb3\x48\
-\x18\x20\xdf\x9d\x34\x41\x70\xc3\x6b\xa2\xd5\xea\x16\x57\x20\x2c\
-\x8c\x9a\xc4\x02\x47\xee\xe2\x8f\x68\x36\x82\x49\x45\xcf\xbb\x80\
-\x2d\xda\x47\x06\xb1\x64\x5f\x59\xf1\xac\xed\x2f\xc4\xeb\xad\xd2\
-\xb7\xa0\x7f\x5c\xb2\xeb\xf6\x06\xe8\x80\x02\x6c\x23\x21\x68\x54\
-\x02\xee\x0d\x3e\x27\x68\x2c\x94\xd7\x24\xad\xba\x0c\xe5\x0d\x97\
-\xa6\xa8\x47\x7a\xb0\xaa\x6a\xab\xda\x8b\x26\xb0\x8c\xe2\x72\x7c\
-\xf8\x22\x48\x36\x14\x8c\xea\x80\x2b\xf2\x54\xea\x8b\x40\xd1\xe2\
-\x59\x8d\x64\xd8\x1c\xc6\x1f\x4f\xec\x3c\xdb\x96\x2a\x09\x01\x16\
-\xb1\xdc\x8d\x50\x71\x71\xda\x17\xd1\x2c\x84\xa6\x28\xa1\xbe\x42\
-\x26\xb2\xb2\xd0\x80\xec\xc4\xe2\xd0\xb3\x7e\xd3\x69\x11\xe3\x99\
-\x95\x6f\x45\x7a\x57\x04\x83\xe9\xd4\x03\x11\xe8\x0d\x75\xe5\xee\
-\x74\xaa\xcd\x04\x1a\x37\x44\x5f\x2c\x6a\x90\x0a\x6c\x82\x2a\xfc\
-\x06\xed\x70\xf9\xc1\x62\x08\x36\x41\x40\xac\x50\x92\xa0\x7d\x73\
-\xf0\x33\x20\xe9\x80\x28\x6c\x27\x7e\x8c\xcc\x46\x63\x93\xd3\xac\
-\xc6\x16\xdf\x6b\x12\x97\xb7\xfa\x2f\x64\x5d\x7b\xb2\x30\x4e\xe0\
-\xef\xf0\x76\x1b\x9a\xc6\x52\x1b\x0a\xe1\x26\x21\x3b\x8b\x5b\x34\
-\xf7\xa8\x27\x0f\x34\x62\x0e\x7b\xf4\x04\x2c\x81\x04\xa7\xa8\xbb\
-\xfe\xf2\x58\xc3\xd6\x7d\x1f\x3d\xe8\x05\x2b\xeb\x31\x10\x3d\x3e\
-\x75\xd5\x09\xdc\xfe\xeb\x9d\xc2\x15\x05\x5e\x99\xc7\x11\x1a\x59\
-\xb6\x93\x05\x0d\x68\x39\x68\xed\x3b\x0e\x32\x6f\xa9\x5b\xa7\x9d\
-\xc7\xf8\x9e\x1c\x22\x17\x35\x19\x25\x37\x07\x28\x60\xd5\x51\x18\
-\x51\x8f\x84\x21\xe8\xba\xdb\x22\xcc\x37\x4e\x46\x3d\x22\x58\x30\
-\xe7\xa0\x5c\x09\xac\xb4\x8c\x6b\x83\xef\x35\x34\x43\xb6\xc1\xd7\
-\x05\x91\x05\x4e\xeb\xd9\x5a\x35\xc4\x40\x65\xb3\xb7\x27\x5d\xa7\
-\xd3\xfe\x6d\x02\x38\xd4\x82\x01\x5b\xba\x2e\xc7\x34\xda\x95\x83\
-\x84\x82\x66\x40\x01\x5c\x60\x05\xcd\xb6\x1f\xd3\xbc\xf0\xea\x81\
-\x00\x6d\x51\x60\xfa\xc1\x8b\x11\x93\x1b\x3a\x91\x9e\x3b\xd2\xd5\
-\xa2\x3d\x90\x64\x44\x4d\x26\x43\x7c\x8a\xf2\xed\x2c\xca\x9e\x11\
-\x4d\x8e\x2f\x41\x4a\xbf\x1d\xcc\x3c\x80\x18\x30\x64\x67\x44\xbd\
-\xba\x81\xc7\xbd\x2b\x90\xd0\x9d\xdb\xb8\x06\x56\x6f\xb1\x94\xe5\
-\x16\x6d\x82\x67\x80\x00\x33\x83\xc4\xd6\xd4\x92\x1e\x44\x43\x4a\
-\x21\x23\x6e\x82\xa9\x90\x86\x52\x3d\x5d\x0d\xcb\x7d\x1d\xf6\x2e\
-\x72\xc8\x2b\xfb\x0b\x8a\xdf\x8b\xc8\x47\x17\x24\x5e\x45\xeb\xbd\
-\xce\xc6\x05\x31\xd4\x05\x97\x52\x16\x23\x6d\xcd\xff\x6a\xbf\xa9\
-\xbc\x01\x2d\x3d\x35\xb4\xab\xc3\xc3\x6b\x5b\x56\xfb\x2b\xf0\xdc\
-\xd4\x96\x6d\xd5\x28\xc3\x04\x9e\x03\xfe\x5b\xcf\xa9\xee\xb7\xd7\
-\x18\x40\x1c\x9c\x01\x97\x72\x3f\x77\xa0\x16\xa2\x87\x16\x61\x99\
-\x6d\x0e\xe6\xd7\x8e\xa2\x76\x4d\xe4\x96\x50\x43\x1a\x91\x7a\x8d\
-\xf6\xae\xa6\xac\x36\x41\xd4\x45\xee\xac\xa2\x96\x73\x05\x99\xe5\
-\x42\x52\x11\xcb\xf3\x1e\xea\x5a\x7c\x37\xb4\x29\x2e\x9f\xb7\x71\
-\x9c\xda\xfa\xd1\x33\x5b\x57\x13\x72\x44\x7f\xea\x69\x85\xa3\x27\
-\xda\x34\xc5\xbe\xc1\xf5\xf1\x74\x33\xee\x57\x97\x53\xdf\xf3\x3d\
-\x1e\x42\x4c\x49\x07\x22\x8f\x8b\x26\x61\xc3\x02\xb1\x04\x5c\xa4\
-\x4e\xf7\xc2\x9e\x8c\x0e\x50\x87\xeb\xeb\x4d\xa3\xf4\x5b\x86\x78\
-\x01\x35\xea\xab\x06\x6d\x1a\x17\x3d\x79\x10\x8b\x36\x46\x9d\x84\
-\x79\x46\x69\xa0\xbc\xb1\x19\x9a\xd1\x29\xc4\x03\xbd\xcb\xea\x48\
-\x26\xc8\x68\xda\x44\x55\x01\x32\xe0\x37\xab\xa4\x4e\x47\x02\xf8\
-\xf3\xcb\xaa\xa6\x79\xf5\xdd\x82\xc3\xf7\xa2\x59\x29\xe8\x7a\xab\
-\xce\xad\xc7\x1f\xd3\x69\x1b\x02\x23\xb9\xb9\x99\x92\xc8\x33\x48\
-\x05\x38\xf5\xb2\xe4\x06\x3b\xa0\xeb\x38\x05\x1c\xa0\x06\xd7\xea\
-\xf1\x9e\xe6\x82\x26\x0b\x55\x9b\x98\x41\xa5\xe3\x45\xa5\x3f\x75\
-\xf5\x8c\x76\x80\x85\xc7\xd0\x63\x91\x06\x0e\x4b\x74\xbe\x31\x1d\
-\xb8\x51\x4d\x43\xd4\x2d\x59\x9b\xcf\x85\x93\xdd\x50\xeb\x9a\xa4\
-\x99\x9a\x96\x9d\x07\xad\xf8\x9e\x1b\x1a\x02\x6b\x78\x72\xa6\xd7\
-\x68\xd2\x78\xcf\xa4\x20\x1b\x3a\x0a\x62\x11\xdb\x21\x2e\x12\xb9\
-\x7a\x03\x87\x1a\x48\xbf\xab\x66\x33\x79\x94\xd3\x37\x70\x86\x44\
-\x46\x5f\xaa\xdf\x51\xcf\x0e\xda\xda\xbf\x52\xc7\xd3\xbf\x0d\x08\
-\x3d\x02\x68\x99\x3c\x85\x82\xb9\x31\x44\x30\xa7\xc4\x58\x20\xd8\
-\xb7\x9a\x58\x59\xd9\xaa\x47\x67\x32\xe1\xff\x1a\x99\x92\x2a\xb5\
-\x55\xd3\xe3\xf5\x4a\x5a\xee\x44\x0f\x0b\xf1\x41\x14\xa7\x9e\x50\
-\xe1\x07\x08\xbb\xcd\x61\x83\x97\x15\xc5\x33\x4b\x8d\xa1\x3c\xb3\
-\x26\x39\xd3\x28\xea\x8b\x1d\x4d\x71\x44\x1c\x8b\x26\xca\x40\xcb\
-\xf9\x95\x8e\x69\x82\x19\xcc\x5c\xe8\x1e\x59\xe2\xa8\x51\xac\x8e\
-\x8d\xab\xc3\xc9\xe6\xcb\xa1\x7e\x34\x37\xd5\x06\xc0\xd1\xe8\x41\
-\xb1\x9b\x34\x1d\x32\x01\xaf\x81\x71\x13\x58\x52\x52\x87\xd5\x94\
-\xa3\x7f\xee\x08\x86\xd1\x24\x17\xf2\xd4\x9a\xd3\x54\x06\x58\xa0\
-\x99\x8c\xf3\xda\x3c\xa2\x0b\xfc\x8d\x7f\xe3\x9e\xe8\x13\x13\x86\
-\x2a\xdc\xcd\xde\xee\xeb\x02\xf4\xf4\x14\x0c\x62\x0d\x35\x44\x65\
-\xe9\xd9\x9d\x52\x5d\xd4\xde\xc4\x89\x1a\x7c\x10\xed\xc7\x37\x34\
-\xf9\x36\x1f\x7a\x28\x11\x31\x84\xe8\xcf\x9a\x1e\xd5\x76\xe4\xeb\
-\x84\x0f\xcd\x98\x75\xac\x3b\xff\x60\xb5\x50\x62\x77\x68\x1e\xf2\
-\x8d\x67\x65\x55\x17\x00\x2a\x90\x5c\x75\x5d\xdc\x4b\x0f\xa3\x53\
-\x6a\x99\xe5\x92\x7c\x05\xfe\x89\x93\x7e\xa1\x40\xd4\x3e\x4a\x93\
-\xcd\x63\x8d\x3a\x32\xc7\x3c\x8c\xe7\xf4\x50\xbb\x69\xda\x78\x17\
-\x3f\xe5\xd6\x70\xa5\xfd\x0d\x05\xa2\x23\xb5\xab\x85\x67\x3b\xb7\
-\xe1\xc9\xad\x6a\x5c\x55\xb3\x5f\xea\x73\xdd\x52\x9e\xa5\x98\xda\
-\x34\xe3\xa7\x0e\x42\xd0\xac\x8a\x08\x02\x1a\x85\x61\x07\x34\x87\
-\xd2\xd8\xda\xd1\xc9\x98\xee\x10\x71\x24\xe1\x76\x71\x05\xd0\xb2\
-\xb2\x02\x26\x62\x03\x33\xa8\x2d\x03\x45\x0b\x64\xee\xd4\x85\x45\
-\xc6\xe8\x79\x91\xa6\x63\x68\xca\x4d\xe3\xac\x49\xbf\x1b\x03\x0c\
-\x29\xaf\x81\x8d\xdf\xd1\x24\xe1\xd0\x53\x3f\x47\xc3\x36\x33\x68\
-\xff\xd9\xd4\xe9\x25\x95\xa8\x1a\xd7\x35\x8e\x45\x5a\x50\x50\x51\
-\xfd\x43\x4d\x16\x57\xcd\xde\x74\x1c\xbc\xf6\x76\x42\x17\x30\xc3\
-\x97\x1a\xb1\x49\x4b\xd3\xd3\xb6\xb4\xa1\xee\x1b\x17\xa0\xa8\x4e\
-\x35\xbc\x5d\x31\x4d\xe7\x20\x35\x85\x51\xa3\xbf\x7a\x38\x6f\x47\
-\x3d\x54\x3d\xfb\xab\x8e\x3c\x32\xf5\xf5\xb8\xc3\xdb\x36\x44\x24\
-\xb2\x68\x68\xf9\x05\x1a\x2e\x75\x7e\xd1\x27\xd7\xa9\xff\x87\x88\
-\x20\x16\x48\xc9\x9c\x8e\x04\x7b\xaf\x44\x8d\xbc\x3c\x40\x39\xcb\
-\x7e\x55\x17\x70\x57\x23\x68\x63\x44\x35\x18\x35\xf0\xfb\x66\xdb\
-\xd0\x25\x4b\xc4\xa4\xe7\x45\x36\xd9\xa2\xbd\xc7\xcd\x11\x25\xf9\
-\xa9\x4c\xc0\x15\xd1\xa1\x07\x84\x70\xee\x65\x79\x75\x0b\xc9\x6d\
-\x3d\xd1\x26\x53\x23\xff\x46\x9e\x1f\x3d\x37\xa6\x79\x83\x0e\x79\
-\x03\x6c\x62\x76\x19\x0d\x2a\x6e\xe4\xe3\x3b\xc6\x12\xb4\xd1\xc4\
-\x74\x03\xc0\x24\x16\x57\xd2\x53\x3d\x2b\x68\xa4\xf6\x88\xfa\x5e\
-\xd6\x35\x3d\x73\x4c\x98\xf1\x9a\x3a\x90\x9e\x6c\x03\x5e\x8e\x9a\
-\xdf\xd8\x1a\x22\x02\x91\x6e\x0d\x7a\x93\x1f\xe5\xc8\xe8\x3e\x45\
-\xba\xf5\xd4\xf0\x09\x47\x77\x8d\x67\x52\x31\x61\x68\x5e\xf7\x1d\
-\x9d\xb6\xc8\xec\x8d\x7a\xb1\xa3\x8a\x5e\x10\x9e\x9c\xfe\x66\x51\
-\xfc\x56\xeb\x36\x68\x88\x71\x1e\xd3\xc0\xd6\x92\x0b\x65\x11\x34\
-\x66\x95\x35\xf7\x25\x43\x80\x30\x50\x93\x01\x07\xe7\xa2\x5c\x22\
-\xc6\x43\x53\xca\xfe\x9b\x36\xd7\xd8\xaa\xc6\x0a\xd7\x50\x1f\x5d\
-\xbb\xf1\xb0\x10\xd9\x2b\xb7\x86\x22\x42\x9b\x9a\x96\x09\x51\x16\
-\xbb\x9e\x4b\x5d\xf8\x60\x58\xa4\x94\x46\x9d\xc3\x96\xfa\x95\x03\
-\x5c\x26\xc0\xad\x31\x16\xd8\x05\xb7\xa1\xa1\x23\x01\x9e\x97\x7a\
-\x27\x9b\x58\xc5\xae\x5d\x89\x86\xea\x25\xc1\xe7\xd6\x5e\x03\xae\
-\x03\xa6\x25\x65\xf4\x18\xbc\x26\xb1\xd5\x7c\xa8\x11\xaf\x01\xb7\
-\x71\xd7\x18\x07\x43\x0f\x6b\x8b\x2e\xe9\x97\x88\xe0\x23\x92\x9e\
-\xf6\x20\x60\x7d\x1c\x78\xa2\xe9\x59\x72\xa8\x0d\x24\x0f\xc3\xb1\
-\xaa\x44\x9c\x90\x5e\x32\x4f\x53\x6c\x40\x08\x12\x58\x83\xb9\x35\
-\xea\x11\xd5\xf3\x4d\xc7\xda\xd0\xdc\xe4\x42\x4c\xf6\xa9\x9d\x71\
-\x3e\x83\x60\xd6\xdc\xef\x86\xbb\x76\x71\x42\x2a\xf8\x8b\xc2\x1e\
-\xb1\xa2\x16\xe5\xac\xa9\x5c\x3d\xcd\xa4\x29\xbf\xb1\xd4\x9d\xde\
-\x41\x86\x4d\x4f\xc8\x61\x5b\xba\x50\x8e\x24\x68\x0a\xe1\x10\xf0\
-\x21\xad\x34\x0f\xb9\x34\x85\x4a\xe1\xc4\xd1\xf5\x5c\xf1\x45\xf7\
-\xdb\xd2\x66\x4c\xcd\x9a\xd3\xd1\x00\xc0\x51\xbb\x7f\x1c\xf0\xb7\
-\xe3\xd3\x38\x27\x00\x9b\x08\x59\x5f\x53\x13\xd2\x28\xf0\xec\x9a\
-\x7e\x35\x84\x1a\x8c\xf0\x8b\x9e\xea\x03\x7f\x3b\x2e\x4a\x93\x23\
-\xe3\x0d\xd2\x81\xfc\x2c\xb4\x66\x97\x86\xca\x7a\xf5\xaa\x2e\xaf\
-\xb6\x9b\xd4\x66\x45\xfe\x41\x87\x85\xf0\x6f\x0d\xbb\x1e\x78\x7c\
-\x2c\xf2\x4e\x0f\xe8\x49\x78\x76\xed\xed\x69\x8a\x2e\x47\x6e\x54\
-\x8a\x5f\x1b\x2c\x17\xeb\x5e\x37\x8a\x62\x20\xb5\x3c\x42\x94\x85\
-\xd3\xae\x12\xcc\x39\xdd\xa5\xd2\x96\x54\x3a\x84\x0f\xe5\x90\x7f\
-\xbc\x90\x38\x31\x2b\x7e\xf4\xb8\xc8\x7d\x0f\x5f\x05\x0d\x19\xca\
-\x09\xe0\x1f\x0c\x62\xd7\xf6\x93\xf4\x54\xd7\xed\x63\x24\x82\x43\
-\x63\xe9\xf1\x45\x4d\x82\x6b\xb4\xd2\xf4\x7c\x18\x52\x4b\x9b\xfb\
-\xbe\xb6\xa7\x84\xde\x03\x92\x8b\xab\x46\x52\x20\x66\xd6\xe5\xdd\
-\xb0\x08\xf1\x84\x26\x3e\xe2\x29\xc5\xc5\x07\x3c\x70\x22\x76\x56\
-\x0d\x2a\x68\x0d\x71\xd0\xf5\xd0\x55\x56\xe3\x4e\xad\x00\x3d\x2c\
-\xcc\x52\x48\xfb\xbc\xa6\x14\x9f\x4c\xc0\x1e\x38\xac\xd1\x53\xc0\
-\x19\xda\x71\x42\xd1\x22\x37\x04\x7b\x68\x68\xbb\x11\x36\xff\x3a\
-\x4d\xe8\xb6\xd0\xe4\x3d\x82\x61\x36\xb8\x2b\x65\x8e\x1e\x0b\x56\
-\x7f\x03\xa9\x2c\xf5\x47\xa9\x69\xcc\x1c\xc5\xe4\x10\xe1\xe7\x9b\
-\x94\xa2\xe8\xc9\x3d\x3d\x2d\x04\xf4\xa0\x87\x35\xc1\x7b\x35\xbc\
-\xb1\xd4\x80\x7d\xbf\xfb\x25\x92\xdf\xf5\x29\x43\x94\x2a\xd7\x34\
-\xd6\x92\xd9\x81\x59\x8a\xd3\xf3\xf3\xef\xd1\xa9\xda\xf5\xac\xf1\
-\xa5\x56\xf0\x52\xe4\x28\x4b\xa5\xd9\xe2\x52\xb4\x25\x60\xa6\x21\
-\xc6\x03\xd6\x1e\x58\x32\xc9\xd4\xaa\x77\x03\xe5\x72\xaf\x45\xed\
-\x42\x17\x96\x36\x2f\x8d\x17\xbe\x69\xd1\xa6\x86\x9f\x0a\x33\x22\
-\x72\x82\x0c\x74\x95\x96\x45\xad\x69\x70\x4f\xbb\x11\x2c\xbe\x6c\
-\x05\x14\x33\xe6\x73\xac\x7a\xa0\x7b\x91\x47\x1a\x62\x56\x8b\xe0\
-\xb5\x21\x0d\x2a\xac\xfa\x0b\x92\x56\xff\x5b\x7e\xc2\x92\x3a\xa2\
-\x05\x7e\x03\xe8\xf4\xfc\x3e\x16\x76\x68\x64\x59\x1d\x81\x39\xde\
-\xa6\xf6\x40\x44\x54\xed\x16\x2a\x1d\x03\x9e\x36\xe8\xb7\x9b\x60\
-\xe6\xa0\xdd\x2a\xef\x15\x35\x6c\xe9\xa5\xe4\xb6\x9e\x83\xb7\x0d\
-\xfa\x69\xb7\x07\x19\x41\x2a\xea\xb1\xe5\xab\x96\x81\xe6\x6a\xd1\
-\xf9\xfa\x1d\x1a\x9a\x76\x93\x72\xdf\x9c\xf5\xeb\xa1\x2c\x0c\x3b\
-\xea\x22\x52\xd0\x64\x4d\xd3\xb6\xd1\xd5\xb4\x3b\x69\xad\x7e\x73\
-\x64\xad\x11\x85\xd4\xac\x76\xa8\x29\x91\x41\x29\x69\x93\x73\xaa\
-\x5b\xce\x81\x66\x6e\x99\x3a\x29\x14\x0b\x30\x65\xda\x63\xf7\x59\
-\x0f\x01\x72\x0c\x80\x65\xe9\x49\xbc\xa4\x27\x20\xa2\xa6\xae\xf4\
-\x04\xd8\x00\x22\xcc\x05\x8d\x09\x72\x4b\xb8\x0a\x54\x69\x10\x98\
-\x23\xff\x34\x03\x25\xaa\x06\x2d\x29\x73\xd3\x13\xde\xa2\x5c\x3d\
-\x4c\x70\xb5\x46\xa0\x21\x10\x83\x70\x47\x13\x64\xb5\xe7\xa2\x0b\
-\x92\xad\x02\xea\x52\xf4\xcb\x10\xd0\x2e\xda\x1b\x4a\xa7\x4b\x19\
-\xb0\xc2\xe6\x61\x8c\xad\x47\x79\xf4\x90\x54\x50\x57\x09\xff\x85\
-\x56\x27\x26\x77\xfc\x7a\xd8\x21\x16\xa7\xae\x91\xd7\x7e\x02\x45\
-\xb4\x57\xa5\xe0\xdb\x53\xb9\x10\x8b\x07\xe3\x41\x7f\xb5\x8b\x22\
-\x22\x03\x49\xa0\xed\x5a\x30\xd6\x9e\xbb\xd3\x1c\x9b\x9e\x44\x2c\
-\x05\x48\x6b\x18\xbf\xa2\xf6\xb1\x1e\xfd\xce\xa8\x74\x60\x17\xdb\
-\xae\x27\x91\x82\x9e\xde\xe5\xa6\xc0\xcd\x84\x72\x45\x4f\x76\x0d\
-\xa5\x6a\xe2\xec\x3d\x8a\xa0\xdf\x69\x83\x86\x20\xa4\x48\xb2\x5b\
-\x5c\x78\x29\x81\x5c\x21\x0d\x63\xfe\x9e\xca\x53\x86\x2b\xa3\x90\
-\x64\xfa\xd5\x2c\x78\x2d\xae\x32\x64\xe9\x69\x68\xa1\x2b\x25\x6f\
-\xd3\x36\x8d\xbd\x16\xe3\xd0\xb3\xe7\x2e\x9d\x18\x10\xde\xf1\x81\
-\x1a\xbc\x28\xc1\x8a\xeb\xa1\x70\x4d\x0f\x4b\x27\x3d\xb8\x33\xd5\
-\x9e\x0c\x70\x09\x49\x00\x50\x05\x96\xad\x4d\x3d\xdd\x12\xb5\x5b\
-\xac\xe7\x04\x1a\x09\xb9\xb7\x79\x6d\x22\x42\x00\x7a\x38\x56\x66\
-\x07\xc4\xd8\xda\xfb\x39\xeb\xc6\x5c\x22\x74\x8b\x1e\x82\x47\x97\
-\x9e\x55\x52\x63\xcd\x64\xaf\x9a\xd2\x80\x6b\x92\x76\xab\xde\xa1\
-\x00\xa0\x0b\xc9\x5d\x24\xd2\xd0\xc3\x92\x5d\x43\x17\x6f\x04\xa5\
-\x46\x8a\x10\xab\xa3\x21\x31\x52\x4d\x43\x69\xa8\xc0\x24\x83\xad\
-\x0d\xf7\xaa\x36\xd7\xfb\xc5\x15\x33\x9b\x7b\xa5\x23\x09\xbf\xb3\
-\x7e\x81\x92\x9e\xab\x7d\x1b\x1b\x38\x2e\xb0\x98\x45\x2d\x1a\xd3\
-\xf6\x59\xef\x93\x25\x7d\xbf\xc4\x82\x95\x61\x85\xd4\xc8\xf5\x92\
-\x71\x15\xed\xeb\x9a\xf6\x59\xf4\x0c\x81\xa1\x3c\x25\x46\xbd\x7a\
-\xdf\x10\x9c\xf4\x43\x26\x78\xda\xb6\x44\x33\xea\x11\xe4\xae\x31\
-\x0a\x0d\xa6\x3c\x82\xd2\x4e\x72\x65\x51\x81\x68\xd0\xc2\x69\x78\
-\x54\xbf\x49\x43\x93\xb8\x28\xef\xbe\xba\x1e\x92\x7c\x88\xa5\x41\
-\x8d\x8c\xca\xd9\x27\x7f\x64\xac\x59\x5d\xee\x5b\x8f\x14\x6a\xf0\
-\x75\x69\x33\xa1\x5a\x02\xe1\xef\x70\xfa\x5d\x12\xda\x9a\x56\x9b\
-\xc3\x90\x28\x38\x40\x3d\x54\x5b\x95\xea\x62\xfc\xf7\x5b\x10\xd0\
-\x70\xd8\xae\xd4\xf4\x7c\xac\x86\x79\xd1\xe1\x29\xca\x1e\x6b\xbe\
-\x01\x17\x9d\x09\x7f\x2d\x14\x00\xfc\x1d\xd5\xb3\x36\xd3\xee\x80\
-\x7e\xdb\x0b\x6b\x3e\xc8\xa6\xa9\x5f\x7c\xf2\xb8\x44\x8e\x38\x15\
-\xf5\x3c\xd5\x6e\x58\xbf\x9e\xef\x1b\x49\xd3\x87\x9d\xf0\x77\x20\
-\x64\xae\xd7\x49\x1d\xfa\xcd\x29\xb0\x24\x49\x03\x58\x20\x19\x35\
-\x1b\x7a\x05\x07\x45\x73\x9d\xb9\x5a\xd4\x96\x58\x1c\x90\x55\x53\
-\xef\x0c\x70\x01\x27\x4d\x5f\x7b\xf7\xf4\xaf\x1e\x10\xd6\xc0\x1e\
-\xea\x02\xf3\xe9\x2f\x46\x79\x6a\x1a\x12\xd5\xa7\x6d\x03\xc9\x85\
-\x37\x0e\xf9\xda\x69\xda\xe3\x1b\xc8\x91\x37\x91\xfc\x36\x99\xb3\
-\x3f\xc1\xe9\xf1\x9f\xa1\x5e\xf7\x53\x8f\xe4\x14\x38\xc7\xff\x76\
-\x48\xe1\x8d\xe9\x5b\xd1\xe3\x14\xa0\xf7\xfa\xe6\xff\x58\xde\x97\
-\x65\xeb\xa9\x48\xe8\x9d\x6f\x00\x7c\x0d\xe8\xc6\xaa\xfd\x99\xf3\
-\x1e\x0b\x0d\x59\x4d\x95\xe1\x35\xff\x48\x8e\x1b\xe4\x97\x75\x69\
-\x7c\x5b\xe1\x1f\xc4\xea\x25\xba\xd4\x0e\x90\x9c\x25\x16\x35\x9b\
-\xab\x01\x94\xe2\x86\xfa\x2b\xac\x32\x35\x89\xdb\x7d\xcf\x61\xfa\
-\xef\x39\x07\xd8\xe3\x22\xdd\x8d\x3c\xc4\xa8\xea\x87\x14\x50\x7d\
-\x67\x43\xf6\x72\x3b\x08\xd2\xda\xc1\x4b\xaf\x26\x18\x22\x82\x38\
-\x8d\xfa\xc7\x4c\xa1\x5c\x35\x8c\x51\xe5\x82\x3a\x95\xfb\xa6\x0a\
-\x35\x72\xbe\x5b\x00\x9d\xda\x29\x28\xb4\x9a\x43\x7f\xbf\x1e\x01\
-\x05\x3f\xf5\x28\xec\x70\x80\x1c\x49\xcc\xf2\x90\x20\x9a\x43\x4c\
-\x42\xbf\x6b\xc3\xfd\x0f\x6c\x5c\x89\x2d\x40\x1d\x04\x9b\x00\x00\
-\x01\x84\x69\x43\x43\x50\x49\x43\x43\x20\x70\x72\x6f\x66\x69\x6c\
-\x65\x00\x00\x78\x9c\x7d\x91\x3d\x48\xc3\x50\x14\x85\x4f\xd3\x4a\
-\xa5\x54\x1c\xec\x20\xe2\x90\xa1\x3a\x59\x10\x15\x71\xd4\x2a\x14\
-\xa1\x42\xa8\x15\x5a\x75\x30\x79\xe9\x1f\x34\x69\x48\x52\x5c\x1c\
-\x05\xd7\x82\x83\x3f\x8b\x55\x07\x17\x67\x5d\x1d\x5c\x05\x41\xf0\
-\x07\xc4\xc5\xd5\x49\xd1\x45\x4a\xbc\x2f\x29\xb4\x88\xf1\xc1\xe3\
-\x7d\x9c\xf7\xce\xe1\xbe\x7b\x01\xa1\x59\x65\x9a\x15\x1a\x07\x34\
-\xdd\x36\x33\xa9\xa4\x98\xcb\xaf\x8a\xe1\x57\x44\x11\x42\x04\xc0\
-\xa0\xcc\x2c\x63\x4e\x92\xd2\xf0\x5d\x5f\xf7\x08\xf0\xf3\x2e\xc1\
-\xb3\xfc\xdf\xfd\xb9\xfa\xd4\x82\xc5\x80\x80\x48\x3c\xcb\x0c\xd3\
-\x26\xde\x20\x9e\xde\xb4\x0d\xce\xfb\xc4\x31\x56\x96\x55\xe2\x73\
-\xe2\x31\x93\x0a\x24\x7e\xe4\xba\xe2\xf1\x1b\xe7\x92\xcb\x02\xcf\
-\x8c\x99\xd9\xcc\x3c\x71\x8c\x58\x2c\x75\xb1\xd2\xc5\xac\x6c\x6a\
-\xc4\x53\xc4\x71\x55\xd3\x29\x5f\xc8\x79\xac\x72\xde\xe2\xac\x55\
-\xeb\xac\x5d\x27\xff\x61\xb4\xa0\xaf\x2c\x73\x9d\xf6\x30\x52\x58\
-\xc4\x12\x24\x88\x50\x50\x47\x05\x55\xd8\x48\xd0\xa9\x93\x62\x21\
-\x43\xf7\x49\x1f\xff\x90\xeb\x97\xc8\xa5\x90\xab\x02\x46\x8e\x05\
-\xd4\xa0\x41\x76\xfd\xe0\x33\xf8\xdd\x5b\xab\x38\x39\xe1\x25\x45\
-\x93\x40\xcf\x8b\xe3\x7c\x8c\x00\xe1\x5d\xa0\xd5\x70\x9c\xef\x63\
-\xc7\x69\x9d\x00\xc1\x67\xe0\x4a\xef\xf8\x6b\x4d\x60\xe6\x93\xf4\
-\x46\x47\x8b\x1f\x01\xfd\xdb\xc0\xc5\x75\x47\x53\xf6\x80\xcb\x1d\
-\x1a\xf7\x93\x21\x9b\xb2\x2b\x05\x69\x0b\xc5\x22\xf0\x7e\x46\x63\
-\xca\x03\x03\xb7\x40\x64\xcd\xeb\x5b\xfb\x1e\xa7\x0f\x40\x96\x7a\
-\x95\xbe\x01\x0e\x0e\x81\xd1\x12\x65\xaf\xfb\xfc\xbb\xb7\xbb\x6f\
-\xff\xbe\x69\xf7\xef\x07\xe4\x93\x72\x6e\xf7\xd9\x44\x17\x00\x00\
-\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x2e\x23\x00\x00\x2e\x23\
-\x01\x78\xa5\x3f\x76\x00\x00\x00\x07\x74\x49\x4d\x45\x07\xe3\x0c\
-\x04\x0a\x01\x19\x66\x71\xa5\x8d\x00\x00\x00\x19\x74\x45\x58\x74\
-\x43\x6f\x6d\x6d\x65\x6e\x74\x00\x43\x72\x65\x61\x74\x65\x64\x20\
-\x77\x69\x74\x68\x20\x47\x49\x4d\x50\x57\x81\x0e\x17\x00\x00\x20\
-\x00\x49\x44\x41\x54\x78\xda\xb4\xbd\x59\xac\x65\xe9\x75\xdf\xf7\
-\xfb\xa6\xbd\xf7\x99\xee\x7c\xeb\xd6\xc8\xee\x62\x37\xd9\x64\x53\
-\xa2\x64\x51\x24\x95\x48\x88\xe4\xc4\x90\x90\x87\x24\x36\x01\x3b\
-\x08\x2c\x05\x30\x92\x58\x42\x02\xe8\x21\x4f\x51\x10\x03\x41\x5e\
-\x9c\xc4\x49\x00\xe7\x21\x41\xfc\x10\x40\xd0\x53\x90\xc8\x43\x06\
-\x5b\x32\xfc\x60\xc7\x0a\x1d\x49\xa6\x38\xb3\xc9\x26\x7b\xa8\xae\
-\xae\xe9\x8e\x67\xde\xc3\x37\xe5\xe1\xdb\xfb\x0c\xb7\xaa\xbb\xa9\
-\x98\xbc\x8d\xd3\x75\xab\xee\x39\xf7\x9c\xfd\xad\xef\x5b\xeb\xbf\
-\xfe\xeb\xbf\xd6\x16\x31\x46\x7e\xd8\xaf\x18\xd3\x43\x88\xf4\xf8\
-\xe0\x2f\xcb\x37\xbf\xf5\x55\x5e\x7d\xf5\x93\xc4\x18\x09\x21\x10\
-\x42\xc0\x7b\x8f\xf7\x7e\xeb\xfb\x18\x23\x45\xd1\x23\xcb\xf2\xcf\
-\x87\x10\x7f\x17\xe2\x71\x8c\x31\x00\x21\xbd\x67\x24\xc6\x08\x11\
-\x22\x31\xbd\x3f\xe0\x42\x43\x08\xee\x03\x3e\xe7\xf6\x35\x49\x29\
-\xc9\xf3\x1c\x99\xbe\xa2\x52\x6a\xae\x95\xfe\x9b\x45\xbe\xf3\x3b\
-\xdf\xfc\xce\x97\xdf\x1f\xf4\x47\x38\xdf\xa0\xb5\x46\x29\x49\x9e\
-\x8d\xe8\x15\x7b\xdd\x6f\x63\x77\xe7\xa8\xbd\xf6\xf4\xfe\x44\x81\
-\x94\x1b\x6b\x20\xd6\xef\x2b\xae\x2d\x4c\x77\xed\x00\x4a\xa9\xe7\
-\x7e\x7e\xfd\x4b\xfc\xa9\x0c\x12\x20\x04\xd2\x87\x91\xeb\x7f\x5f\
-\x2c\x2f\x45\xfa\x55\x01\xe7\x1a\x7c\x48\x8b\xfd\xd7\xfe\xab\x97\
-\xf9\x9f\xfe\x46\xbc\xd1\x34\xf3\x4f\x37\xb6\xfe\xd7\xbd\xf7\xf7\
-\xbc\xf7\xc2\x7b\x1f\xbd\xf3\xf8\xe0\x09\x21\x12\x63\xa8\xa5\x94\
-\x2f\x2b\xad\xfe\xec\xca\xf2\xdd\x06\x20\xae\x17\x39\x76\x7f\x83\
-\x18\x7d\xfb\xb8\x66\x88\xd5\x73\xe2\xc6\xcf\x62\x67\xdf\xf6\xaa\
-\x05\xce\xd9\x37\xad\x6d\xde\x8c\x31\x4c\x8d\xd6\x51\x1b\x23\x8c\
-\xd1\x48\x29\x65\xaf\xd8\x5d\x0e\xfa\x87\xdf\xe8\xf7\x86\x7f\xf3\
-\x3b\xdf\xfb\x63\x6c\x53\xd1\xeb\x0f\xd8\x19\xed\x90\xe7\x05\xce\
-\x3b\x94\x54\x62\x77\x74\x27\x0a\x40\x48\xb1\xda\x78\x31\x46\xa4\
-\x94\x08\x21\x10\xe2\xf9\x7f\x97\x52\xfe\x08\x0d\x12\x93\x51\x84\
-\x84\xc9\xf4\x99\x88\xed\x8b\x23\x91\xc3\xfd\xdb\x94\xd5\xe4\xa5\
-\xa6\xa9\xee\x3a\xef\x86\xde\xfb\x10\x82\xdf\x97\x42\xdc\x95\x52\
-\x7d\x16\xc4\x97\x62\x8c\xa3\xee\x84\x74\x8f\xf5\xfb\x47\x10\xf1\
-\xb9\x1d\xde\x7d\x1f\xd3\x11\xd9\x38\xa9\x2e\x19\x64\xe3\x79\xb1\
-\xfd\x7d\xab\x47\xfb\xe4\x18\x03\x3e\x58\x42\x4c\xef\x1d\x43\x6c\
-\xed\x92\x16\x48\x69\x85\x56\x1a\xa5\x14\x52\x0a\x8c\x19\xa0\x55\
-\xef\x8d\x8b\x8b\xa7\xff\xc5\x7c\x31\x7e\xb8\xbb\x73\xd0\x1f\x0c\
-\x46\xec\xec\xec\x66\xfd\x7e\xff\xc9\x1f\xfd\xf1\x3f\xf9\x93\xbb\
-\x77\x5f\xa6\xdf\xef\x31\x18\x0c\x90\x52\x12\x63\x14\xfd\xfc\x76\
-\xb7\x24\x2b\xa3\x6c\x5e\x43\x67\xa4\x1f\xa1\x41\x22\xb3\xd9\x9c\
-\xaf\x7e\xf5\x1b\xdc\xff\xf8\x31\x47\x87\xc7\x34\xb6\x11\x5a\xeb\
-\x28\x84\xbc\x13\x63\xf8\x0d\xe7\x9a\x5f\xf5\xc1\xbf\xec\xbd\xc7\
-\xda\x1a\xef\x3d\x5b\xae\xe7\xda\x82\x77\x1f\x32\xb9\x41\xf1\x42\
-\xb7\xb3\xf9\xda\xee\xef\x3e\xd4\x78\x6f\xb7\x7e\xde\x3d\xc2\x35\
-\xc3\x20\x40\xeb\xb4\x5b\x3b\x57\xd9\x6d\x8c\xeb\x9f\x25\xb9\x99\
-\x76\xe3\x09\x85\xd6\x86\x22\xef\xad\x4e\x48\x96\xe5\xff\xb4\xb1\
-\xcd\xbf\x9a\x99\xdc\xd5\xcd\x4c\x0c\x06\x03\x8c\xc9\xe2\xe5\xe5\
-\x39\x5a\x1c\x73\x70\x70\x80\x52\x8a\x10\xc2\xc6\xb5\x89\x1f\x7a\
-\x8d\x7f\x68\x83\x94\xd5\x8c\x5e\x31\x62\x3a\xbb\x68\x2f\xc8\x71\
-\x74\x78\x3c\x9c\x4c\xaf\x7e\xdb\x7b\x77\xe2\xbc\x25\x04\xff\x52\
-\x08\xee\x8e\x0f\x5e\x24\xbf\xb9\xe5\x4f\x78\xd1\x3b\x89\xed\xff\
-\x3d\xe7\x7a\xd6\x31\x64\x73\xc7\x43\xc4\x12\xa2\xdb\x36\x48\x88\
-\x44\x62\xe7\x06\x59\x9d\xdf\x18\xf0\xbe\x66\xf3\x13\x6c\x19\x31\
-\x44\x42\x5c\x9f\xd8\x10\x02\x91\x80\x12\x1a\x21\x14\x42\x48\x40\
-\x62\x74\x8e\x94\x72\x19\x42\xf8\x7f\xf7\xf7\x0f\xfc\xfe\xfe\xc1\
-\x60\x38\x1c\x4c\x7b\xd9\xe0\xdf\x3b\x3d\x1b\x3f\xce\xcc\x0e\x4a\
-\x29\x9c\x73\xec\xed\xed\x6d\x19\xf9\x47\x62\x90\xaa\xb9\x42\x29\
-\x8d\xb5\x0d\x65\xb9\x64\xb1\x98\xf2\xb1\xbb\x9f\xe9\x4f\x26\x17\
-\xbf\x52\x37\x55\xe6\xbd\x7d\x59\x29\xf5\x5f\x86\xe8\xf0\xde\x12\
-\x5a\xb7\x10\xa3\x6f\xe3\x5b\x77\x6c\x45\xe7\xba\xb7\x16\x9e\x0d\
-\x5f\x2f\x04\x2f\x3c\x49\xd7\x77\xfb\x2a\xb8\x62\xdb\x18\xb2\xf1\
-\xdc\xce\x70\x1b\xcf\x4d\x3b\xde\x63\xdd\x92\x48\x40\x20\x9e\x3b\
-\x89\x9b\xee\x33\x84\x48\xc4\x11\xb1\x90\x22\x04\xc1\x47\xac\xf5\
-\x04\x1f\xa3\x52\x99\xe8\xf7\x47\x0c\x06\x23\x06\x83\x21\x45\xd1\
-\x23\xba\xde\x7f\x9d\xa9\xe3\xbf\x7b\xfb\xee\xfe\x3b\xff\xdb\xff\
-\xf5\x9f\x3e\xfd\xc2\x4f\xff\x2a\x1f\xbb\xf3\x49\x40\xe0\xe3\x02\
-\x25\x76\x7e\x34\x06\x29\xeb\x4b\x7a\xf9\x8e\xa8\x9a\x99\x9e\xcd\
-\xae\xb4\x52\x79\x2e\xd0\x3f\x13\x23\xff\x8b\x73\xf6\xa8\x69\x2a\
-\x9c\x4f\x0b\x03\x01\x21\x03\x42\x80\x94\xdd\xd1\x17\xc4\xb8\x76\
-\x47\x2f\xda\x2d\xdb\x2e\xa3\x33\x46\x5a\xcc\xb4\x48\x5d\xbc\xd9\
-\xfe\x99\xf7\x0d\x3e\xd8\x17\x1a\xf1\xfa\xf7\x91\x40\x08\x0d\x09\
-\xbc\x6d\x9f\x8e\xe7\x5f\x03\x91\x26\x3d\xa2\x68\xe3\xa6\x58\xc5\
-\xcf\xd0\x7e\x0f\xc9\x2d\x49\xa1\xb8\x75\xe3\x75\x76\x46\x07\xdf\
-\x18\x0e\x7b\xff\x7d\x59\x4f\xfe\xc1\x57\xde\xfa\xd4\xd3\xbf\xf0\
-\x8b\x91\xf7\x1e\x7d\x37\x1c\x1d\x1e\xa3\x94\x22\x37\x7b\x5b\xb1\
-\xe4\x87\x32\x48\xf2\xb7\x81\xba\x99\x62\x8c\xc1\x5a\x4b\x91\xed\
-\x0f\x6b\x3b\xfe\x73\xf3\xf9\xf4\xd7\x9b\xa6\xf9\x84\xb5\x56\x48\
-\xa9\xee\x13\xa3\x08\x31\xb4\x0b\x14\x37\x4e\xc0\x36\x08\xe8\x1c\
-\xd3\x73\x9f\x41\xc4\x8d\xd7\x0a\x20\x10\x82\xbf\xb6\x60\xad\x41\
-\xba\xef\x43\x58\xb9\x9d\x10\x12\xca\xea\x0c\x95\x9e\xbb\xfe\x9d\
-\x69\x61\xfd\x7a\xb1\xc3\xfa\x39\x91\xd6\xbd\xc5\xd0\x7e\xdf\xfd\
-\xde\x36\x06\xc5\x40\x0c\x1e\x10\x5b\x27\x2f\xac\xdc\x62\xf2\xc6\
-\xeb\x18\x95\x61\x8c\x69\xfa\xfd\xde\xd9\xce\xe8\xc0\xee\xef\x1d\
-\xfd\xce\xc7\xee\x7c\xf6\x7f\x7c\xfc\xec\xad\x27\xfb\x7b\xfb\x34\
-\x4d\x23\x76\x47\x87\x31\x06\xc3\x86\xc3\x78\xe1\x97\xbe\xee\xd1\
-\xe7\xf3\x2b\x21\xa4\x88\x4d\x5d\x32\x1a\x0d\xef\x2c\xca\xb3\x5f\
-\x69\x9a\xe6\xdf\xb6\xd6\xfe\xb2\xf7\xae\xf5\xc7\xbe\x5b\x51\x71\
-\x3d\x18\x77\x80\x29\xbe\x38\x5a\xb4\x71\x65\xbd\xdb\xbb\xc7\x26\
-\x5e\x5f\x1b\xc4\x6f\xf9\xf4\xed\x9d\x1c\x36\x8c\xb1\xf9\xfc\x0e\
-\x93\x45\x62\xf0\x84\x76\xf1\x09\x5d\x1c\xbb\xfe\x9a\xee\x7d\xb7\
-\x7f\x16\x82\xd8\x40\x74\xf1\x85\x8f\xee\x3a\xea\xe6\x22\xd6\x8d\
-\xc8\xac\x1b\xdd\x09\x01\x9c\xf5\xff\x8e\xf7\xdf\x3c\x38\x3a\x3c\
-\x39\x55\xca\xfc\xae\x31\xf1\xdb\x8b\x72\x82\xd6\x9a\xdc\xec\x7d\
-\xa8\xcb\xd2\xdd\x2e\xde\x48\xf6\x62\xb4\x5a\x0a\x65\x8f\x96\xe5\
-\xf2\x2f\x36\x4d\xf3\x97\xeb\xba\xfa\xd9\xa6\x69\x08\xc1\x47\x91\
-\x4c\xb0\x5a\xe1\x6e\x01\x3e\xe0\x00\x6e\x19\x21\xfd\x3d\xae\x16\
-\x77\xd3\x38\xdd\xc2\xbf\xf0\x84\x84\xf8\x9c\x41\x3a\x77\xb6\xf9\
-\x7d\x87\x6c\xd2\x73\xc3\xc6\x6e\x4f\x27\xe4\x3a\x50\xd8\x3c\x75\
-\xb1\x0d\xfe\xeb\xf7\x0f\x2f\x44\x70\xeb\xcf\xc5\xea\x1a\xf2\xac\
-\x10\xce\x3b\x16\x8b\x39\xcb\x45\x15\x17\x83\xe5\xab\xa0\x5e\x1d\
-\x0e\x76\x00\x9a\xd3\xd3\xa7\xdf\x7e\xf5\xe3\x3f\x85\x8f\xf3\x8f\
-\x8c\x21\x3a\x84\xb8\xf2\xf9\x5d\xf2\x24\xb4\x7f\x3d\x46\xfe\x7a\
-\x59\x96\x9f\x6f\x9a\xea\xd8\xda\xa6\xbd\x58\xfe\x74\x90\x61\x13\
-\xd5\x6c\x24\x67\xe9\x62\xc2\xd6\x45\xa7\x13\xe2\x56\x19\x79\x32\
-\x82\xdf\xda\xfd\x69\xe1\xd3\xc6\x09\x1b\x2e\x28\xb9\xaf\xd0\x66\
-\xca\x1d\xd2\x0a\x5b\x46\x25\xb0\x9d\x6d\x13\x9e\x3b\x1d\x21\x44\
-\x84\xe8\x4e\xdf\xda\x65\xad\x0d\xb0\x0e\xfc\x9b\xae\x51\x8a\x40\
-\x88\xae\x7d\x8d\x17\xe3\xc9\x39\xb6\x49\xaf\x3f\x3e\xbe\xf5\xfa\
-\x2b\xf7\x3f\xfb\x85\x18\xab\x7f\xee\x42\x13\x3e\x22\x2f\x44\x5f\
-\xf7\x36\x75\x5d\x23\x84\xd8\x8f\x31\xfe\xa2\xb5\xcd\xc8\x5a\x97\
-\x82\x97\x94\x1b\x41\xf7\xc3\x0f\x44\x67\xb7\xb8\xe5\xbb\x62\xfb\
-\xf7\xf8\xdc\x22\xc6\x55\xf2\xe6\xaf\xed\xe2\xed\xe7\x6c\x9e\x8a\
-\xeb\xff\xd6\xc5\x03\xb6\x10\xda\xc6\xeb\x37\x50\xf8\xea\xf9\x6d\
-\x7c\xea\xa0\xf1\x0a\x65\x6d\x9c\x90\xe7\xdf\x2b\x3e\x07\x0a\xac\
-\xb3\xc4\x18\xd0\x5a\x20\x95\xc6\xd6\x81\x45\x39\xe6\xc9\xd3\x87\
-\x28\xa5\x7f\x45\x4b\x35\x0b\x21\x7c\xcd\x07\xdf\xbc\x74\xef\xf5\
-\x8f\x36\x48\x32\x4a\xfa\x60\x4d\xd3\x00\x42\x43\x1c\x39\xef\x5a\
-\x04\x05\x4a\x49\x20\xe2\x3f\x80\x3f\xda\x4e\xae\xe2\x46\xee\x11\
-\x57\x41\xe5\xb9\xb8\xd0\x05\xe5\x55\x30\xf5\xeb\x3c\x63\xc3\x20\
-\x21\x74\x41\xb5\x33\xc8\xe6\x73\x36\x5c\x1a\x61\xe3\xad\xd7\xf1\
-\x21\x05\xf5\xcd\xd8\x16\xd6\x6e\xae\x7d\xcd\xe6\x89\xbd\x9e\x30\
-\x6e\xbd\x4f\xec\x62\xde\xda\x05\xfa\xe8\x11\x32\xa2\xb5\x41\x2b\
-\x09\x11\x9a\xda\x31\x99\x9e\xc7\xbd\xdd\xc3\x1b\x59\x96\xff\x2b\
-\x31\x04\xb9\xce\xcd\xc4\x87\x19\x44\xac\xb8\x9e\x8e\x83\x4a\x01\
-\x3b\x06\x88\xb2\xcb\xa2\x3b\xff\xff\x61\x90\xed\x7a\x46\xdd\xed\
-\xd0\x75\xac\x69\x77\x66\x48\x8b\x1f\xe2\xf5\x40\xee\xdb\xd7\x6d\
-\xfb\xe9\xce\x70\xb0\x0e\xee\xb4\x90\x34\x3d\xd7\x6f\x04\xe4\x8d\
-\xf7\xd9\xd8\xd5\x84\x6b\x0b\x4c\x58\x05\xfc\x78\x0d\x2d\xae\x5d\
-\x16\x1f\x12\x47\xe2\x06\xa1\x98\x36\x62\x08\x81\x26\xd4\x08\x21\
-\xd1\x46\x50\x95\x56\x94\xe5\x8c\xc5\x3c\x2b\xc3\x06\x12\xfc\xb0\
-\x35\xd4\x9b\x7e\x5e\x08\xd2\x2e\x5d\xb1\xa4\x89\xef\x49\x1f\xd0\
-\x81\x48\x3e\x7a\x15\x9c\x23\x2f\xf8\x73\x33\xe1\x72\xd7\x32\xe6\
-\x75\x70\x0e\xc1\xb7\x06\x8b\x5b\x01\xb2\x5b\x9c\x2d\x38\xdb\xf9\
-\xfb\x8d\x5d\x4c\x94\xc9\x20\xf1\x79\xd7\xb7\x05\x5f\x3b\x8a\x7a\
-\x75\x50\xd7\x01\x7c\xfd\xba\xb0\x85\x9c\xd2\x67\x0b\xd7\x50\x63\
-\x7c\x6e\xc3\x11\x93\x21\xa4\xd4\x20\xd3\xc9\x72\xce\xa2\xb5\x46\
-\x2a\x0d\x04\x9c\x77\x34\xb6\xd9\x38\x65\xa0\x14\x1f\x6d\x90\xc5\
-\x72\x92\x18\x49\x21\xa8\xea\xca\x26\xa2\x4d\x23\xa5\xc0\xfb\x88\
-\x0f\x1e\x29\x63\x4b\x23\x3c\x0f\xfd\xd6\x8b\xba\xc1\x37\x79\xbf\
-\xed\x62\xd8\x44\x4e\x61\xc3\xc7\xb3\x05\x85\x57\x1f\x7e\xb5\xc0\
-\x61\x2b\x56\xa4\xdf\x2f\xdb\xc4\xcd\x3f\x87\xca\x56\x89\x65\x7b\
-\x72\xd6\xe8\x3a\xae\xf3\x90\xe7\x8c\x11\xae\x01\x88\xb8\x8e\x8b\
-\xd7\x36\xde\x3a\x5e\x26\x84\x21\x84\x6e\xbd\xc7\x7a\x53\x0a\x21\
-\x50\x4a\xb6\xf1\xb4\x83\xaf\x1f\x91\x84\x6c\xe6\x21\x67\x67\x67\
-\xf4\x8a\x82\xf9\x62\x8e\x10\x22\x0f\x21\xa0\x94\x48\xc1\x5c\xb6\
-\x4e\x2c\x7e\x70\x96\xfb\xa2\x7f\x5f\xb9\x2c\xc1\x35\xdc\xbf\x1d\
-\x47\x9e\xcf\x98\x5b\x97\x12\x53\x2e\xb1\x15\x0b\xd2\x1e\x4e\xbf\
-\x37\x8a\xe7\x8c\xb1\x7e\xfd\x76\x10\x16\x91\x0f\x00\x0c\x3c\xf7\
-\xfa\xee\x54\x72\x1d\xd1\x8b\x17\x71\x70\x91\x88\x40\x20\x91\x22\
-\x62\x8c\x49\x86\x10\x02\xad\x0d\xc6\x64\x68\x9d\xad\x7e\xaf\x92\
-\x1f\x61\x10\xef\x3d\x52\x0a\x0e\x0e\x0e\x00\xb8\xbf\xb7\xf7\x97\
-\xaf\xc6\x57\xff\xc1\xf9\xf9\x99\xd0\x5a\xa1\xb5\x5a\x15\x56\x36\
-\x51\xcb\x75\x63\x6c\x5e\xfc\x0a\xba\x6e\x10\x83\xd7\xb9\xa9\xf5\
-\x8e\x7f\x41\xb2\xc5\x46\xfe\x11\xc3\xf6\x29\x60\xe3\x84\x04\xd6\
-\xae\x6c\x83\xcc\xdc\xce\xba\x53\x9c\x10\x71\x0d\x34\xc2\x0b\xf3\
-\x8a\xb0\x9d\x38\xb6\xbf\x4b\x20\x5e\xb8\xa9\x37\xe3\x80\x73\x09\
-\xe2\x2a\x2d\x3a\x2a\x9e\x18\x03\x59\x96\xd3\x1f\xf4\x19\x8d\x46\
-\x1b\x10\xfb\x23\x61\xaf\xbc\x4e\x77\x7c\x52\x08\x7e\xa2\x69\xe6\
-\x42\xe9\x06\xa9\x7a\x28\xad\x51\xd2\x20\xa5\xc2\xfb\xf0\x42\x52\
-\x6e\x2b\xa7\x58\x05\x6e\x7b\x0d\x3e\xae\xe1\xe9\x66\xf2\xd6\x2d\
-\xa2\xf7\x71\x5d\x7d\x0b\x6d\x2e\x17\x20\x22\xb7\x4f\x1f\xb4\xb5\
-\x8f\xb0\xa6\x40\xae\x9d\x8e\xad\xc5\x26\x12\x83\x5c\xbb\xcd\xb0\
-\x4d\xcb\xac\x83\x9f\x00\x24\x11\xbf\xaa\xcd\xac\x8d\x21\x3e\x80\
-\xb1\x4e\xaf\x01\x41\x0c\x01\xa5\x35\x52\x49\x94\x32\xe4\x66\x40\
-\x91\xf7\xd0\xda\x6c\xc5\x10\xf9\x61\x31\x44\x4a\xb5\x0a\x4e\x09\
-\xde\xea\x77\x43\xb0\x3f\xb0\x7e\x76\x20\x1a\x21\xa2\xc8\x31\x7a\
-\x40\xbf\xb7\x8b\x40\xb5\x6f\xbe\x8e\x03\x9b\x71\x22\x55\xc8\x92\
-\x4b\x72\xce\x11\xa3\x5b\x27\x83\x1f\x90\x9d\x47\xba\x64\x8c\x15\
-\x5d\x91\x7e\x2e\xda\x13\xb2\xf6\xbf\xe9\xf5\x72\x05\x18\xc2\x8a\
-\x5c\xbc\x1e\xa0\xc3\x8a\x8a\x4f\x17\x07\x21\xe8\xd6\xc0\xd7\x63\
-\xc6\x26\xdf\xd6\x12\xa0\xc2\x83\x08\xab\x78\xd9\xfd\x3c\xae\xc8\
-\xd0\x55\xc2\x85\x40\x60\x4c\xd1\xa2\x59\x87\x31\x86\x2c\xcb\xc8\
-\xf3\x82\xdc\xf4\x51\x4a\x13\xfc\x1a\x22\x7f\xa4\x41\xae\x1f\xc1\
-\xcc\xe4\x6f\x79\xef\xdf\x88\x91\x2f\x24\xd4\xe0\x21\x5a\x6a\xd9\
-\xa0\x94\x5e\x2d\xe8\x26\x83\xdb\xf9\xe1\x8e\x73\xea\x0a\x40\x1d\
-\x5c\x4e\x17\x2d\xd7\x28\x2b\xb4\xa7\x2b\xae\xab\x87\xb4\x41\x70\
-\x0d\x4b\x23\xc8\x44\xfc\xad\x4e\xe1\x66\x1c\x09\x82\x18\x54\xbb\
-\x39\xe4\x8a\x99\x05\xdf\x9e\x86\xb0\x51\xfe\x0d\xb8\x50\xad\x04\
-\x01\x9b\xfc\xdb\x07\x52\x23\x44\x04\x61\x55\x3e\x10\x2b\x0b\x48\
-\xa4\x90\x08\x29\x91\x42\x24\x88\x2b\x0d\x4a\x69\xb4\x91\x14\xbd\
-\x0c\x63\x0c\x52\xe8\x76\x03\xb3\x66\x03\xe2\x87\x23\xac\xb5\x41\
-\xba\x0f\x28\x00\xf4\x33\xef\xdd\xfb\x5d\xee\x10\x7c\xc0\x06\x87\
-\x14\x0d\xc6\xd0\xd6\x85\x3b\xb8\x27\xb7\xa8\x85\xcd\xc5\x14\x42\
-\x10\xfc\x06\xbb\x1a\x5f\x40\x75\xb4\xf0\x35\xb9\x03\x8f\x6f\x17\
-\x2d\x6e\x24\x92\xa1\x33\x62\xf7\x5f\xeb\x4a\x42\x54\x29\xfb\xde\
-\xf4\xf9\xd7\x08\xcb\x6d\x48\xef\x89\x22\x22\xae\x15\xc2\x5e\x14\
-\xc3\x40\x21\x30\x5b\x15\xbf\x14\xb4\x53\xc9\x57\x2a\x8d\x92\x0a\
-\xa9\x24\x52\x2a\x32\xdd\xc7\x18\x83\x36\x8a\xa2\x97\x82\x7a\x0c\
-\x60\x9b\x6d\x28\x1f\x89\x08\xf9\xc3\x18\x24\x6e\x05\xa9\x45\x08\
-\x7e\xde\xfd\x7b\x88\x11\x11\x03\xde\x3b\xa4\xd4\xeb\x1d\x23\x24\
-\x52\x76\x17\xb2\x86\xc2\x9d\x65\x04\xa2\x0d\xba\xed\x71\x0d\x8e\
-\xd0\x26\x72\x2b\x48\x89\x4c\xf5\x13\x21\x08\xad\x40\x62\x3b\xe6\
-\xb0\xed\xde\x36\x60\x67\x72\x59\x1b\x40\x68\x13\x12\x13\xda\xbf\
-\x6f\xf0\x68\x62\x4d\xa1\xaf\x32\xed\x0e\x12\xb7\xae\x47\xc8\xf6\
-\xba\x44\x8e\x14\x39\x42\x8a\x74\x0a\xa4\x4c\x06\x91\x32\x9d\x04\
-\x6d\x5a\x85\x4a\x02\x3c\x99\xe9\xa5\xdc\x43\x82\xc9\xd2\x5a\xa4\
-\x40\xdf\xd6\xfc\x45\xf8\x08\x12\x76\x8b\x5c\x0c\x5c\xe3\x0c\x45\
-\xfb\x05\xed\x62\x89\xf6\x68\xae\x17\x47\xb4\x85\x28\xb9\x65\x90\
-\x54\xb6\x91\x6d\x41\x28\x92\x67\xaa\x2d\x26\x79\x9c\x77\x78\xe7\
-\x70\xce\xe2\x9c\xc3\x7b\xd7\xaa\x4e\x5a\xcc\x2f\x3c\x52\xb5\xae\
-\x67\x13\x0d\x85\x98\x6a\xdc\xd7\x72\x9d\x18\x6c\x2b\x74\xe0\x5a\
-\x4c\xf0\xab\x84\x30\xb6\x55\xa5\x74\x42\xcd\xb6\x0a\x45\x08\xa4\
-\x90\x28\x25\x51\x52\xb7\x42\x07\x85\x90\x02\xad\xfa\x68\xd9\x5b\
-\x5d\xbf\x94\x0a\x21\x15\x6a\xc3\x20\x09\xde\x26\xd9\x90\x31\x79\
-\xa2\x95\x7c\x92\x26\x79\xef\x70\xce\xe3\x7d\x44\xc9\x3f\x5d\x19\
-\x57\x7f\x38\x2f\x45\xbb\x4b\xe4\x4a\x45\xb1\x49\x15\x6c\x0a\x14\
-\x56\xaf\x91\x02\x81\x42\x88\xd8\xfa\x50\x91\x76\x11\x2d\x16\x6f\
-\xe9\x19\xb7\xfa\xe0\x6e\x05\x0e\x9c\xab\x57\x28\x28\xc4\xb4\xcb\
-\x43\xf4\xd0\x25\x91\x21\xac\x8c\x04\xbe\x45\x44\xac\x32\x77\x08\
-\x08\x24\x4a\x24\xf6\xa7\xe3\xad\x04\x0a\x6d\x86\x69\x61\x85\x48\
-\x0b\xbb\xb1\xc3\xb5\xd2\xad\xfb\x91\xed\x26\x13\xc4\x20\x91\x72\
-\xbd\x19\xa5\x50\xed\x09\x51\x28\x65\xd0\x46\xa7\x53\x22\xd3\xbf\
-\x7b\xdf\x6e\x32\x17\x70\xbe\x03\x35\x62\xc5\x5d\x75\x49\xe3\x47\
-\x52\x27\xe2\x05\x25\xac\x17\x8a\x11\xe4\xf3\x0a\x8a\x75\x0e\xb2\
-\x41\x29\x44\xb6\x12\x43\x10\x48\x99\x76\x59\xba\x40\xbd\x01\x4d\
-\xdb\x8c\x3d\x46\x82\x0b\x58\x1b\xd6\x34\x45\xb7\xf8\x1f\xc0\xb4\
-\x8a\xad\x0a\xe5\xa6\x3b\x6b\x41\xc7\x3a\xa4\xa7\xc0\x9b\xe5\xa4\
-\x1a\xff\x3a\xfe\x89\xae\x9e\xf0\x01\xe2\xb6\xf5\xf3\x53\xc6\x9d\
-\x0c\xa6\xda\x53\xa2\x51\x4a\xaf\xbd\x44\x10\xed\x83\x2d\x66\xf9\
-\x45\x7c\xdf\x47\x1b\x24\x3e\x2f\xc0\xda\x4a\xfa\xba\x5d\x29\xd9\
-\xaa\xa2\x6d\x7e\xf8\x4e\xee\xc3\x46\xa0\x75\xce\x13\x43\xaa\xb1\
-\x0b\xc9\x6a\x07\x6a\x9d\x76\x5a\x2b\x4c\x43\x08\x92\xdb\x50\xfd\
-\x55\x22\xb6\x29\x36\xdb\xfc\xbe\x3b\x91\x32\x16\x08\x34\x88\xb0\
-\xc1\x59\xb1\x51\x37\x59\x93\x95\x31\x06\x82\xb0\xab\xcf\xea\x9c\
-\x5b\x3d\xac\xb5\x58\x6b\xdb\x1d\x9e\xae\x43\xe9\xf4\x19\xd7\x08\
-\x4b\xb4\x02\x37\xb9\x41\x83\xb0\x22\x37\xbd\x8b\x38\x97\x4e\x82\
-\x54\x1a\xc5\xba\x2c\x8d\x10\x5b\x3c\xdf\x47\x79\x2f\xfd\x51\xf5\
-\xa5\x55\xd1\x67\x8b\xa9\x8c\x5b\xa8\xaa\x7b\xa3\xd8\xe2\xfc\xd0\
-\x42\x5b\x21\x00\x19\xf0\x21\x10\x5c\x58\x91\x76\x2b\x57\x28\xbb\
-\x5d\x27\x90\x42\xa3\x44\x6f\x15\x58\x95\x92\x6b\x17\xd1\x22\x1a\
-\x25\x13\xdc\x14\x42\x90\x29\x8f\x92\xd9\x8a\x31\x0e\xc1\xaf\xe4\
-\x49\xde\xb7\xaa\x48\xef\x57\xf1\xc5\xc6\x2a\x95\x74\x43\xc4\x79\
-\x47\xf0\x9b\x62\xbd\xd0\x39\x96\x2e\xff\x5b\xe5\x3f\x62\x4b\x26\
-\xba\xc1\x00\x84\x80\x10\x1e\x21\x12\xd7\x97\x40\x82\x5c\xa5\x06\
-\x89\xcb\xeb\xd6\x70\xbd\x49\x3f\x2a\x9e\xbc\xc8\x20\x1e\x70\xd7\
-\x35\xab\xdb\x3c\xd6\x3a\x50\x75\x3b\xb8\x53\x61\x80\x40\xc4\x84\
-\x9a\xd6\x34\x78\xb7\x60\x8e\xa4\xdf\x0a\x5b\xc9\x5c\xfa\x55\x92\
-\x18\xf4\xd6\x49\x58\xc1\x4c\x29\x9f\x3b\x25\x5a\xe5\x48\x61\xb6\
-\xa0\xb4\x0f\x6e\x83\xb4\x5c\x57\x18\x23\x01\x1f\xdd\x16\x85\x43\
-\x8b\xaa\xd6\x9b\xa2\x7d\x08\x09\x68\x52\x6a\xd4\x4a\x3f\xc5\xba\
-\xe4\xf6\x42\x58\xdd\x15\x95\x62\x7a\x44\x56\x15\xe3\x6d\x16\xe3\
-\x87\x41\x59\xc9\x1f\x8b\xeb\x6e\xcc\xac\xfc\xeb\x16\x5b\xd9\x65\
-\xc5\xf2\x9a\x31\xe2\x2a\x53\x0f\x51\xb4\xe5\xd2\x48\xd3\xd4\x84\
-\x90\x76\x91\x54\x11\xa9\x14\x3a\x8a\x8d\xdd\x9c\x82\x5f\x4a\x10\
-\x1d\xc1\x37\x5b\xae\xd2\x07\xbf\x4e\x22\xaf\x49\x4f\x9d\xab\x09\
-\xde\xad\x16\x4d\x2a\x81\xda\x58\xdc\x8e\xe0\x5b\x05\x65\x99\xa5\
-\x64\xee\xda\x43\x29\x85\x14\xb1\x95\x30\xc5\x94\xaf\xb4\x5c\x59\
-\xb7\x99\xd3\x89\xde\x56\x59\x76\x01\xbf\xfb\x1d\x31\x88\x95\x56\
-\x39\xf8\x40\xb8\xae\x8c\xfc\x21\x05\xa2\xda\x5a\x8b\x56\x1a\xe7\
-\xd2\xa1\xa8\x9b\xf9\x2f\xe7\x79\xff\x4b\x29\xf9\xf2\x68\xa9\x31\
-\xda\x10\x7c\x3a\xb2\x5a\xeb\xe7\xb2\xdc\x17\x2b\x46\xe2\x2a\x6f\
-\x59\xb9\xb2\x15\xf7\x24\x5a\x78\x9b\x16\x4b\x44\x81\x14\x1e\xa1\
-\x3c\xce\xa6\xfa\xb7\x14\x20\xb5\xc0\xc7\x9a\xe8\x4a\x02\x0d\x01\
-\x09\xd1\x40\x34\x68\x5d\x11\xd5\x9c\x10\x04\x5a\x19\x94\x32\x48\
-\xa1\x10\x68\xa4\x30\x28\x91\x72\x88\x35\xed\xa1\xd1\x5a\xa2\x75\
-\x24\x06\x8b\x8c\x12\x19\x32\x24\x06\x21\x73\x84\x50\xc9\xbd\x62\
-\x51\x28\xa4\x30\x6d\x1c\xa1\x55\xda\x24\x5a\x44\xe9\x74\x8a\x3a\
-\x6f\xa0\x94\x46\x38\x89\xb4\xa4\x13\xde\x06\x17\x81\x40\x8a\x40\
-\x46\x8e\x21\x5f\x43\x0c\x0f\x51\x84\x17\xea\xd4\x62\x8c\xe8\x4e\
-\x8d\xdd\x59\xd2\x7b\xf7\xba\x14\xf2\xcf\x08\x21\x45\xe7\x67\x41\
-\xa0\x5a\x1c\x7e\xbd\x15\xe1\x3a\xed\xbe\x59\xa5\x92\x52\x10\xa3\
-\x6a\x77\x8a\x58\xa9\xe7\x57\x4f\x8b\x6b\xcd\x96\x40\x82\xf0\x04\
-\x01\xbe\xe3\x95\x64\xf2\xe5\x42\x46\x24\x31\xc5\x97\xa8\x89\x21\
-\x43\x8a\x3e\x20\x70\x1e\x94\xec\x0c\xa2\xa1\x35\x88\x54\x1a\x81\
-\x4e\x79\x50\x88\x38\x0f\x52\x09\xb4\x06\xa5\x04\x22\x08\x64\x94\
-\x10\x64\x3a\xd5\xdd\xf5\xa8\x88\x04\x62\x88\x2b\xfa\x27\x9d\x88\
-\xb5\xea\x7f\xe5\xb6\x11\xc9\x90\x22\x12\xa5\x6f\xbd\x7d\xba\xc8\
-\xa4\x66\xf1\x44\xd1\x16\xd8\x44\x7b\xd1\x82\x0f\x6d\xa1\xd0\x5a\
-\x6b\x62\xd8\xfa\x41\x26\x84\x50\x4a\x49\xac\x8b\x78\xe7\xf1\xca\
-\x93\x67\xc9\x0d\x3c\xaf\x71\x10\x6b\x17\x1a\x37\x0b\x3a\x2f\xee\
-\xd5\x58\x3d\xef\x1a\xcc\x16\x1d\x3f\x26\x41\x84\x96\x4c\x0c\x22\
-\xb9\x0e\x34\x4a\x48\x10\x06\x62\x8e\xf7\x06\x1f\x0d\x9e\x21\x3e\
-\x44\x7c\x90\x88\xa0\x92\x0e\x37\x2a\x84\x48\xf9\x01\x28\x9c\x4b\
-\xa8\x2a\x52\xe2\x3d\xc4\xa8\xe8\x17\x09\xdd\x11\x65\x7b\x62\x5d\
-\x22\x00\x09\x28\x1d\x11\x22\x2d\x68\xd3\x38\xa4\x12\x64\x26\x25\
-\x83\x52\xaa\xd6\x85\x7a\x84\x50\x09\xca\x0b\x05\xa6\x26\x88\x06\
-\xef\x1b\x22\x16\xe7\x1b\x6c\x6c\x70\xc1\x23\xa4\x02\x29\xd7\xd4\
-\x8e\x0c\x48\xd4\x07\xae\x8f\xee\x16\x49\xaa\x96\xed\xd5\xf2\x4c\
-\x48\xce\x85\x90\x47\x5d\x22\xe5\xbd\xa7\x69\x1a\x8c\x11\x18\xa3\
-\xf8\x91\x7f\x6d\x88\x0f\x44\x1b\x9b\x92\x9b\x8b\xeb\xfc\x5f\xa6\
-\x93\xe1\x9c\xa6\xa9\x23\x4b\xab\xa9\x9c\x4a\x1b\xc6\x87\x94\x90\
-\x39\x87\xb5\x69\x71\x63\x10\x38\xe7\x59\x2c\x6b\x94\xf0\xdc\x7f\
-\x79\x44\x99\x47\x96\x4b\x38\x3c\xe8\xd1\xcf\x73\x8c\x02\xa1\x40\
-\x48\x99\x76\xb2\x08\x68\x23\xc9\x54\x86\x8a\x39\xd6\xc9\x36\xae\
-\xc8\x2d\x12\x35\x06\x90\x3a\x25\xbd\xde\x07\x84\x4e\x32\xd8\x10\
-\x3c\xce\x5b\x7c\x74\x44\x09\xc2\x68\x64\x96\x21\x95\x59\xe5\x44\
-\xb5\xf3\x14\x5a\x6d\xd5\x55\x36\x8d\xa2\x43\xf0\x2d\xb2\x58\x75\
-\x5a\xec\x40\xdc\x4d\xbb\x20\x19\x4a\x4a\x81\x54\xeb\x0f\xf5\xa3\
-\xfe\x12\x62\xa3\x8a\xb7\xc2\xfa\xed\x23\x26\x04\x97\x50\x9c\xc4\
-\x36\x91\xe5\xc2\x71\x36\x0d\x4c\x6a\x85\x24\x65\xd6\xde\x2b\x82\
-\x57\xf8\xa0\x20\xca\x64\x40\x24\xa5\xaf\xd1\xb2\x21\xd2\x67\xb1\
-\x98\x30\x9f\x2f\xd0\x5a\xa0\xf7\x14\x5a\x65\x08\x22\x52\x76\xa2\
-\x94\x14\x8c\x3d\x0e\x29\xd6\x7a\xb5\xae\x1c\x2d\x25\x29\x46\x49\
-\x85\x92\x1a\x50\x09\x9c\xac\x58\xeb\x96\x85\xf6\x82\x90\x08\x06\
-\xbc\x10\xa8\x28\x57\x84\xa9\x12\xea\xa3\x50\x56\x20\x6e\x05\x17\
-\x61\x23\xd1\xc6\xe8\x0d\xb2\xcb\x17\x40\xb5\xf9\xc2\x8f\xeb\x6b\
-\x53\xc4\x26\x5a\xe2\x31\xb1\xbc\x9d\x51\x24\xc1\x83\x6d\x02\xe5\
-\xb2\xe1\x6a\xa2\x38\x2f\x33\x7a\x79\x47\x5f\x24\xbe\x49\x28\x81\
-\x92\x1a\x63\x32\x8c\xce\xd0\x85\x45\x51\x53\xf4\x34\x57\x97\x0b\
-\x66\xd3\x39\xbd\x5c\x31\x1c\xe4\xf4\x8a\x4e\xbc\x97\xc8\xc7\x18\
-\x02\xde\x5a\xf0\x0a\xa4\x41\x1b\xb9\x61\x90\x00\xa8\xb6\xac\xad\
-\xda\x78\x25\x13\xc4\xf6\xa9\x9a\xa6\x42\xa2\x8d\x88\x81\xe8\x23\
-\xde\xae\xf3\x90\x65\x59\xc5\x41\xbf\x87\x11\x4b\x60\xf4\x42\x77\
-\x05\x20\xd3\xae\x17\x18\xa3\x31\x46\x53\x64\xc3\xbf\x1b\x82\xfb\
-\x1d\xa5\x54\x54\x52\xb5\x19\xb7\xc3\xda\xa6\x0d\x72\x3f\x3e\xa3\
-\x3c\xdf\x42\xb7\x36\x86\x68\x71\x7e\xc7\x20\xeb\xac\x60\x30\xda\
-\x63\xb8\xb3\x47\x7f\x34\x22\xef\x0f\x30\x45\x01\x52\xd3\xf8\xc0\
-\xb2\xae\x59\x36\x0d\x8b\xaa\xa2\xb6\x1e\x63\x86\x38\xaf\xb9\x18\
-\xcf\x19\xcf\xe6\x58\x97\xa8\x99\xb4\xc3\x1d\x82\x88\x92\x0a\xd1\
-\xba\x21\xeb\xdc\x06\x4f\x17\x57\x05\xac\x04\xb9\x03\xce\xb7\xd5\
-\x3f\x61\x28\x94\xa6\xaf\x15\x3d\x25\xe9\x29\x41\x5f\x4b\xfa\x46\
-\x31\xc8\x14\x3d\x2d\x28\x24\xf1\x9f\xfd\x93\x7f\xec\x86\xb9\x26\
-\xb6\x89\xeb\x56\xc9\x7b\xc3\x7d\x69\x44\xe2\x7d\x3a\x1d\x92\x0f\
-\xcb\x2f\x0a\x21\x7e\xb1\xaa\x4a\xf2\x9e\x24\xcf\x7a\x48\x32\x9c\
-\x4d\xc7\x19\x63\x7e\x2c\x8b\x9f\x2e\x36\x35\xc7\xc4\x55\x1a\xd6\
-\x52\xea\xad\xfc\x48\x69\x89\xc9\x24\x79\xae\x11\xf3\x48\x63\x1d\
-\x99\x51\xab\x5c\x23\x31\xd4\x49\xc1\x1f\x01\x21\xdb\x20\x2d\xc1\
-\x47\x89\xb5\x91\xe5\xb2\x62\x59\xe6\x6d\xfe\x93\xdc\xa4\x70\x1e\
-\x69\x4c\x12\x23\x88\x84\x0c\x53\x52\x2a\x56\xc5\x25\x29\xe5\xaa\
-\xa4\x10\x7c\x44\x68\x89\xd6\x59\x42\x87\xae\x24\xfa\xd0\x02\x93\
-\x88\x20\x15\xf5\xa2\xf7\xf8\x28\xd0\x4a\x8c\x7e\xf3\x3f\xfc\xf7\
-\xff\x25\xd9\xbb\xf9\x15\xdc\x65\x79\xbd\xcf\xb0\x8b\x23\x31\xc6\
-\x56\x06\x24\x3a\xc5\x22\xc4\xc8\x2f\x58\xeb\x3f\x75\x79\x75\xc1\
-\xc8\x17\x31\xcb\x32\x91\xe5\x1a\xa2\x44\x7c\x54\x75\xe5\x5f\xcc\
-\x24\x08\xda\xbc\x45\xc8\x76\x53\x76\xf4\xb9\x4f\xfc\x96\x12\x98\
-\x4c\x52\xf4\x14\x5a\x09\xbc\xf3\x84\x36\x7f\x4a\x1c\x99\x4e\x3a\
-\xdb\x55\xb9\xd8\x21\x70\x29\x49\x75\x01\x17\x13\x1c\x74\xed\x09\
-\xf0\xc1\xa3\x44\x42\x99\xd1\x03\x5a\xb5\x6e\x59\xae\xe2\xea\x8a\
-\xcc\x14\x2b\x35\x50\xcb\xfc\x6a\x82\x0f\xd4\x55\x85\xb3\x0d\x44\
-\x8f\x50\xa9\x76\xe2\x2c\x54\x95\x65\x59\x96\x08\x1a\x76\xd0\x07\
-\x0d\xe6\xdf\x28\xe0\xf1\x3b\x8f\x66\x6f\x67\xba\xa4\x28\x72\xf2\
-\xbc\x48\x4c\x78\x96\xad\x48\x4a\x9d\x32\x72\xc1\x72\xb9\x04\x20\
-\xcf\x43\x35\x9f\xcd\x78\xff\xfd\xf7\x19\x8e\x32\x11\x42\xe4\xc6\
-\x71\x4e\x2f\x1f\x21\x84\x59\xd5\xb9\x7f\x1c\x9e\x6b\x6d\xf0\x8e\
-\xd4\x6b\xf5\x47\xb4\x35\x0e\x11\x12\xa7\x65\x22\x79\xae\xe9\x67\
-\x19\x46\x2a\x9c\xf7\x88\x10\x91\x6d\x5e\xe3\x63\xc4\x5b\x8b\x8d\
-\x91\xba\xac\x50\x32\x62\xbd\x47\x6a\x4d\x31\x18\x12\xa5\x48\xf5\
-\x99\x10\xc8\x32\x0d\x21\xf1\x51\xd8\x88\xf4\x02\xa9\x20\x2a\x8f\
-\xb5\x1b\x8a\xfa\xa4\xac\x40\x4a\x4d\x96\xe5\x08\x21\x18\x5f\x4e\
-\x78\xf7\xdd\xf7\x91\x66\x48\xde\x2b\xc8\x73\x49\x96\x1b\x1a\x67\
-\x99\xcd\x3c\xe3\x71\x49\x0c\x25\x37\xc3\xee\xfe\xed\x46\xfc\xb2\
-\xea\xf9\xff\x33\x28\xf3\xf6\x76\x25\x53\x6c\x35\x88\x6a\x81\xc0\
-\x3a\x47\xaf\x57\x00\x82\xdd\xdd\xdd\x7f\xf8\xe4\xc9\xc3\x97\x2f\
-\x2f\x2f\x7f\xfe\xd1\xe3\xa9\xb8\xba\x9c\xf1\xf2\xcb\x35\x77\x6e\
-\xbd\xc4\xce\xce\x01\xc6\x14\x2b\xd1\xf5\xb6\xce\x96\x0f\x2c\x9f\
-\x6e\x35\xe9\xc4\x0f\xe4\xa5\x5b\xda\x21\xe5\x1f\xab\x46\xd0\x2e\
-\x4f\x08\x91\x10\x24\x2e\x08\x42\x8c\x58\xab\x28\xe7\x02\xab\x02\
-\x55\x55\x63\xb4\x66\xb4\x33\x4a\x3b\xd9\x39\xbc\x75\x38\xeb\xa8\
-\xca\x86\xcc\x08\xca\xaa\xc2\x07\x87\x52\x92\x10\x2c\x55\x53\xe1\
-\xda\xec\x5b\x46\x0d\x51\xb5\xad\x0c\xac\x3a\x78\xa5\x00\xad\xd5\
-\x8a\x8a\xf1\x4e\xac\x8a\x65\x93\xf1\x84\xb7\xde\x7a\x8b\x3f\xf8\
-\x83\x3f\x62\xf7\xf8\xa7\xe9\x0f\x77\x91\xaa\x41\x9b\x40\x88\x15\
-\x75\xb3\x64\xb9\x2c\x09\x31\x72\x35\xcb\x8d\xe5\xed\x4f\x9e\x5d\
-\x56\x7f\xfd\x68\x54\x3c\xfb\xe2\x4f\xbd\x14\xfb\xbd\xde\xdf\xea\
-\xf5\x07\x7f\xe0\xbd\x5f\x7a\xef\x57\x0c\x88\x06\x89\x88\x81\xfd\
-\xdd\xbd\x76\x67\x0e\x7f\xdf\xfb\xe6\xe0\xd6\xcd\xdb\xff\xf2\xc3\
-\x47\x95\x78\xef\xe1\x5b\xcc\x66\x73\x66\x93\x92\x5b\xb7\xee\xb2\
-\x7f\x70\x40\xaf\xc8\x29\x7a\x05\xc6\x18\xbc\x0b\x1b\xe4\x63\x97\
-\x54\x84\x04\xff\x70\x6b\x98\x11\x41\xc4\x2e\xd1\x8b\x08\xba\x3f\
-\xd7\x0a\xa8\x15\xc2\x12\x61\x45\x78\x08\x04\x44\xd5\x72\xdd\x49\
-\xf0\xa6\x15\x44\x57\xd3\xd4\x30\xdc\x2f\x18\xf4\xfb\xf8\x10\xa8\
-\xeb\x05\x5a\x65\xc4\x08\x85\x31\xdc\x3c\x39\x64\x32\xb9\xe2\xec\
-\xfc\x9c\xc5\xb2\x42\x08\xc5\xa0\x18\x22\xdc\x05\xd2\x7b\x64\x68\
-\x3b\xa5\x94\x42\xb4\x8c\x6f\xaa\x90\x46\x24\x89\x15\x90\x28\x24\
-\x2a\xa1\x27\xe1\x40\x38\xa2\x08\x2c\x6b\xc7\xb3\xf3\x05\x5f\xfe\
-\xe3\x77\xf9\xf4\xcf\xbe\xc6\xb0\x2a\xb0\x6e\x89\x56\x80\x74\xad\
-\x6a\x26\x9d\xa4\x3a\x3a\x31\x77\x4f\xfb\xce\xc5\x9f\xd7\xb7\x86\
-\x9c\x9e\x9e\xd2\xeb\xf7\x94\x31\x99\x00\x7e\x3f\x84\xc0\xe1\xe1\
-\x21\xfd\x7e\x3f\x19\x44\x9b\x0c\xc8\x00\xf8\xc3\xaf\xfc\xef\xa7\
-\x4a\xe9\xaf\xbf\xfe\xfa\x67\xd8\xd9\x2d\xf8\xde\xf7\xbf\xc5\x3b\
-\xef\xbc\xc1\x5b\x6f\x7f\x97\xbb\x77\xee\xf3\xca\x2b\xaf\x70\xef\
-\xde\x3d\x6e\xdf\xba\xc7\xee\xee\x3e\x44\x81\xf7\x12\xef\x93\x6f\
-\x8d\x51\x24\xb2\xd0\xa5\x9a\x7b\x62\x7c\x3b\x26\xb4\x0d\x8c\xd1\
-\x23\xa2\x4c\xf1\x37\xa9\xae\x08\x44\xa4\x0c\xc4\x0d\xa5\x09\x21\
-\xa4\x45\x89\x89\x3b\x92\x31\x22\x65\x24\xcb\x23\x4a\xd4\x68\xa5\
-\x39\xb9\xb9\xcb\xe1\xf1\x1e\xf3\xc5\x82\x37\xbe\xfb\x36\x42\x4a\
-\x14\x19\xa3\x41\x9f\x9f\x78\xfd\x35\xce\x9e\x3e\x60\x7c\xf1\x2e\
-\xb3\xb2\x61\xaf\xd7\xa3\xd7\x3f\x60\x71\x71\x4e\x2f\x48\x4c\x88\
-\x34\xf5\x02\x55\x38\x84\x94\x10\x22\x3d\x61\x50\x2d\x7b\x2d\xbd\
-\x84\x98\x11\x7d\x22\x20\x95\x74\xa0\x1d\x41\x67\x04\x9d\x43\x76\
-\xc4\xce\xe1\x6b\xec\x1c\xee\x30\xdc\xed\x63\x6d\x86\xd1\x89\x81\
-\x76\x2e\x95\xa7\x53\xad\x5d\x72\x35\x6b\x98\x2e\x2a\xe6\xe3\x53\
-\xea\xf1\x3b\x7c\xe6\x33\xaf\xff\xf9\xbd\xbd\xfd\x79\x55\x55\xbf\
-\xdf\xb9\xac\xa2\x28\xd0\x4d\x53\xa1\x95\xa1\x6a\xa6\x00\x7c\xf1\
-\x73\xff\xe6\xee\x3b\xef\x7d\xed\xb5\xf1\xe4\x29\x77\xee\xdc\xc1\
-\x64\x92\x5e\x31\xe0\xf4\xf4\x82\x8b\x8b\x53\xae\xae\x2e\x78\xf8\
-\xfe\x7b\xdc\xb9\x7d\x97\x93\x93\x9b\x1c\x1e\x1c\x32\xda\xd9\xa5\
-\x57\xf4\x51\x52\x12\x42\x44\x5a\x9f\x78\x29\x1f\x92\x6f\x66\xad\
-\x40\x0c\xd1\xaf\x89\xc6\x55\x07\x13\x2b\xfd\x94\x48\xc2\xf6\xb6\
-\x17\x2f\x6e\x57\x17\x57\x04\x58\x2a\xfc\x74\x13\x14\x76\x76\x76\
-\x30\x59\x86\xd6\x1a\x63\x0c\xc1\x42\x63\x6d\xca\x17\xb4\x59\x49\
-\x90\x92\x70\x1c\xa6\x93\x19\xf3\xd9\x00\x1f\x8e\x18\xf5\x07\x90\
-\x99\x96\x62\xb1\xf8\x00\x31\x5a\x10\x0d\x99\xce\xc8\xb4\x24\x33\
-\x19\x59\x2f\xe2\xf0\x34\xb1\xa1\x76\x25\xf3\xa5\x65\xb6\xb8\xc2\
-\xf9\x25\xd1\xfb\xf4\x91\x42\xc4\x35\xcd\xba\x54\x1b\x41\xb5\xb2\
-\x21\x17\x05\xf8\xc0\xac\x5c\xf0\x84\x19\x37\x6f\x9e\x20\xa5\x1a\
-\x7e\xfe\xf3\x9f\xdf\x03\xc6\xe3\xf1\x78\xb3\x84\xcb\x86\x12\x84\
-\x97\x94\xcc\x5e\x75\xce\x8b\x7e\xbf\xcf\xed\xdb\xb7\xc9\xb2\x82\
-\x5b\x37\xe7\x3c\x7a\xf4\x88\x77\x1f\x7c\x97\x87\x0f\xdf\xe4\xd9\
-\xb3\xf7\x38\x38\xb8\xc1\xed\xdb\x77\x39\xb9\x71\xc2\xee\xde\x1e\
-\xbd\xa2\x47\x96\x65\x28\xdd\x0a\x02\xb4\x41\xae\xa8\xe9\xe4\x7f\
-\xbd\x6f\x15\x8a\x3e\xe2\x43\x0a\xd4\xeb\x06\xcc\x75\x8f\xe0\xa6\
-\x72\x50\x88\x54\xad\x14\x1b\xad\x03\x52\x26\x52\xac\xae\x6a\xf2\
-\xac\x68\x13\xc7\x48\xd4\xe0\x82\xa3\xae\x3d\x01\x90\xca\x60\xb2\
-\x3c\x35\x22\x0d\x7b\x68\x63\x68\x9c\xa3\xb6\x2e\x15\x90\xa4\x26\
-\x04\x05\x68\x8c\xc9\x53\x15\x53\x34\x04\x9a\x16\x2e\x5b\x96\x95\
-\x65\xb2\x58\xb0\xa8\x27\x2c\xaa\x05\x8b\xda\xf3\xe4\xa9\xe3\xe9\
-\xd3\x33\x84\xac\xf1\xce\xe2\xad\xc5\xbb\x54\x7d\xcc\x4c\x86\xc9\
-\x4c\x42\x81\xde\x41\x90\x08\x02\xbd\xdc\xe0\xbc\x62\x3a\x9d\x32\
-\x9f\xcf\x19\x8d\x76\x64\x8c\x71\x28\x84\x98\x02\x41\x08\x81\x36\
-\xc6\xac\x7a\x2d\xda\x2f\xe5\x7c\xd0\x75\xdd\xa0\x8c\xa4\xdf\x1f\
-\x70\xf7\xee\x80\xe3\xa3\xc0\xc1\xc1\x21\xfb\x07\x23\xce\xcf\x2f\
-\x38\x3f\x3b\xe3\xf1\xe3\xf7\x79\xf4\xf8\x3d\xfa\xfd\x82\xbd\xbd\
-\x5d\x0e\x0e\x0e\x38\x3a\x3a\x62\x7f\x7f\x8f\xd1\x68\x97\x41\x71\
-\x80\x56\xd9\xaa\x56\x92\xe0\x77\xa7\x0e\x14\x09\x6a\x76\x9d\x1a\
-\x61\xad\xcf\xed\x3e\xcb\x1a\xae\xb7\xfd\xe2\xac\x2b\x79\x46\x4b\
-\x24\x50\x57\x15\xa2\xa5\xcb\xad\xf5\x64\x59\x32\xb4\x8b\xe9\x4f\
-\x65\x0c\x45\x7f\xc8\xd5\xd5\x92\x78\x58\x90\x15\x39\x4a\x6b\x84\
-\xd0\xf8\x28\xa9\xeb\x80\x8d\x16\xa9\x72\xfa\x45\x8f\x40\xab\xbe\
-\x8c\x0e\xdb\x34\xd4\x65\xc9\x74\x32\xe5\xf4\xec\x11\xa7\x17\x8f\
-\xb8\x9c\x5e\x52\xda\xc8\x72\x99\x33\x19\x4b\xf2\x3c\xc3\xfb\x86\
-\xd4\xf6\xe7\xa9\xaa\x12\xad\x15\xc6\x14\x38\x67\x69\x1a\xbb\x82\
-\xcd\xc6\x18\x44\x96\xe1\x6b\xd7\x95\xc9\xbd\x10\xa2\xe9\x10\x90\
-\x94\x32\xe5\x21\x3e\xac\xe1\xdd\x67\xff\x2d\xf1\xd5\xff\xf9\x3f\
-\xff\x47\x77\x41\xfc\x66\x5d\x5b\x81\x08\x14\x79\x9f\xdd\x9d\x1e\
-\xfb\x7b\x07\xbc\xfc\xd2\x7d\xae\xc6\x97\x3c\x7d\xf6\x84\xc7\x8f\
-\xdf\xe7\xf4\xec\x19\x93\xf1\x05\xe7\xe7\x67\x5c\x5e\x5d\xf0\xf0\
-\xe1\x7b\x64\x79\x46\x91\xf7\xd8\x1b\xdd\xa0\xd7\x1b\x92\xe7\x19\
-\xc3\xe1\x90\xc1\xa0\x47\x51\x14\xe9\x14\x29\x89\xd1\x8a\xa8\x44\
-\x2b\xa1\xf1\x58\xbb\x5d\xc9\x49\xc8\x6a\x7d\xb2\x40\xac\xf4\x54\
-\x79\x9e\x31\x1c\x24\x31\x9b\x0f\xe9\x67\x79\xd1\x23\xcb\xf3\x44\
-\xa5\x44\x47\xd5\xd4\xf8\x28\xe8\x0d\x76\x08\xe7\xcf\x5a\xd8\x2a\
-\x41\x28\xa4\xca\x20\x6a\xea\x3a\xb2\xb0\x1e\x1f\x03\x57\xe3\x8a\
-\xd3\xc7\x8f\xa9\xeb\x09\x5a\x79\x5c\x23\x68\x4a\x47\x59\x96\x2c\
-\xcb\x09\x9e\x1a\x64\x4e\xa6\x72\xac\x31\x14\x3d\x8d\x50\x79\xdb\
-\x07\xe3\x30\x46\x61\x9b\x8a\x72\x99\x54\x8f\xb3\xd9\x6c\x03\x36\
-\x47\x42\x14\x28\x3f\xe3\xd0\x64\xe4\x45\x81\x52\x6a\xf1\xa5\x2f\
-\x7d\xe9\xf4\xd7\x7e\xed\xd7\xf8\xa5\x5f\xfa\xa5\x96\xcb\x22\xb4\
-\xca\x90\xb4\x7d\xff\xd7\xff\xe6\x8f\xe3\x5b\xef\x7e\xf3\xd1\xde\
-\xee\x11\x4a\x8a\x96\x4a\x48\xc1\xd7\xa0\xc9\x4c\x8f\xa3\xc3\x3e\
-\xa3\xe1\x11\xb7\x4e\xee\x73\x75\x75\xc1\xe5\xd5\x39\xe3\xf1\x39\
-\xb3\xf9\x98\xf9\x7c\xca\xb2\x9c\x31\x9b\x9e\x71\x75\x31\x45\xeb\
-\x9c\x2c\xcb\xe8\xf7\xfa\xf4\x7a\x3d\x7a\xbd\x82\x3c\x4f\x46\xe9\
-\xe8\x9a\xae\x7e\xbe\xd9\xad\xb5\x29\x2f\xba\xae\xbd\x12\x2d\xf1\
-\xa7\x14\x38\x6b\x19\x5f\x8e\x49\xa1\x4a\xb6\xba\x2f\x8b\x6b\x6a\
-\xde\x7d\xf0\x00\xd7\x34\x5c\x8d\x17\x48\xad\x31\x59\x06\xc2\x32\
-\x9b\x2f\x79\xff\xd1\x53\x6a\x1f\x91\x79\x9f\xd2\x0b\x0e\x8e\x6f\
-\x73\xf7\xce\x4b\x7c\xf2\xd3\xb7\xb1\x4d\xc3\xb2\x2c\xc1\x77\x2a\
-\x92\x40\x0c\x96\x80\xa5\xac\x4b\xce\x2f\xae\x78\xf0\xf0\x8c\xe9\
-\xf4\x82\xaa\xb2\xdc\xbc\xd7\xe3\xa5\x7b\xb7\x19\x0c\x06\x28\x22\
-\x65\x55\x21\xa2\x47\x8a\xc8\xc9\xcd\x63\x86\x83\x21\xf3\xf9\x9c\
-\x67\x67\xe7\x54\x8b\x25\x18\x3a\xf9\x90\xff\xad\xdf\xfa\x2d\x9a\
-\x26\x8d\x86\x8a\x31\xb6\x25\x5c\x29\x93\x6a\x44\x10\x5f\xfb\xc4\
-\xcf\xd2\x34\xf5\xab\x8b\x72\x4c\x66\x34\x4a\x25\xe6\xb2\x71\x16\
-\x8b\xc2\x28\x43\xaf\x3f\xa4\xbf\xb7\xcf\xfe\x5e\xe0\xe8\xe0\x06\
-\xb3\xf9\x98\xe9\xec\x8a\xd9\x6c\xc2\x74\x3e\x65\xb1\x98\x53\x96\
-\x4b\xe6\xd3\x19\x75\x9d\x06\xd0\xcc\x66\x33\x2e\x2f\x2f\xda\xca\
-\x64\x44\x6b\x45\x9e\x67\xf4\xfa\x7d\xf2\x2c\x27\xcf\x93\xe1\x44\
-\x4b\x59\xc8\x56\xef\xf4\x22\xc5\x89\x10\x91\xaa\x16\x78\x9f\x61\
-\x4b\xc7\xa3\x47\x4f\x88\x42\xe3\x43\x4c\x9c\x5b\xf0\xd4\xde\xf1\
-\x83\xb7\xdf\x25\xd8\x80\x73\x01\x59\xa4\xa2\x55\x88\x8e\xf1\x64\
-\xce\x7c\xf6\x8c\x77\x9f\x3c\x65\x61\xa1\xf2\x8a\xcf\x7d\xee\xe7\
-\x38\x39\x79\x99\x1b\xf7\xee\x10\x83\x64\x3c\x99\x27\x68\x1e\x3b\
-\x25\xb8\xc5\xfa\x86\xe9\x7c\xca\x6c\x69\x08\x94\x4c\x66\x17\x2c\
-\x96\x0d\xbd\x5e\xc1\x8d\xe3\x63\xf6\xf7\xf7\xb8\xba\x38\xe7\xfc\
-\x22\xf5\x4a\x1a\x2d\xb9\x7d\xf3\x84\xc3\xa3\x23\xce\xce\xce\x98\
-\xcd\x66\x2c\x2e\x6c\x12\xa8\xb7\x8a\xc4\x2e\x21\x1f\x0e\x87\x6d\
-\xc5\x70\x25\x0d\x4d\xdb\xb1\xaa\x17\x7f\x65\x7f\xff\xe4\xaf\x2e\
-\x96\x93\x76\x32\x80\x42\x0a\x81\xd6\x39\x4a\xf5\xd1\x72\x00\x31\
-\xb1\xae\x88\x88\x94\x39\xc3\xc1\x01\x45\x31\xe4\x60\xff\x04\xe7\
-\x1a\x9c\x4f\x64\xe4\x7c\x76\x49\x55\x2e\x71\xde\x53\x37\x15\x65\
-\x59\x52\x96\x4b\xca\x72\x49\x55\x95\x34\x8d\xc5\x36\x8e\xa6\xae\
-\xb9\xba\xf2\x94\x55\xb3\x92\xb5\x76\x8b\x7f\x7d\x6a\x42\x6c\x79\
-\x0e\xd3\xff\x49\x3c\x07\x8c\x27\x25\x2e\x18\x4c\xde\x47\x48\x89\
-\xce\x32\x7a\x99\x66\x24\x46\xf8\xc6\xa1\x65\x0e\x51\xf2\xec\xea\
-\x19\x75\x53\x23\xa4\x4d\xd9\xd6\x70\x97\xfe\xce\x3e\xb1\xf4\x3c\
-\x7d\xf0\x98\x7f\xf0\x7b\xff\x98\x37\xbe\xf3\x80\x57\xee\x7f\x1c\
-\x93\x0d\xa9\x6d\xf2\x0e\xf8\xb6\xcc\x19\x12\x7d\x13\x45\xa4\xf1\
-\x91\xb2\x56\x1c\x9d\xdc\x65\xcf\x07\x9c\x75\xd8\x66\x49\xf0\x43\
-\x9a\xba\xa4\x2a\xe7\x44\xa0\x2a\x2b\x8c\x96\x14\x79\x86\x14\x5d\
-\x67\x96\x7b\x21\xcb\xbb\x12\x6f\x5c\xa7\x81\x8b\x7c\xf0\x4f\x9b\
-\xa6\x7a\x49\x4a\xf9\xc5\xe0\x03\x0e\x87\x94\x06\xa5\x0d\xa6\x93\
-\xb8\x10\x56\x42\xe7\x84\x0c\x34\x4a\x0b\xb4\x96\x58\xab\x50\xde\
-\x25\x31\x99\x02\x3f\x1a\x6d\x28\x13\x2d\xd6\x59\x9c\x4d\x72\x52\
-\xb7\x52\x2e\xfa\x44\xc7\xb4\x4a\xc7\xeb\xc3\xc7\x9e\xd7\xf6\x06\
-\x96\xcd\x21\x97\x93\x0c\x18\x83\x4a\xbb\xbf\x50\x12\xa9\x3b\xc5\
-\x21\x58\x48\xf1\x42\xe8\x55\xc9\x55\x6b\xc3\xe1\xd1\x31\x37\x4f\
-\xf6\xe8\x8d\x76\x51\x57\x0b\x1e\x3e\x19\xf3\x87\xdf\x7b\xc2\xd2\
-\x0e\xb8\x71\xe3\x3e\x3d\x99\x51\x79\x95\x00\x87\x6d\x88\x2e\xa0\
-\xa5\x41\x2b\x85\x36\x9a\xa2\x67\x30\x03\x41\xd0\x33\xae\xae\xc6\
-\xa9\x1d\x5a\x24\xd8\x11\x82\x43\xc9\xb4\x26\xae\xa9\xd3\x67\x21\
-\x60\x9b\x1a\x29\x22\x45\x91\xa3\x75\x83\x31\x49\x8e\xfa\x82\x8a\
-\x61\x5c\xb1\x99\x31\x46\xde\xf8\xde\x1f\xfd\xe0\xd9\xd9\xc3\xbf\
-\xdf\x2b\x06\x7f\xcd\x87\x20\x56\xa7\x27\xca\xb6\x7b\xa9\x5e\x2b\
-\xfe\x5a\x21\x04\x1b\x5a\xda\x4d\x8e\x2b\xcb\x72\xc0\xbc\xb0\xed\
-\x2c\xb4\xd2\xa0\xe0\x53\xf7\xaf\x10\x12\xad\xf2\xad\x26\xcb\xeb\
-\x4d\x97\x6b\x65\x52\xe4\x62\x5a\x10\xa4\x67\xb6\xb0\x04\xfa\x48\
-\x5d\xe0\x05\x44\xe9\x12\x7c\x6e\x1b\x7e\x7c\x80\x20\xd2\x78\xbd\
-\xae\x0a\x59\xf4\x7a\x8c\x46\xbb\xf4\x86\x3b\x4c\x2a\xc8\xf3\x3e\
-\x83\xd1\x90\xc3\xdd\x5d\x0e\xf6\x8f\xc8\x47\x87\x2c\xbc\x40\x49\
-\x88\xce\x12\x9d\xc3\xb4\x7d\x04\x52\x4a\x94\x31\xb8\x18\x59\x38\
-\x4b\x7d\xd1\xac\x36\x40\xf0\x2e\x11\x8d\x44\x8c\xd6\x2d\xda\x52\
-\x28\x95\x62\x1b\x44\x8c\xd1\x68\x1d\xd0\x3a\xa9\x1f\x53\x9d\x65\
-\x3d\x11\x69\xd5\xf4\x39\x1a\xa6\x96\xb6\xaf\x5f\x7c\x19\x29\xb2\
-\x7e\xd3\x58\xb2\x4c\x20\x74\xa2\xc4\xad\xf5\x84\x50\xa1\x34\x2d\
-\x3b\xa9\x92\x00\xad\xae\x5b\x1d\x2b\x6d\x70\x06\x63\x24\x42\xa8\
-\x44\x44\x86\xf5\xcc\xaa\x10\xd8\x68\x65\x8e\x2b\x25\x7c\x0c\xe0\
-\x43\xa0\xa9\xea\x0f\x6d\x1d\x5b\xc5\x10\x52\x9b\x04\xd1\xe3\x9d\
-\x43\xea\x14\x73\x02\xb1\xad\x5f\xa7\xc4\x53\xeb\x24\x7c\x08\x41\
-\x90\xe5\x19\xb5\xb5\xf8\x7a\x41\x59\xd6\xd4\x75\x83\xd0\x0d\x55\
-\xd9\xe0\x5d\x64\x90\xe5\x44\xa1\x68\x6c\x00\xeb\xb0\x08\xa4\x49\
-\x71\x0c\xa5\x89\x42\xe2\xea\x9a\xe0\x22\x06\x10\x46\x21\x75\x24\
-\x08\x4f\xdd\x34\x54\x55\x45\x99\x97\x2c\xcb\x92\xaa\xaa\xd0\x5a\
-\x13\x42\xc0\xb4\xc2\xec\x24\x20\x49\xe2\xbd\x44\xe5\xb3\x35\xb2\
-\xaa\x6b\xe9\xd0\x60\xb9\xc0\xe1\xdb\x00\x00\x20\x00\x49\x44\x41\
-\x54\x10\x08\xe6\x8b\x0b\x62\x8c\xe2\xf8\xe8\x24\x3e\x78\xff\xbb\
-\xf3\x9d\xe1\x3e\x4a\x27\xf5\xb6\x94\xa9\x3e\x1d\xa3\x4a\x89\x5e\
-\x14\x2d\x65\x95\xdc\x8c\x92\xac\x7e\xa1\x5f\x4d\x5b\xe8\x44\x63\
-\x22\xb5\x21\x44\xb1\xd1\xa2\xd6\xfe\xdb\xaa\x5e\x27\x88\xc2\x13\
-\x54\xb5\xa1\x0c\x8c\x1d\x2d\xd6\x1a\x8e\x2d\x81\xdd\xbc\xea\x51\
-\xda\x24\xc8\x53\xd2\x10\xa3\xc2\xf9\x86\x3c\x2f\x08\x3e\xe0\x6a\
-\x47\x91\x15\xa9\xd5\x41\x58\xfa\x32\x43\x04\x99\x28\xf7\xfe\x31\
-\x5e\xef\x30\xaf\x03\xef\x3f\x7a\xcc\xb2\xaa\xd9\xcd\x75\xfa\x30\
-\xaa\x47\x0c\xd0\x2c\xc6\x2c\xaf\x2c\x79\x9e\xa3\x95\x62\xb1\x58\
-\x60\xb4\x86\x18\x39\x3b\x3b\x65\xb4\x33\x22\x5a\x4b\x5f\x19\xce\
-\x2f\xa6\x7c\xe7\x8d\xb7\x28\x8a\x82\x45\x15\x51\x66\x80\x0b\x92\
-\xc6\xc1\x5b\x6f\x3f\xe0\xfc\x62\xcc\x7c\x5e\x61\x2d\x6d\x61\xcc\
-\x92\x17\x9a\xfe\x20\x43\xaa\x8e\xa7\xf0\x48\xa1\xd0\x3e\x24\xc5\
-\xaa\xf7\x1e\x81\x88\x9f\xfa\xe4\x17\xee\x19\x93\xfd\xb9\xf3\xab\
-\xf7\x85\x10\x61\x45\x5f\x24\xa9\x7e\xaa\x57\xd3\xe9\xaa\x62\x6c\
-\xfb\x26\x68\xeb\xda\xeb\x71\x49\x89\x39\x15\xd7\x7a\xd7\x3b\x36\
-\x95\xf5\x9f\x5d\x4f\xbf\x00\xa9\x36\x3a\xa6\x44\x58\x9d\xa0\xd0\
-\x8a\xe5\xbc\x5f\x4b\x3f\x6d\x08\x04\x5a\x09\x4e\xeb\x8a\x52\x7d\
-\x24\x24\xce\x2c\x68\x9a\xca\x11\x63\x43\x0c\x15\xd1\x45\xbc\xc9\
-\x12\x7d\xde\x1b\xe1\xa2\xa1\x2c\x67\x3c\x7e\xfa\x8c\xb2\x8a\x18\
-\x65\x5a\x62\x53\x11\xbd\x27\xd6\x4b\x0a\x63\xa8\x17\x33\xea\x96\
-\x9e\x59\x2e\x96\x58\x67\x39\xd8\xe9\x27\x9a\xa5\xae\x18\xe4\x19\
-\xda\x14\x4c\x16\x0d\x97\xd3\x8a\x41\xbf\x47\x9e\x67\xc9\xfd\x68\
-\xc7\xe3\x27\xe7\x9c\x9d\x8f\x91\x52\xd0\xd8\xd0\xc6\xc9\x7a\x15\
-\x73\xb5\x96\x5b\xe2\x47\xed\x5a\xa1\x5c\xe7\x1a\xca\x6a\xfa\x57\
-\x06\xfd\x9d\xff\xe8\xfc\x12\x11\x3a\x0d\x2b\x91\x7e\x2f\x03\x92\
-\xec\xfe\xba\x84\xe7\xb9\x86\xfa\xff\x5f\xe5\x29\x89\x12\xbd\xb6\
-\xb8\xe4\xdb\x8a\x51\x3a\x43\x29\xef\x88\x68\xb1\x66\x94\x83\x90\
-\x64\x59\x00\x1a\xac\xad\x13\xaf\x15\x02\xcb\xd9\x0c\x6d\x72\x94\
-\xce\xb8\xbc\xbc\x24\x86\x12\xa3\x03\xde\x0a\x94\x1e\x90\xe7\x90\
-\x19\x83\x73\x8e\x72\x59\x61\x1b\x87\xb5\x01\x21\xcd\x1a\xfe\xe3\
-\x31\x46\x72\xef\xde\x1d\xde\x7b\xf0\x80\xab\xab\x4b\x7e\xe6\xa7\
-\x3f\xcb\x9b\xdf\x7f\x13\x37\x2b\x79\xfd\xf5\x4f\xf3\xf0\xbd\xf7\
-\x98\xbf\x3f\xa1\x57\x18\x8e\x6e\x1c\x93\x65\x45\x12\x6d\x3b\xd7\
-\x6a\x95\x53\x3d\xc7\xfb\x94\x17\x2d\x16\x25\x21\xc4\x94\xb8\x2a\
-\x9b\xdc\xb4\x5f\x37\x2f\xc9\x56\xfc\xa0\x53\x3f\x9c\x40\xb5\x96\
-\xca\x8b\xec\x2b\x61\xec\xfe\x00\xc4\x5f\xe8\x7a\x8b\x00\xaa\xaa\
-\x44\x4a\x83\xd6\xea\xc7\x50\x98\x4a\xae\xc9\x5b\x56\x73\x71\x45\
-\x50\xc8\x28\x12\xd9\xd8\x89\x84\x3a\x32\x32\x46\x94\x8a\x28\xed\
-\xb1\xb6\xa4\xaa\x26\x08\xed\x10\x5a\x32\x9d\x5f\x31\x1a\xee\x70\
-\xb8\x7f\x44\x6e\xe0\xe6\xcd\x1b\xec\xee\x0e\xf8\xde\x1b\x0f\x92\
-\x6f\x57\x86\xa2\xe8\xa1\xa4\x4f\x03\x2e\x8b\x02\x1b\x2c\x21\xca\
-\x36\x36\x39\x8c\xd1\x0c\x07\x03\x0e\x0f\xf6\x99\x4d\xc6\x94\xe5\
-\x92\xa2\xc8\x19\xf4\x7b\x10\x03\xbd\xa2\xa0\xdf\xef\x51\xe4\x59\
-\x8a\x1f\x75\x43\x94\x26\x95\x91\xbb\xbc\x49\x49\xb2\x5e\x8e\xa0\
-\x20\x04\x8f\x32\x39\xd6\x79\x94\x8b\xe4\x99\x4b\x3d\x26\xca\xe0\
-\xd4\x76\xab\xb4\xec\xc4\xc4\x5a\x2b\xb4\x51\x48\x8a\x6f\x5b\x57\
-\xff\xc9\xba\x59\x3f\x6c\x8c\xd3\xf8\x71\x2a\x1a\x48\x70\xa8\x35\
-\xc2\xca\x9f\x75\x5d\x50\xc1\x11\x83\xc5\xfb\x1a\xef\x6a\x88\x16\
-\x29\x3c\x52\x78\x94\x82\xa3\xc3\x3d\x3e\xf9\xea\x7d\xf6\x76\x86\
-\x08\x3c\x52\x06\x84\x70\x1c\x1e\x0e\xb9\x7d\xe7\x88\x7e\xbf\x48\
-\xc8\x2e\x06\xb2\x3c\x4f\x20\x20\xc4\x2d\xe1\x84\x90\xa9\xd7\x1c\
-\x52\x9d\xa4\xc8\x33\xb2\x4c\x27\x21\xaa\x96\xa9\xe9\x3f\x46\x88\
-\x3e\x49\x5d\x05\x49\x51\xdf\xf2\x66\xce\x27\x42\xd3\xc7\x88\x75\
-\x9e\xa6\xad\xdb\x2b\xa5\xc9\xf3\x3c\xe9\xbf\xda\xdc\x2e\x75\x5f\
-\x25\xa3\x68\x65\x56\x7c\x5d\x1b\xc9\xc4\xba\xbf\x43\x93\x03\x85\
-\x10\xad\x34\xa6\x6d\x6b\x36\xa6\xeb\x2a\x8d\x3f\x16\x5b\x08\x91\
-\x44\x6b\x5d\x40\x17\xd2\xaf\xa6\x38\x24\xda\xbe\x6d\x81\x8b\xae\
-\x85\xcc\xe9\x85\x46\x4b\xa4\xcc\xb9\x7d\xeb\x84\x97\x3f\x7e\x9f\
-\x65\x39\xe1\xe9\xe9\x33\x82\xab\x71\xb6\x44\x2a\x47\x96\x0b\x4c\
-\xa6\x60\x91\x92\x33\x25\x33\xea\x3a\xd0\xd4\xb6\xa5\xdd\x03\xc8\
-\x56\xa0\x20\xdb\xa1\x99\xbe\x6e\x5b\x3b\x02\xde\xd9\xf6\xf4\x78\
-\xaa\x6a\x49\x5d\x57\x2d\x99\x98\x48\x42\x25\xbb\xbe\xc2\x26\x75\
-\x62\x45\x41\xf0\x1e\xeb\x1a\x82\xd6\x64\xc6\xa4\xe1\x3e\xce\x12\
-\x9b\x86\xd8\x07\x29\xbb\x86\x1f\xbf\x35\x26\xa2\x9d\xe4\xa0\xb0\
-\xb6\x41\x08\x58\x94\xe7\xbf\x5e\x14\xbd\xdf\xcc\xf3\x5c\x48\xdd\
-\x92\x77\xd6\x63\xa9\x91\x32\xd5\x1c\x7e\x3c\x1a\x87\x88\x90\xae\
-\x15\xff\x76\x53\xab\xdd\xaa\x89\x5f\xb6\x4d\x3c\xc4\xa4\x02\xf4\
-\x4e\x26\x15\x4c\x88\x38\xdb\xa0\x24\x0c\xfa\x39\xb9\x91\x34\xf5\
-\x82\x2b\x5b\x33\x9b\x4d\x78\xf6\xe4\x29\x21\x58\xc6\xe3\x4b\x16\
-\xcb\x0a\x29\x72\x8a\x2c\x49\x4c\xd3\x20\x98\x0c\xa3\x23\x3e\x0a\
-\xac\xb5\xcc\xe7\x33\xfa\x45\xce\xa8\x3f\x40\xc9\xb4\x7b\x8d\xce\
-\x5a\x44\x29\xf1\x2e\xb2\x5c\xa4\xd8\x13\x43\x9a\x58\xea\x9d\x4d\
-\xe2\x09\x6b\x31\xb4\xed\x6e\x59\x4e\x08\x26\x6d\xaa\xe0\x20\x06\
-\xb4\x12\x44\xa5\x89\xc1\x25\x41\x07\x06\x29\xfc\x6a\x1a\x84\x94\
-\x62\x3d\x2f\xab\x93\x01\x09\x21\xef\x38\xeb\xd4\x64\x32\x26\xef\
-\x29\x86\x83\x21\xbd\x7e\x81\x6b\xc4\xbf\x70\xe0\xfe\xb0\xb9\x67\
-\x69\x7e\x9c\x4b\x3c\x80\xec\x5a\x63\x55\x5b\xf6\x5d\xf7\xa8\x87\
-\xf6\x7b\x29\x33\x72\x1d\x11\xb1\x61\x3e\x9d\xf2\xec\xe9\x63\x76\
-\xf7\xfb\x5c\x8d\xcf\x69\x9a\x92\x41\x6f\xc0\xf1\xf1\x61\x9a\xa4\
-\x20\x34\xaf\x7d\xf2\x13\x5c\x5e\x5e\x31\x9d\x8c\xa9\xca\x0a\x5b\
-\xa7\xfc\x43\x29\x83\x52\x9e\xe0\x45\x4b\x91\x2b\x84\x84\xd9\x7c\
-\xce\xc3\x87\x0f\xb9\xb8\xbc\xa2\x6a\x1a\xde\x7d\xf7\x5d\xa6\xf3\
-\x39\x3e\x44\xde\x7f\xf4\x3e\xde\x27\x17\x35\x99\x4e\x28\x86\xbb\
-\x0c\x47\x3b\xf4\x73\x45\x24\x62\xeb\x92\xaa\x1d\x59\xe2\x9d\x4b\
-\xb5\x92\xe0\xb0\x3e\xd0\x93\x81\x7e\x7f\xb8\xd2\x0a\x4b\xa9\xb7\
-\x5a\x06\xb5\xdc\x98\x5b\xde\x2e\x4e\x55\xd7\x35\xef\x3d\x7c\x40\
-\x7f\x60\xb8\x73\xfb\x2e\xc7\xc7\xc3\xa4\x12\x0f\x3f\x5e\xe5\x62\
-\x88\x92\xd8\x35\x6b\x4a\xb1\x9e\xe0\xe3\x23\x3e\x7a\x9c\x0f\xad\
-\x8e\xd7\x23\x4d\x86\x91\x92\x7e\x2f\x32\x28\x3c\x4d\xbd\x64\x7c\
-\xf5\x8c\xd1\xc8\xf0\x4a\xef\x0e\xfd\xde\x2e\xfd\xde\x80\x7e\xa1\
-\xc8\x72\xcd\xc1\xe1\x08\xa5\x35\xe5\x72\xce\x7c\x32\xc1\xdb\x06\
-\xef\x63\x1a\x02\x20\x64\x02\x0c\x44\xb2\xdc\xa0\x94\x62\x32\x9f\
-\xf3\xfd\x77\x1f\x60\x9b\x06\x8f\xe4\xcd\x77\xde\xa5\x57\x14\x98\
-\xbc\xe0\xd9\xf9\x25\xbb\xbb\xbb\x08\xa5\x19\x4f\xe7\xe4\xbd\x0b\
-\x06\xfd\x9c\x9d\xbd\x03\x32\x63\x28\x97\x0b\x16\xf3\x05\x59\x6e\
-\x88\x46\x63\x55\xa4\xb1\x29\xee\x0c\x32\x43\xbf\x3f\x24\x84\x88\
-\xb5\x36\x34\x8d\x45\x08\xc1\x5b\xdf\x7f\xc8\x27\x5f\x7b\x29\x71\
-\x59\xce\xf9\x55\x3f\x9d\xd2\x1a\x1f\x02\x0f\x1f\xbe\x4f\xe3\x66\
-\x94\x65\x8d\x52\x39\xfb\xbb\x37\xd0\x3a\x95\x3a\x7f\x2c\x11\x5d\
-\x48\x10\xc5\x2a\xbf\x09\xed\x64\xd0\x95\x5b\xf0\xe0\x5d\x68\x47\
-\x45\x05\x9a\x85\xc5\x59\xc9\xc9\x8d\xbb\xdc\xb9\xb3\xcb\xc1\xf1\
-\x21\x37\x6e\xef\xa1\xf2\x94\xef\x04\xab\x53\xbd\xa3\x5c\x30\x99\
-\x5e\x72\x35\x9b\x30\x9d\x4d\xa9\xaa\x8a\xc5\x72\x81\x6a\x73\xa4\
-\x54\xc1\x0c\x34\x4d\x43\x5d\x55\x34\x75\xc9\xee\xfe\x11\xc7\x27\
-\x77\x56\xed\xdc\x5d\x4d\xa3\xab\x8f\x8f\x42\x20\xcf\x72\xa2\x34\
-\x64\xbd\x11\x8f\x1e\xbd\xcf\xde\x4e\x8f\xfb\x2f\xdd\xe5\x63\x77\
-\xee\xe0\xbd\x63\xb9\x5c\x52\x14\x19\x49\xd5\x63\x59\x2e\x97\x94\
-\x8b\x05\xae\x5a\x20\x85\x63\x3c\x9e\x12\x42\xf4\x4a\x69\xbc\xf7\
-\xf4\xfb\x7d\x01\x44\xdd\x8d\xef\xeb\xd2\x7b\xad\x55\x2c\xf2\x8c\
-\x83\x83\x7d\x7e\xf0\xd6\x63\xbe\xfd\xed\x6f\x31\x9f\xd5\x7c\xec\
-\xee\xc7\x93\xea\x64\xff\xb0\x85\xbe\x9b\x93\x0f\x9e\xcb\x4c\x5e\
-\xd8\xcf\xfb\xa2\x56\x84\x15\x3d\x12\x05\x2e\x68\xea\xb2\xa2\x69\
-\xd2\xee\x25\x68\x84\xc8\xd0\xaa\x20\xcf\x06\x0c\xfb\x7d\xb2\xac\
-\xc0\xe8\xe4\x66\x84\x50\xc4\xb0\x47\x10\x05\x95\xab\xb8\xb8\x78\
-\x46\x54\x49\xfa\x33\x9b\x5a\x54\x2c\x68\xaa\x8a\x45\x39\xc7\x12\
-\x28\x72\xc3\xfd\xfb\x2f\x51\x1e\x1f\xb0\x9c\x2d\x78\xf6\xec\xb4\
-\x6d\x43\x90\x18\x93\x4a\xcf\xa1\x1b\xf0\xaf\x74\x52\xa1\x48\x95\
-\x9a\x7f\x5a\x15\x63\x14\x69\x7c\x46\xa7\xd5\xf7\x42\x30\x99\x8e\
-\x99\x5c\x9c\x32\x9f\x5c\xe1\x4f\x8e\x13\xb9\x28\x22\xb6\x2a\x57\
-\x89\xae\x26\x92\x1b\x8d\x2f\x03\xe3\xab\x0b\x1e\x3e\xc8\xb8\x7b\
-\xef\xee\x2f\xbf\xf4\xf2\xcb\xff\x6d\x39\x1d\xfd\x67\xc3\xd1\xb4\
-\x3c\xbf\x78\x22\x74\x6c\xc5\x5f\xaa\x25\xcf\xb4\xd2\x6f\x6b\x63\
-\x4e\xef\xde\xb9\x77\xa3\xb1\x25\x0f\x1f\xbe\xc7\x37\xbe\xf1\x55\
-\x9e\x3d\x39\xe7\xd3\x9f\x2e\xb9\x7f\xdf\xd3\xeb\xe5\xe4\x79\x86\
-\xd6\xa6\x25\xed\x04\xc1\x8b\x16\xaf\xe9\x8d\xfe\x82\x90\x7a\x2d\
-\xe2\x76\xaf\x62\x37\x09\x42\x74\xd3\x15\x82\x67\x59\x3a\x2e\x26\
-\x4b\x76\x76\x8e\x19\x0c\x7b\x78\x97\x4e\x45\x96\xe5\xe4\x79\x2f\
-\x65\xd8\xa6\x40\xab\x3c\x05\x44\x59\xb7\xa4\xa6\xc4\x7a\xcb\x78\
-\x32\xe6\xdd\xf7\xdf\x26\x08\xc7\xb2\x6c\x98\x4d\x6a\x72\xd9\x4f\
-\xef\xa3\xa0\x37\xcc\xe9\xf7\x47\xf4\x8b\x3e\x6e\xb8\xcb\x24\x1f\
-\x33\x5f\x2c\x70\xc1\x81\x08\x64\x46\x92\x69\x85\x42\x41\x00\x1f\
-\x1d\xd6\xd9\xd4\xa8\xd4\x0e\xd7\xb7\xd6\xae\x06\x93\x25\xd9\x6d\
-\x6a\x2a\x75\xd6\x52\x55\x25\x75\x5d\x25\x0e\x4d\x68\x84\xa0\xed\
-\xea\x75\x28\x29\x19\x0e\xfb\x84\xd0\x23\x37\x8a\x29\xf0\xec\xfc\
-\x2a\xf6\x47\xc3\x7b\xfb\xb3\xf1\x7f\xbc\x77\xd0\x7c\xf7\xce\x9d\
-\x9b\xbf\x7b\x71\x79\x75\xa9\x43\x74\x6d\xc7\x90\x6a\x63\x48\xff\
-\xf7\xbd\x0b\x37\x8f\x8e\x4e\x7e\xa3\x3f\xcc\xc5\xf1\xf1\x21\xdf\
-\x7d\xe3\xfb\x3c\x78\xef\x1d\x1e\xbe\xff\x2e\xb7\x6f\xdf\xe4\xde\
-\xc7\xee\x71\xff\xe5\x57\xb8\x75\xf3\x0e\xc3\xe1\x2e\x90\xaa\x5d\
-\x38\x99\x66\x84\xac\x34\x56\x49\x7d\xb2\xda\x5d\x5d\xcf\x8a\x94\
-\x6d\xfb\x99\xc2\x86\x8a\xba\x76\x3c\x7e\x7c\xca\x97\xbf\xf2\x8c\
-\xbf\xf4\x17\x7f\x95\xfb\xf7\x5f\x85\x28\xa8\xea\x2a\x41\xd6\x5c\
-\x70\x39\xbe\x64\x3e\xaf\x59\x4c\xe6\x8c\xaf\x96\x9c\x5f\x9c\x33\
-\x99\x8e\xf1\x7e\x93\x69\x16\xec\xec\xec\xb0\xbf\x7b\xcc\xcd\x1b\
-\x79\xdb\x7b\x98\x76\xb8\x88\x96\xe0\xc1\x35\x20\x65\x0f\x53\x38\
-\x4c\xd1\xc3\x87\x0a\x29\x5d\xea\xba\x0a\x11\x13\x32\x74\x90\x84\
-\x68\x71\xcb\x25\x32\xcb\x88\xd1\x50\x97\xe5\x4a\x40\xd7\x2c\xe6\
-\xf4\xfb\x7d\x54\xf0\x64\x02\x84\x54\x14\xfd\x21\x83\x9d\x5d\x7a\
-\xc3\x51\x1a\x84\x29\x05\xba\x4d\xba\x8d\xd6\xf4\xfb\xbd\x04\xd7\
-\x5d\xa4\xb9\xf3\x2a\xdf\xfa\xf6\x3f\x17\x3f\x78\xef\x2d\x64\x56\
-\xf3\xb9\xa3\x9f\xfa\x5b\xb3\xd9\xfc\x95\x18\xe3\x7f\xa2\xc5\xaa\
-\x47\xad\x0b\xd8\x72\x01\xcc\xb3\x2c\xc3\xe4\x7b\xa9\x77\xc2\x4b\
-\x0e\x0f\x6e\xf2\xf8\xc9\x23\xde\x7b\xf4\x26\x97\xe3\x53\x1e\x3d\
-\x7a\xc4\x8d\x1b\xb7\xb8\x71\x7c\x83\xa3\xa3\x63\x76\x77\x77\xe9\
-\x15\x03\x4c\x6e\x5a\x7d\x56\xa4\xac\x02\xc1\x87\xb6\xa3\x76\x3d\
-\xfd\xb4\x6b\x04\xed\xea\xe3\x4a\x29\x08\x9e\xef\x7c\xe7\x4d\xbe\
-\xfc\xe5\x3f\xa4\x2a\x03\xb7\x6e\xde\xe1\x72\x72\xc1\x62\x71\x45\
-\xd5\xcc\xb8\x1c\x5f\xd2\xd8\x08\x21\xc3\xdb\x04\x2d\x47\x3b\x7b\
-\x58\xdb\x30\xe8\xa7\xf2\xb0\x31\x49\xea\xda\xd5\x2d\xe2\x46\x4b\
-\x97\x77\xae\x8d\x53\x92\xaa\x76\x34\xd6\x13\x11\x64\xbd\x1e\x65\
-\x39\xa7\xb6\x16\xa3\x2d\x08\x49\x5d\x37\xcc\xca\x09\x31\x44\xca\
-\xe5\x1c\x21\x04\x83\xfe\x80\xa6\xae\x09\x31\x26\x61\x9e\x4d\x02\
-\x08\x82\xa7\x5f\xe4\x20\x04\xd3\xe9\x94\x6f\x7d\xeb\x5b\x28\x09\
-\x46\x29\xf6\x0f\x0f\x38\x3e\x3c\xc6\xfb\xc0\x9b\x6f\xbe\x89\x73\
-\x96\x41\x6f\xc4\x70\xb0\x47\xd3\x58\x96\xd5\x92\x65\xb9\x4c\xbd\
-\xf2\xce\xf5\xac\xb5\x9b\x32\x20\xdf\xce\xa0\x5d\x7e\x5c\x29\xfd\
-\x9a\x10\xc9\xaf\xee\xed\xed\xa1\x55\xc6\xcd\x93\xc8\xc9\xcd\x1b\
-\x3c\x7c\x7f\xc8\xd9\xd9\x29\xef\x3f\xfe\x3e\xef\x3c\xf8\x36\xc7\
-\x87\x37\xb9\x7b\xef\x65\x4e\x6e\xdc\x62\x77\x77\x9f\x7e\xaf\x4f\
-\x5e\xa4\x11\x45\x31\xa4\xf2\xb0\x52\x0a\xa9\xc0\x6c\x0c\xac\x49\
-\xb1\x23\xa2\x75\x6a\x9c\x2c\x7a\x39\x4d\x53\xf1\x77\xfe\x8f\xdf\
-\xc3\xd6\x9e\xcf\x7e\xf6\x67\x18\xcf\xc6\xcc\x66\x97\xd4\xcd\x1c\
-\x1f\x03\x26\xeb\x51\x64\xbd\x34\x8b\xaa\xc8\x90\x1a\xbc\xcb\xe9\
-\xf7\xfb\xe4\x79\xde\xde\xdf\x64\x46\xe9\x1c\xaa\xad\x51\x67\x59\
-\x86\xd1\x1a\xeb\x7c\xe2\xec\xa4\xc2\x79\x8b\x0b\x21\x0d\xdd\x50\
-\x06\x1f\xa1\xb6\x8e\x22\x8f\x20\x13\x74\x55\x02\x0e\x6f\x1c\x71\
-\x71\x71\xc1\x7c\x3e\xe7\xf0\xee\x1d\x2e\xaf\x2e\x71\xd6\x71\xe3\
-\xc6\x11\xd3\xe9\x14\xef\x6d\x7b\x0d\x6a\xe5\xf2\x9b\xa6\x21\x33\
-\xa9\xca\x3a\x9d\x4c\x19\x0d\x86\x48\x21\x78\xf0\xe0\x01\x26\x33\
-\xec\xef\x06\xea\x32\x4d\xc1\x76\xce\xe3\x6c\x2a\xd2\x79\xe7\x1a\
-\xef\x7d\xd2\xf6\x6e\x92\x83\xce\xd9\x9f\x12\x42\x7d\xd1\xfb\x20\
-\x94\x8e\xe4\x79\x4e\x9e\xf5\x20\xe6\x1c\x1d\x1f\x70\xfb\xce\x1e\
-\x4f\x9f\x3e\xe3\xc9\x93\x27\x3c\x7b\x76\xca\x7c\x3e\xe3\x8d\xef\
-\x7e\x83\x6f\x7f\xe7\x2b\x68\x6d\xd8\xdf\xdf\xe3\xe8\xe8\x88\xa3\
-\xa3\x63\x0e\x0f\x6e\x31\xe8\x8f\x56\xd5\xb1\x44\xd3\xac\xc5\x6f\
-\x88\x88\x54\x29\xa8\xe7\x45\xc6\xad\x5b\xb7\xf8\xbd\x7f\xf6\x1d\
-\x5e\xfe\xc6\x37\xd1\x7a\xc0\x70\x67\xc0\x70\xb8\xc3\xf1\xf1\x11\
-\x79\x3f\xc7\xe8\x02\x41\x8e\x6d\x24\xf3\xe5\x84\xaa\x5e\x20\xa5\
-\x64\xb9\x5c\x26\x43\x94\x25\xe3\xf1\x15\x21\xc4\xc4\x51\x39\xc7\
-\xe1\xfe\x3e\x7b\xfb\xfb\xa9\x16\xa3\x52\x93\xa6\xd4\xa9\x0b\x0a\
-\xd1\x0a\xb3\x43\x24\xd2\x75\x5d\xa5\x0d\xb2\xb7\xb7\xc3\xfd\xfb\
-\x2f\xa3\x75\x22\x54\x4f\x4e\x6e\xe0\x9d\xa5\x6e\x6a\x6e\xdd\x3c\
-\x81\xe0\x39\x93\xe9\xe4\xc7\x18\x51\x5a\x31\xda\xd9\xe1\xde\xdd\
-\xbb\xf4\x7b\x05\x4d\x5d\x71\x7a\x7a\xca\x72\xb1\x44\xca\x04\x9a\
-\x4e\x6e\xdc\x20\x33\x05\xcf\x1e\x9f\x33\x9f\xcf\xd1\x7a\xa3\x4f\
-\xa4\xeb\xc2\xdd\x1c\x51\x97\xc8\x2d\xfd\xd0\x7b\xff\xb6\x73\xee\
-\x46\x14\x4e\x44\x34\x46\x17\x28\x99\x14\x8c\x45\x71\x8f\xfd\xfd\
-\x13\xee\xbf\xfc\x09\x66\xf3\x24\x5c\x38\x3b\x7f\xc6\xf9\xd9\x13\
-\xc6\xd3\x4b\x96\xe5\x84\x47\x8f\xe7\x9c\x9f\x9f\xa2\xe4\x03\x8c\
-\x2e\xc8\xf2\x8c\xbc\x55\x16\xaa\xd6\x9d\xe4\x79\x4e\x91\xe7\x98\
-\xcc\x90\xe7\x86\xaa\xae\x39\x3a\x3a\xe4\x13\x37\xf7\x71\x2e\x4d\
-\x28\x3a\x3e\xba\x49\x96\x2b\xea\x7a\xce\x64\xbc\x20\xf8\x05\xde\
-\x49\x9a\x06\xaa\x7a\x4e\x10\x96\xa2\xe8\x51\x95\x25\xce\x25\xe1\
-\xf4\xc9\xc9\x4d\xf6\xf7\xf7\xc9\xf3\x9c\x77\xdf\x7d\xb7\x1d\x58\
-\x26\x30\x79\x96\xaa\x93\xae\x49\xc5\x35\xb1\x9e\x52\x94\xe5\x39\
-\x59\xa6\x50\x26\xa3\xac\x2b\x5c\xb0\x0c\x7a\x82\x7e\x51\x90\x1b\
-\xd3\x52\x27\xb1\x15\xbd\x05\x32\xad\x13\x5d\x12\x02\xae\xd3\x63\
-\x95\x15\xcb\xc5\x02\xef\x3d\x75\x5d\x53\x95\x65\x62\x35\x5a\x75\
-\xfb\xc1\xc1\x01\xc3\xd1\x08\xd7\x78\xe6\xf3\x39\xd6\x3a\xf2\x5c\
-\xad\x6e\xb7\xa4\xb5\xc2\x7b\xdd\x19\x64\xfd\xc8\xb3\xc1\x3f\x2c\
-\xab\xe5\xb1\x10\xe2\xe7\x42\x5b\xc0\x97\xc2\x23\x08\x68\x95\xa1\
-\x75\x41\xbf\x90\xec\x0c\x23\xfb\x7b\x35\x07\x7b\x37\x38\xb9\x71\
-\x9b\xf9\xe2\x15\xca\xe5\x82\xf9\x62\xc6\x7c\x31\x63\xb9\x58\xb0\
-\x58\xd4\x58\xd7\x60\x17\x35\xd3\xa9\x6b\x47\x5a\x78\x84\x94\xeb\
-\x31\x78\x59\x4e\x96\x69\x16\xcb\x54\x57\xe9\x15\xba\x1d\x2a\x10\
-\x18\x0d\x77\x70\xc1\x32\x9e\xcc\x89\x04\xac\x0b\x34\x55\xc0\x5a\
-\xd8\xdd\xef\xb3\x7f\x70\x44\x51\xf4\x38\x3d\x7d\xc6\x78\x3c\x41\
-\x4a\xc9\xde\xde\x1e\xc7\xc7\xc7\x18\x63\x78\xf2\xe4\x49\x3b\xc7\
-\x24\xf5\x6e\x38\x1f\x52\x17\x6e\xbf\x4f\xd5\x18\x02\x31\xfd\xbc\
-\xbd\x0f\x48\x97\x02\xc8\x56\x5d\x21\x85\x4c\xdd\xbc\x11\x6c\x63\
-\x5b\xd4\x14\xa8\xeb\x7a\x3d\x7e\xbd\xfd\x4f\xe9\x34\xe1\x64\x32\
-\x99\x10\x83\xc7\x36\x35\xa3\x51\x52\xe3\x37\x6d\x45\x71\x7c\x75\
-\x85\x77\x09\x7c\x18\xa3\xc9\x8c\x5c\xdd\x19\xae\x53\xd9\xe8\xf5\
-\x64\xcd\xd4\xc2\xf5\x77\xfe\xfe\xdf\x78\xfc\xf1\x97\xbe\xf0\x2d\
-\xad\x74\xf4\xd1\x89\xd4\x34\x1f\x90\x32\x10\x82\x40\x38\x43\x94\
-\x69\x6a\x9a\xca\x7b\x68\xd5\x67\x67\x74\x40\x88\x0d\xde\x5b\x96\
-\xe5\x82\xd9\x7c\xc6\x7c\x9e\x92\xb0\xa6\x49\xf2\xca\xb2\xac\x58\
-\x2e\x97\x2c\x97\x4b\x9a\xa6\xc1\x5a\xcb\x72\x51\x32\x9d\xcc\xf0\
-\xae\xc6\xc5\x21\x79\x71\x4c\x91\x27\xda\x62\xb1\x98\x03\x82\xa6\
-\x4e\x49\xd4\xad\xdb\x37\x70\x3e\xe0\xec\x02\x5f\x35\x1c\x1d\x1d\
-\x70\xe7\xde\x6d\x32\x93\x11\x63\xa0\x69\xb6\x87\xcb\x00\x89\xb6\
-\x68\xa7\x45\xc8\xb6\x98\xa2\xb5\xa1\xd7\x2f\x98\x2f\x14\x31\x7a\
-\xac\x6d\x68\x5c\x03\xd1\x92\xe9\x3e\x59\x66\x30\x5a\x81\x48\x0d\
-\x37\x8d\xb5\xc4\x08\xf3\xf9\x02\x6b\x53\x97\xef\xe5\xe5\x15\x55\
-\x9d\x4e\x9a\x6a\x29\x90\xbd\xdd\x5d\xf6\xf7\xf7\x69\x9a\x86\xa6\
-\xae\x50\x92\x04\x34\xb4\xc1\xd6\x0d\x8b\xc5\x82\xe5\x72\x81\xd1\
-\x05\x83\xc1\x00\xeb\x7a\x18\xd3\xac\x26\xbe\x76\xdd\xc7\xba\x1b\
-\x15\xd9\x05\xa5\x5f\xf9\xb3\xbf\xf1\x57\x27\x93\xf3\xdf\x78\x7a\
-\xfa\xb6\x08\xa1\x6d\xe8\x8f\xdd\x3e\xd0\x10\x33\x82\x5f\x4f\x95\
-\x8b\x41\xa5\x01\x93\x21\x09\xd5\xf2\x4c\xa1\xf7\x06\xec\x0c\x0f\
-\x69\xec\x12\xe7\x9a\x55\xb5\x6f\xf3\x66\x5c\x9d\x12\x25\x15\x75\
-\x1a\x96\x8d\xe2\x6c\xa2\x79\xf2\xf8\x09\xff\xf7\xff\xf3\x90\x97\
-\x5e\x7a\xc2\x78\x32\xc6\x39\xc7\x60\xd0\xe7\x33\x9f\xf9\x09\xca\
-\xaa\xe2\xfb\xdf\x7f\x8b\xcb\xcb\xf7\x70\xce\x12\x43\x6c\xeb\xf9\
-\x49\xf9\x38\x1e\x8f\x99\xcd\x66\x3c\x7e\xfc\x88\xa2\xe8\x31\x9e\
-\x4e\x19\x0e\x06\x68\xad\xe8\x15\x9a\x18\x12\x2c\x97\xd1\xe3\x6d\
-\x85\xad\x4a\xc0\x53\xd5\x25\x8b\xd2\xa1\xa3\x21\xd8\x1a\x87\x61\
-\x51\xce\x78\xeb\x9d\x77\xb8\xb8\xb8\x60\x3a\x5f\xf0\xe8\xe9\xd3\
-\xd6\x35\x7a\xde\x7b\xf4\x28\xcd\x77\x77\x2e\xd1\xed\xc0\xf1\xf1\
-\x31\x1f\xbf\x7f\x9f\xd8\x32\xd0\x46\x77\x0b\x2d\x18\x0e\x07\x98\
-\x4c\x33\x18\xf4\x89\x5e\x70\xf6\xec\x82\x65\x79\x99\xc8\xd4\x6b\
-\xc3\x17\x74\xa7\x2a\xe9\x5a\xda\xbc\x8f\x3f\x13\x42\xfc\x33\xd7\
-\x67\xd6\xc6\x10\x89\x22\x80\xf0\xb4\x24\xeb\x6a\xec\xc4\x7a\x54\
-\x11\x69\x58\x98\x54\xe8\x3c\x8d\xb2\xf0\xc1\xb5\x2a\xf8\xd6\x10\
-\x1b\x45\xa6\x6e\x32\x0f\x21\x50\x5a\x70\x3a\x30\x1c\xf6\x98\x4e\
-\x66\x94\xf5\xb2\x1d\xbb\xaa\xc8\xf3\x62\x25\xba\x4e\x5d\xb0\xf0\
-\xe4\xc9\x53\xac\x4b\x72\x9a\xf9\x7c\x4e\x8c\x91\xe1\x70\xd8\x8e\
-\x7d\xca\x50\x4a\x71\x74\x78\x40\xaf\x97\xe6\x21\x2e\xa6\xd3\xf6\
-\x3e\x52\x89\xbb\xba\xb8\x38\xc5\xda\x9a\x3b\xb7\x4e\x78\x49\xdf\
-\x62\xb1\xa8\x98\x8e\x2d\xd3\xf1\x25\xa3\xfd\x03\x7a\x83\x1d\x16\
-\xb5\x05\x65\xd8\xd9\x3f\x04\xa9\xc9\x7a\x03\xa4\xf7\xd4\x2e\x24\
-\xa1\x87\x29\x10\x2a\x4d\x21\xed\x62\x47\xa2\xe1\x32\xb4\x6a\x5b\
-\x28\x48\x02\x8c\xe1\x70\x48\x96\x67\xb8\xc6\xa3\x94\xee\x6e\x46\
-\x16\x95\x52\x42\xa5\x01\x6a\x7d\xa5\x54\x42\x59\x09\xae\xd9\x36\
-\xa8\x87\x81\xb5\x6d\x07\xaa\x54\x6d\x36\xdd\x91\x20\x9e\x28\x9a\
-\xd6\x42\x9b\x8d\x99\x7e\xeb\xd6\x12\x2b\x14\x85\xdc\xd0\x5a\xb1\
-\x16\x3e\x6c\xcc\x7a\x57\xd2\x20\x14\x64\x02\xf2\xbc\x21\x2f\x34\
-\x0c\x04\xde\x37\x20\x02\x46\x67\x10\x23\x4f\x9e\x3c\x5a\x75\x03\
-\xf7\x7a\x39\xb3\xd9\x94\x65\xb9\xa0\x28\x52\xe3\x50\xaf\xd7\xa3\
-\xdf\x4f\x8b\xdf\x69\x69\x93\x3b\x90\x38\x6b\x99\x4f\xc7\x04\x1f\
-\x91\x22\x43\x0a\xc9\xe1\xee\x90\xc3\xbd\x4f\xf1\x93\xaf\xbf\xcc\
-\x70\x50\xb0\x98\x97\xbc\xf3\xce\x53\x16\x33\x4f\xf0\x91\xbc\x37\
-\x48\xd5\xc1\xe1\x2e\x83\x91\x58\x93\x41\x21\xb4\x9d\x57\x19\xd6\
-\x45\x82\x48\x3d\x82\xcb\xe5\x92\xf3\xf3\xf3\xc4\x55\x28\x41\x91\
-\x67\x8c\x46\x23\x88\xb1\x8d\x3f\x96\xb2\x5c\xe2\x6c\x72\xa9\x4d\
-\x63\xd1\xbd\x28\x94\xd2\x51\x48\x71\xa9\xb5\x79\xcb\x39\xbf\x8e\
-\x21\x5d\x81\x2a\x79\x93\x56\xaa\x22\xda\x82\x54\x4c\xa3\x92\x10\
-\x01\x44\xbd\x1a\x8f\xd7\x4d\x32\x48\xfc\x8f\x4f\x73\x40\x36\x66\
-\x57\x39\xef\x37\x6e\xe2\xd8\x4d\xe5\x61\x7d\x77\x84\xb6\xbd\x60\
-\x35\xb8\x40\x38\x4c\xa6\x30\x59\x64\x32\xbe\x62\x3e\x9b\xd1\xeb\
-\xf7\x59\x2c\xe7\x7c\xed\x6b\xef\x53\x14\x05\xfd\xfe\x88\x9d\x9d\
-\x11\xbd\xc1\x09\x45\xaf\x48\x41\x57\x80\x56\x49\xbb\x1b\xbc\x67\
-\xb1\x58\x30\x9d\x4e\x11\x52\x62\xad\x83\xe0\x38\xda\xc9\xd9\xdd\
-\xd9\x67\x67\xe7\x90\x9d\xd1\x1e\x87\x87\xbb\x0c\x06\x19\x52\x5b\
-\x76\x47\x05\xd3\xe9\x92\x6f\x7f\xfb\x3d\xbe\xf5\x8d\x37\x79\xf7\
-\xd9\x84\xab\xe9\x02\x25\x04\xbb\x3b\x23\xb2\x5e\x42\x72\xa2\x1b\
-\xbe\xd6\xba\xf8\xb8\x58\xb2\x28\x1b\x4c\x2b\x02\xaf\xeb\x06\x04\
-\x5c\x4c\x27\x18\xad\xf8\xcc\x67\x3e\xc3\x7c\x36\xe3\xf1\xa3\xc7\
-\x2c\x16\x33\x62\x0c\xe4\xa6\x47\x6e\x06\x54\x55\xc5\xee\xc8\x20\
-\xa5\x98\x3f\x78\xf8\xf0\xcf\xdf\xbb\x73\xff\x0f\x2e\x2e\x9f\x26\
-\xb1\xb5\x40\x52\xd7\x55\xbb\x70\x0a\x1f\x6c\x3b\x6a\x43\xae\x2a\
-\x75\xb4\x7d\x85\xc1\x83\xcc\x74\x2b\xc2\xf6\xa9\xc8\x23\x75\xea\
-\x4a\x0d\x61\xd5\xe0\x1f\x42\x40\xc9\x8a\x40\x93\xfa\x30\x84\x69\
-\x07\xd1\x28\x84\x2e\xf0\x75\xa0\x76\x81\x10\x25\xb3\xe9\x84\x45\
-\xe9\xa8\x7d\x41\x53\x15\x28\x61\x70\xc1\x32\x5d\x5c\xd1\x1f\xe5\
-\x9c\xdc\x3c\x66\xaf\xde\x01\x29\x30\x59\x46\xaf\xe8\x27\x36\xc0\
-\x93\x04\x04\xcb\x25\x42\xc0\x70\x30\x20\x2f\x72\x16\xd3\x31\xdf\
-\xf8\xda\xd7\x38\x3c\x3c\xe2\x17\x7e\xe1\xe7\xf8\xf4\x6b\xaf\x90\
-\xf9\x0a\x2d\x04\x42\x69\xa4\x52\x98\x0c\xb4\xf1\x28\x93\xee\x55\
-\xd8\x1f\x8c\x78\xed\x53\xaf\xf0\xea\xab\x77\x79\xe7\xbd\x67\xfc\
-\xe1\xd7\xdf\xe1\xc1\xc3\x87\x94\xcb\xe4\x26\xa3\x88\x49\x79\xd9\
-\x56\x08\x95\x30\x88\xe8\x88\xbe\x22\x46\x97\xa8\xf5\x7e\xc1\xed\
-\xdb\xb7\x38\x3b\x3d\xe5\xec\xec\xac\x15\x8d\x54\x48\x25\xf9\xe4\
-\xa7\x3e\xc5\xc5\xc5\x05\xe3\xcb\x2b\xea\xea\x0a\x11\x2d\xc3\xfe\
-\x01\x3b\x83\x83\x78\x79\x51\x3e\xfe\x93\xaf\xfe\x09\x42\xa4\x01\
-\x88\x2f\x28\x3c\x75\xf3\xd1\xbb\xdb\xf8\xc8\x8d\x71\x42\x72\x05\
-\x11\x63\x4c\xc6\x14\x2d\x8d\x1b\x43\x1a\x90\x9f\x86\xbf\xb4\x6e\
-\x4a\x46\x52\xa8\xd2\x58\x1b\x29\x2b\x87\x47\x50\xd5\xd0\xd8\x34\
-\x50\xe6\xd1\xa9\xa5\x2a\x23\x87\x87\xfb\xe4\xd9\x01\x37\x46\x3b\
-\x38\x67\x99\xce\xc7\x9c\x88\x63\x76\xf7\x52\x6e\xd2\x58\x9b\xc8\
-\x3b\xa3\xb0\x95\xa7\xa9\x1a\xac\x75\xcc\x26\xb3\x34\x1c\xad\x69\
-\x38\x3e\x3e\xa2\xae\x4a\xbe\xf6\xf5\x6f\xf2\xca\xfd\x97\xf8\xe2\
-\x17\x3e\x4b\xbf\xc8\x39\x1e\xec\x60\xda\x98\x56\xd6\x25\x2e\xb4\
-\xf7\x41\x0c\x19\xd3\xe9\x12\x1f\x52\xdb\x75\xaf\xd7\x67\x6f\x6f\
-\xc8\xa8\x97\xa1\x42\xc3\x7c\x3c\xc7\x7b\x4b\xd1\x1f\x51\x55\x15\
-\xd6\x39\x8a\xcc\x10\x83\xc1\xd5\x25\x46\x26\x91\x9d\x14\x82\xe0\
-\x1d\xaa\x85\xb4\x49\x28\x97\x3c\x45\x96\xe7\x1c\x1d\x1d\x13\xa3\
-\xa0\x5a\x2e\x58\x8c\x4f\x21\x36\xe4\x3a\xa3\xc8\xfb\x62\x38\xd8\
-\x19\x94\x65\xc3\xfe\xde\x61\xa2\xdf\x43\x0c\xf4\x7a\xbd\x2e\x31\
-\xa4\x6e\x02\xf3\x65\x83\xf3\x15\x52\x42\x66\x7a\x2d\x56\xd6\x09\
-\x75\xad\x6e\xc7\xa0\xb6\xd0\x52\x5d\xd7\xab\x7e\x71\xad\x33\x96\
-\xcb\x9d\x14\xd8\x94\x21\xa0\xa8\xea\x92\xf3\xf3\x09\xe3\xd9\x14\
-\x1f\x24\x4a\x15\x48\x5d\x30\x9f\x07\x7a\xbd\x3e\xc7\x37\x0e\x39\
-\xb9\x79\x83\x9b\x37\x8e\x18\x5f\x5d\x32\x9f\xcf\x69\x9a\x94\x47\
-\xcc\xa6\x33\x6a\xdb\xa4\x3e\x8e\xab\x40\x5d\x5a\x62\x10\xf4\x7a\
-\x05\x3a\x33\xf8\xda\x73\x35\x9d\xb0\xb3\xbf\x87\xce\x0a\x6e\xdf\
-\xb9\xc5\xc5\xd5\x98\xff\xee\x7f\xf8\x6d\xfe\xb5\x9f\xfb\x3a\xff\
-\xee\x5f\xfa\x12\x77\xee\xde\x42\x69\x83\x0d\x15\x48\x8d\x32\x06\
-\xa1\x0c\xcb\xf9\x84\xab\xab\x09\x57\xe3\x29\xa7\xcf\x2e\xb8\x1a\
-\xcf\x19\xcf\x4a\x8c\x56\x94\x57\x0b\xa6\xf3\x05\x77\xef\xe5\x34\
-\x55\x45\xdd\xd4\xe4\x6a\xc8\x72\x5e\xb1\x58\xcc\x28\x8c\xe1\x60\
-\x7f\x88\x54\x92\xf3\xf3\x73\xce\xcf\xcf\x5b\x64\x38\xc0\xfb\x24\
-\x19\xad\xeb\x9a\x8b\x8b\x0b\xac\xb3\x18\x63\xd2\x3d\x45\x1a\xdb\
-\xd6\x5a\x7c\xdb\x03\x93\x06\x86\x26\xea\x64\x63\xaa\x68\x6c\x59\
-\x59\xa5\x14\x08\x93\x82\xba\x48\x79\x4a\x1a\xa9\x2a\x57\x7a\xd4\
-\xcd\xa1\x65\xed\xac\xa7\xd5\x5d\x14\x9a\xc6\x82\x3c\x64\xb1\xa8\
-\x39\x3f\x3f\xa5\xaa\x1d\x11\x4d\x08\x03\x1a\x27\x59\x2e\x6b\xac\
-\xad\x90\xda\x93\x17\x07\x0c\x47\x03\xca\xb2\xc4\x18\xc3\xf1\xd1\
-\x01\x67\xa7\x67\x34\x75\x3a\x01\x4d\x63\x19\x4f\x26\x20\x40\x69\
-\xcd\x78\x3c\xc1\x35\x81\xbd\xdd\x3d\x4e\x6e\x9c\xb0\xb7\xbf\xc3\
-\x7c\x31\xe7\xed\xb7\xdf\x26\xc4\x88\x94\x8a\xfd\xbd\x7d\x62\x88\
-\x2c\x26\x0b\xbe\xfe\xed\x37\xf9\xdb\x7f\xf7\xef\xf1\xf9\xcf\x7f\
-\x9e\x7b\x2f\x7d\x0c\xa9\x05\xe7\x17\x67\x5c\x5c\x9c\x51\xd6\x0d\
-\x8b\x45\x0a\xb6\xc8\xd4\x8f\xd8\xef\x0f\xd8\xdb\x3d\xe0\xf6\xad\
-\xdb\xf4\xde\x7a\x8b\xa7\xe7\x57\xbc\xf4\xb1\xdb\x5c\x5c\x5e\xe1\
-\x9d\xe5\xa5\x7b\x77\x39\x3b\x3d\x65\x31\xbd\xa2\x2c\x17\x34\x4d\
-\xc6\xfe\xfe\x3e\x2f\xbf\x7c\x3f\xe5\x3c\x6d\xe2\x2b\x65\x42\x5a\
-\x65\x59\xf2\xde\x7b\xef\x51\xd7\x0d\xde\x96\xa9\x2f\x26\xd3\x68\
-\xa3\x36\x4e\x53\x58\x8f\x67\x4a\x32\xc7\xa4\x15\xaa\x6d\x15\x9c\
-\x4f\x3d\x1d\xdd\x4c\xc2\x6e\xfa\x68\xea\xaa\xdd\x18\x78\xb9\x31\
-\xc3\xb0\xeb\xe5\xf0\xde\x53\x55\x35\xd3\xe9\x8c\xca\x65\x4c\xe7\
-\x91\x8b\xf3\x48\x55\xa5\xfb\x34\x21\x3c\xf3\x65\x83\x0f\x02\x44\
-\x86\x0c\x8a\x7e\x3e\x44\x48\xc3\x74\x3a\x43\x6b\xc3\xc1\xfe\x41\
-\x7b\x27\x06\xbf\xca\xda\x9b\xc6\x72\x74\x74\xc8\xce\xee\x2e\xd1\
-\xc3\x64\x32\x4d\xe2\xe5\xdc\x30\x18\x0e\x57\xea\x18\x67\x53\x46\
-\x6d\x4c\xaa\xa3\x9c\x1c\xa4\x1b\x64\xfe\xf6\xdf\xfe\x47\x8c\x67\
-\x25\x3f\xf9\x53\x3f\xc9\xd1\x8d\x43\xc6\x93\x31\x67\xe7\xe7\x2c\
-\xab\x8a\x5e\xd1\x43\xeb\x2c\x0d\x90\x51\xeb\x21\x01\xbd\x3c\xa3\
-\xc8\x0c\xbd\x22\xe3\x60\x7f\x8f\x72\xb9\xa0\x2a\x3d\x3b\xa3\x21\
-\xe5\x7c\x46\xa6\x25\xc1\xd6\x28\xad\x38\x3c\x3c\xe4\xce\x9d\xbb\
-\x94\xe5\x72\xb5\x1e\xde\x7b\x86\xc3\x61\x22\x6d\xad\x65\x30\x08\
-\x34\x55\xce\x62\xd2\xb4\x1d\x64\xdd\xfd\x45\xf4\x6a\xb0\x9b\x8e\
-\x6d\x3b\xd9\xc5\xe5\x19\xb3\xd9\x15\x47\x87\xb7\x95\x75\x15\x65\
-\x5d\x91\xe7\x11\x99\xa9\x36\x1f\x11\x9b\x62\x2e\x36\xd1\x59\x67\
-\x98\xce\x85\xd5\x75\xc5\xe9\xe9\x19\xef\x3d\x9d\xe3\xd8\x65\x67\
-\x38\xc0\x14\x39\xb3\xf9\x9c\xcb\xf1\x05\xf3\xc5\x92\x83\xfd\x7d\
-\x76\xf7\x46\x20\x15\x52\x2b\xac\x73\x54\x8b\x05\x5a\x67\xec\xec\
-\xec\x26\x39\xbf\xef\xa6\x9b\xa6\x36\x82\xe3\x1b\x37\x39\xb9\x79\
-\x13\x21\x14\xce\x3f\xa0\xaa\x4a\xa6\xd3\x2b\x8c\x49\xda\xdb\xaa\
-\xaa\xdb\x99\x2c\xed\x4c\x2b\xa9\xc9\x8c\x22\xcf\x0a\x3e\x71\x5f\
-\xf3\x47\x5f\x7b\x83\x07\x4f\x9e\xf1\xd3\x3f\xfd\x59\x6e\xdc\xbc\
-\xc1\xd1\xcd\xdb\x68\x25\xd9\xdf\x3f\x20\x78\xb8\xb8\xb8\x62\x36\
-\x5f\xb2\x2c\x4b\xca\xf9\x14\x21\x35\xb3\xc9\x04\x11\x03\x99\x94\
-\xf8\xa6\x66\x3a\x19\x53\x2e\x97\x84\xe8\x31\x4a\x62\x94\x62\xd0\
-\xef\xd3\xef\xf7\x29\x8a\x9c\xaa\x2a\xb1\xd6\xae\x46\x66\xec\xed\
-\xed\xb1\xb3\x93\x6e\x5a\xac\xb5\xe6\xea\xf2\x9c\x37\xbe\xf1\x6c\
-\x45\x38\x1a\x63\xb6\x4f\x48\xba\x93\x8e\xe2\xf3\x9f\xfb\xf9\xde\
-\x62\x51\x7e\xee\xad\xb7\xbf\x77\xb7\xae\x2a\xaa\xba\x24\xcb\xf3\
-\x36\xc9\x32\x54\xa5\xc3\xdb\x08\xb9\x68\xc7\x6c\xab\xad\x3b\x9a\
-\x6d\xde\xd8\x5d\xc9\xf4\xe6\x51\x08\xc6\xd3\x39\x93\xd9\x98\xe0\
-\x3d\x79\xaf\xc7\xde\xe1\x3e\xfd\xd1\x00\x6b\x2d\x67\x17\xa7\xf8\
-\xe0\x79\xed\xb5\x4f\xd2\x2b\x7a\x4c\x2e\x6b\xb4\xd1\x64\x59\xd6\
-\x52\x26\x13\x9c\xf3\x69\x7c\x9f\x94\x78\xe7\x5a\x4c\x1f\xa9\x9b\
-\x9a\xf3\xcb\x73\x7c\x08\x5c\x5d\x8d\x53\xe1\x4b\x69\x76\xf6\x76\
-\x11\x52\x60\xf2\x1c\xb1\x48\xd4\x87\x92\x82\x2c\x1f\xb0\x9f\x0f\
-\x38\x3e\x39\xe1\xe0\xe8\x26\x51\x48\x2e\x2f\xc7\x54\xe5\x92\xf9\
-\xac\x22\x2f\x7a\x08\x24\x77\x6e\xdf\xe5\x60\x67\x80\x21\xf0\xfd\
-\x1f\xbc\xb3\xea\x75\xb4\xed\xbd\xa5\xf2\x2c\xa7\x69\x9a\x76\x4a\
-\x5d\xca\xb0\xaa\xaa\xe2\xfd\x87\x49\x89\x32\x9f\xcf\x5a\xb6\x78\
-\x8f\x93\x93\x13\x16\x8b\x05\x93\xc9\xa4\xbd\x6f\xbb\x66\x39\x9f\
-\x22\x44\x2a\x0b\x64\xad\x10\x2f\x49\xab\xd2\x04\x66\x2d\x44\xba\
-\x77\xe1\xd5\xd5\xf4\xd8\x39\xfb\xeb\x52\xc8\x9f\x28\xcb\x92\xcb\
-\xf1\x25\x30\x20\xcf\x33\xfa\xfd\x61\x1a\xa6\x1f\xe4\xaa\x8f\x64\
-\x7d\xef\x90\xed\x1b\xee\x0a\x21\xc8\xf3\x9c\x9d\x9d\x11\xf2\x69\
-\x8d\xc3\x93\x6b\x81\x8b\x91\xba\x29\xf1\xd1\x22\x04\x64\x85\xa2\
-\xe8\x15\x6d\xb1\xca\xe1\x5d\xaa\x5f\xe7\x26\x11\x8e\x42\x28\xc6\
-\x93\x59\xe2\xd8\xda\x7c\xe2\xd9\xe9\x29\x55\x5d\x73\x7e\xfe\xff\
-\xb5\x75\x2e\x3f\x96\x24\x57\x19\xff\x45\x66\xe4\xf3\x66\xde\x47\
-\xdd\xaa\xee\xea\xae\xee\x1e\x79\xf0\x63\xcc\x30\xc0\x0a\x1b\x81\
-\xc4\x06\xc4\x82\x05\x42\x82\x35\x5b\x16\xb0\x61\xcd\x1f\x80\x84\
-\x04\x3b\x83\x58\x20\xb1\x40\x2c\x59\x80\x17\x20\x19\x59\x62\x01\
-\x12\xf2\xc8\x46\xb6\x6c\xec\x1e\xba\xdd\xd3\x8f\x7a\xdc\x67\xde\
-\x7c\x44\x66\x64\x44\xb2\x88\xbc\x77\xba\xad\x29\xa9\xf6\x55\xf7\
-\x66\x64\x9c\x73\xbe\xf3\xfd\xbe\x0d\xbe\xef\x73\x71\xbe\xc4\x97\
-\x01\x08\xf7\x90\x24\xe9\x84\x2c\xcb\xe8\xda\x0e\x21\xbc\x51\x4d\
-\x04\x84\x87\x19\x46\xde\x97\xe7\x33\xe0\xb1\x5c\x5e\x10\x86\x97\
-\xd4\xd5\x81\xba\x6a\xa8\xcb\x0a\xdf\x0f\xc8\x73\x77\x07\x89\x91\
-\x99\x32\x08\x41\xa7\x7b\xee\x56\x6b\xf6\x87\x92\xb2\xaa\xb8\xbd\
-\xbd\x75\xcb\x72\xbd\x41\x46\x11\xd6\x5a\xca\xaa\x62\xbf\x2f\x4e\
-\xd0\x00\x77\x62\x15\xbb\xdd\xce\x91\x1b\x92\x04\x3b\x0c\x74\x4d\
-\x35\xa6\xef\x04\xc4\x91\xb3\xf2\x7d\x06\x16\x1d\xe1\x33\x63\xba\
-\xd8\xdc\x18\xfb\xfb\x42\x78\x71\xd3\x34\x5c\x5f\x5f\xd3\xa8\x18\
-\x19\x48\x26\x93\x9c\x28\x8e\x1d\x0f\x64\x2c\x73\xcd\x89\x6f\x3e\
-\xbc\x05\xe5\x77\x5f\x4e\x10\x3a\xd7\xad\xe7\xb7\xf8\xbe\x60\x3a\
-\x9b\xa0\x75\x4f\x5d\x57\x28\x55\x12\xc8\x80\x2c\x9b\x91\x65\xce\
-\x1e\xd7\xaa\x06\x65\x2c\x71\x94\x10\x04\x11\x52\x86\x24\x49\xcc\
-\xa1\x6c\x9c\xd1\x65\x24\x6b\xdf\xde\xac\x58\xaf\xb7\x18\x63\xb8\
-\xb8\x77\x46\x9e\xbb\x4a\xc6\x3b\xf2\x0f\x3d\xe9\xbe\x08\x3b\x8c\
-\x06\xd0\x23\x39\x34\xa0\xed\x7a\xba\x5e\x39\x68\x40\x59\xf1\xc1\
-\xe2\xcb\x5c\x9c\x9f\x51\x55\x05\xaf\x3f\x7d\xc5\x56\xef\xc0\x5a\
-\x8a\xcd\x1a\xa3\x6a\x7c\xcf\x43\xe9\x1e\x19\x46\xf4\xb6\xe6\xe5\
-\x9b\x6b\x0e\x65\x45\xdb\x34\xf4\xe6\x86\x30\x08\x30\x16\xfc\x20\
-\x24\x08\xdc\xdf\x3b\x9d\xe6\xa7\xae\xbd\xeb\x3a\xea\xba\xa6\x2c\
-\x4b\x94\x52\xe4\x79\x4e\x55\xd5\x54\x55\x89\xed\x34\x49\x1c\x8c\
-\x27\x24\xf4\x02\x29\xc5\x5b\x44\x39\x46\xc0\xbc\xec\x05\x66\x2d\
-\x84\xb8\xea\x8d\x61\xbd\x5e\x73\x73\x5b\xd1\x34\x0d\xc6\x58\x1e\
-\x3f\xfa\x02\x51\x14\x62\xcd\xf0\x56\x26\x95\xfd\x19\x71\xab\x3f\
-\xd1\xa5\x8f\xeb\xa7\x7d\x5f\xb3\xdf\x6b\xb2\x2c\xe7\xd1\xa3\x2b\
-\xd2\x24\x41\x6b\xcd\x7e\xb7\xe7\xf6\x7a\x3d\xca\xbb\x82\x38\x8e\
-\xc8\x92\xf4\xe4\xed\xce\x26\x13\x6e\xb6\x07\x5a\xa5\x38\xb2\x40\
-\x8c\x1d\x08\x42\xb7\x20\x1d\x44\x2e\x9a\x48\x35\x1d\x9d\xd6\x0e\
-\xe4\x6f\xa1\xd3\x86\xe2\x50\x22\xc3\xd0\xf9\x50\xac\x83\x07\xa4\
-\x69\x88\x39\x38\x20\xcd\x30\x0c\xd4\x65\xc9\xeb\xb6\xe6\xc5\xf3\
-\x67\xf4\x5a\x73\x36\x5f\x72\x36\x3f\xe3\xd5\xab\x97\xec\x75\x47\
-\x3e\x9d\x33\x9d\x9d\xb1\x58\x2a\x76\x8d\x66\x18\x7c\x26\xd9\x8c\
-\xe9\x6c\x41\x1c\x06\x8e\x3d\x29\x04\xaf\x5e\xbe\x64\x32\x99\x30\
-\x9d\x4e\xc9\xf3\x9c\x30\x8a\x4e\x8c\x4a\x21\x04\x69\x9a\x12\x86\
-\x21\x97\x97\x97\xac\x56\x2b\xaa\xd1\x1c\x1b\x06\xf3\xc1\x97\x9e\
-\xf0\xa5\x98\x78\x52\x78\xbe\x71\x73\x43\x29\x84\xab\x00\xac\xb1\
-\xd2\x0e\x76\xe1\xf9\x1e\x59\x36\x61\xb9\x5c\xf2\xea\xcd\x8e\x67\
-\xcf\x9f\xa2\x9a\x96\xb2\xec\x58\x2e\xce\xc9\x26\x53\x16\x67\x8b\
-\xf1\xa8\x05\xa7\xf7\xa9\x31\xfd\x98\x25\x3b\xa6\x21\x84\x11\xf3\
-\xc5\x05\x8b\xa6\xa4\xa9\xf6\xce\x6a\x5c\xd5\x98\xde\x35\x74\x87\
-\x5d\x89\x6e\x0d\xd3\xd9\x0c\xd5\x28\xac\x84\x49\x9a\xb2\xdf\xef\
-\xe9\xb4\x66\x92\x4e\xb0\xeb\x1d\x87\x43\x45\x5d\x2b\xd2\x34\xc3\
-\x97\xfe\x09\x05\xde\xe9\x8e\x4e\x37\xd4\x65\x83\xd6\xc6\x19\x61\
-\xec\x70\xf2\x68\xe6\x79\x8e\x94\x01\x6d\xa7\x61\x70\x1d\x7d\x20\
-\x25\x51\x14\x33\xd8\x81\xed\x76\x4b\x28\x5d\x15\x79\xb6\x98\x93\
-\xa5\x09\xb6\xd7\x84\xbe\xc7\xa6\xa8\xd8\x94\x2d\x67\x67\x67\x0c\
-\xc2\xc3\xf3\x03\x64\x14\xe1\x8d\xf7\xa6\x61\x20\x0e\x22\x64\x14\
-\xa3\xad\x83\x68\x36\x4d\xc3\xdd\xdd\x1d\x51\x14\xa1\x94\x3a\x7d\
-\x0e\x47\x59\xb7\x6d\x5b\x9a\x46\xd1\x28\x45\xdf\xf7\x24\x71\x22\
-\xaa\xaa\xfe\x1f\x5f\xfa\x7f\x33\x49\x93\x17\xc7\xe1\xae\x04\xcf\
-\x19\x2f\xbd\xa1\x1d\x06\xfb\xdc\xf7\xbc\x9f\x9f\xe6\x53\x1e\x5c\
-\x5e\xd1\xa8\x8a\xd7\xaf\x5e\xf0\xc3\x1f\xfd\x88\x9b\x9b\x0d\x0f\
-\x1f\x3e\xe2\xd1\xd5\x63\x5a\x7d\xc5\x62\x3e\x3b\xe9\xd8\x42\xd8\
-\x31\xca\x47\x7c\xe6\xae\x0a\x7c\xe6\xb3\x88\x59\x69\x68\xeb\x3d\
-\xa6\xb7\xec\xb6\x07\x7a\xbd\xc7\xf4\x3d\xb6\xd7\xee\x1d\x1a\x84\
-\x58\xdd\x13\x06\x21\x51\x92\x42\x71\xc0\xda\x81\x20\x0a\x11\x58\
-\xf6\xc5\x8e\xc3\xa1\x60\x36\xcd\x19\x04\xd4\x75\x43\xdb\x76\xe8\
-\x5e\xd1\x76\x0d\x4d\xd3\x39\xff\x7b\x14\x8e\x8b\xf2\x06\x21\x06\
-\xd2\x34\x19\x4b\xd8\x61\x14\xb7\xdc\x13\x1b\x06\x0e\x2e\x53\x97\
-\x25\x7d\xe8\x11\x87\x11\x79\x96\x23\x10\x14\x87\x02\x4f\x4a\xf2\
-\x2c\x25\xd4\x96\xbe\x6b\xd1\x5d\xe7\x84\xaa\xc0\x91\xb1\x4d\xaf\
-\xd1\xad\x26\x8d\xe3\x53\x74\x5e\x9a\xb8\x0c\xaa\xa2\xd8\x23\x7d\
-\x49\x38\x82\x12\xdc\xab\xdd\xbd\xaa\xb7\x9b\x0d\x55\x55\x61\xfa\
-\x1e\x81\x65\x92\xc6\x1c\x0e\xd5\xc7\xff\xf5\xdf\xdf\xf9\xeb\xa6\
-\x6a\xf8\xf0\x97\xbf\xca\x3d\x16\x48\x6b\x24\x79\x9e\x92\x24\xe9\
-\xcb\xae\x6b\xff\x74\xb3\x6d\xfe\x2c\x8a\x92\x5f\xcf\x26\x4b\x2e\
-\xce\xde\xc3\xf6\x01\xab\xf5\x2d\xeb\xd5\x8e\xcd\xe6\x8e\xe7\x3f\
-\xfd\x3e\xd3\xd9\x9c\xcb\xcb\x4b\xae\xae\xae\xb8\xba\x7a\xc4\x7c\
-\xbe\x20\x0d\x42\x74\xef\xd1\xaa\xce\xbd\x16\x30\xc4\x81\x22\x1c\
-\xee\xa8\x8a\x5b\x2e\x2e\xbe\x80\xb1\x92\xda\x34\x84\x93\x10\x3b\
-\x28\xac\x6d\xd9\xee\x5f\x91\xa5\x19\x59\x36\x67\xf0\x02\xbc\x30\
-\xc6\x0f\x43\x8c\xe8\x19\xbc\x8e\x43\xbd\xa1\x6c\xd6\x78\xe1\x25\
-\xeb\xd5\x9a\x67\xcf\x5e\xb8\x5e\x44\x0b\x74\xdb\x83\x07\x0f\x9e\
-\xdc\xe3\xfc\xe2\x9c\x61\x18\xf8\xe9\x8b\x17\xec\xf6\xa5\x23\xcb\
-\xd9\x0e\x6b\x3b\x84\x97\xe2\x87\x92\xb2\x2a\xe9\x74\x4d\x9c\x84\
-\x44\x51\x88\x56\x35\xeb\xeb\x5b\xba\xb6\x23\x9e\x4c\x30\x03\x54\
-\x7d\xcf\x2f\x7d\xe9\x7d\x9e\xdc\xbf\xc7\x7f\x7e\xe7\xbb\x5c\x77\
-\x0a\x1f\x41\xaf\x2d\x9e\xf4\x18\x06\x1f\x5f\x78\x88\x5e\x43\xdb\
-\x10\xa3\x79\x70\xff\x82\xcb\xcb\x07\xa7\xbb\x35\x8e\x9d\x6c\xdd\
-\xf7\x06\xe9\x79\xc4\x61\x48\xaf\x3b\x26\x69\x42\x3f\x9b\x72\xbb\
-\xfb\x29\x91\x0f\xf7\x97\xf3\xc7\x5f\xff\xfa\xd7\xbe\x96\x24\xc9\
-\xf7\xb6\xdb\xad\xb2\xc6\x73\xbb\xbd\xd3\x69\xca\x37\xff\xf5\x5f\
-\xaa\xdf\xfd\x9d\x3f\xf8\x76\x55\x17\x7f\x92\x65\x19\xb3\xd9\x9c\
-\xb6\x55\x43\x6f\x3a\x61\x4c\xcf\x60\x07\x8a\xc3\x1d\x37\xb7\xb7\
-\xee\x0b\x5a\xdf\xb1\xba\xbb\xe3\xf6\xe6\x8e\xb3\xe5\x92\x3c\xcb\
-\x89\xa2\x98\x38\x8a\x49\x92\x98\x24\x8d\x59\xfa\x92\x5d\xd1\x90\
-\xbc\xf0\xe8\x3b\x45\xd7\x3b\xfa\x5b\x18\x05\x64\x93\x19\x61\xe8\
-\x81\xe9\xa9\x8b\x9a\xf5\x7a\x43\x8f\xe3\x1e\x4e\x67\x33\x7c\x29\
-\x09\xa4\xa4\x69\x1a\xaa\xb2\x3a\x05\xbf\xe4\x79\xce\x07\x5f\xfe\
-\x80\xaa\xa8\xb9\x7e\x7d\x4b\xa5\xaa\x91\x12\xe4\x2a\xbc\xbe\xef\
-\xe8\x7b\xed\x36\x59\xe2\x08\xd5\xf5\xe8\xde\xfd\x9a\xbe\xa7\x51\
-\x8a\xa2\x28\x38\x9b\x65\xdc\xbf\xba\xe2\xc9\xa3\xc7\xdc\xde\xdd\
-\xa1\x94\x22\xcd\xa7\xe8\xba\xa6\x69\xd5\xe8\xa3\x57\xb4\xad\xa2\
-\x6d\x5b\x86\x20\x21\xf4\xe5\xd8\x6b\xc9\x93\x5d\x2f\x94\x11\x49\
-\x3c\x21\xcb\x72\x87\x6c\x37\xfd\x69\x77\xc0\x13\x9a\xd9\x74\xce\
-\x64\x92\x21\x7d\xb7\xa2\x8b\x69\xb9\x63\x20\x0c\x24\x30\xec\x93\
-\x24\x79\x0a\xb4\xc7\xfd\x66\x29\x04\xd4\x75\xcb\xaf\xfe\xca\xaf\
-\xb1\x5a\x5f\xb7\x41\x20\xbf\x35\x0c\xf1\x2f\x2c\xcf\x96\xef\x1d\
-\x43\xd8\x84\x10\xe2\xb8\x7a\xb3\xdb\xb9\x7b\x63\xbf\x55\x14\xbb\
-\xe7\x7c\xfa\xe9\x35\x79\x9e\xb3\x98\xcf\x59\x9c\x2d\x38\x3f\x3f\
-\xe7\x6c\xb1\x70\x82\xbe\x97\x21\x84\x65\x92\x86\xf4\xc6\x6d\x01\
-\xa6\x89\x5b\x28\x70\xa5\xa5\x33\xae\xd8\xa1\x45\x55\x2d\x42\x16\
-\xdc\xbf\x7f\x41\x9e\xe5\x78\xf8\xf8\x42\x52\xd7\x2d\x75\xd5\x60\
-\x7b\xf0\x7d\x37\x42\xbf\x7f\xef\x01\x3b\xb9\xa3\xd8\x1d\xa8\x54\
-\xcd\x7e\xbf\x3f\x45\x30\x35\x4a\x8d\x23\x9e\x00\x19\x38\x23\x8c\
-\x75\xfe\x49\xa4\xf4\xd1\xba\x67\x5f\x14\xc0\x03\xa6\xb3\x19\xd3\
-\x2c\x67\xb3\xdd\xa0\x94\x22\x0a\x43\x3c\x60\xb5\xd9\xe0\x5b\x8d\
-\xb6\x96\x20\x0e\xf1\x9a\xfe\x14\x55\x01\xce\x25\xe5\x2c\xd7\x02\
-\xe1\x0a\x5e\xb4\x43\x00\x00\x07\xe6\x49\x44\x41\x54\x05\x4e\x8e\
-\x18\x73\xa9\xc4\xd8\x34\xbb\xfb\xd4\x23\x4a\x12\x52\xdf\x77\x0f\
-\x97\x6a\x91\x32\x18\x8d\x41\x92\x61\x18\x8a\x8f\x3f\xfe\x78\x5d\
-\x55\x15\x1f\x7d\xf4\x91\xb3\x23\x00\x4c\xa7\x73\xde\xfc\xd8\xe9\
-\x0d\x49\x12\xfd\x55\x14\x85\xdf\x0b\x82\xe5\xb7\xa4\x6b\x00\x85\
-\x94\x92\x34\x99\x90\xc4\x29\x69\x92\x52\x55\x4e\xf3\xae\xeb\x9a\
-\xa6\xee\x51\xcd\x9a\xcd\x7a\x43\xf8\x32\x18\x79\x26\x11\x71\x9c\
-\x30\x59\xdc\xc7\xf3\x33\x82\x20\x46\xfa\x02\x19\xa5\xc8\x60\x42\
-\x6f\x3b\x8a\x62\x47\x5d\x95\x44\x41\x44\x12\x4d\x5c\x09\x6b\xad\
-\xbb\x4b\xc2\x68\x64\x8c\x08\xca\xb2\x41\xd5\x0a\xdf\x0b\x08\xfc\
-\x08\x6d\xad\xab\xac\x5a\x7d\xca\x40\xbc\xbb\x5b\xb1\xdd\xae\x1d\
-\x18\xdf\xf7\x48\xd3\xcc\xc1\x02\x8c\x5b\xff\x8c\xa3\x98\x28\x0a\
-\xc7\xd5\x56\x71\x5a\x0b\x6d\xdb\x96\xda\xf3\x4f\xf3\xa7\x63\x77\
-\xbd\x2f\x0f\xf4\x5d\x8d\x8c\x43\xe6\x67\x0b\x9a\x41\x62\x38\x4e\
-\x6f\x2d\x52\x80\xed\x07\x7a\xed\x80\x32\x78\x8e\x8b\xa7\xc7\xc5\
-\xec\xb7\x03\x0a\xa4\x94\xf8\xc2\xc7\x0e\x03\xaa\x73\x97\xba\x10\
-\xde\x91\xed\xe5\x6d\xb7\x5b\x00\xe6\xf3\xf9\x67\x65\x2f\xc0\x62\
-\xb1\x38\x95\xaf\xe7\xcb\xe5\x7f\xac\x37\x9b\xdf\xce\xb3\xe9\x37\
-\x7c\xdf\xff\x39\x6f\xfc\x27\xd3\x34\x23\x49\x72\xca\xb2\xa0\x28\
-\x76\x14\x87\x3d\x4d\x53\xd3\x75\x35\xba\x77\x4f\x72\x5d\x35\x0e\
-\xbc\x2c\x3d\xe4\xcd\x2d\xf9\xf4\x21\x59\x76\xe9\xe4\x53\x3a\x84\
-\x4c\x08\x42\x17\xd0\x15\x27\x13\x3c\x7c\x8c\x71\xcd\xa9\xd2\x8a\
-\xc3\xe1\x40\xdb\xba\x8b\x3a\x8e\x42\xca\xa6\xa5\x51\xdd\xa8\xb4\
-\x59\xd6\xdb\x1d\x3f\xf8\xfe\x0f\x69\x55\x83\xee\x5a\xb2\x49\x46\
-\x9c\x06\x84\xa1\xeb\xe6\x65\xe8\x06\x84\x87\xa2\x42\xeb\x6e\x04\
-\x18\x04\xe8\xbe\xa7\x51\x0d\x51\x90\x92\xc4\x31\xc6\x18\xee\xee\
-\xee\x78\xd3\x75\x20\x84\x53\xf7\x80\x28\x8c\x28\xea\x82\xc3\x7e\
-\xcd\x64\xba\xa0\x69\x6b\x94\xaa\x11\x22\x84\x31\x29\x22\x8e\x22\
-\x02\x21\x48\x52\x07\x20\x88\x42\x67\x57\x3b\x06\xc8\x1c\x37\xe5\
-\x8d\xb1\xa7\x0d\x4d\x63\x35\x4a\xb5\x8e\xdb\x35\x36\xb2\x9f\x4b\
-\x72\x38\x12\x04\x2e\xce\x1f\x02\x03\x77\xab\x57\x62\xb5\x5e\x6b\
-\x6b\xed\xbf\x45\x51\xf4\x97\xc0\x1f\x5f\x2c\x2f\xbf\x3a\x49\xa7\
-\x64\xd9\x9c\x69\xbe\xa4\x38\xec\xd9\xef\xb7\xec\xf7\x5b\x0e\x65\
-\x41\x53\x97\x28\x55\xd1\x76\x0d\x9d\x56\x63\xa4\x9d\xe5\xb0\x5f\
-\xd3\xb5\x03\xad\xf2\x90\xbe\x25\x4c\x42\x82\x20\x76\xda\xb3\x60\
-\x54\x21\x8f\x81\x93\x82\x38\x0a\xf0\x3d\xd7\x93\x3c\xba\x7a\xc8\
-\xdd\xf5\x6b\x9e\x5d\x6f\xa8\x0e\x15\xaa\x69\xf0\xf0\x89\x83\x98\
-\xb2\xa8\x89\x22\x9f\xd9\x7c\x46\x10\x86\x0e\x75\x11\xca\x31\xa7\
-\xc4\xa3\x37\x0e\x8a\x7c\x1c\xf1\x1c\xe3\x90\x8c\x71\x6c\x79\x29\
-\x25\x76\x18\x28\xcb\x92\xed\x7a\xc3\xc5\xfd\x7b\x48\x5f\x8e\xf1\
-\x47\x1d\xf3\xf9\x9c\xf4\xc1\x39\x65\xdd\x62\xb6\x7b\x54\x73\x20\
-\x0c\x52\xc2\x28\x41\x7a\x3e\x83\xe9\x1c\x8f\xab\xd7\x48\xe9\xb9\
-\x89\xad\xef\xd1\x99\x7e\x34\xd0\x1e\xc1\x39\x23\xc6\x5d\x30\xc6\
-\x3f\x99\x71\xcc\x3e\x38\x85\x33\x08\xde\x99\x98\x9f\x58\x27\x9f\
-\x8d\x3e\x04\xe7\xcb\x87\xc3\x6e\xef\x5a\x7d\xa5\xba\x6f\x04\x41\
-\xf4\xc2\xf7\x83\x7f\x8a\xa2\x84\x34\xc9\xcc\x34\x9f\x07\x65\xb9\
-\xf0\xf6\xd3\x39\xbb\xe9\x8c\xc3\xa1\xa0\xaa\x0a\xd7\x85\xb7\x15\
-\xaa\xad\x9d\xff\xce\x18\x9a\x6e\x47\x5d\x2b\xb6\xab\x3b\xce\x2f\
-\xe6\xcc\xa6\x39\x69\x76\xc6\x6a\xb7\xa3\x51\x0d\x02\x41\x1c\xba\
-\x11\x74\x14\x85\x4c\x52\xc9\x7c\x96\x61\x4c\xcf\xa3\x87\x0f\xf8\
-\xe4\xc7\x13\xca\x4f\xb7\x94\x5f\x74\x72\xee\xd9\xe2\x9c\x07\x97\
-\x97\xf4\x7a\x20\x9f\xa6\x04\x81\xe0\x50\x57\x0c\x43\x7f\xa2\x6e\
-\x6b\xa3\x19\x06\x0f\xcf\xf7\x48\xd2\x09\x72\x5f\x39\xfd\x3a\x74\
-\xcb\x08\x8c\x7d\x17\x03\x44\xa1\xd3\xbd\xdd\x40\xb4\xc5\x0b\x42\
-\x0e\x87\x92\x47\x5f\x79\x9f\xf7\xbf\xf0\x1e\x3f\xf9\xe4\xff\xb8\
-\xbe\xbe\xc5\x76\x0a\x2b\x04\x5e\xe8\x43\x6f\xa9\xda\x16\xab\x7b\
-\x0e\xfb\x1d\xd6\x34\x58\xd3\xd1\xeb\x96\x5e\x77\xe3\x74\x5c\x32\
-\x78\x9e\x13\xec\xa4\x1c\x2d\xd2\x76\x44\xb0\xd9\xd3\xa6\xa3\x3b\
-\x45\xe6\x5d\x09\xe3\x67\x1d\xb6\x47\x42\xf4\x71\xa2\xeb\xfb\xf2\
-\xdb\xd0\x7f\x5d\x08\xaa\x24\x99\xfc\x66\x1c\x4d\xfe\x28\x89\x27\
-\x1f\xa6\x6e\x6e\x34\xd4\x75\x2d\xea\xba\xa4\xae\x4b\xaa\xa6\xa4\
-\xae\xca\xb1\x42\x69\xe9\x74\x4c\xdd\x34\xd4\x75\x42\x18\x04\x1c\
-\xf6\x05\x65\xa5\xc1\xf7\xb8\xbc\x7f\xc1\x7c\x3e\x27\x08\x12\x8c\
-\xb6\x58\xd3\x23\xfd\xd1\xbe\x80\x41\x06\x9e\x33\x6a\x2e\x24\xbd\
-\xd1\xd4\x75\xc9\x7c\x76\x46\x1c\x27\x08\xd1\xd3\xb6\x8a\xae\x1b\
-\x4e\x1a\x89\x77\xcc\xf5\x18\x57\x83\x54\xa3\xd0\x5a\x9f\x0c\xa5\
-\x6e\xb7\x4c\xa0\xda\x8e\xeb\xeb\x1b\xae\x2e\xcf\xb9\xf7\xf8\x8a\
-\xd9\x17\x73\x7e\xfc\xf4\x29\x75\x53\x73\x3e\x9d\xe2\xfb\xae\x74\
-\xaf\xaa\x1a\xdd\x76\x8e\x82\x2a\xa0\xde\x6f\xb0\xaa\x44\xfa\x4e\
-\x70\xf2\x3d\x41\xe0\x1b\x82\xc4\xe3\xe9\xff\xfe\x90\x34\x4d\x4e\
-\x13\xef\xe3\xe7\xe7\x79\x1e\x93\x74\x42\x18\x85\xe3\x9a\xd2\x9e\
-\x72\xb7\x1e\x3f\x63\xef\x1d\x5e\xef\x29\xd0\xe5\xf3\x80\xc8\xb3\
-\xe9\x3d\x60\xa0\xae\x95\xe8\x7b\x5d\x0e\xc3\xf0\x1d\xf0\x58\xcc\
-\x96\xfb\xba\xae\x6a\xe0\x3d\xcf\x17\xbf\x97\xa6\xc9\x47\x6d\xab\
-\xc6\x77\x63\x43\xa3\x1a\xaa\xb2\xa4\xae\x9a\xa1\xd3\xad\xd0\xfa\
-\x16\xa5\x14\x75\x13\xd3\xf5\x19\x75\x2b\x31\x42\x70\x7e\xef\x9c\
-\x7c\x9e\x13\x45\xd1\x28\x6c\x85\x0c\xc6\xa3\xd7\x15\xfb\xc3\x96\
-\xba\x2e\xd9\xee\x56\x20\x2c\x4f\xee\xe7\xe8\xbe\x1b\x97\x04\x0c\
-\x41\x28\x4f\x73\x34\x21\x06\x64\x18\x60\x87\xfe\xe4\x02\x8b\xa2\
-\x08\xdf\xb7\x54\x95\x7a\xe7\x9f\xb5\xd6\x55\x5a\xd6\xda\x71\x6d\
-\xc8\x92\xa6\x29\xcb\xe5\x39\xf2\xd9\x33\x2a\xa5\xc6\x10\x49\x8f\
-\xf5\x7a\x8b\xb0\x50\x16\x25\x52\x08\x92\xc0\x67\xf5\x66\x4d\x1f\
-\xf8\xa4\x69\x8c\xe7\x09\xe2\x30\x24\x4c\x1d\x6c\xa0\xde\xaf\x69\
-\x0a\x37\xe5\x16\x9e\x70\x78\x11\x6b\xf1\x7d\xb7\x8b\x75\x1c\xa7\
-\xec\x76\x7b\x3a\x55\x0d\x17\xe7\xe7\x22\xcb\x32\xe2\x38\x4e\xdf\
-\x1e\xca\xbe\xb5\xdb\xfb\x79\xec\x26\x8f\xe5\xd9\xe5\xe9\xc6\xd9\
-\x6e\xd7\xa2\xaa\xcb\x37\xc6\x98\xbf\x43\x0c\x4c\x26\xe9\xca\x18\
-\xf3\xe7\x61\x18\x16\x71\xac\xad\xd6\x13\xba\xb6\x63\x96\x2f\x97\
-\x5d\xd7\x47\x5a\x77\xf4\x7d\x46\xdb\x2a\x9a\x26\xa1\xa8\x7c\xb6\
-\x87\x9e\x6e\xf0\xb9\xb8\xb8\x00\x7f\xa0\x6d\x1d\x33\x4b\xca\x64\
-\xa4\x30\x6c\x58\x6f\x56\xac\xd7\x2b\xb6\xbb\x0d\x9e\x2f\xb8\xbc\
-\x98\x53\x97\x15\xc5\x61\x87\x19\xf4\x88\xa2\x70\x41\xf1\x9e\x74\
-\xe9\x6d\xee\xc2\xd7\xa7\x1d\x5e\xf1\x16\xf4\xec\xc8\x5f\x39\x06\
-\xcf\xf8\xc2\x55\x53\xa7\x1d\x5c\xd5\xbc\x33\x20\x8d\xa2\x90\xaa\
-\x52\x74\xf5\x2d\x71\x28\x49\x82\x88\x69\x12\x63\x54\x49\x92\x4e\
-\x79\x78\x6f\xc6\x6c\x9e\x3b\xe9\x58\xba\x79\x16\xbd\x37\x46\x55\
-\x7c\x06\xf8\xb7\xe6\x64\xa2\x75\xe2\x99\xd5\x24\x52\x70\x76\x6f\
-\x29\x1e\x3f\xbe\x64\x32\x99\xd8\x28\x8a\x3e\x7d\x5b\x5b\x72\x9b\
-\x8b\x6f\xdd\xf2\xa7\xf4\xb2\xcf\x39\x36\x9e\xe7\x0f\x47\xcb\xc2\
-\x98\xd2\xf6\xf7\x42\x88\x7f\x16\x42\x58\x57\x49\xf4\xad\xb1\xbd\
-\x77\x71\x71\xf9\x8f\xd6\x8a\xdf\xe8\xb5\x76\x8b\x00\x7d\x47\xdd\
-\xc4\x6c\xf6\x02\x6e\x8b\x61\x7d\xa8\x45\x6f\x1c\x82\xa2\xd5\x2d\
-\xc3\x30\x70\xb7\xba\x66\xbd\x5a\x71\x77\xf3\x29\xd7\x6f\x5e\xb3\
-\xda\x6e\xf1\x7d\x9f\xaf\x7c\xe9\x8b\x9c\x2d\xe7\xfc\xe0\xe9\x77\
-\xf9\x60\xbd\x42\x77\x1d\x42\x0c\x18\xd3\x9f\xf2\x68\xbb\xde\x89\
-\x41\x9e\x17\xa2\xda\x96\x57\xaf\x5e\x51\x96\x35\x87\xa2\xa6\x38\
-\x54\xe8\x91\x54\x94\xa4\x31\xc6\xb8\xd9\x55\x3a\x49\x29\x8a\x03\
-\x4f\x7f\xf2\x13\x5e\x3c\x7f\xce\x00\x4c\xa7\x53\xa4\x94\x9c\x2d\
-\x97\x30\x17\x04\x83\x8f\x87\xa1\x0a\x7d\x54\xb9\x63\x36\x49\xf9\
-\xf0\xab\x5f\x1a\x3e\xfa\xc5\x0f\xc5\x83\x07\x17\xc8\xd1\xfe\x66\
-\x07\x4b\xe8\xe7\x0c\x46\x8c\xde\x75\xfb\x4e\x70\xf3\xb1\xbc\x6e\
-\xdb\xd6\x45\x7d\x47\x92\x28\x0e\xf0\xa5\xff\x87\x4f\x9e\x3c\xf9\
-\x87\x4f\x3e\xf9\xe4\x1d\x3d\x49\xbe\x7d\x5c\x3e\x2f\xf5\xf3\xf8\
-\x93\xe7\x33\x84\x80\xe2\xb0\x01\xe1\x0b\x63\x4c\x61\xad\x2d\x8e\
-\xba\x88\xf3\xb0\x43\x92\xa4\x7f\xd1\xf7\xf6\xdf\x7d\xcf\x57\x9e\
-\xb7\x78\x3c\x0c\x9c\x85\x49\x78\x11\xa6\xfc\xd6\xe0\x21\x9a\x66\
-\x3b\xec\x57\x2f\x85\x6a\x1b\x54\xab\x50\x4a\xb1\xd9\xec\xd8\xac\
-\x6e\x69\x0e\xb7\xcc\xc3\x80\xc7\xef\xdf\x63\x36\x3f\xe3\xfc\xde\
-\x43\x76\xf3\x9c\x40\x0f\xdc\xbc\x7e\x45\x53\x16\xf8\x0c\x4c\x92\
-\x10\x6b\x34\xba\x29\xa9\xaa\x0a\xdd\xbb\x27\xbd\x38\x14\xdc\xdc\
-\x5c\x73\x28\x4b\xc4\x20\x88\x6c\xcf\xfd\x89\x83\x00\x14\x55\x8b\
-\x1d\x18\x91\xb2\x30\x5b\x9c\x93\x2d\x16\xb4\xad\x22\x8a\x22\x82\
-\x28\xc1\x58\x08\xe4\xc8\x82\x1c\x29\x47\x9d\xaa\xf1\xfd\x80\xfb\
-\x0f\xaf\xb8\xbc\x7c\x24\xa6\xd9\xfc\xd9\x7c\x36\xfd\xdb\x20\x90\
-\xad\x36\x3a\xb0\xd6\x10\x07\x53\x06\xe3\xd1\x76\x2d\x83\xb5\xa7\
-\x34\x38\x18\xcb\x79\xa5\x4e\x1a\x7b\x10\x4a\x29\x03\x4f\x23\xf8\
-\xe6\xd3\xa7\x4f\x07\x21\x84\xf0\x3c\x6f\x38\x1e\x82\xff\x07\xab\
-\xe4\x86\x1e\x42\x5d\x48\xc9\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-"
-
-qt_resource_name = b"\
-\x00\x07\
-\x07\x3b\xe0\xb3\
-\x00\x70\
-\x00\x6c\x00\x75\x00\x67\x00\x69\x00\x6e\x00\x73\
-\x00\x0f\
-\x08\x86\xcb\x62\
-\x00\x63\
-\x00\x69\x00\x74\x00\x79\x00\x64\x00\x62\x00\x5f\x00\x65\x00\x78\x00\x70\x00\x6c\x00\x6f\x00\x72\x00\x65\x00\x72\
-\x00\x08\
-\x0a\x61\x5a\xa7\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x14\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
-\x00\x00\x00\x38\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x14\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x38\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x6f\x3c\x2b\x3f\xe8\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
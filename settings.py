@@ -0,0 +1,53 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+
+from qgis.PyQt.QtCore import QSettings
+
+# Group of the plugin options. They can be changed in the QGIS
+# advanced settings editor (Settings > Options > Advanced).
+SETTINGS_GROUP = "CityDbExplorer"
+
+
+def value(key: str, default=None, type=None):
+    """Read a plugin option
+
+    Args:
+        key (str): option name inside the plugin group
+        default: value returned if the option is not set
+        type (type): type the stored value is converted to
+
+    Returns:
+        the option value
+    """
+
+    settings = QSettings()
+    key = "{}/{}".format(SETTINGS_GROUP, key)
+
+    if type is None or not settings.contains(key):
+        return settings.value(key, default)
+
+    return settings.value(key, default, type=type)
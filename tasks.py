@@ -0,0 +1,475 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+
+from psycopg2 import Error
+from qgis.core import QgsTask
+from qgis.PyQt.QtCore import pyqtSignal
+
+from .building_loader import split_extent
+from .db.pool import ConnectionPoolException
+from .db.postgresql import PostgreSQLInterface, PostgreSQLInterfaceException
+
+
+class ConnectTask(QgsTask):
+    """
+    Connect to a database and read its metadata in the background.
+    """
+
+    def __init__(
+        self,
+        connection_parameters: dict,
+        maxconn=4,
+        metadata_cache=None,
+        attribute_cache=None,
+        stats=None,
+    ):
+        """Create the task
+
+        Args:
+            connection_parameters (dict): see PostgreSQLInterface
+            maxconn (int): see PostgreSQLInterface
+            metadata_cache (MetadataCache): see PostgreSQLInterface
+            attribute_cache (AttributeCache): see PostgreSQLInterface
+            stats (QueryStats): see PostgreSQLInterface
+        """
+
+        super(ConnectTask, self).__init__("Connect to 3D CityDB", QgsTask.CanCancel)
+
+        self.connection_parameters = connection_parameters
+        self.maxconn = maxconn
+        self.metadata_cache = metadata_cache
+        self.attribute_cache = attribute_cache
+        self.stats = stats
+
+        # Results, read when the task is finished.
+        self.db_interface = None
+        self.metadata = None
+        self.index_advice = None
+        self.exception = None
+
+    def run(self) -> bool:
+        try:
+            self.db_interface = PostgreSQLInterface(
+                self.connection_parameters,
+                maxconn=self.maxconn,
+                metadata_cache=self.metadata_cache,
+                attribute_cache=self.attribute_cache,
+                stats=self.stats,
+            )
+            self.setProgress(50)
+            self.metadata = self.db_interface.metadata()
+            if self.metadata["version"] != -1:
+                try:
+                    self.index_advice = self.db_interface.index_advice()
+                except PostgreSQLInterfaceException:
+                    # Only a diagnostic, the connection is usable anyway.
+                    pass
+        except (Error, PostgreSQLInterfaceException, ConnectionPoolException) as error:
+            self.exception = error
+            # The pool may be open already, e.g. if reading the metadata failed.
+            if self.db_interface is not None:
+                self.db_interface.close_connection()
+                self.db_interface = None
+            return False
+
+        if self.isCanceled():
+            self.db_interface.close_connection()
+            self.db_interface = None
+            return False
+
+        return True
+
+
+class DatabaseTask(QgsTask):
+    """
+    Cancellable task running its statements on pooled connections.
+    Cancelling the task cancels its running statements on the server.
+    """
+
+    def __init__(self, description: str, db_interface):
+        """Create the task
+
+        Args:
+            description (str): description of the task
+            db_interface (PostgreSQLInterface): the connected database
+        """
+
+        super(DatabaseTask, self).__init__(description, QgsTask.CanCancel)
+
+        self.db_interface = db_interface
+        self.exception = None
+
+        # Connections of the running statements, guarded by the lock so cancel()
+        # never reaches a connection already returned to the pool.
+        self._connections = set()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _connection(self):
+        """
+        Check out a pooled connection that cancel() can abort.
+        """
+
+        with self.db_interface.connection() as connection:
+            with self._lock:
+                self._connections.add(connection)
+            try:
+                yield connection
+            finally:
+                with self._lock:
+                    self._connections.discard(connection)
+
+    def cancel(self):
+        """
+        Cancel the task and abort its running statements.
+        """
+
+        # Flag the task first, so run() sees the aborted statements as cancelled.
+        super(DatabaseTask, self).cancel()
+
+        with self._lock:
+            for connection in self._connections:
+                try:
+                    connection.cancel()
+                except Error:
+                    pass
+
+
+class BuildingLoadTask(DatabaseTask):
+    """
+    Load buildings in the background, either a list of grid tiles or a
+    page of an extent. Every fetched batch is emitted with batchLoaded,
+    so it can be added to the layer in the main thread while the rest
+    is still loading.
+
+    With several workers, tiles are fetched at the same time over several
+    pooled connections, and a page is fetched as one sub-page per part of
+    the extent, merged by id. Cancelling the task cancels the running
+    queries on the server.
+    """
+
+    # Emitted with the tile (None when loading a page) and (id, wkb, attributes)
+    # rows.
+    batchLoaded = pyqtSignal(object, list)
+
+    # Number of buildings emitted at once when a page is merged.
+    BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        loader,
+        extent,
+        tiles=None,
+        limit=None,
+        after_id=0,
+        known_ids=(),
+        workers: int = 1,
+    ):
+        """Create the task
+
+        Args:
+            loader (BuildingLoader): loader of the buildings
+            extent (QgsRectangle): extent of the page
+            tiles (list): tiles to load in this order, None to load a page
+            limit (int): max number of new buildings
+            after_id (int): id the page starts after
+            known_ids (set): ids already loaded, they do not count for limit
+            workers (int): number of connections used at the same time
+        """
+
+        super(BuildingLoadTask, self).__init__(
+            "Load 3D CityDB buildings", loader.db_interface
+        )
+
+        self.loader = loader
+        self.extent = extent
+        self.tiles = tiles
+        self.limit = limit
+        self.after_id = after_id
+        self.known_ids = set(known_ids)
+        self.workers = max(workers, 1)
+
+        self.loaded = 0
+
+    def run(self) -> bool:
+        try:
+            if self.tiles is not None:
+                self._load_tiles()
+            elif self.workers > 1:
+                self._load_parallel_page()
+            else:
+                self._load_page()
+        except (Error, PostgreSQLInterfaceException, ConnectionPoolException) as error:
+            if not self.isCanceled():
+                self.exception = error
+            return False
+
+        return not self.isCanceled()
+
+    def _load_page(self):
+        with self._connection() as connection:
+            batches = self.loader.fetch(
+                self.extent,
+                limit=self.limit,
+                after_id=self.after_id,
+                batch_size=self.BATCH_SIZE,
+                connection=connection,
+            )
+            for batch in batches:
+                if self.isCanceled():
+                    return
+                self.loaded += len(batch)
+                self.batchLoaded.emit(None, batch)
+                if self.limit:
+                    self.setProgress(100 * self.loaded / self.limit)
+
+    def _fetch_part(self, part) -> list:
+        """
+        Fetch the page of a part of the extent on its own connection.
+        """
+
+        if self.isCanceled():
+            return []
+
+        with self._connection() as connection:
+            return [
+                row
+                for batch in self.loader.fetch(
+                    part,
+                    limit=self.limit,
+                    after_id=self.after_id,
+                    batch_size=self.BATCH_SIZE,
+                    connection=connection,
+                )
+                for row in batch
+            ]
+
+    def _load_parallel_page(self):
+        parts = split_extent(self.extent, self.workers)
+
+        # Every part holds the first buildings of its area after after_id,
+        # so the first ones of their union are the page of the extent.
+        # Buildings crossing the border of two parts are merged by id.
+        buildings = {}
+        for done, rows in enumerate(self._map(self._fetch_part, parts)):
+            buildings.update((row[0], row) for row in rows)
+            self.setProgress(100 * (done + 1) / len(parts))
+
+        if self.isCanceled():
+            return
+
+        page = [buildings[building_id] for building_id in sorted(buildings)]
+        if self.limit is not None:
+            page = page[: self.limit]
+
+        for start in range(0, len(page), self.BATCH_SIZE):
+            batch = page[start:start + self.BATCH_SIZE]
+            self.loaded += len(batch)
+            self.batchLoaded.emit(None, batch)
+
+    def _fetch_tile(self, tile) -> tuple:
+        """
+        Fetch a tile from the cache, else on its own connection.
+        """
+
+        if self.isCanceled() or self._limit_reached():
+            return tile, None
+
+        # A cached tile needs no connection, so it does not wait for one.
+        rows = self.loader.cached_tile(tile)
+        if rows is not None:
+            return tile, rows
+
+        with self._connection() as connection:
+            return tile, self.loader.fetch_tile(tile, connection=connection)
+
+    def _load_tiles(self):
+        for done, (tile, rows) in enumerate(self._map(self._fetch_tile, self.tiles)):
+            # Once the limit is reached, the tiles other workers were still
+            # fetching are dropped.
+            if self.isCanceled() or self._limit_reached() or rows is None:
+                return
+
+            new_ids = {row[0] for row in rows} - self.known_ids
+            self.known_ids |= new_ids
+            self.loaded += len(new_ids)
+
+            self.batchLoaded.emit(tile, rows)
+            self.setProgress(100 * (done + 1) / len(self.tiles))
+
+    def _limit_reached(self) -> bool:
+        """
+        Whether limit new buildings have been loaded, so no more tiles are
+        fetched or emitted.
+        """
+
+        return self.limit is not None and self.loaded >= self.limit
+
+    def _map(self, function, items):
+        """
+        Yield function(item) for all the items, running up to workers of
+        them at the same time. Results come in order of completion; when
+        the caller stops iterating, the pending items are dropped.
+        """
+
+        if self.workers == 1:
+            for item in items:
+                yield function(item)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        futures = [executor.submit(function, item) for item in items]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+
+class BulkEditTask(DatabaseTask):
+    """
+    Apply a bulk edit of a generic attribute in the background, in a
+    single transaction. Cancelling the task aborts the running statement
+    and rolls the edit back.
+    """
+
+    def __init__(self, db_interface, targets: dict, operation: str, name: str, **edit):
+        """Create the task
+
+        Args:
+            db_interface (PostgreSQLInterface): the connected database
+            targets (dict): arguments of select_bulk_buildings
+            operation (str), name (str): see bulk_edit_generic_attribute
+            edit: datatype and value, see bulk_edit_generic_attribute
+        """
+
+        super(BulkEditTask, self).__init__(
+            "Edit 3D CityDB generic attributes", db_interface
+        )
+
+        self.targets = targets
+        self.operation = operation
+        self.name = name
+        self.edit = edit
+
+        # Results, read when the task is finished.
+        self.buildings = 0
+        self.counts = None
+
+    def run(self) -> bool:
+        try:
+            with self._connection() as connection:
+                self._edit(connection)
+        except (Error, PostgreSQLInterfaceException, ConnectionPoolException) as error:
+            if not self.isCanceled():
+                self.exception = error
+            return False
+
+        return self.counts is not None
+
+    def _edit(self, connection):
+        with connection.cursor() as cursor:
+            self.setProgress(10)
+            self.buildings = self.db_interface.select_bulk_buildings(
+                cursor, **self.targets
+            )
+            self.setProgress(40)
+            if self.isCanceled():
+                connection.rollback()
+                return
+
+            counts = self.db_interface.bulk_edit_generic_attribute(
+                cursor, self.operation, self.name, **self.edit
+            )
+            self.setProgress(90)
+            if self.isCanceled():
+                connection.rollback()
+                return
+
+        connection.commit()
+        self.counts = counts
+        self.setProgress(100)
+
+
+class CountTask(DatabaseTask):
+    """
+    Estimate and optionally count the buildings of an extent in the
+    background. Cancelling the task aborts the running count.
+    """
+
+    # Emitted with the generation and the estimate before the exact count.
+    estimated = pyqtSignal(int, int)
+
+    def __init__(self, db_interface, extent, srs: int, generation: int, exact=False):
+        """Create the task
+
+        Args:
+            db_interface (PostgreSQLInterface): the connected database
+            extent (QgsRectangle): extent to count the buildings of
+            srs (int): srid of the extent
+            generation (int): generation of the extent, see RefreshScheduler
+            exact (bool): also count the buildings exactly
+        """
+
+        super(CountTask, self).__init__("Count 3D CityDB buildings", db_interface)
+
+        self.extent = extent
+        self.srs = srs
+        self.generation = generation
+        self.exact = exact
+
+        # Results, read when the task is finished.
+        self.estimate = None
+        self.count = None
+
+    def run(self) -> bool:
+        try:
+            with self._connection() as connection:
+                self._count(connection)
+        except (Error, PostgreSQLInterfaceException, ConnectionPoolException) as error:
+            if not self.isCanceled():
+                self.exception = error
+            return False
+
+        return not self.isCanceled()
+
+    def _count(self, connection):
+        self.estimate = self.db_interface.estimate_building_count(
+            self.extent, self.srs, connection
+        )
+        self.estimated.emit(self.generation, self.estimate)
+
+        if self.exact and not self.isCanceled():
+            self.count = self.db_interface.count_building(
+                self.extent, self.srs, connection
+            )
@@ -0,0 +1,201 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+"""
+Make the plugin importable as the citydb_explorer package, as QGIS
+does, whatever the name of the checkout directory, and provide stand-ins
+for the clock and the database connections.
+"""
+
+import importlib.util
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+PLUGIN_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if "citydb_explorer" not in sys.modules:
+    spec = importlib.util.spec_from_file_location(
+        "citydb_explorer",
+        os.path.join(PLUGIN_DIRECTORY, "__init__.py"),
+        submodule_search_locations=[PLUGIN_DIRECTORY],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["citydb_explorer"] = module
+    spec.loader.exec_module(module)
+
+
+class Clock:
+    """
+    Stands in for the time module of the module under test, advanced by
+    the tests.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """
+    Return a Clock. Test modules override this fixture to install it.
+    """
+
+    return Clock()
+
+
+# psycopg2.extensions.TRANSACTION_STATUS_IDLE, without importing psycopg2.
+TRANSACTION_STATUS_IDLE = 0
+
+
+class FakeCursor:
+    """
+    Stands in for a psycopg2 cursor, see FakeConnection.
+    """
+
+    def __init__(self, connection, name=None):
+        self.connection = connection
+        self.name = name
+        self.itersize = 2000
+        self.rowcount = -1
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def execute(self, query, parameters=None):
+        if not self.connection.healthy:
+            from psycopg2 import OperationalError
+
+            raise OperationalError("server closed the connection")
+
+        self.connection.statements.append((query, parameters))
+        self._rows = list(self.connection.respond(query, parameters))
+        self.rowcount = len(self._rows)
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchmany(self, size=None):
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    """
+    Stands in for a psycopg2 connection. The statements run on it are
+    recorded in statements as (query, parameters), respond returns the
+    rows of a statement.
+    """
+
+    def __init__(self):
+        self.closed = 0
+        self.healthy = True
+        self.autocommit = False
+        self.commits = 0
+        self.rollbacks = 0
+        self.cancels = 0
+        self.prepared = set()
+        self.stats = None
+        self.statements = []
+        self.respond = lambda query, parameters: []
+        self.info = SimpleNamespace(transaction_status=TRANSACTION_STATUS_IDLE)
+
+    def cursor(self, name=None):
+        return FakeCursor(self, name)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.info.transaction_status = TRANSACTION_STATUS_IDLE
+
+    def cancel(self):
+        self.cancels += 1
+
+    def close(self):
+        self.closed = 1
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    """
+    Make the connection pools open FakeConnections. Returns the list of
+    the connections opened.
+    """
+
+    pytest.importorskip("psycopg2")
+    from citydb_explorer.db import pool
+
+    opened = []
+
+    def connect(dsn, connection_factory=None):
+        connection = FakeConnection()
+        opened.append(connection)
+        return connection
+
+    monkeypatch.setattr(pool, "connect", connect)
+    return opened
+
+
+@pytest.fixture
+def db_interface(connections):
+    """
+    Return a PostgreSQLInterface on FakeConnections.
+    """
+
+    from citydb_explorer.db.postgresql import PostgreSQLInterface
+
+    interface = PostgreSQLInterface(
+        {
+            "host": "localhost",
+            "port": 5432,
+            "dbname": "citydb",
+            "username": "citydb",
+            "password": "secret",
+        }
+    )
+    yield interface
+    interface.close_connection()
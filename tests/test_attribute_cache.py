@@ -0,0 +1,91 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+"""
+LRU cache of the generic attributes of buildings.
+"""
+
+import pytest
+from citydb_explorer.db import attribute_cache
+from citydb_explorer.db.attribute_cache import AttributeCache
+
+
+@pytest.fixture
+def clock(clock, monkeypatch):
+    monkeypatch.setattr(attribute_cache, "time", clock)
+    return clock
+
+
+def test_attribute_cache_lru():
+    cache = AttributeCache(max_entries=2)
+    cache.put(1, [("a", "x", None, None)])
+    cache.put(2, [])
+    cache.get(1)
+    cache.put(3, [])
+
+    assert cache.get(1) == [("a", "x", None, None)]
+    assert cache.get(2) is None
+    assert cache.get(3) == []
+
+
+def test_attribute_cache_returns_copies():
+    cache = AttributeCache()
+    attributes = [("a", "x", None, None)]
+    cache.put(1, attributes)
+    attributes.append(("b", None, 1, None))
+    cache.get(1).append(("c", None, 2, None))
+
+    assert cache.get(1) == [("a", "x", None, None)]
+
+
+def test_attribute_cache_ttl(clock):
+    cache = AttributeCache(ttl=10)
+    cache.put(1, [])
+
+    clock.now += 10
+    assert cache.get(1) == []
+    clock.now += 1
+    assert cache.get(1) is None
+
+
+def test_attribute_cache_invalidate():
+    cache = AttributeCache()
+    cache.put(1, [])
+    cache.put(2, [])
+
+    cache.invalidate(1)
+    assert cache.get(1) is None
+    assert cache.get(2) == []
+
+    cache.clear()
+    assert cache.get(2) is None
+
+
+def test_attribute_cache_disabled():
+    cache = AttributeCache(max_entries=0)
+    cache.put(1, [])
+
+    assert cache.get(1) is None
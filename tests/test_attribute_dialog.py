@@ -0,0 +1,57 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+"""
+Generic attribute dialog, skipped without the Python of QGIS.
+"""
+
+import pytest
+
+pytest.importorskip("qgis.core")
+
+from citydb_explorer.attribute_dialog import AttributeDialog  # noqa: E402
+from qgis.testing import start_app  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def application():
+    return start_app()
+
+
+def test_changed_attributes(application):
+    dialog = AttributeDialog(
+        [("a", "x", None, None), ("b", None, 1, None), ("c", None, None, 2.5)], 7
+    )
+    assert dialog.changed_attributes() == []
+
+    dialog.tableWidget.item(0, 1).setText("y")
+    dialog.tableWidget.item(1, 2).setText("not a number")
+    dialog.tableWidget.item(2, 3).setText("2.5")
+
+    assert dialog.changed_attributes() == [
+        ("a", "y", None, None),
+        ("b", None, None, None),
+    ]
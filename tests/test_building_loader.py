@@ -0,0 +1,174 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+"""
+Splitting of extents and tiling of the building loader. BuildingLoader
+needs QGIS, the tests are skipped without the Python of QGIS.
+"""
+
+import pytest
+
+pytest.importorskip("qgis.core")
+
+from citydb_explorer.building_loader import BuildingLoader, split_extent  # noqa: E402
+from citydb_explorer.db.tile_cache import TileCache  # noqa: E402
+from qgis.core import QgsPointXY, QgsRectangle  # noqa: E402
+
+
+def bounds(rectangle):
+    return (
+        rectangle.xMinimum(),
+        rectangle.yMinimum(),
+        rectangle.xMaximum(),
+        rectangle.yMaximum(),
+    )
+
+
+def test_split_extent_square():
+    parts = split_extent(QgsRectangle(0, 0, 100, 100), 4)
+
+    assert sorted(bounds(part) for part in parts) == [
+        (0, 0, 50, 50),
+        (0, 50, 50, 100),
+        (50, 0, 100, 50),
+        (50, 50, 100, 100),
+    ]
+
+
+def test_split_extent_wide():
+    parts = split_extent(QgsRectangle(0, 0, 400, 100), 4)
+
+    assert [bounds(part) for part in parts] == [
+        (x, 0, x + 100, 100) for x in (0, 100, 200, 300)
+    ]
+
+
+def test_split_extent_at_least_parts():
+    parts = split_extent(QgsRectangle(0, 0, 300, 100), 5)
+
+    assert len(parts) >= 5
+    assert sum(part.area() for part in parts) == pytest.approx(300 * 100)
+
+
+@pytest.mark.parametrize(
+    "extent, parts",
+    [(QgsRectangle(0, 0, 100, 100), 1), (QgsRectangle(0, 0, 0, 100), 4)],
+)
+def test_split_extent_unsplit(extent, parts):
+    assert split_extent(extent, parts) == [extent]
+
+
+class Database:
+    """
+    Stands in for PostgreSQLInterface.iter_buildings, with buildings at
+    points. Building 5 crosses the border between two tiles.
+    """
+
+    POSITIONS = {1: [(50, 50)], 2: [(150, 50)], 3: [(60, 50)], 5: [(90, 50), (110, 50)]}
+
+    def __init__(self):
+        self.queries = []
+
+    def iter_buildings(self, extent, srs, limit=None, after_id=0, **options):
+        self.queries.append((bounds(extent), limit, after_id))
+        rows = [
+            (building_id, b"", None)
+            for building_id, points in sorted(self.POSITIONS.items())
+            if building_id > after_id and
+            any(extent.contains(QgsPointXY(x, y)) for x, y in points)
+        ]
+        yield rows[:limit]
+
+
+def loader(tmp_path=None):
+    return BuildingLoader(
+        Database(),
+        25832,
+        "citydb@localhost:5432/citydb",
+        tile_cache=None if tmp_path is None else TileCache(str(tmp_path / "t.sqlite")),
+        tile_size=100,
+    )
+
+
+def page(building_loader, **options):
+    return [
+        row[0]
+        for batch in building_loader.fetch(QgsRectangle(0, 0, 199, 99), **options)
+        for row in batch
+    ]
+
+
+def test_fetch_pages(tmp_path):
+    building_loader = loader(tmp_path)
+
+    assert page(building_loader, limit=2) == [1, 2]
+    assert page(building_loader, limit=2, after_id=2) == [3, 5]
+    assert page(building_loader, limit=2, after_id=5) == []
+    # Every tile is fetched once, the pages are cut from the cached tiles.
+    assert sorted(building_loader.db_interface.queries) == [
+        ((0, 0, 100, 100), None, 0),
+        ((100, 0, 200, 100), None, 0),
+    ]
+
+
+def test_fetch_pages_without_cache():
+    building_loader = loader()
+
+    assert page(building_loader, limit=2, after_id=2) == [3, 5]
+    assert building_loader.db_interface.queries == [((0, 0, 199, 99), 2, 2)]
+
+
+def test_cached_tile(tmp_path):
+    building_loader = loader(tmp_path)
+
+    assert loader().cached_tile((0, 0)) is None
+    assert building_loader.cached_tile((0, 0)) is None
+
+    ids = [row[0] for row in building_loader.fetch_tile((0, 0))]
+
+    assert [row[0] for row in building_loader.cached_tile((0, 0))] == ids
+    assert [row[0] for row in building_loader.fetch_tile((0, 0))] == ids
+    assert len(building_loader.db_interface.queries) == 1
+
+
+@pytest.mark.parametrize(
+    "options, name",
+    [
+        ({}, "lod2#100"),
+        ({"tile_size": 250.5}, "lod2#250.5"),
+        ({"precision": 2, "tolerance": 0.5}, "lod2#100@2~0.5"),
+        ({"lod": "envelope", "tolerance": 0.5}, "envelope#100"),
+        ({"lod": "lod1", "precision": -1, "attributes": True}, "lod1#100@-1+attributes"),
+    ],
+)
+def test_cache_lod(options, name):
+    building_loader = loader()
+    building_loader.tile_size = 100
+    for option, value in options.items():
+        setattr(building_loader, option, value)
+
+    # The layer and the cached tiles only match the same geometries.
+    assert building_loader.cache_lod == name
@@ -0,0 +1,173 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+"""
+Comparison of the existing indexes to the recommended ones.
+"""
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+from psycopg2 import sql  # noqa: E402
+
+from citydb_explorer.db import index_advisor  # noqa: E402
+from citydb_explorer.db.index_advisor import RECOMMENDED_INDEXES, advise  # noqa: E402
+
+MB = 1024 * 1024
+
+
+def index(table, name, method, columns, unique=False, scans=5, size=MB, valid=True):
+    """
+    Return a row of INDEXES_SQL.
+    """
+
+    return (table, name, method, list(columns), unique, scans, size, 1000, valid)
+
+
+def all_recommended():
+    return [
+        index(item.table, "{}_{}".format(item.table, i), item.method, item.columns)
+        for i, item in enumerate(RECOMMENDED_INDEXES)
+    ]
+
+
+def by_index(advice):
+    return {item.index: item for item in advice if item.index is not None}
+
+
+def test_all_present():
+    advice = advise(all_recommended(), {})
+
+    assert len(advice) == len(RECOMMENDED_INDEXES)
+    assert {item.status for item in advice} == {"ok"}
+    assert index_advisor.report(advice) == ""
+
+
+def test_missing():
+    indexes = [row for row in all_recommended() if row[0] != "cityobject_genericattrib"]
+
+    advice = advise(indexes, {"cityobject_genericattrib": 5000})
+    (missing,) = [item for item in advice if item.status == "missing"]
+
+    assert missing.columns == ("cityobject_id", "attrname")
+    assert missing.rows == 5000
+    assert "Missing index on cityobject_genericattrib(cityobject_id, attrname)" in (
+        index_advisor.report(advice)
+    )
+
+
+def test_leading_columns():
+    table = "cityobject_genericattrib"
+    indexes = [row for row in all_recommended() if row[0] != table]
+    # The recommended columns must lead the index, with the same method.
+    indexes += [
+        index(table, "wrong_order", "btree", ["attrname", "cityobject_id"], scans=0),
+        index(table, "hash", "hash", ["cityobject_id", "attrname"], scans=0),
+        index(table, "longer", "btree", ["cityobject_id", "attrname", "strval"]),
+    ]
+
+    advice = by_index(advise(indexes, {}))
+
+    assert advice["longer"].status == "ok"
+    assert advice["longer"].purpose == "generic attributes of a building"
+    assert advice["wrong_order"].purpose == "not used by the plugin"
+    assert advice["hash"].purpose == "not used by the plugin"
+
+
+def test_unused():
+    indexes = all_recommended()
+    indexes[0] = index("cityobject", "envelope", "gist", ["envelope"], scans=0)
+    indexes += [
+        index("cityobject", "unused", "btree", ["gmlid"], scans=0),
+        index("cityobject", "small", "btree", ["name"], scans=0, size=8192),
+        index("cityobject", "unique", "btree", ["id"], unique=True, scans=0),
+        index("cityobject", "used", "btree", ["objectclass_id"]),
+    ]
+
+    advice = by_index(advise(indexes, {}))
+
+    assert advice["envelope"].status == "unused"
+    assert advice["unused"].status == "unused"
+    assert {"small", "unique", "used"}.isdisjoint(advice)
+    assert "Unused index unused on cityobject(gmlid), 1024 kB" in (
+        index_advisor.report(list(advice.values()))
+    )
+
+
+def test_invalid():
+    indexes = all_recommended()
+    indexes[0] = index("cityobject", "broken", "gist", ["envelope"], valid=False)
+    indexes.append(
+        index("building", "broken_other", "btree", ["gmlid"], scans=0, valid=False)
+    )
+
+    advice = by_index(advise(indexes, {}))
+
+    assert advice["broken"].status == "invalid"
+    assert "broken_other" not in advice
+    assert index_advisor.report([advice["broken"]]).startswith("Invalid index broken")
+    assert index_advisor.drop_index_sql(advice["broken"]) == sql.SQL(
+        "DROP INDEX CONCURRENTLY IF EXISTS {}"
+    ).format(sql.Identifier("citydb", "broken"))
+
+
+def test_drop_index_sql_quotes_name():
+    indexes = all_recommended()
+    indexes[0] = index("cityobject", 'Broken "Index"', "gist", ["envelope"], valid=False)
+
+    (broken,) = [item for item in advise(indexes, {}) if item.status == "invalid"]
+
+    # The name is quoted as it is in the catalog, not pasted in the statement.
+    assert index_advisor.drop_index_sql(broken) == sql.SQL(
+        "DROP INDEX CONCURRENTLY IF EXISTS {}"
+    ).format(sql.Identifier("citydb", 'Broken "Index"'))
+
+
+def test_valid_preferred_over_invalid():
+    indexes = all_recommended()
+    indexes.insert(0, index("cityobject", "broken", "gist", ["envelope"], valid=False))
+
+    advice = advise(indexes, {})
+
+    assert advice[0].status == "ok"
+    assert advice[0].index == "cityobject_0"
+
+
+def test_create_index_sql():
+    (missing,) = [
+        item for item in advise([], {}) if item.table == "cityobject_genericattrib"
+    ]
+
+    assert index_advisor.create_index_sql(missing) == sql.SQL(
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS {} ON {} USING {} ({})"
+    ).format(
+        sql.Identifier("cityobject_genericattrib_cityobject_id_attrname_cdbx_idx"),
+        sql.Identifier("citydb", "cityobject_genericattrib"),
+        sql.Identifier("btree"),
+        sql.Composed([sql.Identifier("cityobject_id"), sql.SQL(", "),
+                      sql.Identifier("attrname")]),
+    )
@@ -0,0 +1,73 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+"""
+Cache of the database metadata read when connecting.
+"""
+
+import pytest
+from citydb_explorer.db import metadata_cache
+from citydb_explorer.db.metadata_cache import MetadataCache
+
+
+@pytest.fixture
+def clock(clock, monkeypatch):
+    monkeypatch.setattr(metadata_cache, "time", clock)
+    return clock
+
+
+def test_metadata_cache_file(tmp_path):
+    path = str(tmp_path / "cache" / "metadata.json")
+    metadata = {"version": "4.1.0", "srs": 25832}
+    MetadataCache(path).put("dbname=citydb", metadata)
+
+    cache = MetadataCache(path)
+    assert cache.get("dbname=citydb") == metadata
+    assert cache.get("dbname=other") is None
+
+    cache.invalidate("dbname=citydb")
+    assert MetadataCache(path).get("dbname=citydb") is None
+
+
+def test_metadata_cache_ttl(clock):
+    cache = MetadataCache(ttl=60)
+    cache.put("dbname=citydb", {"srs": 25832})
+
+    clock.now += 60
+    assert cache.get("dbname=citydb") == {"srs": 25832}
+    clock.now += 1
+    assert cache.get("dbname=citydb") is None
+
+
+@pytest.mark.parametrize("content", ["not json", "[1, 2]"])
+def test_metadata_cache_invalid_file(tmp_path, content):
+    path = tmp_path / "metadata.json"
+    path.write_text(content)
+
+    cache = MetadataCache(str(path))
+    assert cache.get("dbname=citydb") is None
+    cache.put("dbname=citydb", {"srs": 25832})
+    assert MetadataCache(str(path)).get("dbname=citydb") == {"srs": 25832}
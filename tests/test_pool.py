@@ -0,0 +1,173 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+"""
+Connection pool checkout, eviction and health checks, with FakeConnections
+standing in for the psycopg2 ones.
+"""
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+from citydb_explorer.db import pool  # noqa: E402
+from citydb_explorer.db.pool import (  # noqa: E402
+    ConnectionPool,
+    ConnectionPoolException,
+)
+from psycopg2 import extensions  # noqa: E402
+
+
+@pytest.fixture
+def clock(clock, monkeypatch):
+    monkeypatch.setattr(pool, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def connection_pool(connections):
+    """
+    Return a function creating pools of FakeConnection.
+    """
+
+    def create(**options):
+        return ConnectionPool("dbname=citydb", **options)
+
+    return create
+
+
+def test_reuse(connection_pool):
+    connections = connection_pool()
+
+    with connections.connection() as first:
+        pass
+    with connections.connection() as second:
+        pass
+
+    assert first is second
+    assert connections.size == 1
+
+
+def test_invalid_size():
+    with pytest.raises(ConnectionPoolException):
+        ConnectionPool("dbname=citydb", minconn=2, maxconn=1)
+
+
+def test_exhausted(connection_pool):
+    connections = connection_pool(maxconn=1, timeout=0)
+    connection = connections.getconn()
+
+    with pytest.raises(ConnectionPoolException):
+        connections.getconn()
+
+    connections.putconn(connection)
+    assert connections.getconn() is connection
+
+
+def test_rollback_on_return(connection_pool):
+    connections = connection_pool()
+    connection = connections.getconn()
+    connection.info.transaction_status = extensions.TRANSACTION_STATUS_INTRANS
+
+    connections.putconn(connection)
+
+    assert connection.rollbacks == 1
+    assert connections.getconn() is connection
+
+
+def test_evict_idle(connection_pool, clock):
+    connections = connection_pool(minconn=1, maxconn=3, idle_timeout=10)
+    checked_out = [connections.getconn() for _ in range(3)]
+    for connection in checked_out:
+        connections.putconn(connection)
+        clock.now += 1
+
+    clock.now += 10
+    connection = connections.getconn()
+
+    # The most recently returned connection is kept, down to minconn.
+    assert connection is checked_out[2]
+    assert [c.closed for c in checked_out] == [1, 1, 0]
+    assert connections.size == 1
+
+
+def test_evict_keeps_recent(connection_pool, clock):
+    connections = connection_pool(minconn=0, maxconn=2, idle_timeout=10)
+    old, recent = connections.getconn(), connections.getconn()
+    connections.putconn(old)
+    clock.now += 8
+    connections.putconn(recent)
+
+    clock.now += 5
+    assert connections.getconn() is recent
+    assert old.closed
+    assert connections.size == 1
+
+
+def test_health_check(connection_pool, clock):
+    connections = connection_pool(health_check_interval=30)
+    connection = connections.getconn()
+    connections.putconn(connection)
+
+    connection.healthy = False
+    clock.now += 10
+    # Recently used connections are not tested.
+    assert connections.getconn() is connection
+    connections.putconn(connection)
+
+    clock.now += 31
+    replacement = connections.getconn()
+
+    assert replacement is not connection
+    assert connection.closed
+    assert connections.size == 1
+
+
+def test_closed_connection_discarded(connection_pool):
+    connections = connection_pool()
+    connection = connections.getconn()
+    connection.close()
+
+    connections.putconn(connection)
+
+    assert connections.size == 0
+    assert connections.getconn() is not connection
+
+
+def test_closeall(connection_pool):
+    connections = connection_pool()
+    idle, checked_out = connections.getconn(), connections.getconn()
+    connections.putconn(idle)
+
+    connections.closeall()
+
+    assert idle.closed
+    with pytest.raises(ConnectionPoolException):
+        connections.getconn()
+
+    connections.putconn(checked_out)
+    assert checked_out.closed
+    assert connections.size == 0
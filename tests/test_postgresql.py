@@ -0,0 +1,186 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+"""
+Statements of PostgreSQLInterface, run on FakeConnections.
+"""
+
+import re
+
+import pytest
+
+
+def test_execute_prepared(db_interface):
+    sql = "SELECT %(b)s, %(a)s, %(b)s WHERE x = %(c)s"
+
+    with db_interface.connection() as connection, connection.cursor() as cursor:
+        for a, b, c in ((1, 2, 3), (4, 5, 6)):
+            db_interface.execute_prepared(
+                cursor, "citydb_test", sql, {"a": a, "b": b, "c": c}
+            )
+
+    # Parameters are numbered in order of first use, and prepared once.
+    assert connection.statements == [
+        ("PREPARE citydb_test AS SELECT $1, $2, $1 WHERE x = $3", None),
+        ("EXECUTE citydb_test (%s, %s, %s)", [2, 1, 3]),
+        ("EXECUTE citydb_test (%s, %s, %s)", [5, 4, 6]),
+    ]
+    assert connection.prepared == {"citydb_test"}
+
+
+def test_execute_prepared_without_parameters(db_interface):
+    with db_interface.connection() as connection, connection.cursor() as cursor:
+        db_interface.execute_prepared(cursor, "citydb_test", "SELECT 1", {})
+
+    assert connection.statements[-1] == ("EXECUTE citydb_test", None)
+
+
+def test_execute_prepared_per_connection(db_interface):
+    first = db_interface.pool.getconn()
+    second = db_interface.pool.getconn()
+
+    for connection in (first, second):
+        with connection.cursor() as cursor:
+            db_interface.execute_prepared(cursor, "citydb_test", "SELECT 1", {})
+
+    assert [query for query, _ in second.statements] == [
+        "PREPARE citydb_test AS SELECT 1",
+        "EXECUTE citydb_test",
+    ]
+
+
+class Extent:
+    """
+    The accessors of QgsRectangle used by PostgreSQLInterface.
+    """
+
+    def __init__(self, xmin, ymin, xmax, ymax):
+        self.bounds = (xmin, ymin, xmax, ymax)
+
+    def xMinimum(self):
+        return self.bounds[0]
+
+    def yMinimum(self):
+        return self.bounds[1]
+
+    def xMaximum(self):
+        return self.bounds[2]
+
+    def yMaximum(self):
+        return self.bounds[3]
+
+
+EXTENT = Extent(0, 0, 100, 100)
+
+
+def parameter(connection, name: str):
+    """
+    Return the value bound to a named parameter of the last prepared
+    building statement.
+    """
+
+    prepared = next(
+        query for query, _ in connection.statements if query.startswith("PREPARE")
+    )
+    # The SQL has "%(name)s" replaced by "$n", find n from the template.
+    match = re.search(r"{} \$(\d+)".format(re.escape(name)), prepared)
+    _, values = connection.statements[-1]
+    return values[int(match.group(1)) - 1]
+
+
+@pytest.mark.parametrize("lod", ["envelope", "lod1", "lod2"])
+def test_iter_buildings_page(db_interface, lod):
+    with db_interface.connection() as connection:
+        connection.respond = lambda query, parameters: (
+            [(11, b"\x01", None), (12, b"\x02", None), (13, b"\x03", None)]
+            if query.startswith("EXECUTE")
+            else []
+        )
+        batches = list(
+            db_interface.iter_buildings(
+                EXTENT,
+                25832,
+                batch_size=2,
+                limit=3,
+                after_id=10,
+                lod=lod,
+                connection=connection,
+            )
+        )
+
+    assert batches == [
+        [(11, b"\x01", None), (12, b"\x02", None)],
+        [(13, b"\x03", None)],
+    ]
+    # The page starts after the last id of the previous page.
+    assert parameter(connection, "id >") == 10
+    assert parameter(connection, "LIMIT") == 3
+
+
+def test_iter_buildings_cursor(db_interface):
+    with db_interface.connection() as connection:
+        batches = list(
+            db_interface.iter_buildings(
+                EXTENT, 25832, after_id=10, lod="envelope", connection=connection
+            )
+        )
+
+    # Without a limit, the buildings are streamed from a named cursor.
+    ((query, parameters),) = connection.statements
+    assert batches == []
+    assert "LIMIT %(limit)s" in query
+    assert (parameters["after_id"], parameters["limit"]) == (10, None)
+
+
+def test_iter_buildings_lod1_fallback(db_interface):
+    with db_interface.connection() as connection:
+        list(
+            db_interface.iter_buildings(
+                EXTENT, 25832, limit=10, lod="lod1", connection=connection
+            )
+        )
+
+    prepared = connection.statements[-2][0]
+    # Buildings without LOD0 or LOD1 geometry are kept, with their envelope.
+    assert "LEFT JOIN" in prepared
+    assert "COALESCE(st_collect(sg.geometry), co.envelope)" in prepared
+
+
+@pytest.mark.parametrize(
+    "precision, expected",
+    [(2, (2, 2)), (12, (7, 7)), (-1, (-1, 0)), (-12, (-8, 0)), (None, (None, None))],
+)
+def test_iter_buildings_precision(db_interface, precision, expected):
+    with db_interface.connection() as connection:
+        list(
+            db_interface.iter_buildings(
+                EXTENT, 25832, precision=precision, connection=connection
+            )
+        )
+
+    # ST_AsTWKB only accepts -8 to 7 decimals for x and y, 0 to 7 for z.
+    ((_, parameters),) = connection.statements
+    assert (parameters["precision"], parameters["z_precision"]) == expected
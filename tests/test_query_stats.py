@@ -0,0 +1,193 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+"""
+Statement statistics and the capture of the plans of slow statements.
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+from citydb_explorer.db import query_stats  # noqa: E402
+from citydb_explorer.db.query_stats import (  # noqa: E402
+    QueryStats,
+    Statement,
+    TimedCursor,
+    row_bytes,
+    statement_label,
+)
+
+
+def statement(label="SELECT 1", query="SELECT 1", duration=0.0, rows=0, size=0):
+    result = Statement(label, query)
+    result.duration = duration
+    result.rows = rows
+    result.bytes = size
+    return result
+
+
+def test_statement_label():
+    assert statement_label(b"EXECUTE citydb_count_building (%s)") == (
+        "citydb_count_building"
+    )
+    assert statement_label("SELECT\n    id\nFROM building") == "SELECT id FROM building"
+    assert statement_label("SELECT " + "x" * 100) == "SELECT " + "x" * 50 + "..."
+
+
+def test_row_bytes():
+    row = (1, None, b"abc", memoryview(b"ab"), "text", 2.5)
+
+    assert row_bytes(row) == 8 + 3 + 2 + 4 + 8
+
+
+def test_summary():
+    stats = QueryStats()
+    stats.record(statement("a", duration=0.1, rows=10, size=100))
+    stats.record(statement("a", duration=0.3, rows=5, size=50))
+    stats.record(statement("b", duration=0.5, rows=1, size=8))
+
+    (b, a) = stats.summary()
+
+    assert b == {
+        "label": "b",
+        "count": 1,
+        "total": 0.5,
+        "mean": 0.5,
+        "max": 0.5,
+        "rows": 1,
+        "bytes": 8,
+    }
+    assert a["count"] == 2
+    assert a["total"] == pytest.approx(0.4)
+    assert a["mean"] == pytest.approx(0.2)
+    assert a["max"] == 0.3
+    assert (a["rows"], a["bytes"]) == (15, 150)
+
+    stats.reset()
+    assert stats.summary() == []
+
+
+def test_listener():
+    slow = []
+    stats = QueryStats(slow_threshold=0.5, listener=slow.append)
+    fast, limit = statement(duration=0.4), statement(duration=0.5)
+
+    stats.record(fast)
+    stats.record(limit)
+
+    assert slow == [limit]
+
+
+@pytest.mark.parametrize(
+    "query, explained",
+    [
+        ("SELECT id FROM citydb.building", True),
+        ("  with ids AS (SELECT 1) SELECT * FROM ids", True),
+        ("EXECUTE citydb_count_building (1, 2)", True),
+        ("INSERT INTO citydb.building VALUES (1)", False),
+        ("WITH gone AS (DELETE FROM citydb.building RETURNING id) SELECT 1", False),
+        ("SELECT nextval('seq'); DROP TABLE citydb.building", False),
+        ("PREPARE citydb_test AS SELECT 1", False),
+        (None, False),
+    ],
+)
+def test_should_explain_read_only(query, explained):
+    stats = QueryStats(slow_threshold=0.5, explain=True)
+
+    assert stats.should_explain(statement(query=query, duration=1)) is explained
+
+
+def test_should_explain_slow_only():
+    assert not QueryStats(explain=True).should_explain(statement(duration=0.1))
+    assert not QueryStats(explain=False).should_explain(statement(duration=1))
+
+
+def test_plans_keep_slowest():
+    stats = QueryStats(slow_threshold=0, explain=True, max_plans=2)
+    for duration in (0.3, 0.1, 0.5, 0.2):
+        captured = statement(duration=duration)
+        if stats.should_explain(captured):
+            captured.plan = "plan {}".format(duration)
+        stats.record(captured)
+
+    assert [captured.plan for captured in stats.plans()] == ["plan 0.5", "plan 0.3"]
+    # Faster than every kept plan: not worth running again.
+    assert not stats.should_explain(statement(duration=0.25))
+
+
+def timed_cursor(stats, name=None, query="SELECT id FROM citydb.building"):
+    """
+    Return a stand-in for a TimedCursor running query, to call the
+    accounting methods of TimedCursor on.
+    """
+
+    return SimpleNamespace(
+        _statement=Statement(statement_label(query), query),
+        _stats=stats,
+        name=name,
+        connection=object(),
+    )
+
+
+def test_timed_cursor_fetches():
+    stats = QueryStats()
+    cursor = timed_cursor(stats, name="citydb_buildings_1")
+
+    for rows in ([(1, b"abcd")], [(2, b"ab"), (3, None)], []):
+        TimedCursor._fetched(cursor, time.perf_counter(), rows)
+    TimedCursor._finish(cursor)
+    TimedCursor._finish(cursor)
+
+    (entry,) = stats.summary()
+    assert entry["count"] == 1
+    # Named cursors count the fetched rows.
+    assert entry["rows"] == 3
+    assert entry["bytes"] == 3 * 8 + 4 + 2
+
+
+def test_timed_cursor_explains_slow(monkeypatch):
+    explained = []
+    monkeypatch.setattr(
+        query_stats,
+        "explain",
+        lambda connection, query: explained.append(query) or "Seq Scan",
+    )
+    stats = QueryStats(slow_threshold=0.5, explain=True)
+
+    cursor = timed_cursor(stats)
+    cursor._statement.duration = 1
+    TimedCursor._finish(cursor)
+
+    cursor = timed_cursor(stats, query="DELETE FROM citydb.building")
+    cursor._statement.duration = 1
+    TimedCursor._finish(cursor)
+
+    assert explained == ["SELECT id FROM citydb.building"]
+    assert [captured.plan for captured in stats.plans()] == ["Seq Scan"]
@@ -0,0 +1,82 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+"""
+Debouncing of the canvas extent changes, skipped without the Python of QGIS.
+"""
+
+import pytest
+
+pytest.importorskip("qgis.PyQt.QtCore")
+
+from citydb_explorer.refresh_scheduler import RefreshScheduler  # noqa: E402
+from qgis.PyQt.QtCore import QCoreApplication  # noqa: E402
+from qgis.PyQt.QtTest import QTest  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def application():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+@pytest.fixture
+def refreshed(application):
+    return []
+
+
+def test_burst_refreshes_once(refreshed):
+    scheduler = RefreshScheduler(refreshed.append, delay=50)
+
+    for _ in range(5):
+        scheduler.schedule()
+        QTest.qWait(10)
+    assert refreshed == []
+
+    QTest.qWait(150)
+    assert refreshed == [5]
+    assert scheduler.is_current(5)
+
+
+def test_change_outdates_generation(refreshed):
+    scheduler = RefreshScheduler(refreshed.append, delay=20)
+    scheduler.schedule()
+    QTest.qWait(100)
+
+    scheduler.schedule()
+
+    assert not scheduler.is_current(refreshed[0])
+
+
+def test_cancel(refreshed):
+    scheduler = RefreshScheduler(refreshed.append, delay=20)
+    scheduler.schedule()
+    generation = scheduler.generation
+
+    scheduler.cancel()
+    QTest.qWait(100)
+
+    assert refreshed == []
+    assert not scheduler.is_current(generation)
@@ -0,0 +1,142 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+"""
+SQLite tile cache of the building geometries.
+"""
+
+import sqlite3
+
+import pytest
+from citydb_explorer.db import tile_cache
+from citydb_explorer.db.tile_cache import TileCache, TileKey, tile_bounds, tile_range
+
+
+@pytest.fixture
+def clock(clock, monkeypatch):
+    monkeypatch.setattr(tile_cache, "time", clock)
+    return clock
+
+
+def key(x=0, y=0, lod="lod2#500"):
+    return TileKey("dbname=citydb", 25832, lod, x, y)
+
+
+def rows(*ids, size=10):
+    return [(building_id, bytes(size), '{"name": "x"}') for building_id in ids]
+
+
+def test_tile_range():
+    assert tile_range(-1, 0, 999, 499, 500) == [(-1, 0), (0, 0), (1, 0)]
+    assert tile_bounds(-1, 2, 500) == (-500, 1000, 0, 1500)
+
+
+def test_tile_cache_get_put(tmp_path):
+    cache = TileCache(str(tmp_path / "cache" / "tiles.sqlite"))
+
+    assert cache.get(key()) is None
+    cache.put(key(), rows(1, 2))
+
+    assert cache.get(key()) == rows(1, 2)
+    # The tile size is part of the key.
+    assert cache.get(key(lod="lod2#250")) is None
+    assert cache.stats() == {"hits": 1, "misses": 2, "tiles": 1, "bytes": 46}
+
+    cache.put(key(), rows(3))
+    assert cache.get(key()) == rows(3)
+    cache.close()
+
+
+def test_tile_cache_persistent(tmp_path):
+    path = str(tmp_path / "tiles.sqlite")
+    cache = TileCache(path)
+    cache.put(key(), rows(1))
+    cache.close()
+
+    cache = TileCache(path)
+    assert cache.get(key()) == rows(1)
+    cache.close()
+
+
+def test_tile_cache_schema_version(tmp_path):
+    path = str(tmp_path / "tiles.sqlite")
+    database = sqlite3.connect(path)
+    database.execute("CREATE TABLE tile (tile_id INTEGER PRIMARY KEY)")
+    database.execute("PRAGMA user_version = 1")
+    database.commit()
+    database.close()
+
+    cache = TileCache(path)
+    cache.put(key(), rows(1))
+    assert cache.get(key()) == rows(1)
+    cache.close()
+
+
+def test_tile_cache_evicts_least_recently_used(tmp_path, clock):
+    cache = TileCache(str(tmp_path / "tiles.sqlite"), max_bytes=70)
+
+    for x in range(3):
+        cache.put(key(x), rows(x))
+        clock.now += 1
+    cache.get(key(0))
+    clock.now += 1
+    cache.put(key(3), rows(3))
+
+    assert cache.get(key(0)) is not None
+    assert cache.get(key(1)) is None
+    assert cache.get(key(2)) is not None
+    assert cache.get(key(3)) is not None
+    cache.close()
+
+
+def test_tile_cache_max_age(tmp_path, clock):
+    cache = TileCache(str(tmp_path / "tiles.sqlite"), max_age=60)
+    cache.put(key(), rows(1))
+
+    clock.now += 30
+    assert cache.get(key()) is not None
+    clock.now += 31
+    assert cache.get(key()) is None
+    assert cache.stats()["tiles"] == 0
+    cache.close()
+
+
+def test_tile_cache_invalidate_buildings(tmp_path):
+    cache = TileCache(str(tmp_path / "tiles.sqlite"))
+    other = TileKey("dbname=other", 25832, "lod2#500", 0, 0)
+    cache.put(key(0), rows(1, 2))
+    cache.put(key(1), rows(3))
+    cache.put(other, rows(1))
+
+    cache.invalidate_buildings("dbname=citydb", [1])
+
+    assert cache.get(key(0)) is None
+    assert cache.get(key(1)) == rows(3)
+    assert cache.get(other) == rows(1)
+
+    cache.clear()
+    assert cache.stats()["tiles"] == 0
+    cache.close()
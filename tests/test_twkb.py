@@ -0,0 +1,189 @@
+#####################################################################################
+# Copyright (C) 2021
+# Chair of Geoinformatics
+# Technical University of Munich, Germany
+# https://www.gis.bgu.tum.de/
+#
+# This source is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation; either version 2 of the License, or (at your option)
+# any later version.
+#
+# This code is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# The 3D City Database is jointly developed with the following cooperation partners:
+#
+# virtualcitySYSTEMS GmbH, Berlin <http://www.virtualcitysystems.de/>
+# M.O.S.S. Computer Grafik Systeme GmbH, Taufkirchen <http://www.moss.de/>
+#
+#####################################################################################
+"""
+Decoding of TWKB geometries as returned by ST_AsTWKB.
+"""
+
+import math
+import struct
+
+import pytest
+from citydb_explorer.db.twkb import TWKBDecodeException, decode
+
+
+def header(wkb_type: int) -> bytes:
+    return struct.pack("<BI", 1, wkb_type)
+
+
+def count(number: int) -> bytes:
+    return struct.pack("<I", number)
+
+
+def coordinates(*values) -> bytes:
+    return struct.pack("<{}d".format(len(values)), *values)
+
+
+def test_point():
+    # ST_AsTWKB('POINT(1 2)')
+    assert decode(bytes.fromhex("01000204")) == bytes.fromhex(
+        "0101000000000000000000f03f0000000000000040"
+    )
+
+
+def test_point_precision():
+    # ST_AsTWKB('POINT(1.5 2.25)', 2)
+    assert decode(bytes.fromhex("4100ac02c203")) == header(1) + coordinates(1.5, 2.25)
+
+
+def test_point_negative_precision():
+    # ST_AsTWKB('POINT(1230 -4560)', -1)
+    wkb = decode(bytes.fromhex("1100f6018f07"))
+
+    assert wkb[:5] == header(1)
+    assert struct.unpack("<2d", wkb[5:]) == pytest.approx((1230, -4560))
+
+
+def test_point_z():
+    # ST_AsTWKB('POINT Z(1 2 3)')
+    assert decode(bytes.fromhex("010801020406")) == header(1001) + coordinates(1, 2, 3)
+
+
+def test_point_z_precision():
+    # ST_AsTWKB('POINT Z(1 2 3.5)', 0, 1)
+    assert decode(bytes.fromhex("010805020446")) == (
+        header(1001) + coordinates(1, 2, 3.5)
+    )
+
+
+def test_linestring():
+    # ST_AsTWKB('LINESTRING(1 1, 5 5)')
+    assert decode(bytes.fromhex("02000202020808")) == (
+        header(2) + count(2) + coordinates(1, 1, 5, 5)
+    )
+
+
+def test_linestring_bbox():
+    # ST_AsTWKB('LINESTRING(1 1, 5 5)', 0, 0, 0, false, true)
+    assert decode(bytes.fromhex("0201020802080202020808")) == (
+        header(2) + count(2) + coordinates(1, 1, 5, 5)
+    )
+
+
+def test_polygon():
+    # ST_AsTWKB('POLYGON((0 0, 1 0, 1 1, 0 0))')
+    assert decode(bytes.fromhex("030001040000020000020101")) == (
+        header(3) + count(1) + count(4) + coordinates(0, 0, 1, 0, 1, 1, 0, 0)
+    )
+
+
+def test_multipoint():
+    # ST_AsTWKB('MULTIPOINT(1 1, 2 3)')
+    assert decode(bytes.fromhex("04000202020204")) == (
+        header(4) +
+        count(2) +
+        header(1) +
+        coordinates(1, 1) +
+        header(1) +
+        coordinates(2, 3)
+    )
+
+
+def test_multipoint_idlist():
+    # ST_AsTWKB(ARRAY['POINT(1 1)', 'POINT(2 3)'], ARRAY[10, 20])
+    assert decode(bytes.fromhex("040402142802020204")) == decode(
+        bytes.fromhex("04000202020204")
+    )
+
+
+def test_multipolygon():
+    # ST_AsTWKB('MULTIPOLYGON(((0 0, 1 0, 1 1, 0 0)), ((2 2, 3 2, 3 3, 2 2)))'),
+    # the coordinates are deltas across the polygons.
+    assert decode(bytes.fromhex("0600020104000002000002010101040404020000020101")) == (
+        header(6) +
+        count(2) +
+        header(3) +
+        count(1) +
+        count(4) +
+        coordinates(0, 0, 1, 0, 1, 1, 0, 0) +
+        header(3) +
+        count(1) +
+        count(4) +
+        coordinates(2, 2, 3, 2, 3, 3, 2, 2)
+    )
+
+
+def test_geometrycollection():
+    # ST_AsTWKB('GEOMETRYCOLLECTION(POINT(1 2), LINESTRING(0 0, 1 1))'),
+    # every member has its own header and deltas.
+    assert decode(bytes.fromhex("0700020100020402000200000202")) == (
+        header(7) +
+        count(2) +
+        header(1) +
+        coordinates(1, 2) +
+        header(2) +
+        count(2) +
+        coordinates(0, 0, 1, 1)
+    )
+
+
+def test_size():
+    # ST_AsTWKB('POINT(1 2)', 0, 0, 0, true)
+    assert decode(bytes.fromhex("0102020204")) == decode(bytes.fromhex("01000204"))
+
+
+def test_empty_point():
+    # ST_AsTWKB('POINT EMPTY')
+    wkb = decode(bytes.fromhex("0110"))
+
+    assert wkb[:5] == header(1)
+    assert all(math.isnan(value) for value in struct.unpack("<2d", wkb[5:]))
+
+
+@pytest.mark.parametrize(
+    "twkb, wkb_type",
+    [("0210", 2), ("0310", 3), ("0610", 6), ("0710", 7)],
+)
+def test_empty(twkb, wkb_type):
+    assert decode(bytes.fromhex(twkb)) == header(wkb_type) + count(0)
+
+
+def test_memoryview():
+    # psycopg2 returns bytea as memoryview.
+    assert decode(memoryview(bytes.fromhex("01000204"))) == decode(
+        bytes.fromhex("01000204")
+    )
+
+
+@pytest.mark.parametrize("twkb", ["", "01", "0100", "020002020208"])
+def test_truncated(twkb):
+    with pytest.raises(TWKBDecodeException):
+        decode(bytes.fromhex(twkb))
+
+
+def test_unsupported_type():
+    with pytest.raises(TWKBDecodeException):
+        decode(bytes.fromhex("0800"))
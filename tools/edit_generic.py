@@ -25,9 +25,9 @@
 #
 #####################################################################################
 
-
-from qgis.gui import QgsMapTool, QgsMapToolEmitPoint, QgsMapToolIdentifyFeature
-from qgis.PyQt.QtCore import Qt
+from qgis.core import QgsFeature
+from qgis.gui import QgsMapTool, QgsMapToolEmitPoint
+from qgis.PyQt.QtCore import Qt, pyqtSignal
 
 
 class EditGenericAttributes(QgsMapToolEmitPoint):
@@ -36,21 +36,25 @@ class EditGenericAttributes(QgsMapToolEmitPoint):
     the map.
     """
 
-    def __init__(self, canvas, layer):
+    # Emitted with the building clicked on.
+    featureIdentified = pyqtSignal(QgsFeature)
+
+    def __init__(self, canvas, building_layer):
 
         QgsMapToolEmitPoint.__init__(self, canvas)
         self.canvas = canvas
-        self.layer = layer
-
-        self.identifier = QgsMapToolIdentifyFeature(canvas, layer)
+        self.building_layer = building_layer
 
         self.setCursor(Qt.CrossCursor)
 
     def canvasReleaseEvent(self, event):
-        feature = self.identifier.identify(
-            event.x(), event.y(), self.identifier.TopDownStopAtFirst
-        )[0]
-        self.identifier.featureIdentified.emit(feature.mFeature)
+        layer = self.building_layer.layer
+        point = self.toLayerCoordinates(layer, event.pos())
+        tolerance = QgsMapTool.searchRadiusMU(self.canvas)
+
+        feature = self.building_layer.identify(point, tolerance)
+        if feature is not None:
+            self.featureIdentified.emit(feature)
 
     def deactivate(self):
         QgsMapTool.deactivate(self)